@@ -0,0 +1,82 @@
+"""create reminder schedule index
+
+Revision ID: 0062_notifications_reminder_schedule
+Revises: 0061_auth_refresh_token_lookup_hash
+Create Date: 2026-04-02 09:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0062_notifications_reminder_schedule"
+down_revision = "0061_auth_refresh_token_lookup_hash"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "reminder_schedule",
+        sa.Column("Id", sa.Integer(), nullable=False),
+        sa.Column("UserId", sa.Integer(), nullable=False),
+        sa.Column("SourceModule", sa.String(length=20), nullable=False),
+        sa.Column("ReminderKey", sa.String(length=40), nullable=False),
+        sa.Column("LocalTime", sa.String(length=5), nullable=False),
+        sa.Column("TimeZone", sa.String(length=64), nullable=False),
+        sa.Column("NextFireAt", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "UpdatedAt",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("SYSUTCDATETIME()"),
+        ),
+        sa.PrimaryKeyConstraint("Id"),
+        schema="notifications",
+    )
+    op.create_index(
+        "ix_notifications_reminder_schedule_user_id",
+        "reminder_schedule",
+        ["UserId"],
+        unique=False,
+        schema="notifications",
+    )
+    op.create_index(
+        "ix_notifications_reminder_schedule_module_next_fire",
+        "reminder_schedule",
+        ["SourceModule", "NextFireAt"],
+        unique=False,
+        schema="notifications",
+    )
+    op.create_index(
+        "ux_notifications_reminder_schedule_module_user_key",
+        "reminder_schedule",
+        ["SourceModule", "UserId", "ReminderKey"],
+        unique=True,
+        schema="notifications",
+    )
+    op.alter_column(
+        "reminder_schedule",
+        "UpdatedAt",
+        server_default=None,
+        schema="notifications",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ux_notifications_reminder_schedule_module_user_key",
+        table_name="reminder_schedule",
+        schema="notifications",
+    )
+    op.drop_index(
+        "ix_notifications_reminder_schedule_module_next_fire",
+        table_name="reminder_schedule",
+        schema="notifications",
+    )
+    op.drop_index(
+        "ix_notifications_reminder_schedule_user_id",
+        table_name="reminder_schedule",
+        schema="notifications",
+    )
+    op.drop_table("reminder_schedule", schema="notifications")
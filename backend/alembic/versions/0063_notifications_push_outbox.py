@@ -0,0 +1,83 @@
+"""create notification push outbox
+
+Revision ID: 0063_notifications_push_outbox
+Revises: 0062_notifications_reminder_schedule
+Create Date: 2026-04-03 09:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0063_notifications_push_outbox"
+down_revision = "0062_notifications_reminder_schedule"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "push_outbox",
+        sa.Column("Id", sa.Integer(), nullable=False),
+        sa.Column("NotificationId", sa.Integer(), nullable=False),
+        sa.Column("UserId", sa.Integer(), nullable=False),
+        sa.Column(
+            "Status",
+            sa.String(length=20),
+            nullable=False,
+            server_default=sa.text("'Pending'"),
+        ),
+        sa.Column("Attempts", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("NextAttemptAt", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("LastError", sa.String(length=255), nullable=True),
+        sa.Column("SentAt", sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            "CreatedAt",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("SYSUTCDATETIME()"),
+        ),
+        sa.Column(
+            "UpdatedAt",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("SYSUTCDATETIME()"),
+        ),
+        sa.PrimaryKeyConstraint("Id"),
+        schema="notifications",
+    )
+    op.create_index(
+        "ix_notifications_push_outbox_status_next_attempt",
+        "push_outbox",
+        ["Status", "NextAttemptAt"],
+        unique=False,
+        schema="notifications",
+    )
+    op.create_index(
+        "ux_notifications_push_outbox_notification",
+        "push_outbox",
+        ["NotificationId"],
+        unique=True,
+        schema="notifications",
+    )
+    for column in ("Status", "Attempts", "CreatedAt", "UpdatedAt"):
+        op.alter_column(
+            "push_outbox",
+            column,
+            server_default=None,
+            schema="notifications",
+        )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ux_notifications_push_outbox_notification",
+        table_name="push_outbox",
+        schema="notifications",
+    )
+    op.drop_index(
+        "ix_notifications_push_outbox_status_next_attempt",
+        table_name="push_outbox",
+        schema="notifications",
+    )
+    op.drop_table("push_outbox", schema="notifications")
@@ -0,0 +1,39 @@
+"""add hae api key lookup hash
+
+Revision ID: 0064_health_hae_api_key_lookup_hash
+Revises: 0063_notifications_push_outbox
+Create Date: 2026-04-06 09:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0064_health_hae_api_key_lookup_hash"
+down_revision = "0063_notifications_push_outbox"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "settings",
+        sa.Column("HaeApiKeyLookupHash", sa.String(length=64), nullable=True),
+        schema="health",
+    )
+    op.create_index(
+        "ix_health_settings_hae_api_key_lookup_hash",
+        "settings",
+        ["HaeApiKeyLookupHash"],
+        unique=False,
+        schema="health",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_health_settings_hae_api_key_lookup_hash",
+        table_name="settings",
+        schema="health",
+    )
+    op.drop_column("settings", "HaeApiKeyLookupHash", schema="health")
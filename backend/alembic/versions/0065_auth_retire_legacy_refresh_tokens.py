@@ -0,0 +1,31 @@
+"""retire legacy refresh tokens without a lookup hash
+
+Revision ID: 0065_auth_retire_legacy_refresh_tokens
+Revises: 0064_health_hae_api_key_lookup_hash
+Create Date: 2026-04-07 09:00:00.000000
+"""
+
+from alembic import op
+
+
+revision = "0065_auth_retire_legacy_refresh_tokens"
+down_revision = "0064_health_hae_api_key_lookup_hash"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The raw token is never stored, so rows issued before 0061 cannot be backfilled.
+    # Revoke them; affected sessions sign in again and get a lookup-hashed token.
+    op.execute(
+        """
+        UPDATE auth.refresh_tokens
+        SET RevokedAt = SYSUTCDATETIME()
+        WHERE LookupHash IS NULL AND RevokedAt IS NULL
+        """
+    )
+
+
+def downgrade() -> None:
+    # Revocation is not reversible; the revoked tokens stay revoked.
+    pass
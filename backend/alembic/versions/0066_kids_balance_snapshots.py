@@ -0,0 +1,52 @@
+"""create kids balance snapshots
+
+Revision ID: 0066_kids_balance_snapshots
+Revises: 0065_auth_retire_legacy_refresh_tokens
+Create Date: 2026-04-08 09:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0066_kids_balance_snapshots"
+down_revision = "0065_auth_retire_legacy_refresh_tokens"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "balance_snapshots",
+        sa.Column("Id", sa.Integer(), nullable=False),
+        sa.Column("KidUserId", sa.Integer(), nullable=False),
+        sa.Column("MonthStart", sa.Date(), nullable=False),
+        sa.Column("ClosingBalance", sa.Numeric(12, 2), nullable=False),
+        sa.Column(
+            "UpdatedAt",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("SYSUTCDATETIME()"),
+        ),
+        sa.PrimaryKeyConstraint("Id"),
+        sa.UniqueConstraint("KidUserId", "MonthStart", name="uq_kids_balance_snapshots_kid_month"),
+        schema="kids",
+    )
+    op.create_index(
+        "ix_kids_balance_snapshots_kid_user_id",
+        "balance_snapshots",
+        ["KidUserId"],
+        unique=False,
+        schema="kids",
+    )
+    op.alter_column(
+        "balance_snapshots",
+        "UpdatedAt",
+        server_default=None,
+        schema="kids",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_kids_balance_snapshots_kid_user_id", table_name="balance_snapshots", schema="kids")
+    op.drop_table("balance_snapshots", schema="kids")
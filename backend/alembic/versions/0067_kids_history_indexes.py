@@ -0,0 +1,61 @@
+"""add kids history keyset indexes
+
+Revision ID: 0067_kids_history_indexes
+Revises: 0066_kids_balance_snapshots
+Create Date: 2026-04-10 09:00:00.000000
+"""
+
+from alembic import op
+
+
+revision = "0067_kids_history_indexes"
+down_revision = "0066_kids_balance_snapshots"
+branch_labels = None
+depends_on = None
+
+# Ascending keys: SQL Server scans them backwards for the newest-first history pages.
+_HISTORY_KEY = ["KidUserId", "EntryDate", "CreatedAt", "Id"]
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_kids_ledger_entries_history",
+        "ledger_entries",
+        _HISTORY_KEY,
+        schema="kids",
+        mssql_include=[
+            "EntryType",
+            "Amount",
+            "Narrative",
+            "Notes",
+            "CreatedByUserId",
+            "SourceType",
+            "SourceId",
+            "IsDeleted",
+            "UpdatedAt",
+        ],
+    )
+    op.create_index(
+        "ix_kids_chore_entries_history",
+        "chore_entries",
+        _HISTORY_KEY,
+        schema="kids",
+        mssql_include=[
+            "ChoreId",
+            "Status",
+            "ChoreType",
+            "Amount",
+            "Notes",
+            "IsDeleted",
+            "CreatedByUserId",
+            "UpdatedByUserId",
+            "ReviewedByUserId",
+            "ReviewedAt",
+            "UpdatedAt",
+        ],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_kids_chore_entries_history", table_name="chore_entries", schema="kids")
+    op.drop_index("ix_kids_ledger_entries_history", table_name="ledger_entries", schema="kids")
@@ -0,0 +1,64 @@
+"""store meal template nutrition totals
+
+Revision ID: 0068_health_template_nutrition
+Revises: 0067_kids_history_indexes
+Create Date: 2026-04-13 09:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0068_health_template_nutrition"
+down_revision = "0067_kids_history_indexes"
+branch_labels = None
+depends_on = None
+
+_TOTAL_COLUMNS = (
+    ("TotalCalories", "CAST(f.CaloriesPerServing AS DECIMAL(14, 6))"),
+    ("TotalProtein", "f.ProteinPerServing"),
+    ("TotalFibre", "COALESCE(f.FibrePerServing, 0)"),
+    ("TotalCarbs", "COALESCE(f.CarbsPerServing, 0)"),
+    ("TotalFat", "COALESCE(f.FatPerServing, 0)"),
+    ("TotalSaturatedFat", "COALESCE(f.SaturatedFatPerServing, 0)"),
+    ("TotalSugar", "COALESCE(f.SugarPerServing, 0)"),
+    ("TotalSodium", "COALESCE(f.SodiumPerServing, 0)"),
+)
+
+
+def upgrade() -> None:
+    for name, _expression in _TOTAL_COLUMNS:
+        op.add_column("meal_templates", sa.Column(name, sa.Numeric(14, 6), nullable=True), schema="health")
+    op.add_column(
+        "meal_templates",
+        sa.Column("NutritionUpdatedAt", sa.DateTime(timezone=True), nullable=True),
+        schema="health",
+    )
+
+    sums = ",\n".join(
+        f"                SUM({expression} * i.Quantity) AS {name}" for name, expression in _TOTAL_COLUMNS
+    )
+    assignments = ",\n".join(f"            t.{name} = COALESCE(s.{name}, 0)" for name, _expression in _TOTAL_COLUMNS)
+    op.execute(
+        f"""
+        UPDATE t
+        SET
+{assignments},
+            t.NutritionUpdatedAt = SYSUTCDATETIME()
+        FROM health.meal_templates AS t
+        LEFT JOIN (
+            SELECT
+                i.MealTemplateId,
+{sums}
+            FROM health.meal_template_items AS i
+            JOIN health.foods AS f ON f.FoodId = i.FoodId
+            GROUP BY i.MealTemplateId
+        ) AS s ON s.MealTemplateId = t.MealTemplateId
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("meal_templates", "NutritionUpdatedAt", schema="health")
+    for name, _expression in reversed(_TOTAL_COLUMNS):
+        op.drop_column("meal_templates", name, schema="health")
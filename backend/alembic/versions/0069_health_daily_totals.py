@@ -0,0 +1,63 @@
+"""create health daily totals rollup
+
+Revision ID: 0069_health_daily_totals
+Revises: 0068_health_template_nutrition
+Create Date: 2026-04-14 09:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0069_health_daily_totals"
+down_revision = "0068_health_template_nutrition"
+branch_labels = None
+depends_on = None
+
+_NUTRIENT_COLUMNS = (
+    "TotalCalories",
+    "TotalProtein",
+    "TotalFibre",
+    "TotalCarbs",
+    "TotalFat",
+    "TotalSaturatedFat",
+    "TotalSugar",
+    "TotalSodium",
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "daily_totals",
+        sa.Column("UserId", sa.Integer(), nullable=False),
+        sa.Column("LogDate", sa.Date(), nullable=False),
+        sa.Column("DailyLogId", sa.String(length=36), nullable=False),
+        sa.Column("Steps", sa.Integer(), nullable=False),
+        sa.Column("StepKcalFactorOverride", sa.Numeric(10, 4), nullable=True),
+        sa.Column("WeightKg", sa.Numeric(6, 2), nullable=True),
+        *(sa.Column(name, sa.Numeric(14, 6), nullable=True) for name in _NUTRIENT_COLUMNS),
+        sa.Column("NutritionUpdatedAt", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("UserId", "LogDate"),
+        schema="health",
+    )
+    op.create_index(
+        "ix_health_daily_totals_daily_log_id",
+        "daily_totals",
+        ["DailyLogId"],
+        unique=True,
+        schema="health",
+    )
+    # Steps and weight are copied straight away so history charts work immediately.
+    # Nutrient sums stay NULL (computed on read) until scripts/backfill_daily_totals.py runs.
+    op.execute(
+        """
+        INSERT INTO health.daily_totals (UserId, LogDate, DailyLogId, Steps, StepKcalFactorOverride, WeightKg)
+        SELECT UserId, LogDate, DailyLogId, Steps, StepKcalFactorOverride, WeightKg
+        FROM health.daily_logs
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_health_daily_totals_daily_log_id", table_name="daily_totals", schema="health")
+    op.drop_table("daily_totals", schema="health")
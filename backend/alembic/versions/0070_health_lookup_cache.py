@@ -0,0 +1,52 @@
+"""create health lookup cache
+
+Revision ID: 0070_health_lookup_cache
+Revises: 0069_health_daily_totals
+Create Date: 2026-04-15 09:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0070_health_lookup_cache"
+down_revision = "0069_health_daily_totals"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "lookup_cache",
+        sa.Column("CacheKey", sa.String(length=450), nullable=False),
+        sa.Column("Namespace", sa.String(length=40), nullable=False),
+        sa.Column("Payload", sa.Text(), nullable=False),
+        sa.Column("IsNegative", sa.Boolean(), nullable=False),
+        sa.Column("ExpiresAt", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "CreatedAt",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("SYSUTCDATETIME()"),
+        ),
+        sa.PrimaryKeyConstraint("CacheKey"),
+        schema="health",
+    )
+    op.create_index(
+        "ix_health_lookup_cache_expires_at",
+        "lookup_cache",
+        ["ExpiresAt"],
+        unique=False,
+        schema="health",
+    )
+    op.alter_column(
+        "lookup_cache",
+        "CreatedAt",
+        server_default=None,
+        schema="health",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_health_lookup_cache_expires_at", table_name="lookup_cache", schema="health")
+    op.drop_table("lookup_cache", schema="health")
@@ -0,0 +1,27 @@
+"""add claim token to push outbox
+
+Revision ID: 0071_notifications_push_outbox_claim
+Revises: 0070_health_lookup_cache
+Create Date: 2026-04-16 09:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0071_notifications_push_outbox_claim"
+down_revision = "0070_health_lookup_cache"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "push_outbox",
+        sa.Column("ClaimToken", sa.String(length=32), nullable=True),
+        schema="notifications",
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("push_outbox", "ClaimToken", schema="notifications")
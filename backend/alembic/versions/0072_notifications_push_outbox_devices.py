@@ -0,0 +1,27 @@
+"""track settled devices on push outbox rows
+
+Revision ID: 0072_notifications_push_outbox_devices
+Revises: 0071_notifications_push_outbox_claim
+Create Date: 2026-04-18 09:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0072_notifications_push_outbox_devices"
+down_revision = "0071_notifications_push_outbox_claim"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "push_outbox",
+        sa.Column("SettledDeviceIds", sa.Text(), nullable=True),
+        schema="notifications",
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("push_outbox", "SettledDeviceIds", schema="notifications")
@@ -0,0 +1,12 @@
+import os
+
+
+def ReadIntEnv(name: str, default: int) -> int:
+    """Integer setting from the environment; unset, blank or malformed values use the default."""
+    raw = os.getenv(name, "").strip()
+    if not raw:
+        return default
+    try:
+        return int(raw)
+    except ValueError:
+        return default
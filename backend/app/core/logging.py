@@ -107,6 +107,7 @@ def setup_logging() -> None:
         "app.migrations",
         "app.reminders",
         "app.kids_reminders",
+        "app.scheduler",
         "app.auth",
         "app.auth.email",
         "integrations.alexa",
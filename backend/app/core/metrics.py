@@ -0,0 +1,237 @@
+import bisect
+import math
+import threading
+from typing import Callable
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(pairs: list[tuple[str, str]]) -> str:
+    if not pairs:
+        return ""
+    rendered = ",".join(f'{name}="{_escape_label_value(value)}"' for name, value in pairs)
+    return "{" + rendered + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    metric_type = ""
+
+    def __init__(self, name: str, help_text: str, label_names: tuple[str, ...]) -> None:
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, str]) -> tuple[str, ...]:
+        if set(labels) != set(self.label_names):
+            raise ValueError(f"{self.name} expects labels {self.label_names}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.label_names)
+
+    def _pairs(self, key: tuple[str, ...]) -> list[tuple[str, str]]:
+        return list(zip(self.label_names, key))
+
+    def Render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.metric_type}"]
+        lines.extend(self._RenderSamples())
+        return lines
+
+    def _RenderSamples(self) -> list[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    metric_type = "counter"
+
+    def __init__(self, name: str, help_text: str, label_names: tuple[str, ...]) -> None:
+        super().__init__(name, help_text, label_names)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def Inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def _RenderSamples(self) -> list[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self._pairs(key))} {_format_value(value)}" for key, value in values]
+
+
+class Gauge(_Metric):
+    """Set/Inc/Dec directly, or SetFunction to read the value at scrape time."""
+
+    metric_type = "gauge"
+
+    def __init__(self, name: str, help_text: str, label_names: tuple[str, ...]) -> None:
+        super().__init__(name, help_text, label_names)
+        self._values: dict[tuple[str, ...], float] = {}
+        self._function: Callable[[], float] | None = None
+
+    def Set(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def Inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def Dec(self, amount: float = 1.0, **labels: str) -> None:
+        self.Inc(-amount, **labels)
+
+    def SetFunction(self, function: Callable[[], float]) -> None:
+        self._function = function
+
+    def _RenderSamples(self) -> list[str]:
+        if self._function is not None:
+            try:
+                return [f"{self.name} {_format_value(float(self._function()))}"]
+            except Exception:  # noqa: BLE001
+                return []
+        with self._lock:
+            values = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self._pairs(key))} {_format_value(value)}" for key, value in values]
+
+
+class Histogram(_Metric):
+    metric_type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        label_names: tuple[str, ...],
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, help_text, label_names)
+        self._buckets = tuple(sorted(buckets))
+        # Per label set: [per-bucket counts (non-cumulative) + overflow, sum, count]
+        self._series: dict[tuple[str, ...], list] = {}
+
+    def Observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self._buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = [[0] * (len(self._buckets) + 1), 0.0, 0]
+                self._series[key] = series
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def _RenderSamples(self) -> list[str]:
+        with self._lock:
+            snapshot = sorted((key, (list(series[0]), series[1], series[2])) for key, series in self._series.items())
+        lines = []
+        for key, (bucket_counts, total, count) in snapshot:
+            pairs = self._pairs(key)
+            cumulative = 0
+            for bound, bucket_count in zip(self._buckets + (math.inf,), bucket_counts):
+                cumulative += bucket_count
+                labels = _format_labels(pairs + [("le", _format_value(bound))])
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(pairs)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(pairs)} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """In-process metrics rendered in the Prometheus text exposition format.
+
+    Metrics are per worker process; scrape each worker (or run one) for totals.
+    Creating a metric that already exists returns the existing one.
+    """
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _GetOrCreate(self, cls, name: str, help_text: str, label_names: tuple[str, ...], **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = cls(name, help_text, tuple(label_names), **kwargs)
+                self._metrics[name] = metric
+            elif not isinstance(metric, cls):
+                raise ValueError(f"{name} is already registered as a {metric.metric_type}")
+            return metric
+
+    def Counter(self, name: str, help_text: str, label_names: tuple[str, ...] = ()) -> Counter:
+        return self._GetOrCreate(Counter, name, help_text, label_names)
+
+    def Gauge(self, name: str, help_text: str, label_names: tuple[str, ...] = ()) -> Gauge:
+        return self._GetOrCreate(Gauge, name, help_text, label_names)
+
+    def Histogram(
+        self,
+        name: str,
+        help_text: str,
+        label_names: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._GetOrCreate(Histogram, name, help_text, label_names, buckets=buckets)
+
+    def Render(self) -> str:
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+        lines: list[str] = []
+        for metric in metrics:
+            lines.extend(metric.Render())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+http_request_duration = registry.Histogram(
+    "everday_http_request_duration_seconds",
+    "HTTP request latency by route template.",
+    ("method", "route", "status"),
+)
+http_requests_in_flight = registry.Gauge(
+    "everday_http_requests_in_flight",
+    "HTTP requests currently being handled.",
+)
+db_pool_checkout_wait = registry.Histogram(
+    "everday_db_pool_checkout_wait_seconds",
+    "Time spent waiting for a pooled database connection.",
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0),
+)
+db_pool_checked_out = registry.Gauge(
+    "everday_db_pool_checked_out",
+    "Database connections currently checked out of the pool.",
+)
+scheduler_job_duration = registry.Histogram(
+    "everday_scheduler_job_duration_seconds",
+    "Background scheduler job run duration.",
+    ("job", "outcome"),
+    buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0),
+)
+openai_request_duration = registry.Histogram(
+    "everday_openai_request_duration_seconds",
+    "OpenAI API call latency.",
+    ("caller", "outcome"),
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0),
+)
+apns_request_duration = registry.Histogram(
+    "everday_apns_request_duration_seconds",
+    "APNs push request latency per device.",
+    ("outcome",),
+)
+
+
+def RenderMetrics() -> str:
+    return registry.Render()
@@ -7,7 +7,9 @@ import traceback
 
 from alembic import command
 from alembic.config import Config
+from alembic.script import ScriptDirectory
 
+from app.core.env import ReadIntEnv
 from app.db import BuildAdminConnectionUrl
 
 logger = logging.getLogger("app.migrations")
@@ -25,14 +27,12 @@ def _append_fallback_migration_log(message: str) -> None:
         handle.write(f"{timestamp} ERROR app.migrations {message}\n")
 
 
-def _read_int_env(name: str, default: int) -> int:
-    raw = os.getenv(name, "").strip()
-    if not raw:
-        return default
-    try:
-        return int(raw)
-    except ValueError:
-        return default
+def GetHeadRevisions() -> list[str]:
+    """Head revision(s) of the migration scripts shipped with this build."""
+    script_location = Path(__file__).resolve().parents[2] / "alembic"
+    config = Config()
+    config.set_main_option("script_location", str(script_location))
+    return sorted(ScriptDirectory.from_config(config).get_heads())
 
 
 def RunMigrations() -> None:
@@ -43,8 +43,8 @@ def RunMigrations() -> None:
     alembic_cfg = Config(str(config_path))
     alembic_cfg.set_main_option("sqlalchemy.url", BuildAdminConnectionUrl())
     alembic_cfg.set_main_option("script_location", str(Path(__file__).resolve().parents[2] / "alembic"))
-    timeout_seconds = _read_int_env("MIGRATIONS_TIMEOUT_SECONDS", 600)
-    progress_seconds = _read_int_env("MIGRATIONS_PROGRESS_LOG_SECONDS", 20)
+    timeout_seconds = ReadIntEnv("MIGRATIONS_TIMEOUT_SECONDS", 600)
+    progress_seconds = ReadIntEnv("MIGRATIONS_PROGRESS_LOG_SECONDS", 20)
 
     logger.info(
         "running migrations (timeout=%ss, progress_log=%ss)",
@@ -0,0 +1,103 @@
+import contextvars
+import re
+import time
+from collections import Counter
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.env import ReadIntEnv
+
+_WHITESPACE = re.compile(r"\s+")
+_PLACEHOLDER_LIST = re.compile(r"\?(?:\s*,\s*\?)+")
+_START_TIMES_KEY = "query_stats_start_times"
+
+
+def NormalizeStatement(statement: str) -> str:
+    """Statement shape: whitespace collapsed and `IN (?, ?, ...)` folded to one
+    placeholder, so the same query with a different id list counts as one shape."""
+    return _PLACEHOLDER_LIST.sub("?", _WHITESPACE.sub(" ", statement).strip())
+
+
+class RequestQueryStats:
+    """Queries issued while handling one request. Shared by reference across the
+    threads the request runs on, so it is mutated in place rather than replaced."""
+
+    def __init__(self) -> None:
+        self.Count = 0
+        self.DurationSeconds = 0.0
+        self.Shapes: Counter[str] = Counter()
+
+    @property
+    def DurationMs(self) -> int:
+        return int(self.DurationSeconds * 1000)
+
+    def Record(self, statement: str, duration_seconds: float) -> None:
+        self.Count += 1
+        self.DurationSeconds += duration_seconds
+        self.Shapes[NormalizeStatement(statement)] += 1
+
+    def NPlusOneSuspects(self, threshold: int | None = None) -> list[tuple[str, int]]:
+        """Statement shapes executed at least `threshold` times, most repeated first."""
+        if threshold is None:
+            threshold = ReadIntEnv("DB_N_PLUS_ONE_THRESHOLD", 5)
+        if threshold <= 0:
+            return []
+        return [(shape, count) for shape, count in self.Shapes.most_common() if count >= threshold]
+
+
+_current_stats: contextvars.ContextVar[RequestQueryStats | None] = contextvars.ContextVar(
+    "request_query_stats",
+    default=None,
+)
+
+
+def BeginRequestQueryStats() -> tuple[RequestQueryStats, contextvars.Token]:
+    stats = RequestQueryStats()
+    return stats, _current_stats.set(stats)
+
+
+def EndRequestQueryStats(token: contextvars.Token) -> None:
+    _current_stats.reset(token)
+
+
+def GetRequestQueryStats() -> RequestQueryStats | None:
+    return _current_stats.get()
+
+
+def _BeforeCursorExecute(conn, _cursor, _statement, _parameters, _context, _executemany) -> None:
+    if _current_stats.get() is None:
+        return
+    conn.info.setdefault(_START_TIMES_KEY, []).append(time.perf_counter())
+
+
+def _AfterCursorExecute(conn, _cursor, statement, _parameters, _context, _executemany) -> None:
+    stats = _current_stats.get()
+    start_times = conn.info.get(_START_TIMES_KEY)
+    if stats is None or not start_times:
+        return
+    stats.Record(statement, time.perf_counter() - start_times.pop())
+
+
+def _HandleError(exception_context) -> None:
+    connection = exception_context.connection
+    if connection is None:
+        return
+    start_times = connection.info.get(_START_TIMES_KEY)
+    if start_times:
+        start_times.pop()
+
+
+_installed = False
+
+
+def InstallQueryInstrumentation() -> None:
+    """Hooks every Engine once. Statements run outside a request (scheduler jobs,
+    startup) are not recorded."""
+    global _installed
+    if _installed:
+        return
+    event.listen(Engine, "before_cursor_execute", _BeforeCursorExecute)
+    event.listen(Engine, "after_cursor_execute", _AfterCursorExecute)
+    event.listen(Engine, "handle_error", _HandleError)
+    _installed = True
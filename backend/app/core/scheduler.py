@@ -0,0 +1,263 @@
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable
+
+from sqlalchemy.orm import Session
+
+import app.db as db_module
+from app.core.env import ReadIntEnv
+from app.core.metrics import scheduler_job_duration
+
+logger = logging.getLogger("app.scheduler")
+
+SchedulerJob = Callable[[Session], None]
+
+
+def _default_session_factory() -> Session:
+    db_module._ensure_engine()
+    return db_module.SessionLocal()
+
+
+@dataclass
+class _JobState:
+    name: str
+    func: SchedulerJob
+    interval_seconds: int
+    job_logger: logging.Logger
+    first_run_delay_seconds: int = 0
+    dedicated_worker: bool = False
+    executor: ThreadPoolExecutor | None = None
+    future: Future | None = None
+    task: asyncio.Task | None = None
+    runs: int = 0
+    failures: int = 0
+    overlaps: int = 0
+    queued_skips: int = 0
+    running: bool = False
+    last_failed: bool = False
+    last_started_at: float | None = None
+    last_finished_at: float | None = None
+    last_duration_ms: int = 0
+    max_duration_ms: int = 0
+    total_duration_ms: int = 0
+
+
+class JobScheduler:
+    """Runs blocking background jobs on a bounded worker pool.
+
+    Each registered job gets a lightweight asyncio ticker that only submits work to the
+    executor, so pyodbc/httpx/OpenAI calls never run on the event loop. Every run opens
+    its own session. A tick that fires while the previous run is still executing is
+    skipped and counted as an overlap; one that fires while the previous run is still
+    waiting for a worker is skipped and counted as a queued skip instead.
+
+    Latency-sensitive jobs can ask for a dedicated worker so they never wait behind slow
+    jobs in the shared pool, and slow periodic jobs can delay their first run so they do
+    not all start together at boot.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        session_factory: Callable[[], Session] | None = None,
+    ) -> None:
+        self._max_workers = max(1, max_workers)
+        self._session_factory = session_factory or _default_session_factory
+        self._executor: ThreadPoolExecutor | None = None
+        self._jobs: dict[str, _JobState] = {}
+        self._lock = threading.Lock()
+        self._submit_lock = threading.Lock()
+        self._stop_event = asyncio.Event()
+
+    def Register(
+        self,
+        name: str,
+        func: SchedulerJob,
+        *,
+        interval_seconds: int,
+        job_logger: logging.Logger | None = None,
+        first_run_delay_seconds: int = 0,
+        dedicated_worker: bool = False,
+    ) -> None:
+        if name in self._jobs:
+            return
+        self._jobs[name] = _JobState(
+            name=name,
+            func=func,
+            interval_seconds=max(1, interval_seconds),
+            job_logger=job_logger or logger,
+            first_run_delay_seconds=max(0, first_run_delay_seconds),
+            dedicated_worker=dedicated_worker,
+        )
+
+    def Start(self) -> None:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers,
+                thread_name_prefix="scheduler",
+            )
+        self._stop_event.clear()
+        for job in self._jobs.values():
+            if job.dedicated_worker and job.executor is None:
+                job.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"scheduler-{job.name}")
+            if job.task is None or job.task.done():
+                job.task = asyncio.create_task(self._Loop(job), name=f"scheduler:{job.name}")
+                logger.info(
+                    "scheduler job started name=%s interval=%ss first_run_delay=%ss workers=%s",
+                    job.name,
+                    job.interval_seconds,
+                    job.first_run_delay_seconds,
+                    "dedicated" if job.dedicated_worker else self._max_workers,
+                )
+
+    async def Stop(self) -> None:
+        self._stop_event.set()
+        for job in self._jobs.values():
+            if job.task and not job.task.done():
+                job.task.cancel()
+            if job.executor is not None:
+                job.executor.shutdown(wait=False, cancel_futures=True)
+                job.executor = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def GetStats(self) -> dict[str, dict]:
+        with self._lock:
+            return {
+                job.name: {
+                    "IntervalSeconds": job.interval_seconds,
+                    "Running": job.running,
+                    "Runs": job.runs,
+                    "Failures": job.failures,
+                    "Overlaps": job.overlaps,
+                    "QueuedSkips": job.queued_skips,
+                    "DedicatedWorker": job.dedicated_worker,
+                    "LastRunFailed": job.last_failed,
+                    "LastStartedAt": job.last_started_at,
+                    "LastFinishedAt": job.last_finished_at,
+                    "LastDurationMs": job.last_duration_ms,
+                    "MaxDurationMs": job.max_duration_ms,
+                    "AvgDurationMs": int(job.total_duration_ms / job.runs) if job.runs else 0,
+                }
+                for job in self._jobs.values()
+            }
+
+    def Trigger(self, name: str) -> bool:
+        """Runs a registered job now instead of waiting for its next tick.
+
+        Safe to call from request handlers and worker threads. Does nothing when the
+        scheduler is not running or the job is already in flight.
+        """
+        job = self._jobs.get(name)
+        if job is None:
+            return False
+        with self._submit_lock:
+            if job.future is not None and not job.future.done():
+                return False
+            return self._SubmitLocked(job)
+
+    def _Submit(self, job: _JobState) -> bool:
+        with self._submit_lock:
+            if job.future is not None and not job.future.done():
+                with self._lock:
+                    executing = job.running
+                    if executing:
+                        job.overlaps += 1
+                    else:
+                        job.queued_skips += 1
+                if executing:
+                    job.job_logger.warning(
+                        "%s run skipped: previous run still in progress (overlaps=%s)",
+                        job.name,
+                        job.overlaps,
+                    )
+                else:
+                    job.job_logger.warning(
+                        "%s run skipped: previous run still waiting for a worker (queued_skips=%s)",
+                        job.name,
+                        job.queued_skips,
+                    )
+                return False
+            return self._SubmitLocked(job)
+
+    def _SubmitLocked(self, job: _JobState) -> bool:
+        executor = job.executor or self._executor
+        if executor is None:
+            return False
+        try:
+            job.future = executor.submit(self._Execute, job)
+        except RuntimeError:
+            return False
+        return True
+
+    def _Execute(self, job: _JobState) -> None:
+        started = time.perf_counter()
+        with self._lock:
+            job.running = True
+            job.last_started_at = time.time()
+        failed = False
+        try:
+            db = self._session_factory()
+            try:
+                job.func(db)
+            finally:
+                db.close()
+        except Exception:  # noqa: BLE001
+            failed = True
+            job.job_logger.exception("%s scheduler run failed", job.name)
+        finally:
+            elapsed = time.perf_counter() - started
+            duration_ms = int(elapsed * 1000)
+            scheduler_job_duration.Observe(elapsed, job=job.name, outcome="failed" if failed else "ok")
+            with self._lock:
+                job.running = False
+                job.runs += 1
+                if failed:
+                    job.failures += 1
+                job.last_failed = failed
+                job.last_finished_at = time.time()
+                job.last_duration_ms = duration_ms
+                job.total_duration_ms += duration_ms
+                job.max_duration_ms = max(job.max_duration_ms, duration_ms)
+            if duration_ms > job.interval_seconds * 1000:
+                job.job_logger.warning(
+                    "%s run took %sms, longer than its %ss interval",
+                    job.name,
+                    duration_ms,
+                    job.interval_seconds,
+                )
+
+    async def _Loop(self, job: _JobState) -> None:
+        if job.first_run_delay_seconds:
+            try:
+                await asyncio.wait_for(self._stop_event.wait(), timeout=job.first_run_delay_seconds)
+                return
+            except asyncio.TimeoutError:
+                pass
+        while not self._stop_event.is_set():
+            self._Submit(job)
+            try:
+                await asyncio.wait_for(self._stop_event.wait(), timeout=job.interval_seconds)
+            except asyncio.TimeoutError:
+                continue
+
+
+_scheduler: JobScheduler | None = None
+
+
+def GetScheduler() -> JobScheduler:
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = JobScheduler(max_workers=ReadIntEnv("SCHEDULER_MAX_WORKERS", 3))
+    return _scheduler
+
+
+def GetSchedulerStats() -> dict[str, dict]:
+    if _scheduler is None:
+        return {}
+    return _scheduler.GetStats()
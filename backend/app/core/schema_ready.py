@@ -0,0 +1,130 @@
+import hashlib
+import logging
+import os
+import tempfile
+from pathlib import Path
+
+from sqlalchemy import bindparam, create_engine, text
+
+from app.core.migrations import GetHeadRevisions
+from app.db import Base, BuildAdminConnectionUrl
+
+logger = logging.getLogger("app.schema")
+
+_CATALOG_QUERY = text(
+    "SELECT TABLE_SCHEMA, TABLE_NAME FROM INFORMATION_SCHEMA.TABLES WHERE TABLE_SCHEMA IN :schemas"
+).bindparams(bindparam("schemas", expanding=True))
+
+# (schema, table) pairs found missing by the last startup check. Empty until a
+# check runs, so routes behave as before if startup never checked.
+_missing: set[tuple[str, str]] = set()
+
+
+def _ExpectedTables() -> dict[tuple[str, str], object]:
+    """Every mapped table in a module schema, keyed case-insensitively (SQL Server's
+    default collation) so catalog names compare cleanly."""
+    return {
+        (table.schema.lower(), table.name.lower()): table
+        for table in Base.metadata.tables.values()
+        if table.schema
+    }
+
+
+def _MarkerPath() -> Path:
+    raw = os.getenv("SCHEMA_READY_MARKER_PATH", "").strip()
+    return Path(raw) if raw else Path(tempfile.gettempdir()) / "everday-schema-ready"
+
+
+def _Fingerprint(expected: dict[tuple[str, str], object]) -> str:
+    parts = [
+        os.getenv("SQLSERVER_HOST", ""),
+        os.getenv("SQLSERVER_DB", ""),
+        ",".join(GetHeadRevisions()),
+        *(f"{schema}.{name}" for schema, name in sorted(expected)),
+    ]
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+def _ReadMarker() -> str:
+    try:
+        return _MarkerPath().read_text(encoding="utf-8").strip()
+    except OSError:
+        return ""
+
+
+def _WriteMarker(fingerprint: str) -> None:
+    path = _MarkerPath()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(fingerprint, encoding="utf-8")
+        os.replace(tmp_path, path)
+    except OSError:
+        logger.warning("could not write schema ready marker path=%s", path, exc_info=True)
+
+
+def FindMissingTables(connection, expected: dict[tuple[str, str], object]) -> set[tuple[str, str]]:
+    """One catalog query covering every module schema."""
+    schemas = sorted({schema for schema, _name in expected})
+    rows = connection.execute(_CATALOG_QUERY, {"schemas": schemas}).all()
+    present = {(str(schema).lower(), str(name).lower()) for schema, name in rows}
+    return set(expected) - present
+
+
+def EnsureSchemaReady(engine=None) -> bool:
+    """Startup check that every mapped table exists, run once after migrations.
+
+    A marker file (SCHEMA_READY_MARKER_PATH) records the fingerprint of the last
+    successful check - database, migration head and table list - so other workers
+    starting against the same database and build skip the catalog query. Missing
+    tables get one create_all repair attempt; anything still missing is logged and
+    reported by IsSchemaReady so the owning routes can answer 503.
+    """
+    expected = _ExpectedTables()
+    fingerprint = _Fingerprint(expected)
+    _missing.clear()
+    if _ReadMarker() == fingerprint:
+        logger.info("schema ready (marker)")
+        return True
+
+    owns_engine = engine is None
+    if owns_engine:
+        engine = create_engine(BuildAdminConnectionUrl(), pool_pre_ping=True)
+    try:
+        with engine.connect() as connection:
+            missing = FindMissingTables(connection, expected)
+        if missing:
+            logger.warning(
+                "schema missing tables=%s, attempting repair",
+                ",".join(f"{schema}.{name}" for schema, name in sorted(missing)),
+            )
+            try:
+                with engine.begin() as connection:
+                    Base.metadata.create_all(
+                        bind=connection,
+                        tables=[expected[key] for key in sorted(missing)],
+                        checkfirst=True,
+                    )
+            except Exception:  # noqa: BLE001
+                logger.exception("schema repair failed")
+            with engine.connect() as connection:
+                missing = FindMissingTables(connection, expected)
+    finally:
+        if owns_engine:
+            engine.dispose()
+
+    if missing:
+        _missing.update(missing)
+        logger.error(
+            "schema still missing tables=%s",
+            ",".join(f"{schema}.{name}" for schema, name in sorted(missing)),
+        )
+        return False
+    _WriteMarker(fingerprint)
+    logger.info("schema ready tables=%s", len(expected))
+    return True
+
+
+def IsSchemaReady(schema: str) -> bool:
+    schema = schema.lower()
+    return not any(missing_schema == schema for missing_schema, _name in _missing)
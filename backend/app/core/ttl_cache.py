@@ -0,0 +1,109 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TtlLruCache(Generic[K, V]):
+    """Thread-safe per-process cache bounded by entry count (LRU) and age (TTL).
+
+    A cache with max_entries or ttl_seconds of 0 is disabled: reads miss and writes are
+    dropped. Entries written together by PutMany share one expiry.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        self._max_entries = max(0, max_entries)
+        self._ttl_seconds = max(0.0, ttl_seconds)
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    @property
+    def Enabled(self) -> bool:
+        return self._max_entries > 0 and self._ttl_seconds > 0
+
+    def _LookupLocked(self, key: K, now: float) -> tuple[bool, V | None]:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= now:
+            if entry is not None:
+                del self._entries[key]
+            return False, None
+        self._entries.move_to_end(key)
+        return True, entry[1]
+
+    def Get(self, key: K) -> V | None:
+        if not self.Enabled:
+            return None
+        now = time.monotonic()
+        with self._lock:
+            found, value = self._LookupLocked(key, now)
+            if found:
+                self._hits += 1
+            else:
+                self._misses += 1
+            return value
+
+    def GetMany(self, keys: Iterable[K]) -> tuple[dict[K, V], set[K]]:
+        """Cached values for `keys` and the keys that still need loading."""
+        if not self.Enabled:
+            return {}, set(keys)
+        now = time.monotonic()
+        found: dict[K, V] = {}
+        missing: set[K] = set()
+        with self._lock:
+            for key in keys:
+                hit, value = self._LookupLocked(key, now)
+                if hit:
+                    found[key] = value
+                else:
+                    missing.add(key)
+            self._hits += len(found)
+            self._misses += len(missing)
+        return found, missing
+
+    def Put(self, key: K, value: V) -> None:
+        self.PutMany({key: value})
+
+    def PutMany(self, values: dict[K, V]) -> None:
+        if not self.Enabled or not values:
+            return
+        expires_at = time.monotonic() + self._ttl_seconds
+        with self._lock:
+            for key, value in values.items():
+                self._entries[key] = (expires_at, value)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def Invalidate(self, key: K) -> None:
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self._invalidations += 1
+
+    def Clear(self) -> None:
+        with self._lock:
+            self._invalidations += len(self._entries)
+            self._entries.clear()
+
+    def GetStats(self) -> dict[str, object]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "Enabled": self.Enabled,
+                "Size": len(self._entries),
+                "MaxEntries": self._max_entries,
+                "TtlSeconds": self._ttl_seconds,
+                "Hits": self._hits,
+                "Misses": self._misses,
+                "HitRatio": round(self._hits / lookups, 4) if lookups else 0,
+                "Evictions": self._evictions,
+                "Invalidations": self._invalidations,
+            }
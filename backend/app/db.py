@@ -1,12 +1,21 @@
+import asyncio
+import contextvars
+import functools
 import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from urllib.parse import quote_plus
 
 from sqlalchemy import create_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.orm import Session, declarative_base, sessionmaker
+from sqlalchemy.pool import QueuePool
+
+from app.core.metrics import db_pool_checked_out, db_pool_checkout_wait
 
 Base = declarative_base()
 engine = None
 SessionLocal = None
+_async_executor: ThreadPoolExecutor | None = None
 
 
 def _read_int_env(name: str, default: int) -> int:
@@ -52,6 +61,19 @@ def BuildUserConnectionUrl() -> str:
 def BuildAdminConnectionUrl(database_override: str | None = None) -> str:
     return _build_connection_url("SQLSERVER_ADMIN_LOGIN", "SQLSERVER_ADMIN_PASSWORD", database_override)
 
+
+class _TimedQueuePool(QueuePool):
+    """QueuePool that records how long each checkout waited. Pool events only fire
+    once a connection is in hand, so the wait is timed around connect() instead."""
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            db_pool_checkout_wait.Observe(time.perf_counter() - started)
+
+
 def _ensure_engine():
     global engine, SessionLocal
     if engine is None:
@@ -64,7 +86,9 @@ def _ensure_engine():
             pool_size=pool_size,
             max_overflow=max_overflow,
             pool_timeout=pool_timeout,
+            poolclass=_TimedQueuePool,
         )
+        db_pool_checked_out.SetFunction(lambda: engine.pool.checkedout())
         SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
 
 
@@ -76,3 +100,67 @@ def GetDb():
         yield db
     finally:
         db.close()
+
+
+def _get_async_executor() -> ThreadPoolExecutor:
+    global _async_executor
+    if _async_executor is None:
+        # Sized to the connection pool by default: more workers would only queue on
+        # pool checkout, fewer would leave connections idle.
+        default_workers = _read_int_env("SQLALCHEMY_POOL_SIZE", 10) + _read_int_env("SQLALCHEMY_MAX_OVERFLOW", 20)
+        max_workers = max(1, _read_int_env("SQLALCHEMY_ASYNC_WORKERS", default_workers))
+        _async_executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="db-async")
+    return _async_executor
+
+
+class AsyncDbSession:
+    """Awaitable handle over a sync Session for `async def` routes.
+
+    Work runs on a dedicated executor sized to the connection pool rather than the
+    shared AnyIO threadpool, so DB-bound handlers stop competing with every other sync
+    route for its ~40 threads. `run_sync` matches `AsyncSession.run_sync`, so routes can
+    move to a native async driver without changing call sites.
+    """
+
+    def __init__(self, session: Session, executor: ThreadPoolExecutor) -> None:
+        self._session = session
+        self._executor = executor
+        self._pending: Future | None = None
+
+    async def run_sync(self, fn, *args, **kwargs):
+        # Carry the request context (query stats) onto the worker thread.
+        context = contextvars.copy_context()
+        self._pending = self._executor.submit(
+            context.run,
+            functools.partial(fn, self._session, *args, **kwargs),
+        )
+        return await asyncio.wrap_future(self._pending)
+
+    def _close(self) -> None:
+        # A cancelled request leaves its call running on the worker; let it finish
+        # before the session is closed underneath it.
+        if self._pending is not None:
+            wait([self._pending])
+        self._session.close()
+
+    async def close(self) -> None:
+        # Not on self._executor: when every worker is waiting on pool checkout, the
+        # close that would hand a connection back must not queue behind them.
+        await asyncio.get_running_loop().run_in_executor(None, self._close)
+
+
+async def AsyncGetDb():
+    if SessionLocal is None:
+        _ensure_engine()
+    db = AsyncDbSession(SessionLocal(), _get_async_executor())
+    try:
+        yield db
+    finally:
+        await db.close()
+
+
+def CloseAsyncDb() -> None:
+    global _async_executor
+    if _async_executor is not None:
+        _async_executor.shutdown(wait=True)
+        _async_executor = None
@@ -1,4 +1,5 @@
 import asyncio
+import itertools
 import logging
 import os
 import time
@@ -12,11 +13,16 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from sqlalchemy.exc import SAWarning
+from sqlalchemy.orm import Session
 
+from app.db import CloseAsyncDb
 from app.core.bootstrap import EnsureDatabaseSetup
 from app.core.logging import setup_logging
+from app.core.metrics import http_request_duration, http_requests_in_flight
 from app.core.migrations import RunMigrations
-import app.db as db_module
+from app.core.schema_ready import EnsureSchemaReady
+from app.core.query_stats import BeginRequestQueryStats, EndRequestQueryStats, InstallQueryInstrumentation
+from app.core.scheduler import GetScheduler, JobScheduler
 from app.modules.auth.router import router as auth_router
 from app.modules.core.router import router as core_router
 from app.modules.budget.router import router as budget_router
@@ -33,8 +39,22 @@ from app.modules.integrations.google.router import router as google_router
 from app.modules.integrations.gmail.router import router as gmail_router
 from app.modules.integrations.gmail.models import GmailIntegration
 from app.modules.notes.routes.notes import router as notes_router
-from app.modules.health.services.reminders_service import RunDailyHealthReminders
-from app.modules.kids.services.reminders_service import RunDailyKidsReminders
+from app.modules.health.services.lookup_cache import PruneExpiredLookupCache
+from app.modules.health.services.reminders_service import (
+    RunDailyHealthReminders,
+    SyncHealthReminderSchedule,
+)
+from app.modules.kids.services.reminders_service import (
+    CompactReminderRuns,
+    RunDailyKidsReminders,
+    SyncKidsReminderSchedule,
+)
+from app.modules.kids.services.balance_snapshot_service import ReconcileBalanceSnapshots
+from app.modules.kids.services.chores_v2_service import TodayAdelaide
+from app.modules.kids.services.pocket_money_service import PostMonthlyPayouts
+from app.modules.notifications.outbox_service import DrainPushOutbox
+from app.modules.notifications.push_service import ClosePushPool, IsPushEnabled
+from app.modules.notifications.services import PUSH_OUTBOX_JOB
 from app.modules.life_admin import gmail_intake_service
 from app.modules.life_admin import documents_service
 
@@ -51,12 +71,10 @@ startup_logger = logging.getLogger("app.startup")
 reminders_logger = logging.getLogger("app.reminders")
 kids_reminders_logger = logging.getLogger("app.kids_reminders")
 gmail_intake_logger = logging.getLogger("app.gmail_intake")
-_reminders_task: asyncio.Task | None = None
-_reminders_stop_event = asyncio.Event()
-_kids_reminders_task: asyncio.Task | None = None
-_kids_reminders_stop_event = asyncio.Event()
-_gmail_intake_task: asyncio.Task | None = None
-_gmail_intake_stop_event = asyncio.Event()
+push_outbox_logger = logging.getLogger("notifications.push")
+kids_balance_logger = logging.getLogger("kids.balance_snapshots")
+kids_payout_logger = logging.getLogger("kids.monthly_payouts")
+lookup_cache_logger = logging.getLogger("health.lookup_cache")
 
 allowed_origins = os.getenv("ALLOWED_ORIGINS", "").strip()
 if not allowed_origins:
@@ -70,6 +88,7 @@ if origin_list:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["X-Next-Cursor"],
     )
 
 
@@ -111,6 +130,16 @@ def _resolve_client_ip(request: Request) -> str:
     return request.client.host if request.client else "unknown"
 
 
+def _resolve_route_template(request: Request) -> str:
+    # Label by template (/api/kids/{kid_id}), never the raw path, to bound cardinality.
+    route = request.scope.get("route")
+    path = getattr(route, "path", None)
+    return path or "<unmatched>"
+
+
+InstallQueryInstrumentation()
+
+
 @app.middleware("http")
 async def request_logger(request: Request, call_next):
     # Force re-enable all logging (uvicorn disables specific loggers)
@@ -118,12 +147,21 @@ async def request_logger(request: Request, call_next):
     logger.disabled = False
     
     request_id = request.headers.get("X-Request-Id") or str(uuid.uuid4())
-    is_health_check = request.url.path in {"/api/health", "/api/health/db"}
+    is_health_check = request.url.path in {"/api/health", "/api/health/db", "/api/metrics"}
+    query_stats, query_stats_token = BeginRequestQueryStats()
+    http_requests_in_flight.Inc()
     start = time.perf_counter()
     try:
         response = await call_next(request)
     except Exception:
-        duration_ms = int((time.perf_counter() - start) * 1000)
+        elapsed = time.perf_counter() - start
+        http_request_duration.Observe(
+            elapsed,
+            method=request.method,
+            route=_resolve_route_template(request),
+            status="500",
+        )
+        duration_ms = int(elapsed * 1000)
         parts = [f"{request.method} {request.url.path}"]
         parts.append(f"ip={_resolve_client_ip(request)}")
         if request.url.query:
@@ -131,12 +169,23 @@ async def request_logger(request: Request, call_next):
         parts.append("ERROR: unhandled exception")
         parts.append("status=500")
         parts.append(f"{duration_ms}ms")
+        parts.append(f"db={query_stats.Count}q/{query_stats.DurationMs}ms")
         log_msg = " | ".join(parts)
         logger.exception(log_msg)
         _append_fallback_request_log(log_msg)
         raise
-
-    duration_ms = int((time.perf_counter() - start) * 1000)
+    finally:
+        http_requests_in_flight.Dec()
+        EndRequestQueryStats(query_stats_token)
+
+    elapsed = time.perf_counter() - start
+    http_request_duration.Observe(
+        elapsed,
+        method=request.method,
+        route=_resolve_route_template(request),
+        status=str(response.status_code),
+    )
+    duration_ms = int(elapsed * 1000)
 
     # Build diagnostic context
     client_ip = _resolve_client_ip(request)
@@ -159,6 +208,20 @@ async def request_logger(request: Request, call_next):
 
     parts.append(f"status={status}")
     parts.append(f"{duration_ms}ms")
+    parts.append(f"db={query_stats.Count}q/{query_stats.DurationMs}ms")
+
+    # Flag statement shapes repeated within the request (likely N+1 loops)
+    n_plus_one = query_stats.NPlusOneSuspects()
+    if n_plus_one:
+        parts.append(f"n+1={len(n_plus_one)}")
+        for shape, count in n_plus_one:
+            logger.warning(
+                "n+1 suspect | %s %s | %sx %s",
+                request.method,
+                request.url.path,
+                count,
+                shape[:300],
+            )
 
     # Log with appropriate level
     log_msg = " | ".join(parts)
@@ -171,10 +234,9 @@ async def request_logger(request: Request, call_next):
         else:
             logger.info(log_msg)
         _append_fallback_request_log(log_msg)
-        
-        _append_fallback_request_log(log_msg)
 
     response.headers["X-Request-Id"] = request_id
+    response.headers["X-DB-Queries"] = str(query_stats.Count)
     response.headers.setdefault("X-Content-Type-Options", "nosniff")
     response.headers.setdefault("X-Frame-Options", "DENY")
     response.headers.setdefault("Referrer-Policy", "no-referrer")
@@ -223,37 +285,17 @@ if static_dir.exists():
 @app.on_event("startup")
 async def startup_tasks() -> None:
     await _run_startup_db_tasks()
-    global _reminders_task
-    if _reminders_task is None or _reminders_task.done():
-        _reminders_stop_event.clear()
-        _reminders_task = asyncio.create_task(_health_reminders_loop())
-        startup_logger.info("health reminders scheduler task created")
-    global _kids_reminders_task
-    if _kids_reminders_task is None or _kids_reminders_task.done():
-        _kids_reminders_stop_event.clear()
-        _kids_reminders_task = asyncio.create_task(_kids_reminders_loop())
-        startup_logger.info("kids reminders scheduler task created")
-    global _gmail_intake_task
-    if _gmail_intake_task is None or _gmail_intake_task.done():
-        _gmail_intake_stop_event.clear()
-        _gmail_intake_task = asyncio.create_task(_gmail_intake_loop())
-        startup_logger.info("gmail intake scheduler task created")
+    scheduler = GetScheduler()
+    _register_scheduler_jobs(scheduler)
+    scheduler.Start()
+    startup_logger.info("background scheduler started")
 
 
 @app.on_event("shutdown")
 async def shutdown_tasks() -> None:
-    global _reminders_task
-    _reminders_stop_event.set()
-    if _reminders_task and not _reminders_task.done():
-        _reminders_task.cancel()
-    global _kids_reminders_task
-    _kids_reminders_stop_event.set()
-    if _kids_reminders_task and not _kids_reminders_task.done():
-        _kids_reminders_task.cancel()
-    global _gmail_intake_task
-    _gmail_intake_stop_event.set()
-    if _gmail_intake_task and not _gmail_intake_task.done():
-        _gmail_intake_task.cancel()
+    await GetScheduler().Stop()
+    ClosePushPool()
+    CloseAsyncDb()
 
 
 def _env_int(name: str, default: int) -> int:
@@ -281,155 +323,256 @@ def _env_bool(name: str, default: bool) -> bool:
     return default
 
 
-async def _health_reminders_loop() -> None:
-    enabled = _env_bool("HEALTH_REMINDERS_SCHEDULER_ENABLED", True)
-    if not enabled:
+def _register_scheduler_jobs(scheduler: JobScheduler) -> None:
+    # Hourly and daily maintenance jobs start one stagger step apart instead of all at boot.
+    stagger_seconds = max(0, _env_int("SCHEDULER_STARTUP_STAGGER_SECONDS", 30))
+    maintenance_delays = itertools.count(stagger_seconds, stagger_seconds)
+
+    if _env_bool("HEALTH_REMINDERS_SCHEDULER_ENABLED", True):
+        health_interval_seconds = max(30, _env_int("HEALTH_REMINDERS_INTERVAL_SECONDS", 60))
+        health_admin_user_id = _env_int("HEALTH_REMINDERS_ADMIN_USER_ID", 1)
+        scheduler.Register(
+            "health_reminders",
+            lambda db: _run_health_reminders(db, health_admin_user_id),
+            interval_seconds=health_interval_seconds,
+            job_logger=reminders_logger,
+        )
+        reminders_logger.info(
+            "health reminders scheduler started (interval=%ss, admin_user_id=%s)",
+            health_interval_seconds,
+            health_admin_user_id,
+        )
+    else:
         reminders_logger.info("health reminders scheduler disabled via env")
-        return
 
-    interval_seconds = max(30, _env_int("HEALTH_REMINDERS_INTERVAL_SECONDS", 60))
-    admin_user_id = _env_int("HEALTH_REMINDERS_ADMIN_USER_ID", 1)
-    reminders_logger.info(
-        "health reminders scheduler started (interval=%ss, admin_user_id=%s)",
-        interval_seconds,
-        admin_user_id,
+    if _env_bool("KIDS_REMINDERS_SCHEDULER_ENABLED", True):
+        kids_interval_seconds = max(30, _env_int("KIDS_REMINDERS_INTERVAL_SECONDS", 60))
+        kids_admin_user_id = _env_int("KIDS_REMINDERS_ADMIN_USER_ID", 1)
+        scheduler.Register(
+            "kids_reminders",
+            lambda db: _run_kids_reminders(db, kids_admin_user_id),
+            interval_seconds=kids_interval_seconds,
+            job_logger=kids_reminders_logger,
+        )
+        kids_reminders_logger.info(
+            "kids reminders scheduler started (interval=%ss, admin_user_id=%s)",
+            kids_interval_seconds,
+            kids_admin_user_id,
+        )
+    else:
+        kids_reminders_logger.info("kids reminders scheduler disabled via env")
+
+    health_enabled = _env_bool("HEALTH_REMINDERS_SCHEDULER_ENABLED", True)
+    kids_enabled = _env_bool("KIDS_REMINDERS_SCHEDULER_ENABLED", True)
+    if health_enabled or kids_enabled:
+        sync_interval_seconds = max(300, _env_int("REMINDER_SCHEDULE_SYNC_INTERVAL_SECONDS", 3600))
+        scheduler.Register(
+            "reminder_schedule_sync",
+            lambda db: _run_reminder_schedule_sync(db, health_enabled, kids_enabled),
+            interval_seconds=sync_interval_seconds,
+            job_logger=reminders_logger,
+            first_run_delay_seconds=next(maintenance_delays),
+        )
+        reminders_logger.info("reminder schedule sync started (interval=%ss)", sync_interval_seconds)
+
+    payout_interval_seconds = max(60, _env_int("KIDS_MONTHLY_PAYOUT_INTERVAL_SECONDS", 3600))
+    scheduler.Register(
+        "kids_monthly_payouts",
+        _run_kids_monthly_payouts,
+        interval_seconds=payout_interval_seconds,
+        job_logger=kids_payout_logger,
+        first_run_delay_seconds=next(maintenance_delays),
+    )
+    kids_payout_logger.info("kids monthly payout job started (interval=%ss)", payout_interval_seconds)
+
+    snapshot_interval_seconds = max(300, _env_int("KIDS_BALANCE_SNAPSHOT_INTERVAL_SECONDS", 86400))
+    scheduler.Register(
+        "kids_balance_snapshots",
+        _run_kids_balance_snapshots,
+        interval_seconds=snapshot_interval_seconds,
+        job_logger=kids_balance_logger,
+        first_run_delay_seconds=next(maintenance_delays),
+    )
+    kids_balance_logger.info("kids balance snapshot reconcile started (interval=%ss)", snapshot_interval_seconds)
+
+    compaction_interval_seconds = max(300, _env_int("KIDS_REMINDER_RUN_COMPACTION_INTERVAL_SECONDS", 86400))
+    retention_days = max(2, _env_int("KIDS_REMINDER_RUN_RETENTION_DAYS", 30))
+    scheduler.Register(
+        "kids_reminder_run_compaction",
+        lambda db: _run_kids_reminder_run_compaction(db, retention_days),
+        interval_seconds=compaction_interval_seconds,
+        job_logger=kids_reminders_logger,
+        first_run_delay_seconds=next(maintenance_delays),
+    )
+    kids_reminders_logger.info(
+        "kids reminder run compaction started (interval=%ss, retention_days=%s)",
+        compaction_interval_seconds,
+        retention_days,
     )
 
-    while not _reminders_stop_event.is_set():
-        started = time.perf_counter()
-        try:
-            db_module._ensure_engine()
-            db = db_module.SessionLocal()
-            try:
-                result = RunDailyHealthReminders(db, admin_user_id=admin_user_id)
-                sent = result.get("NotificationsSent", 0)
-                errors = result.get("Errors", 0)
-                if sent or errors:
-                    reminders_logger.info(
-                        "health reminders run complete eligible=%s processed=%s sent=%s skipped=%s errors=%s",
-                        result.get("EligibleUsers", 0),
-                        result.get("ProcessedUsers", 0),
-                        sent,
-                        result.get("Skipped", 0),
-                        errors,
-                    )
-            finally:
-                db.close()
-        except Exception:  # noqa: BLE001
-            reminders_logger.exception("health reminders scheduler run failed")
-
-        elapsed_seconds = int(time.perf_counter() - started)
-        sleep_for = max(1, interval_seconds - elapsed_seconds)
-        try:
-            await asyncio.wait_for(_reminders_stop_event.wait(), timeout=sleep_for)
-        except asyncio.TimeoutError:
-            continue
+    prune_interval_seconds = max(300, _env_int("HEALTH_LOOKUP_CACHE_PRUNE_INTERVAL_SECONDS", 3600))
+    scheduler.Register(
+        "health_lookup_cache_prune",
+        _run_health_lookup_cache_prune,
+        interval_seconds=prune_interval_seconds,
+        job_logger=lookup_cache_logger,
+        first_run_delay_seconds=next(maintenance_delays),
+    )
+    lookup_cache_logger.info("health lookup cache prune started (interval=%ss)", prune_interval_seconds)
+
+    if IsPushEnabled():
+        outbox_interval_seconds = max(1, _env_int("NOTIFICATIONS_PUSH_OUTBOX_INTERVAL_SECONDS", 5))
+        batch_size = max(1, _env_int("NOTIFICATIONS_PUSH_OUTBOX_BATCH_SIZE", 100))
+        max_attempts = max(1, _env_int("NOTIFICATIONS_PUSH_MAX_ATTEMPTS", 6))
+        scheduler.Register(
+            PUSH_OUTBOX_JOB,
+            lambda db: _run_push_outbox(db, batch_size, max_attempts),
+            interval_seconds=outbox_interval_seconds,
+            job_logger=push_outbox_logger,
+            dedicated_worker=True,
+        )
+        push_outbox_logger.info(
+            "push outbox drainer started (interval=%ss, batch_size=%s, max_attempts=%s)",
+            outbox_interval_seconds,
+            batch_size,
+            max_attempts,
+        )
+
+    if _env_bool("GMAIL_INTAKE_SCHEDULER_ENABLED", False):
+        gmail_interval_seconds = max(60, _env_int("GMAIL_INTAKE_INTERVAL_SECONDS", 600))
+        owner_user_id = _env_int("GMAIL_INTAKE_OWNER_USER_ID", 0)
+        max_messages = max(1, _env_int("GMAIL_INTAKE_MAX_MESSAGES", 10))
+        scheduler.Register(
+            "gmail_intake",
+            lambda db: _run_gmail_intake(db, owner_user_id, max_messages, gmail_interval_seconds),
+            interval_seconds=gmail_interval_seconds,
+            job_logger=gmail_intake_logger,
+        )
+        gmail_intake_logger.info(
+            "gmail intake scheduler started (interval=%ss, owner_user_id=%s, max_messages=%s)",
+            gmail_interval_seconds,
+            owner_user_id,
+            max_messages,
+        )
+    else:
+        gmail_intake_logger.info("gmail intake scheduler disabled via env")
 
 
-async def _kids_reminders_loop() -> None:
-    enabled = _env_bool("KIDS_REMINDERS_SCHEDULER_ENABLED", True)
-    if not enabled:
-        kids_reminders_logger.info("kids reminders scheduler disabled via env")
-        return
+def _run_health_reminders(db: Session, admin_user_id: int) -> None:
+    result = RunDailyHealthReminders(db, admin_user_id=admin_user_id)
+    sent = result.get("NotificationsSent", 0)
+    errors = result.get("Errors", 0)
+    if sent or errors:
+        reminders_logger.info(
+            "health reminders run complete eligible=%s processed=%s sent=%s skipped=%s errors=%s",
+            result.get("EligibleUsers", 0),
+            result.get("ProcessedUsers", 0),
+            sent,
+            result.get("Skipped", 0),
+            errors,
+        )
+
+
+def _run_reminder_schedule_sync(db: Session, health_enabled: bool, kids_enabled: bool) -> None:
+    if health_enabled:
+        users = SyncHealthReminderSchedule(db)
+        reminders_logger.info("health reminder schedule synced users=%s", users)
+    if kids_enabled:
+        kids = SyncKidsReminderSchedule(db)
+        kids_reminders_logger.info("kids reminder schedule synced kids=%s", kids)
+
+
+def _run_kids_monthly_payouts(db: Session) -> None:
+    result = PostMonthlyPayouts(db, today=TodayAdelaide())
+    if result["Posted"]:
+        kids_payout_logger.info(
+            "kids monthly payouts posted kids=%s entries=%s",
+            result["Kids"],
+            result["Posted"],
+        )
+
+
+def _run_kids_balance_snapshots(db: Session) -> None:
+    result = ReconcileBalanceSnapshots(db, today=TodayAdelaide())
+    kids_balance_logger.info(
+        "kids balance snapshots reconciled checked=%s created=%s repaired=%s",
+        result["Checked"],
+        result["Created"],
+        result["Repaired"],
+    )
+
 
-    interval_seconds = max(30, _env_int("KIDS_REMINDERS_INTERVAL_SECONDS", 60))
-    admin_user_id = _env_int("KIDS_REMINDERS_ADMIN_USER_ID", 1)
+def _run_kids_reminder_run_compaction(db: Session, retention_days: int) -> None:
+    result = CompactReminderRuns(db, today=TodayAdelaide(), retention_days=retention_days)
     kids_reminders_logger.info(
-        "kids reminders scheduler started (interval=%ss, admin_user_id=%s)",
-        interval_seconds,
-        admin_user_id,
+        "kids reminder runs compacted skipped_removed=%s expired_removed=%s",
+        result["Compacted"],
+        result["Pruned"],
     )
 
-    while not _kids_reminders_stop_event.is_set():
-        started = time.perf_counter()
-        try:
-            db_module._ensure_engine()
-            db = db_module.SessionLocal()
-            try:
-                result = RunDailyKidsReminders(db, actor_user_id=admin_user_id)
-                sent = result.get("NotificationsSent", 0)
-                errors = result.get("Errors", 0)
-                if sent or errors:
-                    kids_reminders_logger.info(
-                        "kids reminders run complete eligible=%s processed=%s sent=%s skipped=%s errors=%s",
-                        result.get("EligibleKids", 0),
-                        result.get("ProcessedKids", 0),
-                        sent,
-                        result.get("Skipped", 0),
-                        errors,
-                    )
-            finally:
-                db.close()
-        except Exception:  # noqa: BLE001
-            kids_reminders_logger.exception("kids reminders scheduler run failed")
-
-        elapsed_seconds = int(time.perf_counter() - started)
-        sleep_for = max(1, interval_seconds - elapsed_seconds)
-        try:
-            await asyncio.wait_for(_kids_reminders_stop_event.wait(), timeout=sleep_for)
-        except asyncio.TimeoutError:
-            continue
 
+def _run_health_lookup_cache_prune(db: Session) -> None:
+    removed = PruneExpiredLookupCache(db)
+    if removed:
+        lookup_cache_logger.info("health lookup cache pruned removed=%s", removed)
+
+
+def _run_kids_reminders(db: Session, admin_user_id: int) -> None:
+    result = RunDailyKidsReminders(db, actor_user_id=admin_user_id)
+    sent = result.get("NotificationsSent", 0)
+    errors = result.get("Errors", 0)
+    if sent or errors:
+        kids_reminders_logger.info(
+            "kids reminders run complete eligible=%s processed=%s sent=%s skipped=%s errors=%s",
+            result.get("EligibleKids", 0),
+            result.get("ProcessedKids", 0),
+            sent,
+            result.get("Skipped", 0),
+            errors,
+        )
+
+
+def _run_push_outbox(db: Session, batch_size: int, max_attempts: int) -> None:
+    # Keep draining while full batches come back so a burst clears in one run.
+    while True:
+        result = DrainPushOutbox(db, batch_size=batch_size, max_attempts=max_attempts)
+        if result["Claimed"] < batch_size:
+            return
 
-async def _gmail_intake_loop() -> None:
-    enabled = _env_bool("GMAIL_INTAKE_SCHEDULER_ENABLED", False)
-    if not enabled:
-        gmail_intake_logger.info("gmail intake scheduler disabled via env")
-        return
 
-    interval_seconds = max(60, _env_int("GMAIL_INTAKE_INTERVAL_SECONDS", 600))
-    owner_user_id = _env_int("GMAIL_INTAKE_OWNER_USER_ID", 0)
-    max_messages = max(1, _env_int("GMAIL_INTAKE_MAX_MESSAGES", 10))
+def _run_gmail_intake(
+    db: Session,
+    owner_user_id: int,
+    max_messages: int,
+    interval_seconds: int,
+) -> None:
+    resolved_owner = owner_user_id
+    if resolved_owner <= 0:
+        record = db.query(GmailIntegration).first()
+        resolved_owner = record.ConnectedByUserId if record else 0
+    if resolved_owner <= 0:
+        gmail_intake_logger.warning("gmail intake skipped: owner user not resolved")
+        return
+    if not gmail_intake_service.CanStartIntake(
+        db, owner_user_id=resolved_owner, min_seconds=interval_seconds
+    ):
+        gmail_intake_logger.info("gmail intake skipped: previous run still running")
+        return
+    result, document_ids = gmail_intake_service.RunGmailIntake(
+        db,
+        owner_user_id=resolved_owner,
+        max_messages=max_messages,
+        triggered_by_user_id=resolved_owner,
+    )
+    for document_id in document_ids:
+        documents_service.RunAiAnalysis(db, document_id=document_id)
     gmail_intake_logger.info(
-        "gmail intake scheduler started (interval=%ss, owner_user_id=%s, max_messages=%s)",
-        interval_seconds,
-        owner_user_id,
-        max_messages,
+        "gmail intake run complete messages=%s documents=%s errors=%s",
+        result.get("MessagesProcessed", 0),
+        result.get("DocumentsCreated", 0),
+        len(result.get("AttachmentErrors") or []),
     )
 
-    while not _gmail_intake_stop_event.is_set():
-        started = time.perf_counter()
-        try:
-            db_module._ensure_engine()
-            db = db_module.SessionLocal()
-            try:
-                resolved_owner = owner_user_id
-                if resolved_owner <= 0:
-                    record = db.query(GmailIntegration).first()
-                    resolved_owner = record.ConnectedByUserId if record else 0
-                if resolved_owner <= 0:
-                    gmail_intake_logger.warning("gmail intake skipped: owner user not resolved")
-                elif not gmail_intake_service.CanStartIntake(
-                    db, owner_user_id=resolved_owner, min_seconds=interval_seconds
-                ):
-                    gmail_intake_logger.info("gmail intake skipped: previous run still running")
-                else:
-                    result, document_ids = gmail_intake_service.RunGmailIntake(
-                        db,
-                        owner_user_id=resolved_owner,
-                        max_messages=max_messages,
-                        triggered_by_user_id=resolved_owner,
-                    )
-                    for document_id in document_ids:
-                        documents_service.RunAiAnalysis(db, document_id=document_id)
-                    gmail_intake_logger.info(
-                        "gmail intake run complete messages=%s documents=%s errors=%s",
-                        result.get("MessagesProcessed", 0),
-                        result.get("DocumentsCreated", 0),
-                        len(result.get("AttachmentErrors") or []),
-                    )
-            finally:
-                db.close()
-        except Exception:  # noqa: BLE001
-            gmail_intake_logger.exception("gmail intake scheduler run failed")
-
-        elapsed_seconds = int(time.perf_counter() - started)
-        sleep_for = max(1, interval_seconds - elapsed_seconds)
-        try:
-            await asyncio.wait_for(_gmail_intake_stop_event.wait(), timeout=sleep_for)
-        except asyncio.TimeoutError:
-            continue
-
 
 async def _run_startup_db_tasks() -> None:
     retries = _env_int("DB_STARTUP_RETRIES", 12)
@@ -443,6 +586,7 @@ async def _run_startup_db_tasks() -> None:
         try:
             await asyncio.to_thread(EnsureDatabaseSetup)
             await asyncio.to_thread(RunMigrations)
+            await asyncio.to_thread(EnsureSchemaReady)
             startup_logger.info("startup complete")
             return
         except Exception as exc:  # noqa: BLE001
@@ -7,6 +7,7 @@ from app.modules.health.models import (
     AiSuggestion,
     AiSuggestionRun,
     DailyLog,
+    DailyTotals,
     Food,
     HealthReminderRun,
     ImportLog,
@@ -26,6 +27,7 @@ from app.modules.integrations.google.models import (
     GoogleTaskShare,
 )
 from app.modules.kids.models import (
+    BalanceSnapshot,
     Chore,
     ChoreAssignment,
     ChoreEntry,
@@ -36,6 +38,7 @@ from app.modules.kids.models import (
     ReminderRun,
     ReminderSettings,
 )
+from app.modules.kids.services.balance_snapshot_service import ApplyLedgerDelta
 from app.modules.life_admin.models import (
     Document,
     DocumentAiSuggestion,
@@ -51,7 +54,12 @@ from app.modules.life_admin.models import (
     LifeReminder,
 )
 from app.modules.notes.models import Note, NoteAssociation, NoteItem, NoteTag, NoteTaskLink
-from app.modules.notifications.models import Notification, NotificationDeviceRegistration
+from app.modules.notifications.models import (
+    Notification,
+    NotificationDeviceRegistration,
+    NotificationPushOutbox,
+    ReminderSchedule,
+)
 from app.modules.shopping.models import ShoppingItem
 from app.modules.tasks.models import (
     Task,
@@ -237,15 +245,22 @@ def DeleteAccountAndData(db: Session, *, user_id: int) -> dict[str, int]:
     chore_entry_ids = _Ids(chore_entry_query.all())
     if chore_entry_ids:
         deleted_rows += _Delete(db.query(ChoreEntryAudit).filter(ChoreEntryAudit.ChoreEntryId.in_(chore_entry_ids)))
-        deleted_rows += _Delete(
-            db.query(LedgerEntry).filter(
-                LedgerEntry.SourceType == "ChoreEntry",
-                LedgerEntry.SourceId.in_(chore_entry_ids),
-            )
+        chore_ledger_query = db.query(LedgerEntry).filter(
+            LedgerEntry.SourceType == "ChoreEntry",
+            LedgerEntry.SourceId.in_(chore_entry_ids),
         )
+        # These can belong to other kids (chores this user owned); keep their snapshots in step.
+        for kid_user_id, entry_date, amount in chore_ledger_query.with_entities(
+            LedgerEntry.KidUserId,
+            LedgerEntry.EntryDate,
+            LedgerEntry.Amount,
+        ).filter(LedgerEntry.KidUserId != user_id, LedgerEntry.IsDeleted == False):
+            ApplyLedgerDelta(db, kid_user_id=kid_user_id, entry_date=entry_date, amount=-amount)
+        deleted_rows += _Delete(chore_ledger_query)
         deleted_rows += _Delete(db.query(ChoreEntry).filter(ChoreEntry.Id.in_(chore_entry_ids)))
 
     deleted_rows += _Delete(db.query(LedgerEntry).filter(LedgerEntry.KidUserId == user_id))
+    deleted_rows += _Delete(db.query(BalanceSnapshot).filter(BalanceSnapshot.KidUserId == user_id))
     deleted_rows += _Delete(db.query(PocketMoneyRule).filter(PocketMoneyRule.KidUserId == user_id))
     deleted_rows += _Delete(db.query(ReminderSettings).filter(ReminderSettings.KidUserId == user_id))
     deleted_rows += _Delete(db.query(ReminderRun).filter(ReminderRun.KidUserId == user_id))
@@ -268,6 +283,7 @@ def DeleteAccountAndData(db: Session, *, user_id: int) -> dict[str, int]:
     if daily_log_ids:
         deleted_rows += _Delete(db.query(MealEntry).filter(MealEntry.DailyLogId.in_(daily_log_ids)))
     deleted_rows += _Delete(db.query(DailyLog).filter(DailyLog.UserId == user_id))
+    deleted_rows += _Delete(db.query(DailyTotals).filter(DailyTotals.UserId == user_id))
 
     template_ids = _Ids(db.query(MealTemplate.MealTemplateId).filter(MealTemplate.UserId == user_id).all())
     if template_ids:
@@ -314,6 +330,8 @@ def DeleteAccountAndData(db: Session, *, user_id: int) -> dict[str, int]:
 
     # Notifications
     deleted_rows += _Delete(db.query(NotificationDeviceRegistration).filter(NotificationDeviceRegistration.UserId == user_id))
+    deleted_rows += _Delete(db.query(ReminderSchedule).filter(ReminderSchedule.UserId == user_id))
+    deleted_rows += _Delete(db.query(NotificationPushOutbox).filter(NotificationPushOutbox.UserId == user_id))
     deleted_rows += _Delete(db.query(Notification).filter(Notification.UserId == user_id))
 
     # Auth linked tables and account row.
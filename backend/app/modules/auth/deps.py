@@ -8,6 +8,7 @@ from sqlalchemy.orm import Session
 
 from app.db import GetDb
 from app.modules.auth.models import User
+from app.modules.auth.principal_cache import principal_cache
 
 ALLOWED_ROLES = {"Parent", "Kid"}
 
@@ -54,6 +55,11 @@ def RequireAuthenticated(
     except (TypeError, ValueError) as exc:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token") from exc
 
+    cached = principal_cache.Get(user_id)
+    if cached is not None:
+        username, role = cached
+        return UserContext(Id=user_id, Username=username, Role=role)
+
     user = db.query(User).filter(User.Id == user_id).first()
     if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
@@ -63,6 +69,7 @@ def RequireAuthenticated(
             detail="Account pending approval. A parent must approve this account before sign in.",
         )
 
+    principal_cache.Put(user.Id, (user.Username, user.Role))
     return UserContext(Id=user.Id, Username=user.Username, Role=user.Role)
 
 
@@ -0,0 +1,24 @@
+from app.core.env import ReadIntEnv
+from app.core.ttl_cache import TtlLruCache
+
+
+class PrincipalCache(TtlLruCache[int, tuple[str, str]]):
+    """(Username, Role) by user id for RequireAuthenticated.
+
+    Only approved users are cached. Anything that changes a user's role, approval or
+    existence must call Invalidate; the TTL bounds staleness across worker processes.
+    """
+
+
+principal_cache = PrincipalCache(
+    max_entries=ReadIntEnv("AUTH_PRINCIPAL_CACHE_MAX_ENTRIES", 1024),
+    ttl_seconds=ReadIntEnv("AUTH_PRINCIPAL_CACHE_TTL_SECONDS", 60),
+)
+
+
+def InvalidatePrincipal(user_id: int) -> None:
+    principal_cache.Invalidate(user_id)
+
+
+def GetPrincipalCacheStats() -> dict[str, object]:
+    return principal_cache.GetStats()
@@ -16,6 +16,7 @@ from app.modules.auth.account_deletion_service import (
 from app.modules.auth.deps import NowUtc, RequireAuthenticated, UserContext, _require_env
 from app.modules.auth.email import SendPasswordResetEmail
 from app.modules.auth.models import PasswordResetToken, RefreshToken, User
+from app.modules.auth.principal_cache import InvalidatePrincipal
 from app.modules.auth.schemas import (
     ChangePasswordRequest,
     ForgotPasswordRequest,
@@ -34,6 +35,7 @@ from app.modules.auth.service import (
     HashPasswordResetToken,
     HashRefreshToken,
     HashPassword,
+    RecordRefreshTokenLookup,
     VerifyPassword,
     VerifyPasswordResetToken,
     VerifyRefreshToken,
@@ -55,7 +57,7 @@ def _CreateRefreshTokenRecord(user_id: int, refresh_token: str, expires_at) -> R
 
 def _FindRefreshTokenRecord(db: Session, raw_refresh_token: str, now) -> RefreshToken | None:
     lookup_hash = ComputeRefreshTokenLookupHash(raw_refresh_token)
-    exact_match = (
+    match = (
         db.query(RefreshToken)
         .filter(
             RefreshToken.LookupHash == lookup_hash,
@@ -64,26 +66,15 @@ def _FindRefreshTokenRecord(db: Session, raw_refresh_token: str, now) -> Refresh
         )
         .first()
     )
-    if exact_match:
-        if VerifyRefreshToken(raw_refresh_token, exact_match.TokenHash):
-            return exact_match
+    if not match:
+        RecordRefreshTokenLookup("Misses")
         return None
-
-    legacy_tokens = (
-        db.query(RefreshToken)
-        .filter(
-            RefreshToken.LookupHash.is_(None),
-            RefreshToken.RevokedAt.is_(None),
-            RefreshToken.ExpiresAt > now,
-        )
-        .all()
-    )
-    for token in legacy_tokens:
-        if VerifyRefreshToken(raw_refresh_token, token.TokenHash):
-            token.LookupHash = lookup_hash
-            db.add(token)
-            return token
-    return None
+    if not VerifyRefreshToken(raw_refresh_token, match.TokenHash):
+        RecordRefreshTokenLookup("VerifyFailures")
+        logger.warning("refresh token lookup hash matched but verify failed", extra={"user_id": match.UserId})
+        return None
+    RecordRefreshTokenLookup("Matched")
+    return match
 
 
 def _NotifyPendingApproval(db: Session, pending_user: User) -> None:
@@ -278,6 +269,7 @@ def DeleteAccount(
     try:
         summary = DeleteAccountAndData(db, user_id=user.Id)
         db.commit()
+        InvalidatePrincipal(user.Id)
     except ValueError as exc:
         db.rollback()
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
@@ -1,6 +1,7 @@
 import hashlib
 import os
 import secrets
+import threading
 from datetime import timedelta
 
 from passlib.context import CryptContext
@@ -43,6 +44,23 @@ def ComputeRefreshTokenLookupHash(token: str) -> str:
     return hashlib.sha256(token.encode("utf-8")).hexdigest()
 
 
+_refresh_lookup_lock = threading.Lock()
+_refresh_lookup_stats = {"Lookups": 0, "Matched": 0, "Misses": 0, "VerifyFailures": 0}
+
+
+def RecordRefreshTokenLookup(outcome: str) -> None:
+    """Counts refresh-token lookups. Legacy tokens without a LookupHash were retired
+    in 0065, so a client still presenting one shows up as a miss."""
+    with _refresh_lookup_lock:
+        _refresh_lookup_stats["Lookups"] += 1
+        _refresh_lookup_stats[outcome] += 1
+
+
+def GetRefreshTokenLookupStats() -> dict[str, int]:
+    with _refresh_lookup_lock:
+        return dict(_refresh_lookup_stats)
+
+
 def HashRefreshToken(token: str) -> str:
     return pwd_context.hash(token)
 
@@ -69,3 +87,7 @@ def HashApiKey(key: str) -> str:
 
 def VerifyApiKey(key: str, key_hash: str) -> bool:
     return pwd_context.verify(key, key_hash)
+
+
+def ComputeApiKeyLookupHash(key: str) -> str:
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
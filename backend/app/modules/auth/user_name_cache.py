@@ -0,0 +1,50 @@
+from sqlalchemy.orm import Session
+
+from app.core.env import ReadIntEnv
+from app.core.ttl_cache import TtlLruCache
+from app.modules.auth.models import User
+
+
+def DisplayName(user: User) -> str:
+    parts = [user.FirstName, user.LastName]
+    name = " ".join([part for part in parts if part])
+    return name or user.Username
+
+
+class UserNameCache(TtlLruCache[int, str]):
+    """Display names ("First Last", else Username) by user id.
+
+    Anything that changes a user's first or last name must call Invalidate; the TTL
+    bounds staleness across worker processes.
+    """
+
+
+user_name_cache = UserNameCache(
+    max_entries=ReadIntEnv("AUTH_USER_NAME_CACHE_MAX_ENTRIES", 2048),
+    ttl_seconds=ReadIntEnv("AUTH_USER_NAME_CACHE_TTL_SECONDS", 300),
+)
+
+
+def LoadUserNames(db: Session, user_ids: set[int]) -> dict[int, str]:
+    """Display names by user id; only ids missing from the cache hit the database."""
+    if not user_ids:
+        return {}
+    names, missing = user_name_cache.GetMany(user_ids)
+    if missing:
+        loaded = {
+            row.Id: DisplayName(row)
+            for row in db.query(User.Id, User.Username, User.FirstName, User.LastName)
+            .filter(User.Id.in_(missing))
+            .all()
+        }
+        user_name_cache.PutMany(loaded)
+        names.update(loaded)
+    return names
+
+
+def InvalidateUserName(user_id: int) -> None:
+    user_name_cache.Invalidate(user_id)
+
+
+def GetUserNameCacheStats() -> dict[str, object]:
+    return user_name_cache.GetStats()
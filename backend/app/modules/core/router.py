@@ -1,24 +1,52 @@
+import hmac
 import logging
 import os
 import time
 
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from pydantic import BaseModel, Field
+from sqlalchemy.orm import Session
 
 from app.core.logging import format_frontend_message
-from app.modules.notifications.push_service import GetApnsHealthStatus
+from app.core.metrics import RenderMetrics
+from app.core.scheduler import GetSchedulerStats
+from app.db import GetDb
+from app.modules.auth.deps import RequireAuthenticated
+from app.modules.auth.principal_cache import GetPrincipalCacheStats
+from app.modules.auth.service import GetRefreshTokenLookupStats
+from app.modules.auth.user_name_cache import GetUserNameCacheStats
+from app.modules.notifications.push_service import GetApnsHealthStatus, GetPushStats
 
 router = APIRouter(prefix="/api", tags=["health"])
 logger = logging.getLogger("core.health")
 frontend_logger = logging.getLogger("frontend")
 
 
+def _RequireOpsAccess(request: Request, db: Session = Depends(GetDb)) -> None:
+    """Metrics and runtime stats are for the scraper and parents only. A scraper sends
+    METRICS_SCRAPE_TOKEN as its bearer token; anyone else needs a parent session."""
+    scrape_token = os.getenv("METRICS_SCRAPE_TOKEN", "").strip()
+    auth_header = request.headers.get("Authorization", "")
+    if scrape_token and auth_header.startswith("Bearer "):
+        presented = auth_header.replace("Bearer ", "", 1).strip()
+        if hmac.compare_digest(presented.encode(), scrape_token.encode()):
+            return
+    user = RequireAuthenticated(request, db)
+    if user.Role != "Parent":
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
+
+
 @router.get("/health")
 async def api_health() -> dict:
     logger.debug("health check ok")
     return {"status": "ok"}
 
 
+@router.get("/metrics", dependencies=[Depends(_RequireOpsAccess)])
+async def api_metrics() -> Response:
+    return Response(content=RenderMetrics(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
 @router.get("/health/db")
 async def api_health_db() -> dict:
     try:
@@ -79,6 +107,32 @@ async def api_health_push() -> dict:
     }
 
 
+@router.get("/health/push/stats", dependencies=[Depends(_RequireOpsAccess)])
+async def api_health_push_stats() -> dict:
+    return {"status": "ok", "stats": GetPushStats()}
+
+
+@router.get("/health/auth-cache", dependencies=[Depends(_RequireOpsAccess)])
+async def api_health_auth_cache() -> dict:
+    return {
+        "status": "ok",
+        "principal_cache": GetPrincipalCacheStats(),
+        "user_name_cache": GetUserNameCacheStats(),
+    }
+
+
+@router.get("/health/auth-refresh", dependencies=[Depends(_RequireOpsAccess)])
+async def api_health_auth_refresh() -> dict:
+    return {"status": "ok", "refresh_tokens": GetRefreshTokenLookupStats()}
+
+
+@router.get("/health/scheduler", dependencies=[Depends(_RequireOpsAccess)])
+async def api_health_scheduler() -> dict:
+    jobs = GetSchedulerStats()
+    failing = any(stats["LastRunFailed"] for stats in jobs.values())
+    return {"status": "error" if failing else "ok", "jobs": jobs}
+
+
 class FrontendLogPayload(BaseModel):
     level: str = Field(default="info", max_length=16)
     message: str = Field(..., max_length=2000)
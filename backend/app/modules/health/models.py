@@ -5,6 +5,7 @@ from sqlalchemy import (
     Column,
     Date,
     DateTime,
+    Index,
     Integer,
     Numeric,
     String,
@@ -96,6 +97,7 @@ class Settings(Base):
     ReminderTimeZone = Column(String(64))
     HaeApiKeyHash = Column(Text)
     HaeApiKeyLast4 = Column(String(8))
+    HaeApiKeyLookupHash = Column(String(64), index=True)
     HaeApiKeyCreatedAt = Column(DateTime(timezone=True))
     CreatedAt = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
 
@@ -121,6 +123,33 @@ class DailyLog(Base):
     CreatedAt = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
 
 
+# Per-day rollup of a daily log: raw (unrounded) nutrient sums of its entries plus steps
+# and weight, clustered on (UserId, LogDate) so history, charts and summaries are one
+# range scan. Kept current by daily_logs_service; Total* stay NULL until first computed.
+class DailyTotals(Base):
+    __tablename__ = "daily_totals"
+    __table_args__ = (
+        Index("ix_health_daily_totals_daily_log_id", "DailyLogId", unique=True),
+        {"schema": "health"},
+    )
+
+    UserId = Column(Integer, primary_key=True)
+    LogDate = Column(Date, primary_key=True)
+    DailyLogId = Column(String(36), nullable=False)
+    Steps = Column(Integer, nullable=False, default=0)
+    StepKcalFactorOverride = Column(Numeric(10, 4))
+    WeightKg = Column(Numeric(6, 2))
+    TotalCalories = Column(Numeric(14, 6))
+    TotalProtein = Column(Numeric(14, 6))
+    TotalFibre = Column(Numeric(14, 6))
+    TotalCarbs = Column(Numeric(14, 6))
+    TotalFat = Column(Numeric(14, 6))
+    TotalSaturatedFat = Column(Numeric(14, 6))
+    TotalSugar = Column(Numeric(14, 6))
+    TotalSodium = Column(Numeric(14, 6))
+    NutritionUpdatedAt = Column(DateTime(timezone=True))
+
+
 class MealEntry(Base):
     __tablename__ = "meal_entries"
     __table_args__ = {"schema": "health"}
@@ -172,6 +201,17 @@ class MealTemplate(Base):
     Servings = Column(Numeric(10, 2), nullable=False, default=1)
     IsFavourite = Column(Boolean, nullable=False, default=False)
     CreatedAt = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
+    # Whole-recipe nutrient totals, kept in step with the items and their foods by
+    # template_nutrition_service. Divide by Servings for per-serving values.
+    TotalCalories = Column(Numeric(14, 6))
+    TotalProtein = Column(Numeric(14, 6))
+    TotalFibre = Column(Numeric(14, 6))
+    TotalCarbs = Column(Numeric(14, 6))
+    TotalFat = Column(Numeric(14, 6))
+    TotalSaturatedFat = Column(Numeric(14, 6))
+    TotalSugar = Column(Numeric(14, 6))
+    TotalSodium = Column(Numeric(14, 6))
+    NutritionUpdatedAt = Column(DateTime(timezone=True))
 
 
 class MealTemplateItem(Base):
@@ -306,3 +346,16 @@ class AiSuggestion(Base):
     Title = Column(String(200), nullable=False)
     Detail = Column(Text, nullable=False)
     CreatedAt = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
+
+
+# Shared by every worker so food lookups survive restarts; see services/lookup_cache.py.
+class LookupCacheEntry(Base):
+    __tablename__ = "lookup_cache"
+    __table_args__ = {"schema": "health"}
+
+    CacheKey = Column(String(450), primary_key=True)
+    Namespace = Column(String(40), nullable=False)
+    Payload = Column(Text, nullable=False)
+    IsNegative = Column(Boolean, nullable=False, default=False)
+    ExpiresAt = Column(DateTime(timezone=True), nullable=False, index=True)
+    CreatedAt = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
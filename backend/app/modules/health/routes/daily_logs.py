@@ -4,7 +4,7 @@ from fastapi import APIRouter, Depends, HTTPException, Response, status
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
-from app.db import GetDb
+from app.db import AsyncDbSession, AsyncGetDb, GetDb
 from app.modules.auth.deps import RequireModuleRole, UserContext
 from app.modules.health.schemas import (
     CreateDailyLogInput,
@@ -69,14 +69,9 @@ def CreateDailyLogRoute(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
 
 
-@router.get("/{log_date}", response_model=DailyLogResponse)
-def GetDailyLog(
-    log_date: str,
-    db: Session = Depends(GetDb),
-    user: UserContext = Depends(RequireModuleRole("health", write=False)),
-) -> DailyLogResponse:
-    daily_log = GetDailyLogByDate(db, user.Id, log_date)
-    settings = GetSettings(db, user.Id)
+def _LoadDailyLog(db: Session, user_id: int, log_date: str) -> DailyLogResponse:
+    daily_log = GetDailyLogByDate(db, user_id, log_date)
+    settings = GetSettings(db, user_id)
 
     if daily_log is None:
         empty_totals = CalculateDailyTotals([], 0, settings.StepKcalFactor, settings)
@@ -89,7 +84,7 @@ def GetDailyLog(
             Targets=settings,
         )
 
-    entries = GetEntriesForLog(db, user.Id, daily_log.DailyLogId)
+    entries = GetEntriesForLog(db, user_id, daily_log.DailyLogId)
     step_factor = (
         daily_log.StepKcalFactorOverride
         if daily_log.StepKcalFactorOverride is not None
@@ -107,6 +102,15 @@ def GetDailyLog(
     )
 
 
+@router.get("/{log_date}", response_model=DailyLogResponse)
+async def GetDailyLog(
+    log_date: str,
+    db: AsyncDbSession = Depends(AsyncGetDb),
+    user: UserContext = Depends(RequireModuleRole("health", write=False)),
+) -> DailyLogResponse:
+    return await db.run_sync(_LoadDailyLog, user.Id, log_date)
+
+
 @router.get("/weights/history", response_model=WeightHistoryResponse)
 def GetWeightHistoryRoute(
     start_date: str,
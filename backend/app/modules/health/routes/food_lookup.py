@@ -1,9 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
+from sqlalchemy.orm import Session
 
+from app.db import AsyncDbSession, AsyncGetDb, GetDb
 from app.modules.auth.deps import RequireModuleRole, UserContext
 from app.modules.health.schemas import FoodInfo, ImageScanInput, ImageScanResponse
 from app.modules.health.services.food_lookup_service import (
+    GetAiLookupCacheStats,
     GetFoodSuggestions,
     LookupFoodByBarcode,
     LookupFoodByImage,
@@ -64,10 +67,11 @@ class BarcodeLookupResponse(BaseModel):
 @router.post("/text", response_model=TextLookupResponse)
 def LookupByText(
     payload: TextLookupInput,
+    db: Session = Depends(GetDb),
     user: UserContext = Depends(RequireModuleRole("health", write=False)),
 ) -> TextLookupResponse:
     try:
-        result = LookupFoodByText(payload.Query)
+        result = LookupFoodByText(db, payload.Query)
         return TextLookupResponse(Result=FoodLookupResponse(**result.ToDict()))
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
@@ -78,10 +82,11 @@ def LookupByText(
 @router.post("/text-options", response_model=TextLookupOptionsResponse)
 def LookupByTextOptions(
     payload: TextLookupInput,
+    db: Session = Depends(GetDb),
     user: UserContext = Depends(RequireModuleRole("health", write=False)),
 ) -> TextLookupOptionsResponse:
     try:
-        results = LookupFoodByTextOptions(payload.Query)
+        results = LookupFoodByTextOptions(db, payload.Query)
         return TextLookupOptionsResponse(
             Results=[FoodLookupResponse(**result.ToDict()) for result in results]
         )
@@ -141,10 +146,11 @@ class FoodSuggestionsResponse(BaseModel):
 def GetFoodSuggestionsRoute(
     q: str = Query(..., min_length=2, description="Search query"),
     limit: int = Query(10, ge=1, le=20, description="Maximum suggestions"),
+    db: Session = Depends(GetDb),
     user: UserContext = Depends(RequireModuleRole("health", write=False)),
 ) -> FoodSuggestionsResponse:
     try:
-        suggestions = GetFoodSuggestions(q)
+        suggestions = GetFoodSuggestions(db, q)
         if len(suggestions) > limit:
             suggestions = suggestions[:limit]
         return FoodSuggestionsResponse(Suggestions=suggestions)
@@ -152,6 +158,13 @@ def GetFoodSuggestionsRoute(
         raise HTTPException(status_code=500, detail="Failed to get suggestions.") from exc
 
 
+@router.get("/ai/cache-stats")
+def GetAiCacheStats(
+    user: UserContext = Depends(RequireModuleRole("health", write=False)),
+):
+    return GetAiLookupCacheStats()
+
+
 class MultiSourceSearchInput(BaseModel):
     Query: str
 
@@ -164,10 +177,11 @@ class MultiSourceSearchResponse(BaseModel):
 @router.post("/multi-source/search", response_model=MultiSourceSearchResponse)
 async def MultiSourceSearch(
     payload: MultiSourceSearchInput,
+    db: AsyncDbSession = Depends(AsyncGetDb),
     user: UserContext = Depends(RequireModuleRole("health", write=False)),
 ) -> MultiSourceSearchResponse:
     try:
-        results = await MultiSourceFoodLookupService.Search(payload.Query)
+        results = await MultiSourceFoodLookupService.Search(payload.Query, db)
         return MultiSourceSearchResponse(
             Openfoodfacts=results.get("openfoodfacts", []),
             AiFallbackAvailable=results.get("ai_fallback_available", True),
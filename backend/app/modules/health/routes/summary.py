@@ -4,7 +4,11 @@ from sqlalchemy.orm import Session
 from app.db import GetDb
 from app.modules.auth.deps import RequireModuleRole, UserContext
 from app.modules.health.schemas import WeeklySummary
-from app.modules.health.services.summary_service import GetWeeklySummary
+from app.modules.health.services.summary_service import (
+    GetMonthlySummary,
+    GetRangeSummary,
+    GetWeeklySummary,
+)
 
 router = APIRouter()
 
@@ -19,3 +23,28 @@ def GetWeeklySummaryRoute(
         return GetWeeklySummary(db, user.Id, start_date)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+
+@router.get("/monthly", response_model=WeeklySummary)
+def GetMonthlySummaryRoute(
+    month: str,
+    db: Session = Depends(GetDb),
+    user: UserContext = Depends(RequireModuleRole("health", write=False)),
+) -> WeeklySummary:
+    try:
+        return GetMonthlySummary(db, user.Id, month)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+
+@router.get("/range", response_model=WeeklySummary)
+def GetRangeSummaryRoute(
+    start_date: str,
+    end_date: str,
+    db: Session = Depends(GetDb),
+    user: UserContext = Depends(RequireModuleRole("health", write=False)),
+) -> WeeklySummary:
+    try:
+        return GetRangeSummary(db, user.Id, start_date, end_date)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
@@ -2,8 +2,12 @@ import json
 from datetime import timedelta
 
 from app.modules.health.schemas import Suggestion
-from app.modules.health.models import AiSuggestion, AiSuggestionRun, DailyLog as DailyLogModel
-from app.modules.health.services.daily_logs_service import GetDailyLogByDate, GetEntriesForLog
+from app.modules.health.models import AiSuggestion, AiSuggestionRun, DailyTotals as DailyTotalsModel
+from app.modules.health.services.daily_logs_service import (
+    GetDailyLogByDate,
+    GetEntriesForDateRange,
+    GetEntriesForLog,
+)
 from app.modules.health.services.settings_service import GetSettings
 from app.modules.health.services.summary_service import GetWeeklySummary
 from app.modules.health.services.openai_client import GetOpenAiContentWithModel
@@ -65,18 +69,19 @@ def _ExtractJsonArray(Content: str) -> str:
 def _BuildRecentEntriesContext(db, UserId: int, LogDateValue, days: int = 7) -> list[str]:
     start_date = LogDateValue - timedelta(days=days - 1)
     rows = (
-        db.query(DailyLogModel)
+        db.query(DailyTotalsModel.DailyLogId, DailyTotalsModel.LogDate)
         .filter(
-            DailyLogModel.UserId == UserId,
-            DailyLogModel.LogDate >= start_date,
-            DailyLogModel.LogDate <= LogDateValue,
+            DailyTotalsModel.UserId == UserId,
+            DailyTotalsModel.LogDate >= start_date,
+            DailyTotalsModel.LogDate <= LogDateValue,
         )
-        .order_by(DailyLogModel.LogDate.asc())
+        .order_by(DailyTotalsModel.LogDate.asc())
         .all()
     )
+    entries_by_log = GetEntriesForDateRange(db, UserId, start_date, LogDateValue) if rows else {}
     lines: list[str] = []
     for log in rows:
-        entries = GetEntriesForLog(db, UserId, log.DailyLogId)
+        entries = entries_by_log.get(log.DailyLogId, [])
         if not entries:
             continue
         for entry in entries:
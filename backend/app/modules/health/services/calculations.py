@@ -9,20 +9,36 @@ def RoundNutrient(Value: float) -> float:
     return round(Value * 10) / 10
 
 
+def SumEntryNutrients(Entries: list[MealEntryWithFood]) -> dict[str, float]:
+    """Unrounded nutrient sums keyed Calories, Protein, Fibre, Carbs, Fat, SaturatedFat,
+    Sugar and Sodium; what CalculateDailyTotals rounds and the daily rollup stores."""
+    return {
+        "Calories": sum(Entry.CaloriesPerServing * Entry.Quantity for Entry in Entries),
+        "Protein": sum(Entry.ProteinPerServing * Entry.Quantity for Entry in Entries),
+        "Fibre": sum((Entry.FibrePerServing or 0) * Entry.Quantity for Entry in Entries),
+        "Carbs": sum((Entry.CarbsPerServing or 0) * Entry.Quantity for Entry in Entries),
+        "Fat": sum((Entry.FatPerServing or 0) * Entry.Quantity for Entry in Entries),
+        "SaturatedFat": sum((Entry.SaturatedFatPerServing or 0) * Entry.Quantity for Entry in Entries),
+        "Sugar": sum((Entry.SugarPerServing or 0) * Entry.Quantity for Entry in Entries),
+        "Sodium": sum((Entry.SodiumPerServing or 0) * Entry.Quantity for Entry in Entries),
+    }
+
+
 def CalculateDailyTotals(
     Entries: list[MealEntryWithFood],
     Steps: int,
     StepKcalFactor: float,
     Targets: Targets,
 ) -> DailyTotals:
-    TotalCaloriesRaw = sum(Entry.CaloriesPerServing * Entry.Quantity for Entry in Entries)
-    TotalProteinRaw = sum(Entry.ProteinPerServing * Entry.Quantity for Entry in Entries)
-    TotalFibreRaw = sum((Entry.FibrePerServing or 0) * Entry.Quantity for Entry in Entries)
-    TotalCarbsRaw = sum((Entry.CarbsPerServing or 0) * Entry.Quantity for Entry in Entries)
-    TotalFatRaw = sum((Entry.FatPerServing or 0) * Entry.Quantity for Entry in Entries)
-    TotalSaturatedFatRaw = sum((Entry.SaturatedFatPerServing or 0) * Entry.Quantity for Entry in Entries)
-    TotalSugarRaw = sum((Entry.SugarPerServing or 0) * Entry.Quantity for Entry in Entries)
-    TotalSodiumRaw = sum((Entry.SodiumPerServing or 0) * Entry.Quantity for Entry in Entries)
+    Sums = SumEntryNutrients(Entries)
+    TotalCaloriesRaw = Sums["Calories"]
+    TotalProteinRaw = Sums["Protein"]
+    TotalFibreRaw = Sums["Fibre"]
+    TotalCarbsRaw = Sums["Carbs"]
+    TotalFatRaw = Sums["Fat"]
+    TotalSaturatedFatRaw = Sums["SaturatedFat"]
+    TotalSugarRaw = Sums["Sugar"]
+    TotalSodiumRaw = Sums["Sodium"]
 
     SafeSteps = max(0, round(Steps))
     CaloriesBurnedRaw = SafeSteps * StepKcalFactor
@@ -87,6 +103,24 @@ def BuildDailySummary(LogDate, Steps: int, Totals: DailyTotals) -> DailySummary:
     )
 
 
+def BuildDailySummaryFromSums(LogDate, Steps: int, StepKcalFactor: float, Sums: dict[str, float]) -> DailySummary:
+    """Same result as BuildDailySummary(CalculateDailyTotals(...)) from stored raw sums."""
+    SafeSteps = max(0, round(Steps))
+    return DailySummary(
+        LogDate=LogDate,
+        TotalCalories=RoundCalories(Sums["Calories"]),
+        TotalProtein=RoundNutrient(Sums["Protein"]),
+        TotalFibre=RoundNutrient(Sums["Fibre"]),
+        TotalCarbs=RoundNutrient(Sums["Carbs"]),
+        TotalFat=RoundNutrient(Sums["Fat"]),
+        TotalSaturatedFat=RoundNutrient(Sums["SaturatedFat"]),
+        TotalSugar=RoundNutrient(Sums["Sugar"]),
+        TotalSodium=RoundNutrient(Sums["Sodium"]),
+        Steps=SafeSteps,
+        NetCalories=RoundCalories(Sums["Calories"] - SafeSteps * StepKcalFactor),
+    )
+
+
 def CalculateWeeklySummary(Days: list[DailySummary]) -> WeeklySummary:
     Count = max(len(Days), 1)
     Totals = {
@@ -3,16 +3,16 @@ from datetime import datetime, timezone
 import uuid
 from datetime import date
 
-from sqlalchemy import func
+from sqlalchemy import func, or_
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.modules.auth.models import User
 from app.modules.health.models import DailyLog as DailyLogModel
+from app.modules.health.models import DailyTotals as DailyTotalsModel
 from app.modules.health.models import Food as FoodModel
 from app.modules.health.models import MealEntry as MealEntryModel
 from app.modules.health.models import MealTemplate as MealTemplateModel
-from app.modules.health.models import MealTemplateItem as MealTemplateItemModel
 from app.modules.health.models import ScheduleSlot as ScheduleSlotModel
 from app.modules.health.schemas import (
     CreateDailyLogInput,
@@ -25,8 +25,14 @@ from app.modules.health.schemas import (
     UpdateMealEntryInput,
     WeightHistoryEntry,
 )
+from app.modules.health.services.calculations import SumEntryNutrients
 from app.modules.health.services.portion_entry_service import BuildPortionValues
 from app.modules.health.services.metric_entries_service import RecordMetricEntry
+from app.modules.health.services.template_nutrition_service import (
+    NUTRIENT_KEYS,
+    ComputeTemplateTotals,
+    StoredTemplateTotals,
+)
 from app.modules.health.utils.dates import ParseIsoDate
 from app.modules.notifications.services import CreateNotification
 
@@ -96,14 +102,14 @@ def GetWeightHistory(
     if EndValue < StartValue:
         raise ValueError("End date must be on or after the start date.")
     rows = (
-        db.query(DailyLogModel)
+        db.query(DailyTotalsModel.LogDate, DailyTotalsModel.WeightKg)
         .filter(
-            DailyLogModel.UserId == UserId,
-            DailyLogModel.LogDate >= StartValue,
-            DailyLogModel.LogDate <= EndValue,
-            DailyLogModel.WeightKg.isnot(None),
+            DailyTotalsModel.UserId == UserId,
+            DailyTotalsModel.LogDate >= StartValue,
+            DailyTotalsModel.LogDate <= EndValue,
+            DailyTotalsModel.WeightKg.isnot(None),
         )
-        .order_by(DailyLogModel.LogDate.asc())
+        .order_by(DailyTotalsModel.LogDate.asc())
         .all()
     )
     return [
@@ -124,13 +130,13 @@ def GetStepsHistory(
     if EndValue < StartValue:
         raise ValueError("End date must be on or after the start date.")
     rows = (
-        db.query(DailyLogModel)
+        db.query(DailyTotalsModel.LogDate, DailyTotalsModel.Steps)
         .filter(
-            DailyLogModel.UserId == UserId,
-            DailyLogModel.LogDate >= StartValue,
-            DailyLogModel.LogDate <= EndValue,
+            DailyTotalsModel.UserId == UserId,
+            DailyTotalsModel.LogDate >= StartValue,
+            DailyTotalsModel.LogDate <= EndValue,
         )
-        .order_by(DailyLogModel.LogDate.asc())
+        .order_by(DailyTotalsModel.LogDate.asc())
         .all()
     )
     return [StepsHistoryEntry(LogDate=row.LogDate, Steps=int(row.Steps or 0)) for row in rows]
@@ -157,54 +163,30 @@ def _BuildMealEntrySchema(entry: MealEntryModel) -> MealEntry:
     )
 
 
-def _BuildTemplateTotals(db: Session, MealTemplateId: str) -> dict:
-    rows = (
-        db.query(MealTemplateItemModel, FoodModel)
-        .join(FoodModel, FoodModel.FoodId == MealTemplateItemModel.FoodId)
-        .filter(MealTemplateItemModel.MealTemplateId == MealTemplateId)
-        .all()
-    )
-
-    totals = {
-        "Calories": 0.0,
-        "Protein": 0.0,
-        "Fibre": 0.0,
-        "Carbs": 0.0,
-        "Fat": 0.0,
-        "SaturatedFat": 0.0,
-        "Sugar": 0.0,
-        "Sodium": 0.0,
-    }
-
-    for item, food in rows:
-        quantity = float(item.Quantity)
-        totals["Calories"] += int(food.CaloriesPerServing) * quantity
-        totals["Protein"] += float(food.ProteinPerServing) * quantity
-        totals["Fibre"] += float(food.FibrePerServing or 0) * quantity
-        totals["Carbs"] += float(food.CarbsPerServing or 0) * quantity
-        totals["Fat"] += float(food.FatPerServing or 0) * quantity
-        totals["SaturatedFat"] += float(food.SaturatedFatPerServing or 0) * quantity
-        totals["Sugar"] += float(food.SugarPerServing or 0) * quantity
-        totals["Sodium"] += float(food.SodiumPerServing or 0) * quantity
-
-    return totals
-
-
-def GetEntriesForLog(db: Session, UserId: int, DailyLogId: str) -> list[MealEntryWithFood]:
-    rows = (
-        db.query(MealEntryModel, FoodModel, MealTemplateModel)
-        .join(DailyLogModel, DailyLogModel.DailyLogId == MealEntryModel.DailyLogId)
-        .outerjoin(FoodModel, FoodModel.FoodId == MealEntryModel.FoodId)
-        .outerjoin(MealTemplateModel, MealTemplateModel.MealTemplateId == MealEntryModel.MealTemplateId)
-        .filter(MealEntryModel.DailyLogId == DailyLogId, DailyLogModel.UserId == UserId)
-        .order_by(MealEntryModel.MealType, MealEntryModel.SortOrder, MealEntryModel.CreatedAt)
-        .all()
-    )
-
+def _LoadTemplateTotals(db: Session, rows: list) -> dict[str, dict]:
+    """Whole-recipe totals for the templates in rows, read from the template row. Only
+    templates whose totals were never stored fall back to summing their items."""
+    totals_by_template: dict[str, dict] = {}
+    missing: set[str] = set()
+    for entry, _food, template in rows:
+        if not entry.MealTemplateId or entry.MealTemplateId in totals_by_template:
+            continue
+        stored = StoredTemplateTotals(template) if template is not None else None
+        if stored is None:
+            missing.add(entry.MealTemplateId)
+        else:
+            totals_by_template[entry.MealTemplateId] = stored
+    if missing:
+        totals_by_template.update(ComputeTemplateTotals(db, missing))
+    return totals_by_template
+
+
+def _BuildEntriesWithFood(db: Session, rows: list) -> list[MealEntryWithFood]:
+    template_totals = _LoadTemplateTotals(db, rows)
     results: list[MealEntryWithFood] = []
     for entry, food, template in rows:
         if entry.MealTemplateId:
-            totals = _BuildTemplateTotals(db, entry.MealTemplateId)
+            totals = template_totals[entry.MealTemplateId]
             template_name = template.TemplateName if template else "Meal"
             servings = float(template.Servings) if template and template.Servings is not None else 1.0
             if servings <= 0:
@@ -306,6 +288,153 @@ def GetEntriesForLog(db: Session, UserId: int, DailyLogId: str) -> list[MealEntr
     return results
 
 
+def _EntriesWithFoodQuery(db: Session, UserId: int | None):
+    query = (
+        db.query(MealEntryModel, FoodModel, MealTemplateModel)
+        .join(DailyLogModel, DailyLogModel.DailyLogId == MealEntryModel.DailyLogId)
+        .outerjoin(FoodModel, FoodModel.FoodId == MealEntryModel.FoodId)
+        .outerjoin(MealTemplateModel, MealTemplateModel.MealTemplateId == MealEntryModel.MealTemplateId)
+        .order_by(MealEntryModel.MealType, MealEntryModel.SortOrder, MealEntryModel.CreatedAt)
+    )
+    if UserId is not None:
+        query = query.filter(DailyLogModel.UserId == UserId)
+    return query
+
+
+def GetEntriesForLog(db: Session, UserId: int, DailyLogId: str) -> list[MealEntryWithFood]:
+    rows = _EntriesWithFoodQuery(db, UserId).filter(MealEntryModel.DailyLogId == DailyLogId).all()
+    return _BuildEntriesWithFood(db, rows)
+
+
+def GetEntriesForDateRange(
+    db: Session, UserId: int, StartDate: date, EndDate: date
+) -> dict[str, list[MealEntryWithFood]]:
+    """Entries for every daily log in StartDate..EndDate, keyed by DailyLogId, in one
+    query (entries with their food and template, whose stored totals cover template meals)."""
+    rows = (
+        _EntriesWithFoodQuery(db, UserId)
+        .filter(DailyLogModel.LogDate >= StartDate, DailyLogModel.LogDate <= EndDate)
+        .all()
+    )
+    entries_by_log: dict[str, list[MealEntryWithFood]] = {}
+    for entry in _BuildEntriesWithFood(db, rows):
+        entries_by_log.setdefault(entry.DailyLogId, []).append(entry)
+    return entries_by_log
+
+
+_DAILY_TOTALS_BATCH_SIZE = 500
+
+
+def _EntrySumsByLog(db: Session, UserId: int | None, DailyLogIds: list[str]) -> dict[str, dict[str, float]]:
+    rows = _EntriesWithFoodQuery(db, UserId).filter(MealEntryModel.DailyLogId.in_(DailyLogIds)).all()
+    entries_by_log: dict[str, list[MealEntryWithFood]] = {}
+    for entry in _BuildEntriesWithFood(db, rows):
+        entries_by_log.setdefault(entry.DailyLogId, []).append(entry)
+    return {log_id: SumEntryNutrients(entries_by_log.get(log_id, [])) for log_id in DailyLogIds}
+
+
+def RefreshDailyTotals(db: Session, DailyLogIds) -> None:
+    """Recompute the DailyTotals rollup rows for the given daily logs (steps, weight and
+    entry nutrient sums), creating missing rows. Stages the changes; the caller commits."""
+    log_ids = sorted(set(DailyLogIds))
+    if not log_ids:
+        return
+    db.flush()
+    now = datetime.now(tz=timezone.utc)
+    for offset in range(0, len(log_ids), _DAILY_TOTALS_BATCH_SIZE):
+        batch = log_ids[offset : offset + _DAILY_TOTALS_BATCH_SIZE]
+        logs = db.query(DailyLogModel).filter(DailyLogModel.DailyLogId.in_(batch)).all()
+        sums_by_log = _EntrySumsByLog(db, None, batch)
+        rollups = {
+            row.DailyLogId: row
+            for row in db.query(DailyTotalsModel).filter(DailyTotalsModel.DailyLogId.in_(batch)).all()
+        }
+        for log in logs:
+            rollup = rollups.get(log.DailyLogId)
+            if rollup is None:
+                rollup = DailyTotalsModel(UserId=log.UserId, LogDate=log.LogDate, DailyLogId=log.DailyLogId)
+                db.add(rollup)
+            rollup.Steps = log.Steps
+            rollup.StepKcalFactorOverride = log.StepKcalFactorOverride
+            rollup.WeightKg = log.WeightKg
+            for key, value in sums_by_log[log.DailyLogId].items():
+                setattr(rollup, f"Total{key}", value)
+            rollup.NutritionUpdatedAt = now
+
+
+def RefreshDailyTotalsForMeals(
+    db: Session,
+    FoodIds: set[str] | None = None,
+    MealTemplateIds: set[str] | None = None,
+) -> None:
+    """Refresh every day that logged one of the foods or templates, after their
+    nutrients (or a template's servings) change."""
+    conditions = []
+    if FoodIds:
+        conditions.append(MealEntryModel.FoodId.in_(FoodIds))
+    if MealTemplateIds:
+        conditions.append(MealEntryModel.MealTemplateId.in_(MealTemplateIds))
+    if not conditions:
+        return
+    db.flush()
+    log_ids = {
+        log_id
+        for (log_id,) in db.query(MealEntryModel.DailyLogId).filter(or_(*conditions)).distinct().all()
+    }
+    RefreshDailyTotals(db, log_ids)
+
+
+def BackfillDailyTotals(db: Session, BatchSize: int = _DAILY_TOTALS_BATCH_SIZE) -> int:
+    """Compute rollup rows for every daily log that has none or was never summed,
+    committing per batch. Returns the number of logs refreshed."""
+    refreshed = 0
+    while True:
+        log_ids = [
+            log_id
+            for (log_id,) in db.query(DailyLogModel.DailyLogId)
+            .outerjoin(DailyTotalsModel, DailyTotalsModel.DailyLogId == DailyLogModel.DailyLogId)
+            .filter(DailyTotalsModel.NutritionUpdatedAt.is_(None))
+            .order_by(DailyLogModel.DailyLogId)
+            .limit(BatchSize)
+            .all()
+        ]
+        if not log_ids:
+            return refreshed
+        RefreshDailyTotals(db, log_ids)
+        db.commit()
+        refreshed += len(log_ids)
+
+
+def _LoadDailyTotals(db: Session, UserId: int, StartDate: date, EndDate: date):
+    return (
+        db.query(DailyTotalsModel)
+        .filter(
+            DailyTotalsModel.UserId == UserId,
+            DailyTotalsModel.LogDate >= StartDate,
+            DailyTotalsModel.LogDate <= EndDate,
+        )
+        .order_by(DailyTotalsModel.LogDate.asc())
+        .all()
+    )
+
+
+def GetDailyTotalsForDateRange(
+    db: Session, UserId: int, StartDate: date, EndDate: date
+) -> list[tuple[DailyTotalsModel, dict[str, float]]]:
+    """Rollup rows for StartDate..EndDate with their raw nutrient sums, in one range scan.
+    Rows not summed yet (pre-backfill) are summed from their entries, without writing."""
+    rollups = _LoadDailyTotals(db, UserId, StartDate, EndDate)
+    pending = [row.DailyLogId for row in rollups if row.NutritionUpdatedAt is None]
+    computed = _EntrySumsByLog(db, UserId, pending) if pending else {}
+    results = []
+    for row in rollups:
+        sums = computed.get(row.DailyLogId)
+        if sums is None:
+            sums = {key: float(getattr(row, f"Total{key}") or 0) for key in NUTRIENT_KEYS}
+        results.append((row, sums))
+    return results
+
+
 def UpsertDailyLog(db: Session, UserId: int, Input: CreateDailyLogInput) -> DailyLog:
     LogDateValue = ParseIsoDate(Input.LogDate)
     occurred_at = datetime.now(tz=timezone.utc)
@@ -392,6 +521,7 @@ def UpsertDailyLog(db: Session, UserId: int, Input: CreateDailyLogInput) -> Dail
                 "user",
             )
 
+    RefreshDailyTotals(db, {record.DailyLogId})
     db.commit()
     db.refresh(record)
 
@@ -484,6 +614,7 @@ def UpdateSteps(
                 "user",
             )
 
+    RefreshDailyTotals(db, {record.DailyLogId})
     db.commit()
     db.refresh(record)
 
@@ -525,6 +656,7 @@ def EnsureDailyLogForDate(db: Session, UserId: int, LogDate: str) -> DailyLog:
     )
     db.add(record)
     try:
+        RefreshDailyTotals(db, {record.DailyLogId})
         db.commit()
     except IntegrityError:
         db.rollback()
@@ -619,6 +751,7 @@ def CreateMealEntry(db: Session, UserId: int, Input: CreateMealEntryInput) -> Me
     )
 
     db.add(record)
+    RefreshDailyTotals(db, {record.DailyLogId})
     db.commit()
     db.refresh(record)
 
@@ -697,6 +830,7 @@ def DeleteMealEntry(db: Session, UserId: int, MealEntryId: str, IsAdmin: bool =
         raise ValueError("Meal entry not found.")
 
     db.delete(record)
+    RefreshDailyTotals(db, {record.DailyLogId})
     db.commit()
 
 
@@ -758,6 +892,7 @@ def UpdateMealEntry(
     record.EntryNotes = Input.EntryNotes
 
     db.add(record)
+    RefreshDailyTotals(db, {record.DailyLogId})
     db.commit()
     db.refresh(record)
     return _BuildMealEntrySchema(record)
@@ -7,17 +7,62 @@ import re
 from typing import Optional
 
 import httpx
+from sqlalchemy.orm import Session
 
+from app.core.env import ReadIntEnv
+from app.modules.health.services.lookup_cache import PersistentLookupCache
 from app.modules.health.services.openai_client import (
     GetOpenAiContent,
     GetOpenAiContentForModel,
     GetOpenAiContentWithModel,
+    GetOpenAiVisionContent,
 )
 from app.modules.health.utils.config import Settings
 
 Logger = logging.getLogger("health.food_lookup")
 
 
+# AI answers for the same food barely change, so text lookups are kept for a week and
+# autosuggest lists for a day. Keys include the model, so switching models starts fresh.
+ai_text_lookup_cache = PersistentLookupCache(
+    "ai-text",
+    max_entries=ReadIntEnv("HEALTH_AI_LOOKUP_CACHE_MAX_ENTRIES", 512),
+    ttl_seconds=ReadIntEnv("HEALTH_AI_LOOKUP_CACHE_TTL_SECONDS", 604800),
+    negative_ttl_seconds=0,
+)
+ai_suggestion_cache = PersistentLookupCache(
+    "ai-suggest",
+    max_entries=ReadIntEnv("HEALTH_AI_LOOKUP_CACHE_MAX_ENTRIES", 512),
+    ttl_seconds=ReadIntEnv("HEALTH_AI_SUGGESTION_CACHE_TTL_SECONDS", 86400),
+    negative_ttl_seconds=0,
+)
+
+_PLURAL_KEEP_SUFFIXES = ("ss", "us", "is", "ous")
+
+
+def _SingularWord(Word: str) -> str:
+    if len(Word) <= 3 or not Word.endswith("s") or Word.endswith(_PLURAL_KEEP_SUFFIXES):
+        return Word
+    if Word.endswith("ies"):
+        return Word[:-3] + "y"
+    if Word.endswith(("oes", "ches", "shes", "xes")):
+        return Word[:-2]
+    return Word[:-1]
+
+
+def NormalizeFoodQuery(Query: str) -> str:
+    """Cache key form of a food query: lower case, single spaces, simple plurals folded,
+    so "Bananas", " banana " and "BANANA" share one entry."""
+    return " ".join(_SingularWord(Word) for Word in Query.lower().split())
+
+
+def GetAiLookupCacheStats() -> dict[str, dict[str, object]]:
+    return {
+        "TextLookups": ai_text_lookup_cache.GetStats(),
+        "Suggestions": ai_suggestion_cache.GetStats(),
+    }
+
+
 class FoodLookupResult:
     def __init__(
         self,
@@ -139,10 +184,15 @@ def NormalizeFoodLookupResult(FoodData: dict, Query: str) -> FoodLookupResult:
     )
 
 
-def LookupFoodByText(Query: str) -> FoodLookupResult:
+def LookupFoodByText(db: Session, Query: str) -> FoodLookupResult:
     if not Settings.OpenAiApiKey:
         raise ValueError("OpenAI API key not configured.")
 
+    CacheKey = f"text:{Settings.OpenAiModel}:{NormalizeFoodQuery(Query)}"
+    Found, Cached = ai_text_lookup_cache.Get(db, CacheKey)
+    if Found:
+        return FoodLookupResult(**Cached)
+
     SystemPrompt = (
         "You are a nutrition database assistant. When given a food name, return accurate nutritional information in JSON format.\n\n"
         "Return ONLY a JSON object with these exact fields:\n"
@@ -184,13 +234,20 @@ def LookupFoodByText(Query: str) -> FoodLookupResult:
     if not isinstance(FoodData, dict):
         raise ValueError("Invalid AI response format.")
 
-    return NormalizeFoodLookupResult(FoodData, Query)
+    Result = NormalizeFoodLookupResult(FoodData, Query)
+    ai_text_lookup_cache.Put(db, CacheKey, Result.ToDict())
+    return Result
 
 
-def LookupFoodByTextOptions(Query: str) -> list[FoodLookupResult]:
+def LookupFoodByTextOptions(db: Session, Query: str) -> list[FoodLookupResult]:
     if not Settings.OpenAiApiKey:
         raise ValueError("OpenAI API key not configured.")
 
+    CacheKey = f"options:{Settings.OpenAiModel}:{NormalizeFoodQuery(Query)}"
+    Found, Cached = ai_text_lookup_cache.Get(db, CacheKey)
+    if Found:
+        return [FoodLookupResult(**Item) for Item in Cached]
+
     SystemPrompt = (
         "You are a nutrition database assistant. When given a food name, return multiple size options in JSON format.\n\n"
         "Return ONLY a JSON array of 1 to 10 objects with these exact fields:\n"
@@ -258,6 +315,7 @@ def LookupFoodByTextOptions(Query: str) -> list[FoodLookupResult]:
 
     if not Results:
         raise ValueError("No valid options returned from AI.")
+    ai_text_lookup_cache.Put(db, CacheKey, [Result.ToDict() for Result in Results])
     return Results
 
 
@@ -295,35 +353,7 @@ def LookupFoodByImage(ImageBase64: str) -> list[FoodLookupResult]:
         "Provide reasonable estimates based on portion size visible in the image."
     )
 
-    Payload = {
-        "model": "gpt-4o",
-        "messages": [
-            {
-                "role": "user",
-                "content": [
-                    {"type": "text", "text": SystemPrompt},
-                    {"type": "image_url", "image_url": {"url": f"data:image/jpeg;base64,{ImageBase64}"}},
-                ],
-            }
-        ],
-        "temperature": 0.3,
-        "max_tokens": 1000,
-    }
-
-    Headers = {
-        "Authorization": f"Bearer {Settings.OpenAiApiKey}",
-        "Content-Type": "application/json",
-    }
-
-    Response = httpx.post(
-        "https://api.openai.com/v1/chat/completions",
-        headers=Headers,
-        json=Payload,
-        timeout=60.0,
-    )
-    Response.raise_for_status()
-    Data = Response.json()
-    Content = Data.get("choices", [{}])[0].get("message", {}).get("content", "")
+    Content = GetOpenAiVisionContent("gpt-4o", SystemPrompt, ImageBase64, Temperature=0.3)
 
     FoodData = ParseLookupJson(Content)
     if not isinstance(FoodData, list):
@@ -410,17 +440,23 @@ def LookupFoodByBarcode(Barcode: str) -> FoodLookupResult | None:
     )
 
 
-def GetFoodSuggestions(Query: str) -> list[str]:
+def GetFoodSuggestions(db: Session, Query: str) -> list[str]:
     if not Settings.OpenAiApiKey:
         return []
 
+    Model = Settings.OpenAiAutosuggestModel or "gpt-5-mini"
+    CacheKey = f"{Model}:{NormalizeFoodQuery(Query)}"
+    Found, Cached = ai_suggestion_cache.Get(db, CacheKey)
+    if Found:
+        return list(Cached)
+
     SystemPrompt = (
         "You are a concise autosuggest assistant for Australian grocery and takeaway items. "
         "Return ONLY a JSON array of 5 to 8 short suggestions. No em dashes."
     )
 
     Content, _ModelUsed = GetOpenAiContentForModel(
-        Settings.OpenAiAutosuggestModel or "gpt-5-mini",
+        Model,
         [
             {"role": "system", "content": SystemPrompt},
             {"role": "user", "content": f"Suggest foods matching: {Query}"},
@@ -434,9 +470,13 @@ def GetFoodSuggestions(Query: str) -> list[str]:
     except ValueError:
         return []
 
-    if isinstance(Parsed, list):
-        return [str(Item) for Item in Parsed if isinstance(Item, str)]
-    return []
+    if not isinstance(Parsed, list):
+        return []
+    Suggestions = [str(Item) for Item in Parsed if isinstance(Item, str)]
+    # Empty lists usually mean a malformed reply, so only real suggestions are cached.
+    if Suggestions:
+        ai_suggestion_cache.Put(db, CacheKey, Suggestions)
+    return Suggestions
 
 
 def ParseImageToBase64(ImageBytes: bytes) -> str:
@@ -10,7 +10,9 @@ from app.modules.health.models import MealEntry as MealEntryModel
 from app.modules.health.models import MealTemplate as MealTemplateModel
 from app.modules.health.models import MealTemplateItem as MealTemplateItemModel
 from app.modules.health.schemas import CreateFoodInput, Food, UpdateFoodInput
+from app.modules.health.services.daily_logs_service import RefreshDailyTotalsForMeals
 from app.modules.health.services.food_image_service import SaveFoodImage, TryRemoveFoodImage
+from app.modules.health.services.template_nutrition_service import RefreshTemplateNutritionForFood
 from app.modules.health.utils.defaults import DefaultFoods
 
 
@@ -210,6 +212,19 @@ def UpdateFood(db: Session, UserId: int, FoodId: str, Input: UpdateFoodInput, Is
         existing.ServingUnit = new_unit
         existing.ServingDescription = f"{new_quantity} {new_unit}".strip()
 
+    nutrients_changed = any(
+        getattr(Input, field) is not None
+        for field in (
+            "CaloriesPerServing",
+            "ProteinPerServing",
+            "FibrePerServing",
+            "CarbsPerServing",
+            "FatPerServing",
+            "SaturatedFatPerServing",
+            "SugarPerServing",
+            "SodiumPerServing",
+        )
+    )
     if Input.CaloriesPerServing is not None:
         existing.CaloriesPerServing = _RoundCalories(Input.CaloriesPerServing)
     if Input.ProteinPerServing is not None:
@@ -234,6 +249,9 @@ def UpdateFood(db: Session, UserId: int, FoodId: str, Input: UpdateFoodInput, Is
         TryRemoveFoodImage(previous_image)
 
     db.add(existing)
+    if nutrients_changed:
+        template_ids = RefreshTemplateNutritionForFood(db, FoodId)
+        RefreshDailyTotalsForMeals(db, FoodIds={FoodId}, MealTemplateIds=template_ids)
     db.commit()
     db.refresh(existing)
     return _BuildFood(existing)
@@ -14,7 +14,7 @@ from app.modules.health.models import DailyLog as DailyLogModel
 from app.modules.health.models import ImportLog as ImportLogModel
 from app.modules.health.models import MetricEntry as MetricEntryModel
 from app.modules.health.services.metric_entries_service import ApplyMetricToDailyLog
-from app.modules.health.services.daily_logs_service import UpdateUserWeightFromLatestLog
+from app.modules.health.services.daily_logs_service import RefreshDailyTotals, UpdateUserWeightFromLatestLog
 
 logger = logging.getLogger("health.hae_import")
 
@@ -132,6 +132,7 @@ def ImportHealthAutoExportPayload(
     )
     db.add(import_log)
 
+    RefreshDailyTotals(db, {record.DailyLogId for record in existing_logs.values()})
     db.commit()
 
     if weight_updated:
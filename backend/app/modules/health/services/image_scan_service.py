@@ -2,9 +2,8 @@
 
 from typing import Any
 
-import httpx
-
 from app.modules.health.services.food_lookup_service import ParseLookupJson
+from app.modules.health.services.openai_client import GetOpenAiVisionContent
 from app.modules.health.services.serving_conversion_service import NormalizeUnit
 from app.modules.health.utils.config import Settings
 
@@ -152,39 +151,7 @@ def _RequestVisionContent(Prompt: str, ImageBase64: str) -> str:
         raise ValueError("OpenAI API key not configured.")
     if not ImageBase64:
         raise ValueError("Image data is required.")
-
-    Payload = {
-        "model": DEFAULT_VISION_MODEL,
-        "messages": [
-            {
-                "role": "user",
-                "content": [
-                    {"type": "text", "text": Prompt},
-                    {
-                        "type": "image_url",
-                        "image_url": {"url": f"data:image/jpeg;base64,{ImageBase64}"},
-                    },
-                ],
-            }
-        ],
-        "temperature": 0.2,
-        "max_tokens": 1000,
-    }
-
-    Headers = {
-        "Authorization": f"Bearer {Settings.OpenAiApiKey}",
-        "Content-Type": "application/json",
-    }
-
-    Response = httpx.post(
-        "https://api.openai.com/v1/chat/completions",
-        headers=Headers,
-        json=Payload,
-        timeout=60.0,
-    )
-    Response.raise_for_status()
-    Data = Response.json()
-    return Data.get("choices", [{}])[0].get("message", {}).get("content", "")
+    return GetOpenAiVisionContent(DEFAULT_VISION_MODEL, Prompt, ImageBase64, Temperature=0.2)
 
 
 def _NormalizeScanResult(Data: dict) -> dict[str, Any]:
@@ -0,0 +1,183 @@
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.modules.health.models import LookupCacheEntry
+
+Logger = logging.getLogger("health.lookup_cache")
+
+
+def _AsUtc(value: datetime) -> datetime:
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+
+class PersistentLookupCache:
+    """Two-tier cache for slow external lookups: a per-process TTL + LRU dict in front of
+    the shared health.lookup_cache table, so results survive restarts and one worker's
+    lookup serves the others.
+
+    Values must be JSON-serialisable. Put(..., Negative=True) records "looked up, nothing
+    found" under the shorter negative TTL so repeated misses skip the upstream call too.
+    Database errors are logged and treated as misses; the cache never fails a lookup.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        max_entries: int,
+        ttl_seconds: float,
+        negative_ttl_seconds: float,
+    ) -> None:
+        self._namespace = namespace
+        self._max_entries = max(0, max_entries)
+        self._ttl_seconds = max(0.0, ttl_seconds)
+        self._negative_ttl_seconds = max(0.0, negative_ttl_seconds)
+        self._entries: OrderedDict[str, tuple[float, bool, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._memory_hits = 0
+        self._persistent_hits = 0
+        self._negative_hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._errors = 0
+
+    @property
+    def Enabled(self) -> bool:
+        return self._ttl_seconds > 0
+
+    def _Key(self, key: str) -> str:
+        return f"{self._namespace}:{hashlib.sha256(key.encode('utf-8')).hexdigest()}"
+
+    def _Remember(self, cache_key: str, expires_at: float, negative: bool, value: Any) -> None:
+        if self._max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[cache_key] = (expires_at, negative, value)
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def Get(self, db: Session, key: str) -> tuple[bool, Any]:
+        """(True, value) on a hit, where value is None for a negative entry; (False, None)
+        on a miss."""
+        if not self.Enabled:
+            return False, None
+        cache_key = self._Key(key)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(cache_key)
+                self._memory_hits += 1
+                if entry[1]:
+                    self._negative_hits += 1
+                return True, entry[2]
+            if entry is not None:
+                del self._entries[cache_key]
+
+        wall_now = datetime.now(timezone.utc)
+        try:
+            row = (
+                db.query(LookupCacheEntry.Payload, LookupCacheEntry.IsNegative, LookupCacheEntry.ExpiresAt)
+                .filter(LookupCacheEntry.CacheKey == cache_key, LookupCacheEntry.ExpiresAt > wall_now)
+                .first()
+            )
+        except SQLAlchemyError:
+            Logger.warning("lookup cache read failed namespace=%s", self._namespace, exc_info=True)
+            db.rollback()
+            row = None
+            with self._lock:
+                self._errors += 1
+
+        if row is None:
+            with self._lock:
+                self._misses += 1
+            return False, None
+
+        value = None if row.IsNegative else json.loads(row.Payload)
+        remaining = (_AsUtc(row.ExpiresAt) - wall_now).total_seconds()
+        self._Remember(cache_key, now + remaining, bool(row.IsNegative), value)
+        with self._lock:
+            self._persistent_hits += 1
+            if row.IsNegative:
+                self._negative_hits += 1
+        return True, value
+
+    def Put(self, db: Session, key: str, value: Any, *, Negative: bool = False) -> None:
+        """Store `value` (ignored when Negative) in both tiers and commit it."""
+        ttl_seconds = self._negative_ttl_seconds if Negative else self._ttl_seconds
+        if not self.Enabled or ttl_seconds <= 0:
+            return
+        cache_key = self._Key(key)
+        stored = None if Negative else value
+        self._Remember(cache_key, time.monotonic() + ttl_seconds, Negative, stored)
+        try:
+            db.merge(
+                LookupCacheEntry(
+                    CacheKey=cache_key,
+                    Namespace=self._namespace,
+                    Payload=json.dumps(stored, separators=(",", ":")),
+                    IsNegative=Negative,
+                    ExpiresAt=datetime.now(timezone.utc) + timedelta(seconds=ttl_seconds),
+                    CreatedAt=datetime.now(timezone.utc),
+                )
+            )
+            db.commit()
+        except SQLAlchemyError:
+            # Usually another worker stored the same key first.
+            Logger.warning("lookup cache write failed namespace=%s", self._namespace, exc_info=True)
+            db.rollback()
+            with self._lock:
+                self._errors += 1
+
+    def Clear(self, db: Session | None = None) -> None:
+        """Drop this process's entries, and the shared rows too when given a session."""
+        with self._lock:
+            self._entries.clear()
+        if db is None:
+            return
+        db.query(LookupCacheEntry).filter(LookupCacheEntry.Namespace == self._namespace).delete(
+            synchronize_session=False
+        )
+        db.commit()
+
+    def GetStats(self) -> dict[str, object]:
+        with self._lock:
+            hits = self._memory_hits + self._persistent_hits
+            lookups = hits + self._misses
+            return {
+                "Namespace": self._namespace,
+                "Enabled": self.Enabled,
+                "Size": len(self._entries),
+                "MaxEntries": self._max_entries,
+                "TtlSeconds": self._ttl_seconds,
+                "NegativeTtlSeconds": self._negative_ttl_seconds,
+                "MemoryHits": self._memory_hits,
+                "PersistentHits": self._persistent_hits,
+                "NegativeHits": self._negative_hits,
+                "Misses": self._misses,
+                "HitRatio": round(hits / lookups, 4) if lookups else 0,
+                "Evictions": self._evictions,
+                "Errors": self._errors,
+            }
+
+
+def PruneExpiredLookupCache(db: Session, now: datetime | None = None) -> int:
+    """Delete expired rows for every namespace; returns how many were removed."""
+    cutoff = now or datetime.now(timezone.utc)
+    removed = (
+        db.query(LookupCacheEntry)
+        .filter(LookupCacheEntry.ExpiresAt <= cutoff)
+        .delete(synchronize_session=False)
+    )
+    db.commit()
+    return int(removed or 0)
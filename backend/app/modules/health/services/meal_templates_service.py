@@ -20,9 +20,14 @@ from app.modules.health.schemas import (
     MealTemplateWithItems,
     UpdateMealTemplateInput,
 )
-from app.modules.health.services.daily_logs_service import CreateMealEntry, EnsureDailyLogForDate
+from app.modules.health.services.daily_logs_service import (
+    CreateMealEntry,
+    EnsureDailyLogForDate,
+    RefreshDailyTotalsForMeals,
+)
 from app.modules.health.services.portion_entry_service import BuildServePortion, ResolvePortionBase
 from app.modules.health.services.serving_conversion_service import TryConvertEntryToServings
+from app.modules.health.services.template_nutrition_service import RefreshTemplateNutrition
 
 
 def _ResolveTemplateItemAmount(
@@ -154,6 +159,7 @@ def CreateMealTemplate(db: Session, UserId: int, Input: CreateMealTemplateInput)
         db.add(record)
         items.append(_BuildMealTemplateItem(record, FoodRow))
 
+    RefreshTemplateNutrition(db, {template.MealTemplateId})
     db.commit()
     db.refresh(template)
     return _BuildMealTemplate(template, items)
@@ -254,6 +260,11 @@ def UpdateMealTemplate(
             )
             db.add(record)
 
+        RefreshTemplateNutrition(db, {template.MealTemplateId})
+
+    if Input.Items is not None or Input.Servings is not None:
+        RefreshDailyTotalsForMeals(db, MealTemplateIds={template.MealTemplateId})
+
     db.add(template)
     db.commit()
     db.refresh(template)
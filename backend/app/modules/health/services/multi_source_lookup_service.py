@@ -1,70 +1,88 @@
-"""Food lookup service with simple in-memory caching."""
+"""Food lookup service backed by the shared persistent lookup cache."""
 
-from datetime import datetime, timedelta
 import logging
 from typing import Any
 
+from app.core.env import ReadIntEnv
+from app.db import AsyncDbSession
 from app.modules.health.schemas import FoodInfo
+from app.modules.health.services.lookup_cache import PersistentLookupCache
 from app.modules.health.services.openfoodfacts_service import OpenFoodFactsService
 from app.modules.health.utils.config import Settings
 
 
-_CACHE: dict[str, tuple[Any, datetime]] = {}
-_CACHE_TTL = timedelta(hours=24)
 Logger = logging.getLogger("health.multi_source_lookup")
 
 
+# OpenFoodFacts data changes slowly and its rate limits are strict, so results are kept
+# for a day; misses ("no products", unknown barcode) expire sooner in case they get added.
+food_lookup_cache = PersistentLookupCache(
+    "openfoodfacts",
+    max_entries=ReadIntEnv("HEALTH_FOOD_LOOKUP_CACHE_MAX_ENTRIES", 1024),
+    ttl_seconds=ReadIntEnv("HEALTH_FOOD_LOOKUP_CACHE_TTL_SECONDS", 86400),
+    negative_ttl_seconds=ReadIntEnv("HEALTH_FOOD_LOOKUP_CACHE_NEGATIVE_TTL_SECONDS", 21600),
+)
+
+
+def _NormalizeQuery(Query: str) -> str:
+    return " ".join(Query.lower().split())
+
+
 class MultiSourceFoodLookupService:
     @classmethod
-    async def Search(cls, Query: str) -> dict[str, list[FoodInfo] | bool]:
-        CacheKey = f"search:{Query}"
-        if CacheKey in _CACHE:
-            CachedResults, CachedTime = _CACHE[CacheKey]
-            if datetime.now() - CachedTime < _CACHE_TTL:
-                return CachedResults
-
-        Results: dict[str, list[FoodInfo] | bool] = {
-            "openfoodfacts": [],
+    def _SearchResults(cls, Products: list[FoodInfo]) -> dict[str, list[FoodInfo] | bool]:
+        return {
+            "openfoodfacts": Products,
             "ai_fallback_available": bool(Settings.OpenAiApiKey),
         }
 
+    @classmethod
+    async def Search(cls, Query: str, db: AsyncDbSession) -> dict[str, list[FoodInfo] | bool]:
+        CacheKey = f"search:{_NormalizeQuery(Query)}"
+        Found, Cached = await db.run_sync(food_lookup_cache.Get, CacheKey)
+        if Found:
+            return cls._SearchResults([FoodInfo(**Item) for Item in Cached or []])
+
         try:
-            Results["openfoodfacts"] = await OpenFoodFactsService.SearchProducts(Query, PageSize=10)
+            Products = await OpenFoodFactsService.SearchProducts(Query, PageSize=10)
         except Exception as ErrorValue:
+            # Not cached: a failed call says nothing about the query.
             Logger.warning("openfoodfacts search failed", exc_info=ErrorValue)
+            return cls._SearchResults([])
 
-        _CACHE[CacheKey] = (Results, datetime.now())
-        return Results
+        await db.run_sync(
+            food_lookup_cache.Put,
+            CacheKey,
+            [Product.model_dump() for Product in Products],
+            Negative=not Products,
+        )
+        return cls._SearchResults(Products)
 
     @classmethod
-    async def GetByBarcode(cls, Barcode: str) -> FoodInfo | None:
-        CacheKey = f"barcode:{Barcode}"
-        if CacheKey in _CACHE:
-            CachedResult, CachedTime = _CACHE[CacheKey]
-            if datetime.now() - CachedTime < _CACHE_TTL:
-                return CachedResult
+    async def GetByBarcode(cls, Barcode: str, db: AsyncDbSession) -> FoodInfo | None:
+        CacheKey = f"barcode:{Barcode.strip()}"
+        Found, Cached = await db.run_sync(food_lookup_cache.Get, CacheKey)
+        if Found:
+            return FoodInfo(**Cached) if Cached is not None else None
 
         try:
             Result = await OpenFoodFactsService.GetProductByBarcode(Barcode)
-            if Result:
-                _CACHE[CacheKey] = (Result, datetime.now())
-            return Result
         except Exception as ErrorValue:
             Logger.warning("barcode lookup failed", exc_info=ErrorValue)
             return None
 
+        await db.run_sync(
+            food_lookup_cache.Put,
+            CacheKey,
+            Result.model_dump() if Result else None,
+            Negative=Result is None,
+        )
+        return Result
+
     @classmethod
-    def ClearCache(cls) -> None:
-        global _CACHE
-        _CACHE = {}
+    def ClearCache(cls, db=None) -> None:
+        food_lookup_cache.Clear(db)
 
     @classmethod
     def GetCacheStats(cls) -> dict[str, Any]:
-        Now = datetime.now()
-        ValidEntries = sum(1 for _, (_, CachedTime) in _CACHE.items() if Now - CachedTime < _CACHE_TTL)
-        return {
-            "total_entries": len(_CACHE),
-            "valid_entries": ValidEntries,
-            "expired_entries": len(_CACHE) - ValidEntries,
-            "ttl_hours": _CACHE_TTL.total_seconds() / 3600,
-        }
+        return food_lookup_cache.GetStats()
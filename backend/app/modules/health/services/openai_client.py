@@ -1,7 +1,9 @@
+import time
 from typing import Any
 
 import httpx
 
+from app.core.metrics import openai_request_duration
 from app.modules.health.utils.config import Settings
 
 
@@ -157,12 +159,18 @@ def _RequestOpenAiContent(
         "Content-Type": "application/json",
     }
 
-    Response = httpx.post(
-        Url,
-        headers=Headers,
-        json=Payload,
-        timeout=30.0,
-    )
+    Started = time.perf_counter()
+    Outcome = "error"
+    try:
+        Response = httpx.post(
+            Url,
+            headers=Headers,
+            json=Payload,
+            timeout=30.0,
+        )
+        Outcome = "ok" if Response.status_code < 400 else "error"
+    finally:
+        openai_request_duration.Observe(time.perf_counter() - Started, caller="health", outcome=Outcome)
     try:
         Response.raise_for_status()
     except httpx.HTTPStatusError as ErrorValue:
@@ -233,6 +241,52 @@ def GetOpenAiContentForModel(
     )
 
 
+def GetOpenAiVisionContent(
+    Model: str,
+    Prompt: str,
+    ImageBase64: str,
+    Temperature: float,
+    MaxTokens: int = 1000,
+) -> str:
+    if not Settings.OpenAiApiKey:
+        raise ValueError("OpenAI API key not configured.")
+
+    Payload = {
+        "model": Model,
+        "messages": [
+            {
+                "role": "user",
+                "content": [
+                    {"type": "text", "text": Prompt},
+                    {"type": "image_url", "image_url": {"url": f"data:image/jpeg;base64,{ImageBase64}"}},
+                ],
+            }
+        ],
+        "temperature": Temperature,
+        "max_tokens": MaxTokens,
+    }
+    Headers = {
+        "Authorization": f"Bearer {Settings.OpenAiApiKey}",
+        "Content-Type": "application/json",
+    }
+
+    Started = time.perf_counter()
+    Outcome = "error"
+    try:
+        Response = httpx.post(
+            "https://api.openai.com/v1/chat/completions",
+            headers=Headers,
+            json=Payload,
+            timeout=60.0,
+        )
+        Outcome = "ok" if Response.status_code < 400 else "error"
+    finally:
+        openai_request_duration.Observe(time.perf_counter() - Started, caller="health_vision", outcome=Outcome)
+    Response.raise_for_status()
+    Data = Response.json()
+    return Data.get("choices", [{}])[0].get("message", {}).get("content", "")
+
+
 def GetOpenAiContent(Messages: list[dict[str, Any]], Temperature: float, MaxTokens: int | None = None) -> str:
     Content, _ModelUsed = GetOpenAiContentWithModel(Messages, Temperature, MaxTokens)
     return Content
@@ -11,7 +11,12 @@ from sqlalchemy.orm import Session
 from app.modules.auth.deps import NowUtc
 from app.modules.auth.models import User
 from app.modules.health.models import DailyLog, HealthReminderRun, MealEntry
-from app.modules.health.services.settings_service import EnsureSettingsForUser
+from app.modules.health.models import Settings as SettingsModel
+from app.modules.health.services.settings_service import (
+    BuildReminderScheduleSlots,
+    EnsureSettingsForUser,
+    ResolveReminderScheduleTimeZone,
+)
 from app.modules.tasks.models import TaskSettings
 from app.modules.health.utils.defaults import (
     DefaultFoodReminderSlots,
@@ -19,6 +24,13 @@ from app.modules.health.utils.defaults import (
     DefaultReminderTimeZone,
     DefaultWeightReminderTime,
 )
+from app.modules.notifications.reminder_schedule_service import (
+    AdvanceReminderSchedule,
+    IsReminderScheduleStale,
+    LoadDueReminderSchedule,
+    ResolveScheduledLocalDate,
+    SyncReminderSchedule,
+)
 from app.modules.notifications.services import CreateNotification
 
 logger = logging.getLogger(__name__)
@@ -281,31 +293,180 @@ def _SendWeightReminder(
     )
 
 
-def RunDailyHealthReminders(
-    db: Session,
-    admin_user_id: int,
-    run_date: date | None = None,
-    run_time: str | None = None,
-) -> dict:
-    now = NowUtc()
-    parent_users = db.query(User).filter(User.Role == "Parent").all()
-    parent_ids = [user.Id for user in parent_users]
+def _LoadTaskTimeZones(db: Session, user_ids: list[int]) -> dict[int, str]:
     settings_rows = (
         db.query(TaskSettings)
-        .filter(TaskSettings.UserId.in_(parent_ids))
+        .filter(TaskSettings.UserId.in_(user_ids))
         .all()
-        if parent_ids
+        if user_ids
         else []
     )
-    timezone_by_user_id = {
+    return {
         row.UserId: row.OverdueReminderTimeZone for row in settings_rows if row.OverdueReminderTimeZone
     }
 
-    eligible_users = 0
-    processed_users = 0
-    notifications_sent = 0
-    skipped = 0
-    errors = 0
+
+def SyncHealthReminderSchedule(db: Session) -> int:
+    """Rebuilds the health reminder index for every parent. Picks up new parents and role
+    changes that did not go through UpdateSettings."""
+    parent_ids = [row.Id for row in db.query(User.Id).filter(User.Role == "Parent").all()]
+    settings_by_user = {
+        row.UserId: row
+        for row in (
+            db.query(SettingsModel).filter(SettingsModel.UserId.in_(parent_ids)).all()
+            if parent_ids
+            else []
+        )
+    }
+    timezone_by_user_id = _LoadTaskTimeZones(db, parent_ids)
+
+    slots_by_user: dict[int, tuple[str, dict[str, str]]] = {}
+    for user_id in parent_ids:
+        settings = settings_by_user.get(user_id) or EnsureSettingsForUser(db, user_id)
+        slots_by_user[user_id] = (
+            ResolveReminderScheduleTimeZone(timezone_by_user_id.get(user_id), settings),
+            BuildReminderScheduleSlots(settings),
+        )
+    SyncReminderSchedule(db, source_module="health", slots_by_user=slots_by_user, now=NowUtc())
+    db.commit()
+    return len(slots_by_user)
+
+
+def _EmptyRunResult() -> dict:
+    return {
+        "EligibleUsers": 0,
+        "ProcessedUsers": 0,
+        "NotificationsSent": 0,
+        "Skipped": 0,
+        "Errors": 0,
+    }
+
+
+def _ProcessUserReminders(
+    db: Session,
+    *,
+    admin_user_id: int,
+    user_id: int,
+    run_date: date,
+    due_jobs: list[tuple[str, str, str]],
+    result: dict,
+) -> None:
+    if not due_jobs:
+        return
+    result["EligibleUsers"] += 1
+    result["ProcessedUsers"] += 1
+    run_time = due_jobs[0][2]
+
+    try:
+        for reminder_type, meal_type, run_time in due_jobs:
+            if _AlreadyRan(db, user_id, run_date, run_time, reminder_type, meal_type):
+                result["Skipped"] += 1
+                continue
+            if reminder_type == "Weight":
+                already_logged = _HasWeightEntry(db, user_id, run_date)
+            else:
+                already_logged = _HasMealEntry(db, user_id, run_date, meal_type)
+            if already_logged:
+                _RecordRun(
+                    db,
+                    user_id,
+                    run_date,
+                    run_time,
+                    reminder_type,
+                    meal_type,
+                    result="skipped",
+                    notification_sent=False,
+                )
+                result["Skipped"] += 1
+                continue
+            if reminder_type == "Weight":
+                _SendWeightReminder(db, admin_user_id, user_id, run_date, run_time)
+            else:
+                _SendMealReminder(db, admin_user_id, user_id, run_date, run_time, meal_type)
+            _RecordRun(
+                db,
+                user_id,
+                run_date,
+                run_time,
+                reminder_type,
+                meal_type,
+                result="sent",
+                notification_sent=True,
+            )
+            result["NotificationsSent"] += 1
+    except Exception as exc:  # noqa: BLE001
+        logger.exception("Health reminder run failed for user %s", user_id)
+        result["Errors"] += 1
+        _RecordRun(
+            db,
+            user_id,
+            run_date,
+            run_time,
+            reminder_type="Error",
+            meal_type="",
+            result="error",
+            notification_sent=False,
+            error_message=str(exc),
+        )
+
+
+def _ParseScheduleKey(reminder_key: str) -> tuple[str, str] | None:
+    if reminder_key == "Weight":
+        return "Weight", ""
+    if reminder_key.startswith("Meal:"):
+        meal_type = reminder_key[len("Meal:"):]
+        if meal_type in MealTypeLabels:
+            return "Meal", meal_type
+    return None
+
+
+def _RunDueHealthReminders(db: Session, admin_user_id: int) -> dict:
+    now = NowUtc()
+    result = _EmptyRunResult()
+
+    due_rows = LoadDueReminderSchedule(db, source_module="health", role="Parent", now_utc=now)
+    if not due_rows:
+        return result
+
+    due_jobs_by_user: dict[tuple[int, date], list[tuple[str, str, str]]] = {}
+    for row in due_rows:
+        parsed = _ParseScheduleKey(row.ReminderKey)
+        if not parsed or IsReminderScheduleStale(row, now):
+            continue
+        reminder_type, meal_type = parsed
+        due_jobs_by_user.setdefault((row.UserId, ResolveScheduledLocalDate(row)), []).append(
+            (reminder_type, meal_type, row.LocalTime)
+        )
+    AdvanceReminderSchedule(db, due_rows, now)
+    db.commit()
+
+    for (user_id, run_date), due_jobs in due_jobs_by_user.items():
+        _ProcessUserReminders(
+            db,
+            admin_user_id=admin_user_id,
+            user_id=user_id,
+            run_date=run_date,
+            due_jobs=due_jobs,
+            result=result,
+        )
+    return result
+
+
+def RunDailyHealthReminders(
+    db: Session,
+    admin_user_id: int,
+    run_date: date | None = None,
+    run_time: str | None = None,
+) -> dict:
+    # The scheduled sweep only touches users whose indexed reminder is due. An explicit
+    # date/time (admin replay) still scans every parent against their settings.
+    if run_date is None and run_time is None:
+        return _RunDueHealthReminders(db, admin_user_id)
+
+    now = NowUtc()
+    parent_users = db.query(User).filter(User.Role == "Parent").all()
+    timezone_by_user_id = _LoadTaskTimeZones(db, [user.Id for user in parent_users])
+    result = _EmptyRunResult()
 
     for user in parent_users:
         settings = EnsureSettingsForUser(db, user.Id)
@@ -326,134 +487,20 @@ def RunDailyHealthReminders(
         )
         weight_time = settings.WeightReminderTime or DefaultWeightReminderTime
 
-        user_eligible = False
-        user_processed = False
-
-        try:
-            for meal_type, slot in food_slots.items():
-                if not bool(slot.get("Enabled")):
-                    continue
-                reminder_time = str(slot.get("Time") or "")
-                if not _TimeMatches(effective_time, reminder_time):
-                    continue
-                user_eligible = True
-                user_processed = True
-                reminder_type = "Meal"
-                if _AlreadyRan(
-                    db,
-                    user.Id,
-                    effective_date,
-                    effective_time,
-                    reminder_type,
-                    meal_type,
-                ):
-                    skipped += 1
-                    continue
-                if _HasMealEntry(db, user.Id, effective_date, meal_type):
-                    _RecordRun(
-                        db,
-                        user.Id,
-                        effective_date,
-                        effective_time,
-                        reminder_type,
-                        meal_type,
-                        result="skipped",
-                        notification_sent=False,
-                    )
-                    skipped += 1
-                    continue
-                _SendMealReminder(
-                    db,
-                    admin_user_id,
-                    user.Id,
-                    effective_date,
-                    effective_time,
-                    meal_type,
-                )
-                _RecordRun(
-                    db,
-                    user.Id,
-                    effective_date,
-                    effective_time,
-                    reminder_type,
-                    meal_type,
-                    result="sent",
-                    notification_sent=True,
-                )
-                notifications_sent += 1
-
-            if settings.WeightRemindersEnabled and _TimeMatches(effective_time, weight_time):
-                user_eligible = True
-                user_processed = True
-                reminder_type = "Weight"
-                meal_type = ""
-                if _AlreadyRan(
-                    db,
-                    user.Id,
-                    effective_date,
-                    effective_time,
-                    reminder_type,
-                    meal_type,
-                ):
-                    skipped += 1
-                    continue
-                if _HasWeightEntry(db, user.Id, effective_date):
-                    _RecordRun(
-                        db,
-                        user.Id,
-                        effective_date,
-                        effective_time,
-                        reminder_type,
-                        meal_type,
-                        result="skipped",
-                        notification_sent=False,
-                    )
-                    skipped += 1
-                    continue
-                _SendWeightReminder(
-                    db,
-                    admin_user_id,
-                    user.Id,
-                    effective_date,
-                    effective_time,
-                )
-                _RecordRun(
-                    db,
-                    user.Id,
-                    effective_date,
-                    effective_time,
-                    reminder_type,
-                    meal_type,
-                    result="sent",
-                    notification_sent=True,
-                )
-                notifications_sent += 1
-
-        except Exception as exc:  # noqa: BLE001
-            logger.exception("Health reminder run failed for user %s", user.Id)
-            errors += 1
-            if user_processed:
-                _RecordRun(
-                    db,
-                    user.Id,
-                    effective_date,
-                    effective_time,
-                    reminder_type="Error",
-                    meal_type="",
-                    result="error",
-                    notification_sent=False,
-                    error_message=str(exc),
-                )
-
-        if user_eligible:
-            eligible_users += 1
-        if user_processed:
-            processed_users += 1
+        due_jobs = [
+            ("Meal", meal_type, effective_time)
+            for meal_type, slot in food_slots.items()
+            if bool(slot.get("Enabled")) and _TimeMatches(effective_time, str(slot.get("Time") or ""))
+        ]
+        if settings.WeightRemindersEnabled and _TimeMatches(effective_time, weight_time):
+            due_jobs.append(("Weight", "", effective_time))
+        _ProcessUserReminders(
+            db,
+            admin_user_id=admin_user_id,
+            user_id=user.Id,
+            run_date=effective_date,
+            due_jobs=due_jobs,
+            result=result,
+        )
 
-    return {
-        "EligibleUsers": eligible_users,
-        "ProcessedUsers": processed_users,
-        "NotificationsSent": notifications_sent,
-        "Skipped": skipped,
-        "Errors": errors,
-    }
+    return result
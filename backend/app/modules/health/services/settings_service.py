@@ -7,8 +7,10 @@ from zoneinfo import ZoneInfo
 
 from sqlalchemy.orm import Session
 
-from app.modules.auth.service import HashApiKey, VerifyApiKey
+from app.core.ttl_cache import TtlLruCache
+from app.modules.auth.service import ComputeApiKeyLookupHash, HashApiKey, VerifyApiKey
 from app.modules.auth.models import User
+from app.modules.auth.user_name_cache import InvalidateUserName
 from app.modules.health.models import Settings as SettingsModel
 from app.modules.kids.models import ReminderSettings as KidsReminderSettings
 from app.modules.tasks.models import TaskSettings
@@ -45,6 +47,10 @@ from app.modules.health.utils.defaults import (
     DefaultTodayLayout,
     DefaultWeightReminderTime,
 )
+from app.modules.notifications.reminder_schedule_service import (
+    ReplaceReminderSchedule,
+    RetimeReminderSchedule,
+)
 from app.modules.notifications.services import CreateNotification
 
 Logger = logging.getLogger(__name__)
@@ -233,12 +239,40 @@ def _SetTaskReminderTimeZone(db: Session, user_id: int, tz_name: str) -> None:
         kids_settings.ReminderTimeZone = tz_name
         kids_settings.UpdatedAt = now
         db.add(kids_settings)
+    RetimeReminderSchedule(db, user_id=user_id, time_zone=tz_name, now=now)
 
 
 def _ResolveWeightReminderTime(value: str | None) -> str:
     return value if _IsValidTime(value) else DefaultWeightReminderTime
 
 
+def BuildReminderScheduleSlots(record: SettingsModel) -> dict[str, str]:
+    slots: dict[str, str] = {}
+    for meal_type, slot in _ParseFoodReminderSlots(record).items():
+        if bool(slot.get("Enabled")):
+            slots[f"Meal:{meal_type}"] = str(slot.get("Time"))
+    if record.WeightRemindersEnabled:
+        slots["Weight"] = _ResolveWeightReminderTime(record.WeightReminderTime)
+    return slots
+
+
+def ResolveReminderScheduleTimeZone(task_time_zone: str | None, record: SettingsModel) -> str:
+    if task_time_zone:
+        return _ResolveReminderTimeZone(task_time_zone)
+    return _ResolveReminderTimeZone(record.ReminderTimeZone)
+
+
+def RefreshHealthReminderSchedule(db: Session, UserId: int, record: SettingsModel) -> None:
+    ReplaceReminderSchedule(
+        db,
+        source_module="health",
+        user_id=UserId,
+        time_zone=ResolveReminderScheduleTimeZone(_GetTaskReminderTimeZone(db, UserId), record),
+        slots=BuildReminderScheduleSlots(record),
+        now=datetime.now(timezone.utc),
+    )
+
+
 def _ShouldAutoTuneTargets(record: SettingsModel) -> bool:
     if not record.AutoTuneTargetsWeekly:
         return False
@@ -477,6 +511,7 @@ def EnsureSettingsForUser(db: Session, UserId: int) -> SettingsModel:
         ReminderTimeZone=global_tz,
     )
     db.add(record)
+    RefreshHealthReminderSchedule(db, UserId, record)
     db.commit()
     db.refresh(record)
     return record
@@ -638,6 +673,7 @@ def RotateHaeApiKey(db: Session, UserId: int) -> HaeApiKeyResponse:
     record = EnsureSettingsForUser(db, UserId)
     api_key = secrets.token_urlsafe(32)
     record.HaeApiKeyHash = HashApiKey(api_key)
+    record.HaeApiKeyLookupHash = ComputeApiKeyLookupHash(api_key)
     record.HaeApiKeyLast4 = api_key[-4:]
     record.HaeApiKeyCreatedAt = datetime.now(timezone.utc)
     db.add(record)
@@ -650,18 +686,65 @@ def RotateHaeApiKey(db: Session, UserId: int) -> HaeApiKeyResponse:
     )
 
 
+class _VerifiedApiKeyCache(TtlLruCache[str, str]):
+    """Remembers which (lookup hash, stored Argon2 hash) pairs verified recently so
+    repeat imports skip the KDF. Holds digests only, never raw keys. An entry is only
+    honoured while the row still carries the same stored hash, so rotation revokes it."""
+
+    def IsVerified(self, lookup_hash: str, stored_hash: str) -> bool:
+        verified_hash = self.Get(lookup_hash)
+        if verified_hash is None:
+            return False
+        if verified_hash != stored_hash:
+            self.Invalidate(lookup_hash)
+            return False
+        return True
+
+    def Remember(self, lookup_hash: str, stored_hash: str) -> None:
+        self.Put(lookup_hash, stored_hash)
+
+
+_verified_hae_keys = _VerifiedApiKeyCache(ttl_seconds=300, max_entries=256)
+
+
 def ResolveUserIdByHaeApiKey(db: Session, api_key: str) -> int | None:
     if not api_key:
         return None
+    lookup_hash = ComputeApiKeyLookupHash(api_key)
+    record = (
+        db.query(SettingsModel)
+        .filter(SettingsModel.HaeApiKeyLookupHash == lookup_hash)
+        .first()
+    )
+    if record:
+        if not record.HaeApiKeyHash:
+            return None
+        if _verified_hae_keys.IsVerified(lookup_hash, record.HaeApiKeyHash):
+            return record.UserId
+        if not VerifyApiKey(api_key, record.HaeApiKeyHash):
+            return None
+        _verified_hae_keys.Remember(lookup_hash, record.HaeApiKeyHash)
+        return record.UserId
+
+    # Keys issued before HaeApiKeyLookupHash existed: verify against last4 candidates
+    # once, then backfill so later imports take the indexed path.
     last4 = api_key[-4:]
     candidates = (
         db.query(SettingsModel)
-        .filter(SettingsModel.HaeApiKeyLast4 == last4, SettingsModel.HaeApiKeyHash.isnot(None))
+        .filter(
+            SettingsModel.HaeApiKeyLast4 == last4,
+            SettingsModel.HaeApiKeyHash.isnot(None),
+            SettingsModel.HaeApiKeyLookupHash.is_(None),
+        )
         .all()
     )
-    for record in candidates:
-        if record.HaeApiKeyHash and VerifyApiKey(api_key, record.HaeApiKeyHash):
-            return record.UserId
+    for candidate in candidates:
+        if candidate.HaeApiKeyHash and VerifyApiKey(api_key, candidate.HaeApiKeyHash):
+            candidate.HaeApiKeyLookupHash = lookup_hash
+            db.add(candidate)
+            db.commit()
+            _verified_hae_keys.Remember(lookup_hash, candidate.HaeApiKeyHash)
+            return candidate.UserId
     return None
 
 
@@ -689,6 +772,7 @@ def UpdateSettings(db: Session, UserId: int, Input: UpdateSettingsInput) -> User
             setattr(record, field, value)
 
     db.add(record)
+    RefreshHealthReminderSchedule(db, UserId, record)
     db.commit()
     db.refresh(record)
     return GetUserSettings(db, UserId)
@@ -739,6 +823,7 @@ def UpdateUserProfile(db: Session, UserId: int, Input: UpdateProfileInput, IsAdm
     db.add(user)
     db.commit()
     db.refresh(user)
+    InvalidateUserName(user.Id)
 
     return UserProfile(
         UserId=user.Id,
@@ -1,45 +1,55 @@
-from datetime import timedelta
+from datetime import date, timedelta
 
 from sqlalchemy.orm import Session
 
-from app.modules.health.models import DailyLog as DailyLogModel
 from app.modules.health.schemas import DailySummary, WeeklySummary
-from app.modules.health.services.calculations import (
-    BuildDailySummary,
-    CalculateDailyTotals,
-    CalculateWeeklySummary,
-)
-from app.modules.health.services.daily_logs_service import GetEntriesForLog
+from app.modules.health.services.calculations import BuildDailySummaryFromSums, CalculateWeeklySummary
+from app.modules.health.services.daily_logs_service import GetDailyTotalsForDateRange
 from app.modules.health.services.settings_service import GetSettings
 from app.modules.health.utils.dates import ParseIsoDate
 
+MAX_RANGE_DAYS = 366
 
-def GetWeeklySummary(db: Session, UserId: int, StartDate: str) -> WeeklySummary:
-    start = ParseIsoDate(StartDate)
-    end = start + timedelta(days=6)
-
-    logs = (
-        db.query(DailyLogModel)
-        .filter(
-            DailyLogModel.UserId == UserId,
-            DailyLogModel.LogDate >= start,
-            DailyLogModel.LogDate <= end,
-        )
-        .order_by(DailyLogModel.LogDate.asc())
-        .all()
-    )
+
+def _BuildDailySummaries(db: Session, UserId: int, StartDate: date, EndDate: date) -> list[DailySummary]:
+    """Daily totals for every logged day in the range from one DailyTotals range scan,
+    however many days it spans."""
+    rows = GetDailyTotalsForDateRange(db, UserId, StartDate, EndDate)
+    if not rows:
+        return []
 
     settings = GetSettings(db, UserId)
     summaries: list[DailySummary] = []
-
-    for log in logs:
-        entries_for_log = GetEntriesForLog(db, UserId, log.DailyLogId)
+    for rollup, sums in rows:
         step_factor = (
-            float(log.StepKcalFactorOverride)
-            if log.StepKcalFactorOverride is not None
+            float(rollup.StepKcalFactorOverride)
+            if rollup.StepKcalFactorOverride is not None
             else settings.StepKcalFactor
         )
-        totals = CalculateDailyTotals(entries_for_log, log.Steps, step_factor, settings)
-        summaries.append(BuildDailySummary(log.LogDate, log.Steps, totals))
+        summaries.append(BuildDailySummaryFromSums(rollup.LogDate, rollup.Steps, step_factor, sums))
+
+    return summaries
+
+
+def GetRangeSummary(db: Session, UserId: int, StartDate: str, EndDate: str) -> WeeklySummary:
+    start = ParseIsoDate(StartDate)
+    end = ParseIsoDate(EndDate)
+    if end < start:
+        raise ValueError("End date must be on or after start date.")
+    if (end - start).days + 1 > MAX_RANGE_DAYS:
+        raise ValueError(f"Date range cannot exceed {MAX_RANGE_DAYS} days.")
+    return CalculateWeeklySummary(_BuildDailySummaries(db, UserId, start, end))
+
+
+def GetWeeklySummary(db: Session, UserId: int, StartDate: str) -> WeeklySummary:
+    start = ParseIsoDate(StartDate)
+    return CalculateWeeklySummary(_BuildDailySummaries(db, UserId, start, start + timedelta(days=6)))
+
 
-    return CalculateWeeklySummary(summaries)
+def GetMonthlySummary(db: Session, UserId: int, Month: str) -> WeeklySummary:
+    try:
+        start = ParseIsoDate(f"{Month}-01")
+    except ValueError as exc:
+        raise ValueError("Invalid month format. Use YYYY-MM.") from exc
+    next_month = date(start.year + start.month // 12, start.month % 12 + 1, 1)
+    return CalculateWeeklySummary(_BuildDailySummaries(db, UserId, start, next_month - timedelta(days=1)))
@@ -0,0 +1,77 @@
+from datetime import datetime, timezone
+
+from sqlalchemy.orm import Session
+
+from app.modules.health.models import Food as FoodModel
+from app.modules.health.models import MealTemplate as MealTemplateModel
+from app.modules.health.models import MealTemplateItem as MealTemplateItemModel
+
+NUTRIENT_KEYS = ("Calories", "Protein", "Fibre", "Carbs", "Fat", "SaturatedFat", "Sugar", "Sodium")
+
+
+def ComputeTemplateTotals(db: Session, MealTemplateIds: set[str]) -> dict[str, dict]:
+    """Whole-recipe nutrient totals for every template in one items/foods query."""
+    totals_by_template = {template_id: dict.fromkeys(NUTRIENT_KEYS, 0.0) for template_id in MealTemplateIds}
+    if not MealTemplateIds:
+        return totals_by_template
+    rows = (
+        db.query(MealTemplateItemModel, FoodModel)
+        .join(FoodModel, FoodModel.FoodId == MealTemplateItemModel.FoodId)
+        .filter(MealTemplateItemModel.MealTemplateId.in_(MealTemplateIds))
+        .all()
+    )
+
+    for item, food in rows:
+        totals = totals_by_template[item.MealTemplateId]
+        quantity = float(item.Quantity)
+        totals["Calories"] += int(food.CaloriesPerServing) * quantity
+        totals["Protein"] += float(food.ProteinPerServing) * quantity
+        totals["Fibre"] += float(food.FibrePerServing or 0) * quantity
+        totals["Carbs"] += float(food.CarbsPerServing or 0) * quantity
+        totals["Fat"] += float(food.FatPerServing or 0) * quantity
+        totals["SaturatedFat"] += float(food.SaturatedFatPerServing or 0) * quantity
+        totals["Sugar"] += float(food.SugarPerServing or 0) * quantity
+        totals["Sodium"] += float(food.SodiumPerServing or 0) * quantity
+
+    return totals_by_template
+
+
+def StoredTemplateTotals(template: MealTemplateModel) -> dict | None:
+    """The totals saved on the template row, or None if they were never computed."""
+    if template.NutritionUpdatedAt is None:
+        return None
+    return {key: float(getattr(template, f"Total{key}") or 0) for key in NUTRIENT_KEYS}
+
+
+def RefreshTemplateNutrition(db: Session, MealTemplateIds: set[str]) -> None:
+    """Recompute and stage the stored totals for the given templates; the caller commits.
+    Pending item changes are flushed first since the session does not autoflush."""
+    if not MealTemplateIds:
+        return
+    db.flush()
+    totals_by_template = ComputeTemplateTotals(db, set(MealTemplateIds))
+    templates = (
+        db.query(MealTemplateModel)
+        .filter(MealTemplateModel.MealTemplateId.in_(totals_by_template.keys()))
+        .all()
+    )
+    now = datetime.now(timezone.utc)
+    for template in templates:
+        totals = totals_by_template[template.MealTemplateId]
+        for key in NUTRIENT_KEYS:
+            setattr(template, f"Total{key}", totals[key])
+        template.NutritionUpdatedAt = now
+
+
+def RefreshTemplateNutritionForFood(db: Session, FoodId: str) -> set[str]:
+    """Refresh every template that uses FoodId after its nutrients change and return
+    their ids."""
+    template_ids = {
+        template_id
+        for (template_id,) in db.query(MealTemplateItemModel.MealTemplateId)
+        .filter(MealTemplateItemModel.FoodId == FoodId)
+        .distinct()
+        .all()
+    }
+    RefreshTemplateNutrition(db, template_ids)
+    return template_ids
@@ -66,7 +66,30 @@ class ChoreAssignment(Base):
 
 class ChoreEntry(Base):
     __tablename__ = "chore_entries"
-    __table_args__ = ({"schema": "kids"},)
+    __table_args__ = (
+        # Keyset history pages: seek and order on the key, everything else included.
+        Index(
+            "ix_kids_chore_entries_history",
+            "KidUserId",
+            "EntryDate",
+            "CreatedAt",
+            "Id",
+            mssql_include=[
+                "ChoreId",
+                "Status",
+                "ChoreType",
+                "Amount",
+                "Notes",
+                "IsDeleted",
+                "CreatedByUserId",
+                "UpdatedByUserId",
+                "ReviewedByUserId",
+                "ReviewedAt",
+                "UpdatedAt",
+            ],
+        ),
+        {"schema": "kids"},
+    )
 
     Id = Column(Integer, primary_key=True, index=True)
     KidUserId = Column(Integer, nullable=False, index=True)
@@ -111,6 +134,24 @@ class LedgerEntry(Base):
             unique=True,
             mssql_where=text("SourceType IS NOT NULL AND SourceId IS NOT NULL"),
         ),
+        Index(
+            "ix_kids_ledger_entries_history",
+            "KidUserId",
+            "EntryDate",
+            "CreatedAt",
+            "Id",
+            mssql_include=[
+                "EntryType",
+                "Amount",
+                "Narrative",
+                "Notes",
+                "CreatedByUserId",
+                "SourceType",
+                "SourceId",
+                "IsDeleted",
+                "UpdatedAt",
+            ],
+        ),
         {"schema": "kids"},
     )
 
@@ -129,6 +170,20 @@ class LedgerEntry(Base):
     UpdatedAt = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
 
 
+class BalanceSnapshot(Base):
+    __tablename__ = "balance_snapshots"
+    __table_args__ = (
+        UniqueConstraint("KidUserId", "MonthStart", name="uq_kids_balance_snapshots_kid_month"),
+        {"schema": "kids"},
+    )
+
+    Id = Column(Integer, primary_key=True, index=True)
+    KidUserId = Column(Integer, nullable=False, index=True)
+    MonthStart = Column(Date, nullable=False)
+    ClosingBalance = Column(Numeric(12, 2), nullable=False)
+    UpdatedAt = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
+
+
 class PocketMoneyRule(Base):
     __tablename__ = "pocket_money_rules"
     __table_args__ = (
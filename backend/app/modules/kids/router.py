@@ -2,17 +2,17 @@ import json
 import logging
 from decimal import Decimal, ROUND_HALF_UP
 from datetime import date, datetime, timedelta
-from threading import Lock
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import create_engine, func, inspect, text
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import func, insert
 from sqlalchemy.exc import ProgrammingError
 from sqlalchemy.orm import Session
 
-from app.core.migrations import RunMigrations
-from app.db import BuildAdminConnectionUrl, GetDb
+from app.core.schema_ready import IsSchemaReady
+from app.db import AsyncDbSession, AsyncGetDb, GetDb
 from app.modules.auth.deps import RequireAuthenticated, UserContext
 from app.modules.auth.models import User
+from app.modules.auth.user_name_cache import LoadUserNames
 from app.modules.kids.models import (
     Chore,
     ChoreAssignment,
@@ -21,7 +21,6 @@ from app.modules.kids.models import (
     KidLink,
     LedgerEntry,
     PocketMoneyRule,
-    ReminderRun,
     ReminderSettings,
 )
 from app.modules.kids.schemas import (
@@ -33,11 +32,14 @@ from app.modules.kids.schemas import (
     ChoreEntryUpdate,
     ChoreOut,
     ChoreUpdate,
+    KidsApprovalBulkRequest,
     KidsApprovalOut,
     KidsLedgerResponse,
+    KidsMonthBundleOut,
     KidsMonthDayOut,
     KidsMonthOverviewResponse,
     KidsMonthSummaryResponse,
+    KidsMonthsResponse,
     KidsOverviewResponse,
     KidsReminderRunRequest,
     KidsReminderRunResponse,
@@ -66,6 +68,7 @@ from app.modules.kids.services.chores_v2_service import (
     CHORE_TYPE_DAILY,
     CHORE_TYPE_HABIT,
     CentsToAmount,
+    DailyChoreSchedule,
     IsAssignmentActiveOnDate,
     IsChoreActiveOnDate,
     MonthRange,
@@ -76,25 +79,18 @@ from app.modules.kids.services.chores_v2_service import (
     STATUS_REJECTED,
     TodayAdelaide,
 )
+from app.modules.kids.services.balance_snapshot_service import (
+    ApplyLedgerDelta,
+    GetBalanceAsOf,
+    GetOpeningBalance,
+)
+from app.modules.kids.services.history_service import PageHistory
+from app.modules.kids.services.month_context_service import LoadKidMonthContext
 from app.modules.kids.services.pocket_money_service import EnsurePocketMoneyCredits
 from app.modules.kids.utils.rbac import RequireKidsManager, RequireKidsMember
 
-_kids_storage_lock = Lock()
-_kids_storage_ready = False
 logger = logging.getLogger("kids")
 
-_KIDS_TABLES = [
-    KidLink,
-    Chore,
-    ChoreAssignment,
-    ChoreEntry,
-    ChoreEntryAudit,
-    LedgerEntry,
-    PocketMoneyRule,
-    ReminderSettings,
-    ReminderRun,
-]
-
 
 def _IsAdmin(user: UserContext) -> bool:
     return user.Role in {"Admin", "Parent"}
@@ -108,71 +104,13 @@ def _handle_db_error(exc: Exception) -> None:
     ) from exc
 
 
-def EnsureKidsStorageReady(db: Session = Depends(GetDb)) -> None:
-    global _kids_storage_ready
-    if _kids_storage_ready:
-        return
-
-    with _kids_storage_lock:
-        if _kids_storage_ready:
-            return
-        inspector = inspect(db.get_bind())
-        missing = [
-            table.__tablename__
-            for table in _KIDS_TABLES
-            if not inspector.has_table(table.__tablename__, schema="kids")
-        ]
-        if not missing:
-            _kids_storage_ready = True
-            return
-
-        logger.info("kids storage missing tables=%s", ",".join(missing))
-        try:
-            RunMigrations()
-        except Exception:
-            logger.exception("kids storage migration failed")
-
-        inspector = inspect(db.get_bind())
-        missing = [
-            table.__tablename__
-            for table in _KIDS_TABLES
-            if not inspector.has_table(table.__tablename__, schema="kids")
-        ]
-        if not missing:
-            _kids_storage_ready = True
-            return
-
-        logger.warning("kids storage still missing tables=%s, attempting repair", ",".join(missing))
-        try:
-            engine = create_engine(BuildAdminConnectionUrl(), pool_pre_ping=True)
-            with engine.begin() as connection:
-                connection.execute(
-                    text(
-                        "IF NOT EXISTS (SELECT 1 FROM sys.schemas WHERE name = 'kids') EXEC('CREATE SCHEMA kids')"
-                    )
-                )
-                for table in _KIDS_TABLES:
-                    table.__table__.create(bind=connection, checkfirst=True)
-        except Exception as exc:
-            logger.exception("kids storage repair failed")
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="Kids storage migration failed. Check server logs.",
-            ) from exc
-
-        inspector = inspect(db.get_bind())
-        missing = [
-            table.__tablename__
-            for table in _KIDS_TABLES
-            if not inspector.has_table(table.__tablename__, schema="kids")
-        ]
-        if missing:
-            logger.exception("kids storage still missing tables=%s", ",".join(missing))
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="Kids storage migration failed. Check server logs.",
-            )
-        _kids_storage_ready = True
+def EnsureKidsStorageReady() -> None:
+    # Tables are checked once at startup (app.core.schema_ready); this only reads the result.
+    if not IsSchemaReady("kids"):
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Kids storage migration failed. Check server logs.",
+        )
 
 
 router = APIRouter(
@@ -188,19 +126,6 @@ def _EnsureParentKidAccess(db: Session, _parent_id: int, kid_id: int) -> None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Kid not linked")
 
 
-def _DisplayName(user: User) -> str:
-    parts = [user.FirstName, user.LastName]
-    name = " ".join([part for part in parts if part])
-    return name or user.Username
-
-
-def _LoadUserNames(db: Session, user_ids: set[int]) -> dict[int, str]:
-    if not user_ids:
-        return {}
-    users = db.query(User).filter(User.Id.in_(user_ids)).all()
-    return {user.Id: _DisplayName(user) for user in users}
-
-
 def _BuildLedgerOut(entry: LedgerEntry, created_by_name: str | None = None) -> LedgerEntryOut:
     return LedgerEntryOut(
         Id=entry.Id,
@@ -294,6 +219,91 @@ def _LoadAssignmentsAndChores(
     return assignments, chores, chore_map
 
 
+def _MonthProjectionToday(today_actual: date, month_start: date, month_end: date) -> date:
+    if (month_start.year, month_start.month) == (today_actual.year, today_actual.month):
+        return today_actual
+    return month_end
+
+
+def _BuildMonthDays(
+    month_start: date,
+    month_end: date,
+    schedule: DailyChoreSchedule,
+    entries: list[ChoreEntry],
+) -> list[KidsMonthDayOut]:
+    days_in_month = (month_end - month_start).days + 1
+    required_by_chore = schedule.RequiredDayMasks(month_start, days_in_month)
+    approved_by_chore: dict[int, int] = {}
+    bonus_by_offset: dict[int, float] = {}
+    pending_by_offset: dict[int, int] = {}
+    for entry in entries:
+        offset = (entry.EntryDate - month_start).days
+        if not 0 <= offset < days_in_month:
+            continue
+        if entry.Status == STATUS_APPROVED:
+            approved_by_chore[entry.ChoreId] = approved_by_chore.get(entry.ChoreId, 0) | (1 << offset)
+            if entry.ChoreType == CHORE_TYPE_BONUS:
+                bonus_by_offset[offset] = bonus_by_offset.get(offset, 0) + float(entry.Amount)
+        elif entry.Status == STATUS_PENDING:
+            pending_by_offset[offset] = pending_by_offset.get(offset, 0) + 1
+
+    days: list[KidsMonthDayOut] = []
+    for offset in range(days_in_month):
+        daily_total = 0
+        daily_done = 0
+        for chore_id, required in required_by_chore.items():
+            if (required >> offset) & 1:
+                daily_total += 1
+                daily_done += (approved_by_chore.get(chore_id, 0) >> offset) & 1
+        days.append(
+            KidsMonthDayOut(
+                Date=month_start + timedelta(days=offset),
+                DailyDone=daily_done,
+                DailyTotal=daily_total,
+                BonusApprovedTotal=bonus_by_offset.get(offset, 0),
+                PendingCount=pending_by_offset.get(offset, 0),
+            )
+        )
+    return days
+
+
+def _BuildMonthSummary(
+    today: date,
+    month_start: date,
+    month_end: date,
+    rule: PocketMoneyRule | None,
+    chores: list[Chore],
+    assignments: list[ChoreAssignment],
+    entries: list[ChoreEntry],
+    schedule: DailyChoreSchedule | None = None,
+) -> KidsMonthSummaryResponse:
+    monthly_allowance_cents = MonthlyAllowanceCents(rule.Amount if rule and rule.IsActive else None)
+    days_in_month = (month_end - month_start).days + 1
+    daily_slice_cents = RoundDailySlice(monthly_allowance_cents, days_in_month)
+    _projection, summary, _protected_by_date = BuildMonthProjection(
+        today=today,
+        month_start=month_start,
+        month_end=month_end,
+        daily_slice_cents=daily_slice_cents,
+        monthly_allowance_cents=monthly_allowance_cents,
+        chores=chores,
+        assignments=assignments,
+        entries=entries,
+        schedule=schedule,
+    )
+    return KidsMonthSummaryResponse(
+        MonthStart=month_start,
+        MonthEnd=month_end,
+        MonthlyAllowance=CentsToAmount(monthly_allowance_cents),
+        DailySlice=CentsToAmount(daily_slice_cents),
+        MissedDays=summary.MissedDays,
+        MissedDeduction=CentsToAmount(summary.MissedDeductionCents),
+        ApprovedBonusTotal=CentsToAmount(summary.ApprovedBonusCents),
+        PendingBonusTotal=CentsToAmount(summary.PendingBonusCents),
+        ProjectedPayout=CentsToAmount(summary.ProjectedPayoutCents),
+    )
+
+
 def _SerializeEntry(entry: ChoreEntry, chore: Chore) -> dict:
     return {
         "Id": entry.Id,
@@ -422,34 +432,18 @@ def _KidLedgerTotal(
 
 
 def _KidRawBalance(db: Session, kid_user_id: int, anchor_date: date | None = None) -> float:
-    return _KidLedgerTotal(db, kid_user_id, end_date=anchor_date)
+    if anchor_date is None:
+        return _KidLedgerTotal(db, kid_user_id)
+    return float(GetBalanceAsOf(db, kid_user_id, anchor_date))
 
 
 def _KidBalance(db: Session, kid_user_id: int, anchor_date: date | None = None) -> float:
     today = anchor_date or TodayAdelaide()
     month_start, month_end = MonthRange(today)
-    opening_balance = _KidLedgerTotal(db, kid_user_id, end_date=month_start - timedelta(days=1))
+    opening_balance = GetOpeningBalance(db, kid_user_id, month_start)
     month_ledger_total = _KidLedgerTotal(db, kid_user_id, start_date=month_start, end_date=today)
-
-    assignments = (
-        db.query(ChoreAssignment)
-        .filter(ChoreAssignment.KidUserId == kid_user_id)
-        .order_by(ChoreAssignment.CreatedAt.asc())
-        .all()
-    )
-    chore_ids = [assignment.ChoreId for assignment in assignments]
-    chores = db.query(Chore).filter(Chore.Id.in_(chore_ids)).all() if chore_ids else []
-    month_entries = (
-        db.query(ChoreEntry)
-        .filter(
-            ChoreEntry.KidUserId == kid_user_id,
-            ChoreEntry.EntryDate >= month_start,
-            ChoreEntry.EntryDate <= month_end,
-            ChoreEntry.IsDeleted == False,
-        )
-        .all()
-    )
-    rule = db.query(PocketMoneyRule).filter(PocketMoneyRule.KidUserId == kid_user_id).first()
+    context = LoadKidMonthContext(db, kid_user_id, month_start, month_end)
+    rule = context.Rule
     monthly_allowance_cents = MonthlyAllowanceCents(rule.Amount if rule and rule.IsActive else None)
     days_in_month = (month_end - month_start).days + 1
     daily_slice_cents = RoundDailySlice(monthly_allowance_cents, days_in_month)
@@ -459,9 +453,9 @@ def _KidBalance(db: Session, kid_user_id: int, anchor_date: date | None = None)
         month_end=month_end,
         daily_slice_cents=daily_slice_cents,
         monthly_allowance_cents=monthly_allowance_cents,
-        chores=chores,
-        assignments=assignments,
-        entries=month_entries,
+        chores=context.Chores,
+        assignments=context.Assignments,
+        entries=context.Entries,
     )
     projected_earnings = CentsToAmount(
         next((point.AmountCents for point in projection_points if point.Date == today), 0)
@@ -469,13 +463,62 @@ def _KidBalance(db: Session, kid_user_id: int, anchor_date: date | None = None)
     return _BuildDisplayedBalance(opening_balance, month_ledger_total, projected_earnings)
 
 
+_NEXT_CURSOR_HEADER = "X-Next-Cursor"
+_MAX_HISTORY_PAGE = 500
+
+
+def _PageHistory(query, model, limit: int, cursor: str | None) -> tuple[list, str | None]:
+    try:
+        return PageHistory(query, model, limit=limit, cursor=cursor)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+
+def _LedgerPage(db: Session, kid_user_id: int, limit: int, cursor: str | None) -> KidsLedgerResponse:
+    query = db.query(LedgerEntry).filter(LedgerEntry.KidUserId == kid_user_id, LedgerEntry.IsDeleted == False)
+    entries, next_cursor = _PageHistory(query, LedgerEntry, limit, cursor)
+    creator_map = LoadUserNames(db, {entry.CreatedByUserId for entry in entries})
+    return KidsLedgerResponse(
+        Balance=_KidBalance(db, kid_user_id),
+        Entries=[_BuildLedgerOut(entry, creator_map.get(entry.CreatedByUserId)) for entry in entries],
+        NextCursor=next_cursor,
+    )
+
+
+def _ChoreEntriesPage(
+    db: Session,
+    response: Response,
+    kid_user_id: int,
+    limit: int,
+    cursor: str | None,
+    include_deleted: bool,
+) -> list[ChoreEntryOut]:
+    # The body stays a plain list for existing clients; the next cursor rides in a header.
+    query = db.query(ChoreEntry).filter(ChoreEntry.KidUserId == kid_user_id)
+    if not include_deleted:
+        query = query.filter(ChoreEntry.IsDeleted == False)
+    entries, next_cursor = _PageHistory(query, ChoreEntry, limit, cursor)
+    if next_cursor:
+        response.headers[_NEXT_CURSOR_HEADER] = next_cursor
+    chore_ids = {entry.ChoreId for entry in entries}
+    chores = (
+        {chore.Id: chore for chore in db.query(Chore).filter(Chore.Id.in_(chore_ids)).all()}
+        if chore_ids
+        else {}
+    )
+    return [
+        _BuildChoreEntryOut(entry, chores.get(entry.ChoreId))
+        for entry in entries
+        if entry.ChoreId in chores
+    ]
+
+
 @router.get("/me/summary", response_model=KidsSummaryResponse)
 def GetKidsSummary(
     db: Session = Depends(GetDb),
     user: UserContext = Depends(RequireKidsMember()),
 ) -> KidsSummaryResponse:
     try:
-        EnsurePocketMoneyCredits(db, user.Id, date.today())
         balance = _KidBalance(db, user.Id)
         entries = (
             db.query(LedgerEntry)
@@ -484,7 +527,7 @@ def GetKidsSummary(
             .limit(8)
             .all()
         )
-        creator_map = _LoadUserNames(db, {entry.CreatedByUserId for entry in entries})
+        creator_map = LoadUserNames(db, {entry.CreatedByUserId for entry in entries})
         chores = _LoadAssignedChoresForDate(db, user.Id, TodayAdelaide())
         return KidsSummaryResponse(
             Balance=balance,
@@ -499,24 +542,13 @@ def GetKidsSummary(
 
 @router.get("/me/ledger", response_model=KidsLedgerResponse)
 def GetKidsLedger(
-    limit: int = 50,
+    limit: int = Query(50, ge=1, le=_MAX_HISTORY_PAGE),
+    cursor: str | None = None,
     db: Session = Depends(GetDb),
     user: UserContext = Depends(RequireKidsMember()),
 ) -> KidsLedgerResponse:
     try:
-        EnsurePocketMoneyCredits(db, user.Id, date.today())
-        entries = (
-            db.query(LedgerEntry)
-            .filter(LedgerEntry.KidUserId == user.Id, LedgerEntry.IsDeleted == False)
-            .order_by(LedgerEntry.EntryDate.desc(), LedgerEntry.CreatedAt.desc())
-            .limit(limit)
-            .all()
-        )
-        creator_map = _LoadUserNames(db, {entry.CreatedByUserId for entry in entries})
-        return KidsLedgerResponse(
-            Balance=_KidBalance(db, user.Id),
-            Entries=[_BuildLedgerOut(entry, creator_map.get(entry.CreatedByUserId)) for entry in entries],
-        )
+        return _LedgerPage(db, user.Id, limit, cursor)
     except ProgrammingError as exc:
         _handle_db_error(exc)
 
@@ -560,140 +592,105 @@ def UpdateReminderSettingsRoute(
         _handle_db_error(exc)
 
 
-@router.get("/me/overview", response_model=KidsOverviewResponse)
-def GetKidsOverview(
-    selected_date: date | None = None,
-    db: Session = Depends(GetDb),
-    user: UserContext = Depends(RequireKidsMember()),
-) -> KidsOverviewResponse:
-    try:
-        today = TodayAdelaide()
-        allowed_start, allowed_end = AllowedDateRange(today)
-        if selected_date is None:
-            selected_date = today
-        if selected_date < allowed_start or selected_date > allowed_end:
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Date is out of range")
+def _LoadKidsOverview(db: Session, user_id: int, selected_date: date | None) -> KidsOverviewResponse:
+    today = TodayAdelaide()
+    allowed_start, allowed_end = AllowedDateRange(today)
+    if selected_date is None:
+        selected_date = today
+    if selected_date < allowed_start or selected_date > allowed_end:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Date is out of range")
 
-        assignments = (
-            db.query(ChoreAssignment)
-            .filter(ChoreAssignment.KidUserId == user.Id)
-            .order_by(ChoreAssignment.CreatedAt.asc())
-            .all()
-        )
-        chore_ids = [assignment.ChoreId for assignment in assignments]
-        chores = db.query(Chore).filter(Chore.Id.in_(chore_ids)).all() if chore_ids else []
-        chore_map = {chore.Id: chore for chore in chores}
+    month_start, month_end = MonthRange(today)
+    context = LoadKidMonthContext(db, user_id, month_start, month_end, extra_date=selected_date)
+    chore_map = context.ChoreMap
 
-        chores_for_date = []
-        for assignment in assignments:
-            chore = chore_map.get(assignment.ChoreId)
-            if not chore:
-                continue
-            if not IsChoreActiveOnDate(chore, selected_date):
-                continue
-            if not IsAssignmentActiveOnDate(assignment, selected_date):
-                continue
-            chores_for_date.append(chore)
-        chores_for_date.sort(key=lambda chore: (chore.SortOrder, chore.Label.lower()))
+    chores_for_date = []
+    for assignment in context.Assignments:
+        chore = chore_map.get(assignment.ChoreId)
+        if not chore:
+            continue
+        if not IsChoreActiveOnDate(chore, selected_date):
+            continue
+        if not IsAssignmentActiveOnDate(assignment, selected_date):
+            continue
+        chores_for_date.append(chore)
+    chores_for_date.sort(key=lambda chore: (chore.SortOrder, chore.Label.lower()))
 
-        entries_for_date = (
-            db.query(ChoreEntry)
-            .filter(
-                ChoreEntry.KidUserId == user.Id,
-                ChoreEntry.EntryDate == selected_date,
-                ChoreEntry.IsDeleted == False,
-            )
-            .order_by(ChoreEntry.CreatedAt.desc())
-            .all()
-        )
+    entries_for_date = context.EntriesOn(selected_date)
+    rule = context.Rule
+    monthly_allowance_cents = MonthlyAllowanceCents(rule.Amount if rule and rule.IsActive else None)
+    days_in_month = (month_end - month_start).days + 1
+    daily_slice_cents = RoundDailySlice(monthly_allowance_cents, days_in_month)
 
-        month_start, month_end = MonthRange(today)
-        month_entries = (
-            db.query(ChoreEntry)
-            .filter(
-                ChoreEntry.KidUserId == user.Id,
-                ChoreEntry.EntryDate >= month_start,
-                ChoreEntry.EntryDate <= month_end,
-                ChoreEntry.IsDeleted == False,
-            )
-            .all()
-        )
+    projection_points, _summary, protected_by_date = BuildMonthProjection(
+        today=today,
+        month_start=month_start,
+        month_end=month_end,
+        daily_slice_cents=daily_slice_cents,
+        monthly_allowance_cents=monthly_allowance_cents,
+        chores=context.Chores,
+        assignments=context.Assignments,
+        entries=context.EntriesBetween(month_start, month_end),
+    )
 
-        rule = db.query(PocketMoneyRule).filter(PocketMoneyRule.KidUserId == user.Id).first()
-        monthly_allowance_cents = MonthlyAllowanceCents(rule.Amount if rule and rule.IsActive else None)
-        days_in_month = (month_end - month_start).days + 1
-        daily_slice_cents = RoundDailySlice(monthly_allowance_cents, days_in_month)
-
-        projection_points, _summary, protected_by_date = BuildMonthProjection(
-            today=today,
-            month_start=month_start,
-            month_end=month_end,
-            daily_slice_cents=daily_slice_cents,
-            monthly_allowance_cents=monthly_allowance_cents,
-            chores=chores,
-            assignments=assignments,
-            entries=month_entries,
-        )
+    if selected_date in protected_by_date:
+        day_protected = protected_by_date[selected_date]
+    else:
+        required_daily = {chore.Id for chore in chores_for_date if chore.Type == CHORE_TYPE_DAILY}
+        approved_ids = {
+            entry.ChoreId for entry in entries_for_date if entry.Status == STATUS_APPROVED
+        }
+        day_protected = required_daily.issubset(approved_ids) if required_daily else True
+
+    entries_out = [
+        _BuildChoreEntryOut(entry, chore_map.get(entry.ChoreId))
+        for entry in entries_for_date
+        if entry.ChoreId in chore_map
+    ]
+    projection_out = [
+        {"Date": point.Date, "Amount": CentsToAmount(point.AmountCents)}
+        for point in projection_points
+    ]
+
+    return KidsOverviewResponse(
+        Today=today,
+        SelectedDate=selected_date,
+        AllowedStartDate=allowed_start,
+        AllowedEndDate=allowed_end,
+        MonthStart=month_start,
+        MonthEnd=month_end,
+        MonthlyAllowance=CentsToAmount(monthly_allowance_cents),
+        DailySlice=CentsToAmount(daily_slice_cents),
+        DayProtected=day_protected,
+        Chores=[_BuildChoreOut(chore) for chore in chores_for_date],
+        Entries=entries_out,
+        Projection=projection_out,
+    )
 
-        if selected_date in protected_by_date:
-            day_protected = protected_by_date[selected_date]
-        else:
-            required_daily = {chore.Id for chore in chores_for_date if chore.Type == CHORE_TYPE_DAILY}
-            approved_ids = {
-                entry.ChoreId for entry in entries_for_date if entry.Status == STATUS_APPROVED
-            }
-            day_protected = required_daily.issubset(approved_ids) if required_daily else True
-
-        entries_out = [
-            _BuildChoreEntryOut(entry, chore_map.get(entry.ChoreId))
-            for entry in entries_for_date
-            if entry.ChoreId in chore_map
-        ]
-        projection_out = [
-            {"Date": point.Date, "Amount": CentsToAmount(point.AmountCents)}
-            for point in projection_points
-        ]
 
-        return KidsOverviewResponse(
-            Today=today,
-            SelectedDate=selected_date,
-            AllowedStartDate=allowed_start,
-            AllowedEndDate=allowed_end,
-            MonthStart=month_start,
-            MonthEnd=month_end,
-            MonthlyAllowance=CentsToAmount(monthly_allowance_cents),
-            DailySlice=CentsToAmount(daily_slice_cents),
-            DayProtected=day_protected,
-            Chores=[_BuildChoreOut(chore) for chore in chores_for_date],
-            Entries=entries_out,
-            Projection=projection_out,
-        )
+@router.get("/me/overview", response_model=KidsOverviewResponse)
+async def GetKidsOverview(
+    selected_date: date | None = None,
+    db: AsyncDbSession = Depends(AsyncGetDb),
+    user: UserContext = Depends(RequireKidsMember()),
+) -> KidsOverviewResponse:
+    try:
+        return await db.run_sync(_LoadKidsOverview, user.Id, selected_date)
     except ProgrammingError as exc:
         _handle_db_error(exc)
 
 
 @router.get("/me/chore-entries", response_model=list[ChoreEntryOut])
 def GetChoreEntries(
-    limit: int = 50,
+    response: Response,
+    limit: int = Query(50, ge=1, le=_MAX_HISTORY_PAGE),
+    cursor: str | None = None,
     include_deleted: bool = False,
     db: Session = Depends(GetDb),
     user: UserContext = Depends(RequireKidsMember()),
 ) -> list[ChoreEntryOut]:
     try:
-        query = db.query(ChoreEntry).filter(ChoreEntry.KidUserId == user.Id)
-        if not include_deleted:
-            query = query.filter(ChoreEntry.IsDeleted == False)
-        entries = (
-            query.order_by(ChoreEntry.EntryDate.desc(), ChoreEntry.CreatedAt.desc())
-            .limit(limit)
-            .all()
-        )
-        chores = {chore.Id: chore for chore in db.query(Chore).all()}
-        return [
-            _BuildChoreEntryOut(entry, chores.get(entry.ChoreId))
-            for entry in entries
-            if entry.ChoreId in chores
-        ]
+        return _ChoreEntriesPage(db, response, user.Id, limit, cursor, include_deleted)
     except ProgrammingError as exc:
         _handle_db_error(exc)
 
@@ -990,25 +987,14 @@ def AddKidLink(
 @router.get("/parents/children/{kid_id}/ledger", response_model=KidsLedgerResponse)
 def GetKidLedger(
     kid_id: int,
-    limit: int = 100,
+    limit: int = Query(100, ge=1, le=_MAX_HISTORY_PAGE),
+    cursor: str | None = None,
     db: Session = Depends(GetDb),
     user: UserContext = Depends(RequireKidsManager()),
 ) -> KidsLedgerResponse:
     try:
         _EnsureParentKidAccess(db, user.Id, kid_id)
-        EnsurePocketMoneyCredits(db, kid_id, date.today())
-        entries = (
-            db.query(LedgerEntry)
-            .filter(LedgerEntry.KidUserId == kid_id, LedgerEntry.IsDeleted == False)
-            .order_by(LedgerEntry.EntryDate.desc(), LedgerEntry.CreatedAt.desc())
-            .limit(limit)
-            .all()
-        )
-        creator_map = _LoadUserNames(db, {entry.CreatedByUserId for entry in entries})
-        return KidsLedgerResponse(
-            Balance=_KidBalance(db, kid_id),
-            Entries=[_BuildLedgerOut(entry, creator_map.get(entry.CreatedByUserId)) for entry in entries],
-        )
+        return _LedgerPage(db, kid_id, limit, cursor)
     except ProgrammingError as exc:
         _handle_db_error(exc)
 
@@ -1016,27 +1002,16 @@ def GetKidLedger(
 @router.get("/parents/children/{kid_id}/chore-entries", response_model=list[ChoreEntryOut])
 def GetKidChoreEntries(
     kid_id: int,
-    limit: int = 200,
+    response: Response,
+    limit: int = Query(200, ge=1, le=_MAX_HISTORY_PAGE),
+    cursor: str | None = None,
     include_deleted: bool = True,
     db: Session = Depends(GetDb),
     user: UserContext = Depends(RequireKidsManager()),
 ) -> list[ChoreEntryOut]:
     try:
         _EnsureParentKidAccess(db, user.Id, kid_id)
-        query = db.query(ChoreEntry).filter(ChoreEntry.KidUserId == kid_id)
-        if not include_deleted:
-            query = query.filter(ChoreEntry.IsDeleted == False)
-        entries = (
-            query.order_by(ChoreEntry.EntryDate.desc(), ChoreEntry.CreatedAt.desc())
-            .limit(limit)
-            .all()
-        )
-        chores = {chore.Id: chore for chore in db.query(Chore).all()}
-        return [
-            _BuildChoreEntryOut(entry, chores.get(entry.ChoreId))
-            for entry in entries
-            if entry.ChoreId in chores
-        ]
+        return _ChoreEntriesPage(db, response, kid_id, limit, cursor, include_deleted)
     except ProgrammingError as exc:
         _handle_db_error(exc)
 
@@ -1053,62 +1028,9 @@ def GetKidMonthOverview(
         anchor = month or TodayAdelaide()
         month_start, month_end = MonthRange(anchor)
 
-        assignments, chores, _chore_map = _LoadAssignmentsAndChores(db, kid_id)
-        assignments_by_chore: dict[int, list[ChoreAssignment]] = {}
-        for assignment in assignments:
-            assignments_by_chore.setdefault(assignment.ChoreId, []).append(assignment)
-
-        entries = (
-            db.query(ChoreEntry)
-            .filter(
-                ChoreEntry.KidUserId == kid_id,
-                ChoreEntry.EntryDate >= month_start,
-                ChoreEntry.EntryDate <= month_end,
-                ChoreEntry.IsDeleted == False,
-            )
-            .all()
-        )
-        entries_by_date: dict[date, list[ChoreEntry]] = {}
-        for entry in entries:
-            entries_by_date.setdefault(entry.EntryDate, []).append(entry)
-
-        days: list[KidsMonthDayOut] = []
-        cursor = month_start
-        while cursor <= month_end:
-            required_daily: set[int] = set()
-            for chore in chores:
-                if chore.Type != CHORE_TYPE_DAILY:
-                    continue
-                if not IsChoreActiveOnDate(chore, cursor):
-                    continue
-                assignments_for_chore = assignments_by_chore.get(chore.Id, [])
-                if not assignments_for_chore:
-                    continue
-                if not any(IsAssignmentActiveOnDate(assignment, cursor) for assignment in assignments_for_chore):
-                    continue
-                required_daily.add(chore.Id)
-
-            entries_for_date = entries_by_date.get(cursor, [])
-            approved_ids = {entry.ChoreId for entry in entries_for_date if entry.Status == STATUS_APPROVED}
-            daily_done = len(required_daily & approved_ids)
-            daily_total = len(required_daily)
-            bonus_total = sum(
-                float(entry.Amount)
-                for entry in entries_for_date
-                if entry.Status == STATUS_APPROVED and entry.ChoreType == CHORE_TYPE_BONUS
-            )
-            pending_count = sum(1 for entry in entries_for_date if entry.Status == STATUS_PENDING)
-            days.append(
-                KidsMonthDayOut(
-                    Date=cursor,
-                    DailyDone=daily_done,
-                    DailyTotal=daily_total,
-                    BonusApprovedTotal=bonus_total,
-                    PendingCount=pending_count,
-                )
-            )
-            cursor = cursor + timedelta(days=1)
-
+        context = LoadKidMonthContext(db, kid_id, month_start, month_end)
+        schedule = DailyChoreSchedule(context.Chores, context.Assignments)
+        days = _BuildMonthDays(month_start, month_end, schedule, context.Entries)
         return KidsMonthOverviewResponse(MonthStart=month_start, MonthEnd=month_end, Days=days)
     except ProgrammingError as exc:
         _handle_db_error(exc)
@@ -1415,7 +1337,7 @@ def ListPendingApprovals(
             if chore_ids
             else {}
         )
-        kid_name_map = _LoadUserNames(db, set(kid_ids))
+        kid_name_map = LoadUserNames(db, set(kid_ids))
         results = []
         for entry in entries:
             chore = chore_map.get(entry.ChoreId)
@@ -1521,6 +1443,97 @@ def RejectChoreEntry(
         _handle_db_error(exc)
 
 
+_BULK_REVIEW_ACTIONS = {
+    "Approve": (STATUS_APPROVED, "Approved", "Approved chore entry"),
+    "Reject": (STATUS_REJECTED, "Rejected", "Rejected chore entry"),
+}
+
+
+@router.post("/parents/approvals/bulk", response_model=list[ChoreEntryOut])
+def BulkReviewChoreEntries(
+    payload: KidsApprovalBulkRequest,
+    db: Session = Depends(GetDb),
+    user: UserContext = Depends(RequireKidsManager()),
+) -> list[ChoreEntryOut]:
+    """Approve or reject many pending entries at once: the same checks as the single
+    endpoints, one UPDATE, one executemany audit insert and a single commit. Nothing
+    is written unless every entry passes."""
+    try:
+        review = _BULK_REVIEW_ACTIONS.get(payload.Action)
+        if review is None:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid action")
+        new_status, audit_action, audit_summary = review
+        entry_ids = list(dict.fromkeys(payload.EntryIds))
+
+        entries = {
+            entry.Id: entry
+            for entry in db.query(ChoreEntry)
+            .filter(ChoreEntry.Id.in_(entry_ids), ChoreEntry.IsDeleted == False)
+            .all()
+        }
+        if len(entries) != len(entry_ids):
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Chore entry not found")
+        kid_ids = {entry.KidUserId for entry in entries.values()}
+        linked_kid_ids = {
+            row[0] for row in db.query(KidLink.KidUserId).filter(KidLink.KidUserId.in_(kid_ids)).distinct()
+        }
+        if kid_ids - linked_kid_ids:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Kid not linked")
+        if any(entry.Status != STATUS_PENDING for entry in entries.values()):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Entry is not pending")
+        chore_ids = {entry.ChoreId for entry in entries.values()}
+        chores = {chore.Id: chore for chore in db.query(Chore).filter(Chore.Id.in_(chore_ids)).all()}
+        if chore_ids - set(chores):
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Chore not found")
+
+        now = datetime.utcnow()
+        updated = (
+            db.query(ChoreEntry)
+            .filter(
+                ChoreEntry.Id.in_(entry_ids),
+                ChoreEntry.IsDeleted == False,
+                ChoreEntry.Status == STATUS_PENDING,
+            )
+            .update(
+                {
+                    ChoreEntry.Status: new_status,
+                    ChoreEntry.ReviewedByUserId: user.Id,
+                    ChoreEntry.ReviewedAt: now,
+                    ChoreEntry.UpdatedByUserId: user.Id,
+                    ChoreEntry.UpdatedAt: now,
+                },
+                synchronize_session="evaluate",
+            )
+        )
+        if updated != len(entry_ids):
+            # Another reviewer got to some of these between the read and the update.
+            db.rollback()
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Entry is not pending")
+        db.execute(
+            insert(ChoreEntryAudit),
+            [
+                {
+                    "ChoreEntryId": entry_id,
+                    "Action": audit_action,
+                    "ActorUserId": user.Id,
+                    "Summary": audit_summary,
+                    "BeforeJson": None,
+                    "AfterJson": json.dumps(_SerializeEntry(entries[entry_id], chores[entries[entry_id].ChoreId])),
+                    "CreatedAt": now,
+                }
+                for entry_id in entry_ids
+            ],
+        )
+        # Built before the commit expires the rows, which would reload them one by one.
+        results = [
+            _BuildChoreEntryOut(entries[entry_id], chores[entries[entry_id].ChoreId]) for entry_id in entry_ids
+        ]
+        db.commit()
+        return results
+    except ProgrammingError as exc:
+        _handle_db_error(exc)
+
+
 @router.get("/parents/children/{kid_id}/month-summary", response_model=KidsMonthSummaryResponse)
 def GetKidMonthSummary(
     kid_id: int,
@@ -1533,55 +1546,129 @@ def GetKidMonthSummary(
         today_actual = TodayAdelaide()
         anchor = month or today_actual
         month_start, month_end = MonthRange(anchor)
-        today = today_actual if (anchor.year == today_actual.year and anchor.month == today_actual.month) else month_end
+        today = _MonthProjectionToday(today_actual, month_start, month_end)
+
+        context = LoadKidMonthContext(db, kid_id, month_start, month_end)
+        return _BuildMonthSummary(
+            today,
+            month_start,
+            month_end,
+            context.Rule,
+            context.Chores,
+            context.Assignments,
+            context.Entries,
+        )
+    except ProgrammingError as exc:
+        _handle_db_error(exc)
+
+
+_MAX_BULK_MONTHS = 12
+
+
+@router.get("/parents/children/months", response_model=KidsMonthsResponse)
+def GetKidsMonths(
+    kid_ids: list[int] | None = Query(None),
+    start: date | None = None,
+    end: date | None = None,
+    db: Session = Depends(GetDb),
+    user: UserContext = Depends(RequireKidsManager()),
+) -> KidsMonthsResponse:
+    """Month overview and summary for several kids across a month range, in a fixed
+    number of queries however many kids and months are requested. Defaults to every
+    linked kid and the current month."""
+    try:
+        today_actual = TodayAdelaide()
+        start_month, _ = MonthRange(start or today_actual)
+        end_month, range_end = MonthRange(end or start or today_actual)
+        if end_month < start_month:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="End month is before start month")
+        month_ranges: list[tuple[date, date]] = []
+        cursor = start_month
+        while cursor <= end_month:
+            month_ranges.append(MonthRange(cursor))
+            cursor = month_ranges[-1][1] + timedelta(days=1)
+        if len(month_ranges) > _MAX_BULK_MONTHS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"At most {_MAX_BULK_MONTHS} months per request",
+            )
+
+        links = db.query(KidLink.KidUserId)
+        if kid_ids:
+            links = links.filter(KidLink.KidUserId.in_(set(kid_ids)))
+        linked = {row.KidUserId for row in links.all()}
+        if kid_ids and any(kid_id not in linked for kid_id in kid_ids):
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Kid not linked")
+        kids = list(dict.fromkeys(kid_ids)) if kid_ids else sorted(linked)
+        if not kids:
+            return KidsMonthsResponse(StartMonth=start_month, EndMonth=end_month, Months=[])
 
         assignments = (
             db.query(ChoreAssignment)
-            .filter(ChoreAssignment.KidUserId == kid_id)
+            .filter(ChoreAssignment.KidUserId.in_(kids))
             .order_by(ChoreAssignment.CreatedAt.asc())
             .all()
         )
-        chore_ids = [assignment.ChoreId for assignment in assignments]
+        chore_ids = {assignment.ChoreId for assignment in assignments}
         chores = db.query(Chore).filter(Chore.Id.in_(chore_ids)).all() if chore_ids else []
-
+        chore_map = {chore.Id: chore for chore in chores}
         entries = (
             db.query(ChoreEntry)
             .filter(
-                ChoreEntry.KidUserId == kid_id,
-                ChoreEntry.EntryDate >= month_start,
-                ChoreEntry.EntryDate <= month_end,
+                ChoreEntry.KidUserId.in_(kids),
+                ChoreEntry.EntryDate >= start_month,
+                ChoreEntry.EntryDate <= range_end,
                 ChoreEntry.IsDeleted == False,
             )
             .all()
         )
+        rules = {
+            rule.KidUserId: rule
+            for rule in db.query(PocketMoneyRule).filter(PocketMoneyRule.KidUserId.in_(kids)).all()
+        }
 
-        rule = db.query(PocketMoneyRule).filter(PocketMoneyRule.KidUserId == kid_id).first()
-        monthly_allowance_cents = MonthlyAllowanceCents(rule.Amount if rule and rule.IsActive else None)
-        days_in_month = (month_end - month_start).days + 1
-        daily_slice_cents = RoundDailySlice(monthly_allowance_cents, days_in_month)
-
-        _projection, summary, _protected_by_date = BuildMonthProjection(
-            today=today,
-            month_start=month_start,
-            month_end=month_end,
-            daily_slice_cents=daily_slice_cents,
-            monthly_allowance_cents=monthly_allowance_cents,
-            chores=chores,
-            assignments=assignments,
-            entries=entries,
-        )
-
-        return KidsMonthSummaryResponse(
-            MonthStart=month_start,
-            MonthEnd=month_end,
-            MonthlyAllowance=CentsToAmount(monthly_allowance_cents),
-            DailySlice=CentsToAmount(daily_slice_cents),
-            MissedDays=summary.MissedDays,
-            MissedDeduction=CentsToAmount(summary.MissedDeductionCents),
-            ApprovedBonusTotal=CentsToAmount(summary.ApprovedBonusCents),
-            PendingBonusTotal=CentsToAmount(summary.PendingBonusCents),
-            ProjectedPayout=CentsToAmount(summary.ProjectedPayoutCents),
-        )
+        assignments_by_kid: dict[int, list[ChoreAssignment]] = {}
+        for assignment in assignments:
+            assignments_by_kid.setdefault(assignment.KidUserId, []).append(assignment)
+        entries_by_kid_month: dict[tuple[int, date], list[ChoreEntry]] = {}
+        for entry in entries:
+            key = (entry.KidUserId, date(entry.EntryDate.year, entry.EntryDate.month, 1))
+            entries_by_kid_month.setdefault(key, []).append(entry)
+
+        months: list[KidsMonthBundleOut] = []
+        for kid_id in kids:
+            kid_assignments = assignments_by_kid.get(kid_id, [])
+            kid_chores = list(
+                {
+                    assignment.ChoreId: chore_map[assignment.ChoreId]
+                    for assignment in kid_assignments
+                    if assignment.ChoreId in chore_map
+                }.values()
+            )
+            schedule = DailyChoreSchedule(kid_chores, kid_assignments)
+            for month_start, month_end in month_ranges:
+                month_entries = entries_by_kid_month.get((kid_id, month_start), [])
+                months.append(
+                    KidsMonthBundleOut(
+                        KidUserId=kid_id,
+                        Overview=KidsMonthOverviewResponse(
+                            MonthStart=month_start,
+                            MonthEnd=month_end,
+                            Days=_BuildMonthDays(month_start, month_end, schedule, month_entries),
+                        ),
+                        Summary=_BuildMonthSummary(
+                            _MonthProjectionToday(today_actual, month_start, month_end),
+                            month_start,
+                            month_end,
+                            rules.get(kid_id),
+                            kid_chores,
+                            kid_assignments,
+                            month_entries,
+                            schedule,
+                        ),
+                    )
+                )
+        return KidsMonthsResponse(StartMonth=start_month, EndMonth=end_month, Months=months)
     except ProgrammingError as exc:
         _handle_db_error(exc)
 
@@ -1608,9 +1695,10 @@ def AddDeposit(
             IsDeleted=False,
         )
         db.add(entry)
+        ApplyLedgerDelta(db, kid_user_id=kid_id, entry_date=entry.EntryDate, amount=entry.Amount)
         db.commit()
         db.refresh(entry)
-        creator_map = _LoadUserNames(db, {entry.CreatedByUserId})
+        creator_map = LoadUserNames(db, {entry.CreatedByUserId})
         return _BuildLedgerOut(entry, creator_map.get(entry.CreatedByUserId))
     except ProgrammingError as exc:
         _handle_db_error(exc)
@@ -1640,9 +1728,10 @@ def AddWithdrawal(
             IsDeleted=False,
         )
         db.add(entry)
+        ApplyLedgerDelta(db, kid_user_id=kid_id, entry_date=entry.EntryDate, amount=entry.Amount)
         db.commit()
         db.refresh(entry)
-        creator_map = _LoadUserNames(db, {entry.CreatedByUserId})
+        creator_map = LoadUserNames(db, {entry.CreatedByUserId})
         return _BuildLedgerOut(entry, creator_map.get(entry.CreatedByUserId))
     except ProgrammingError as exc:
         _handle_db_error(exc)
@@ -1673,9 +1762,10 @@ def AddStartingBalance(
             IsDeleted=False,
         )
         db.add(entry)
+        ApplyLedgerDelta(db, kid_user_id=kid_id, entry_date=entry.EntryDate, amount=entry.Amount)
         db.commit()
         db.refresh(entry)
-        creator_map = _LoadUserNames(db, {entry.CreatedByUserId})
+        creator_map = LoadUserNames(db, {entry.CreatedByUserId})
         return _BuildLedgerOut(entry, creator_map.get(entry.CreatedByUserId))
     except ProgrammingError as exc:
         _handle_db_error(exc)
@@ -153,6 +153,7 @@ class KidsSummaryResponse(BaseModel):
 class KidsLedgerResponse(BaseModel):
     Balance: float
     Entries: list[LedgerEntryOut]
+    NextCursor: str | None = None
 
 
 class KidsProjectionPoint(BaseModel):
@@ -187,6 +188,11 @@ class KidsMonthSummaryResponse(BaseModel):
     ProjectedPayout: float
 
 
+class KidsApprovalBulkRequest(BaseModel):
+    EntryIds: list[int] = Field(min_length=1, max_length=200)
+    Action: str = Field(min_length=1, max_length=20)
+
+
 class KidsApprovalOut(BaseModel):
     Id: int
     KidUserId: int
@@ -229,6 +235,18 @@ class KidsMonthOverviewResponse(BaseModel):
     Days: list[KidsMonthDayOut]
 
 
+class KidsMonthBundleOut(BaseModel):
+    KidUserId: int
+    Overview: KidsMonthOverviewResponse
+    Summary: KidsMonthSummaryResponse
+
+
+class KidsMonthsResponse(BaseModel):
+    StartMonth: date
+    EndMonth: date
+    Months: list[KidsMonthBundleOut]
+
+
 class KidsDayDetailResponse(BaseModel):
     Date: date
     DailyJobs: list[ChoreOut]
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import logging
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.modules.kids.models import BalanceSnapshot, LedgerEntry
+
+logger = logging.getLogger("kids.balance_snapshots")
+
+_ZERO = Decimal("0.00")
+
+
+def _MonthStart(value: date) -> date:
+    return date(value.year, value.month, 1)
+
+
+def _PreviousMonthStart(month_start: date) -> date:
+    return _MonthStart(month_start - timedelta(days=1))
+
+
+def _NextMonthStart(month_start: date) -> date:
+    if month_start.month == 12:
+        return date(month_start.year + 1, 1, 1)
+    return date(month_start.year, month_start.month + 1, 1)
+
+
+def _ToDecimal(value) -> Decimal:
+    return Decimal(str(value or 0)).quantize(Decimal("0.01"))
+
+
+def _LedgerSum(db: Session, kid_user_id: int, start_date: date | None, end_date: date) -> Decimal:
+    query = db.query(func.coalesce(func.sum(LedgerEntry.Amount), 0)).filter(
+        LedgerEntry.KidUserId == kid_user_id,
+        LedgerEntry.IsDeleted == False,
+        LedgerEntry.EntryDate <= end_date,
+    )
+    if start_date is not None:
+        query = query.filter(LedgerEntry.EntryDate >= start_date)
+    return _ToDecimal(query.scalar())
+
+
+def _ClosingSnapshot(db: Session, kid_user_id: int, month_start: date) -> Decimal | None:
+    snapshot = (
+        db.query(BalanceSnapshot.ClosingBalance)
+        .filter(
+            BalanceSnapshot.KidUserId == kid_user_id,
+            BalanceSnapshot.MonthStart == month_start,
+        )
+        .first()
+    )
+    return None if snapshot is None else _ToDecimal(snapshot.ClosingBalance)
+
+
+def GetBalanceAsOf(db: Session, kid_user_id: int, as_of: date) -> Decimal:
+    """Ledger total through `as_of`: the previous month's closing snapshot plus this
+    month's entries so far. Falls back to a full SUM when no snapshot exists yet."""
+    month_start = _MonthStart(as_of)
+    closing_balance = _ClosingSnapshot(db, kid_user_id, _PreviousMonthStart(month_start))
+    if closing_balance is None:
+        return _LedgerSum(db, kid_user_id, None, as_of)
+    return closing_balance + _LedgerSum(db, kid_user_id, month_start, as_of)
+
+
+def GetOpeningBalance(db: Session, kid_user_id: int, month_start: date) -> Decimal:
+    """The previous month's closing snapshot, read by its unique key. Only a month that
+    has not been snapshotted yet (the one just closed) goes on to sum ledger entries."""
+    closing_balance = _ClosingSnapshot(db, kid_user_id, _PreviousMonthStart(month_start))
+    if closing_balance is not None:
+        return closing_balance
+    return GetBalanceAsOf(db, kid_user_id, month_start - timedelta(days=1))
+
+
+def ApplyLedgerDelta(db: Session, *, kid_user_id: int, entry_date: date, amount) -> None:
+    """Shift every snapshot at or after the entry's month. Call in the same transaction
+    as the ledger write (negate `amount` for deletes); the caller commits."""
+    delta = _ToDecimal(amount)
+    if delta == _ZERO:
+        return
+    db.query(BalanceSnapshot).filter(
+        BalanceSnapshot.KidUserId == kid_user_id,
+        BalanceSnapshot.MonthStart >= _MonthStart(entry_date),
+    ).update(
+        {
+            BalanceSnapshot.ClosingBalance: BalanceSnapshot.ClosingBalance + delta,
+            BalanceSnapshot.UpdatedAt: datetime.now(timezone.utc),
+        },
+        synchronize_session=False,
+    )
+
+
+def _ExpectedClosingBalances(db: Session, last_closed_month: date) -> dict[tuple[int, date], Decimal]:
+    month_end = _NextMonthStart(last_closed_month) - timedelta(days=1)
+    rows = (
+        db.query(LedgerEntry.KidUserId, LedgerEntry.EntryDate, func.sum(LedgerEntry.Amount))
+        .filter(LedgerEntry.IsDeleted == False, LedgerEntry.EntryDate <= month_end)
+        .group_by(LedgerEntry.KidUserId, LedgerEntry.EntryDate)
+        .all()
+    )
+    monthly: dict[int, dict[date, Decimal]] = {}
+    for kid_user_id, entry_date, total in rows:
+        months = monthly.setdefault(kid_user_id, {})
+        key = _MonthStart(entry_date)
+        months[key] = months.get(key, _ZERO) + _ToDecimal(total)
+
+    expected: dict[tuple[int, date], Decimal] = {}
+    for kid_user_id, months in monthly.items():
+        running = _ZERO
+        cursor = min(months)
+        while cursor <= last_closed_month:
+            running += months.get(cursor, _ZERO)
+            expected[(kid_user_id, cursor)] = running
+            cursor = _NextMonthStart(cursor)
+    return expected
+
+
+def ReconcileBalanceSnapshots(db: Session, *, today: date) -> dict:
+    """Recomputes every closed month's closing balance from the raw ledger in one
+    grouped query, creates missing snapshots and repairs drifted ones. Commits."""
+    result = {"Checked": 0, "Created": 0, "Repaired": 0}
+    last_closed_month = _PreviousMonthStart(_MonthStart(today))
+    expected = _ExpectedClosingBalances(db, last_closed_month)
+    existing = {
+        (row.KidUserId, row.MonthStart): row
+        for row in db.query(BalanceSnapshot).filter(BalanceSnapshot.MonthStart <= last_closed_month).all()
+    }
+    now = datetime.now(timezone.utc)
+
+    for key, closing_balance in expected.items():
+        row = existing.pop(key, None)
+        if row is None:
+            db.add(
+                BalanceSnapshot(
+                    KidUserId=key[0],
+                    MonthStart=key[1],
+                    ClosingBalance=closing_balance,
+                    UpdatedAt=now,
+                )
+            )
+            result["Created"] += 1
+            continue
+        result["Checked"] += 1
+        if _ToDecimal(row.ClosingBalance) != closing_balance:
+            logger.warning(
+                "kids balance snapshot drift kid_user_id=%s month=%s stored=%s ledger=%s",
+                key[0],
+                key[1].isoformat(),
+                row.ClosingBalance,
+                closing_balance,
+            )
+            row.ClosingBalance = closing_balance
+            row.UpdatedAt = now
+            result["Repaired"] += 1
+
+    # Snapshots with no ledger behind them any more (entries deleted) close at zero.
+    for row in existing.values():
+        result["Checked"] += 1
+        if _ToDecimal(row.ClosingBalance) != _ZERO:
+            row.ClosingBalance = _ZERO
+            row.UpdatedAt = now
+            result["Repaired"] += 1
+
+    db.commit()
+    return result
@@ -95,6 +95,60 @@ def MonthlyAllowanceCents(rule_amount: Decimal | float | int | None) -> int:
     return cents if cents > 0 else DEFAULT_MONTHLY_ALLOWANCE_CENTS
 
 
+def _ActiveDayMask(
+    is_enabled: bool,
+    starts_on: date | None,
+    disabled_on: date | None,
+    month_start: date,
+    days_in_month: int,
+) -> int:
+    """Bitmap of the month's days (bit i = month_start + i) on which IsActiveOnDate holds."""
+    if not is_enabled and disabled_on is None:
+        return 0
+    first = max(0, (starts_on - month_start).days) if starts_on else 0
+    last = min(days_in_month - 1, (disabled_on - month_start).days) if disabled_on else days_in_month - 1
+    if first > last:
+        return 0
+    return ((1 << (last - first + 1)) - 1) << first
+
+
+class DailyChoreSchedule:
+    """A kid's daily chores and their activity windows, built once from the kid's
+    chores and assignments and evaluated for any month as day bitmaps. Build it once
+    per kid when projecting several months."""
+
+    def __init__(self, chores: list[Chore], assignments: list[ChoreAssignment]) -> None:
+        assignment_windows: dict[int, list[tuple[bool, date | None, date | None]]] = {}
+        for assignment in assignments:
+            assignment_windows.setdefault(assignment.ChoreId, []).append(
+                (assignment.IsEnabled, assignment.StartsOn, assignment.DisabledOn)
+            )
+        self._chores = [
+            (chore.Id, (chore.IsActive, chore.StartsOn, chore.DisabledOn), assignment_windows[chore.Id])
+            for chore in chores
+            if chore.Type == CHORE_TYPE_DAILY and chore.Id in assignment_windows
+        ]
+
+    def RequiredDayMasks(self, month_start: date, days_in_month: int) -> dict[int, int]:
+        """Chore id -> days on which the chore and at least one of its assignments are active."""
+        required_by_chore: dict[int, int] = {}
+        for chore_id, chore_window, windows in self._chores:
+            assigned = 0
+            for window in windows:
+                assigned |= _ActiveDayMask(*window, month_start, days_in_month)
+            required = assigned & _ActiveDayMask(*chore_window, month_start, days_in_month)
+            required_by_chore[chore_id] = required_by_chore.get(chore_id, 0) | required
+        return required_by_chore
+
+
+def _UnprotectedDayMask(required_by_chore: dict[int, int], approved_by_chore: dict[int, int]) -> int:
+    """Days on which some required daily chore has no approved entry."""
+    unprotected = 0
+    for chore_id, required in required_by_chore.items():
+        unprotected |= required & ~approved_by_chore.get(chore_id, 0)
+    return unprotected
+
+
 def BuildMonthProjection(
     today: date,
     month_start: date,
@@ -104,102 +158,67 @@ def BuildMonthProjection(
     chores: list[Chore],
     assignments: list[ChoreAssignment],
     entries: list[ChoreEntry],
+    schedule: DailyChoreSchedule | None = None,
 ) -> tuple[list[ProjectionPoint], MonthSummary, dict[date, bool]]:
-    days_in_month = (month_end - month_start).days + 1
-    normalized_allowance = max(0, monthly_allowance_cents if monthly_allowance_cents is not None else 0)
-    base_daily = normalized_allowance // days_in_month if days_in_month > 0 else 0
-    remainder = normalized_allowance % days_in_month if days_in_month > 0 else 0
+    days_in_month = max(0, (month_end - month_start).days + 1)
     fallback_daily_slice = max(0, daily_slice_cents)
-
-    daily_slice_by_date: dict[date, int] = {}
-    cursor = month_start
-    offset = 0
-    while cursor <= month_end:
-        if monthly_allowance_cents is None:
-            daily_slice_by_date[cursor] = fallback_daily_slice
-        else:
-            daily_slice_by_date[cursor] = base_daily + (1 if offset < remainder else 0)
-        cursor = cursor + timedelta(days=1)
-        offset += 1
+    if monthly_allowance_cents is None:
+        base_daily = fallback_daily_slice
+        remainder = 0
+    else:
+        normalized_allowance = max(0, monthly_allowance_cents)
+        base_daily = normalized_allowance // days_in_month if days_in_month > 0 else 0
+        remainder = normalized_allowance % days_in_month if days_in_month > 0 else 0
 
     chore_by_id = {chore.Id: chore for chore in chores}
-    assignment_by_chore: dict[int, list[ChoreAssignment]] = {}
-    for assignment in assignments:
-        assignment_by_chore.setdefault(assignment.ChoreId, []).append(assignment)
-
-    approved_by_date: dict[date, set[int]] = {}
-    approved_bonus_by_date: dict[date, int] = {}
+    approved_by_chore: dict[int, int] = {}
+    approved_bonus_by_offset: dict[int, int] = {}
     pending_bonus_total = 0
     approved_bonus_total = 0
 
     for entry in entries:
         if entry.IsDeleted:
             continue
-        entry_date = entry.EntryDate
         chore = chore_by_id.get(entry.ChoreId)
-        chore_type = entry.ChoreType or (chore.Type if chore else None)
+        is_bonus = (entry.ChoreType or (chore.Type if chore else None)) == CHORE_TYPE_BONUS
+        # Amounts only matter for bonus entries; skip the Decimal conversion otherwise.
+        amount_cents = AmountToCents(entry.Amount) if is_bonus else 0
         status = entry.Status
-        amount_cents = AmountToCents(entry.Amount)
         if status == STATUS_APPROVED:
-            approved_by_date.setdefault(entry_date, set()).add(entry.ChoreId)
-            if chore_type == CHORE_TYPE_BONUS and amount_cents:
-                approved_bonus_by_date[entry_date] = approved_bonus_by_date.get(entry_date, 0) + amount_cents
+            offset = (entry.EntryDate - month_start).days
+            in_month = 0 <= offset < days_in_month
+            if in_month:
+                approved_by_chore[entry.ChoreId] = approved_by_chore.get(entry.ChoreId, 0) | (1 << offset)
+            if amount_cents:
+                if in_month:
+                    approved_bonus_by_offset[offset] = approved_bonus_by_offset.get(offset, 0) + amount_cents
                 approved_bonus_total += amount_cents
-        elif status == STATUS_PENDING and chore_type == CHORE_TYPE_BONUS and amount_cents:
+        elif status == STATUS_PENDING and amount_cents:
             pending_bonus_total += amount_cents
 
-    def _RequiredDailyChores(on_date: date) -> set[int]:
-        required: set[int] = set()
-        for chore in chores:
-            if chore.Type != CHORE_TYPE_DAILY:
-                continue
-            if not IsChoreActiveOnDate(chore, on_date):
-                continue
-            assignments_for_chore = assignment_by_chore.get(chore.Id, [])
-            if not assignments_for_chore:
-                continue
-            if not any(IsAssignmentActiveOnDate(assignment, on_date) for assignment in assignments_for_chore):
-                continue
-            required.add(chore.Id)
-        return required
-
-    def _IsProtected(on_date: date) -> bool:
-        required = _RequiredDailyChores(on_date)
-        if not required:
-            return True
-        approved = approved_by_date.get(on_date, set())
-        return required.issubset(approved)
-
-    is_closed_month = today >= month_end
-    missed_days = 0
-    missed_deduction_cents = 0
-    running = 0
+    schedule = schedule or DailyChoreSchedule(chores, assignments)
+    unprotected = _UnprotectedDayMask(schedule.RequiredDayMasks(month_start, days_in_month), approved_by_chore)
+
+    # Unprotected past days are missed. An unprotected today earns nothing yet and
+    # only counts as missed once it closes the month; future days are still earnable.
+    today_offset = (today - month_start).days
+    past_mask = (1 << min(max(today_offset, 0), days_in_month)) - 1
+    today_mask = 1 << today_offset if 0 <= today_offset < days_in_month else 0
+    missed_mask = unprotected & (past_mask | (today_mask if today >= month_end else 0))
+    unearned_mask = unprotected & (past_mask | today_mask)
+    missed_days = missed_mask.bit_count()
+    missed_deduction_cents = base_daily * missed_days + (missed_mask & ((1 << remainder) - 1)).bit_count()
+
     projection: list[ProjectionPoint] = []
     protected_by_date: dict[date, bool] = {}
-
-    cursor = month_start
-    while cursor <= month_end:
-        protected = _IsProtected(cursor)
-        protected_by_date[cursor] = protected
-        day_slice = daily_slice_by_date.get(cursor, fallback_daily_slice)
-        if cursor < today:
-            if protected:
-                running += day_slice
-            else:
-                missed_days += 1
-                missed_deduction_cents += day_slice
-        elif cursor == today:
-            if protected:
-                running += day_slice
-            elif is_closed_month:
-                missed_days += 1
-                missed_deduction_cents += day_slice
-        else:
-            # Future days remain potential earnings for projection.
-            running += day_slice
-        running += approved_bonus_by_date.get(cursor, 0)
+    running = 0
+    for offset in range(days_in_month):
+        cursor = month_start + timedelta(days=offset)
+        protected_by_date[cursor] = not (unprotected >> offset) & 1
+        if not (unearned_mask >> offset) & 1:
+            running += base_daily + (1 if offset < remainder else 0)
+        running += approved_bonus_by_offset.get(offset, 0)
         projection.append(ProjectionPoint(Date=cursor, AmountCents=running))
-        cursor = cursor + timedelta(days=1)
 
     projected_payout = projection[-1].AmountCents if projection else 0
     summary = MonthSummary(
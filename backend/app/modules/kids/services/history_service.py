@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import base64
+from datetime import date, datetime
+
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Query
+
+
+def EncodeHistoryCursor(entry) -> str:
+    """Opaque cursor for the row after `entry` in (EntryDate, CreatedAt, Id) descending order."""
+    raw = f"{entry.EntryDate.isoformat()}|{entry.CreatedAt.isoformat()}|{entry.Id}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def DecodeHistoryCursor(cursor: str) -> tuple[date, datetime, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        entry_date, created_at, entry_id = (
+            base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8").split("|")
+        )
+        return date.fromisoformat(entry_date), datetime.fromisoformat(created_at), int(entry_id)
+    except (ValueError, UnicodeError) as exc:
+        raise ValueError("Invalid cursor") from exc
+
+
+def PageHistory(query: Query, model, *, limit: int, cursor: str | None = None) -> tuple[list, str | None]:
+    """One page of `query` (ledger or chore entries, already filtered to a kid) newest
+    first, seeking past `cursor` instead of offsetting, plus the cursor for the next
+    page (None on the last one). Raises ValueError for a malformed cursor.
+
+    The (KidUserId, EntryDate, CreatedAt, Id) history indexes serve both the seek and
+    the ordering, so deep pages cost the same as the first.
+    """
+    if cursor:
+        entry_date, created_at, entry_id = DecodeHistoryCursor(cursor)
+        query = query.filter(
+            or_(
+                model.EntryDate < entry_date,
+                and_(model.EntryDate == entry_date, model.CreatedAt < created_at),
+                and_(model.EntryDate == entry_date, model.CreatedAt == created_at, model.Id < entry_id),
+            )
+        )
+    rows = (
+        query.order_by(model.EntryDate.desc(), model.CreatedAt.desc(), model.Id.desc())
+        .limit(limit + 1)
+        .all()
+    )
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, EncodeHistoryCursor(rows[-1])
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date
+
+from sqlalchemy import Integer, literal, or_, select
+from sqlalchemy.orm import Session
+
+from app.modules.kids.models import Chore, ChoreAssignment, ChoreEntry, PocketMoneyRule
+
+
+@dataclass
+class KidMonthContext:
+    Assignments: list[ChoreAssignment]
+    Chores: list[Chore]
+    Rule: PocketMoneyRule | None
+    # Non-deleted entries in the requested range (plus `extra_date`), newest first.
+    Entries: list[ChoreEntry]
+    ChoreMap: dict[int, Chore] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.ChoreMap = {chore.Id: chore for chore in self.Chores}
+
+    def EntriesBetween(self, start_date: date, end_date: date) -> list[ChoreEntry]:
+        return [entry for entry in self.Entries if start_date <= entry.EntryDate <= end_date]
+
+    def EntriesOn(self, on_date: date) -> list[ChoreEntry]:
+        return [entry for entry in self.Entries if entry.EntryDate == on_date]
+
+
+def LoadKidMonthContext(
+    db: Session,
+    kid_user_id: int,
+    start_date: date,
+    end_date: date,
+    *,
+    extra_date: date | None = None,
+) -> KidMonthContext:
+    """A kid's assignments, their chores, pocket money rule and chore entries for
+    `start_date`..`end_date` (and `extra_date`, if outside that range) in two queries.
+
+    The first query anchors on the kid id and outer-joins assignments, chores and the
+    rule, so a kid with no assignments still gets their rule back.
+    """
+    kid = select(literal(kid_user_id, Integer).label("KidUserId")).subquery()
+    rows = (
+        db.query(ChoreAssignment, Chore, PocketMoneyRule)
+        .select_from(kid)
+        .outerjoin(ChoreAssignment, ChoreAssignment.KidUserId == kid.c.KidUserId)
+        .outerjoin(Chore, Chore.Id == ChoreAssignment.ChoreId)
+        .outerjoin(PocketMoneyRule, PocketMoneyRule.KidUserId == kid.c.KidUserId)
+        .order_by(ChoreAssignment.CreatedAt.asc())
+        .all()
+    )
+    assignments: list[ChoreAssignment] = []
+    chores: dict[int, Chore] = {}
+    rule = None
+    for assignment, chore, row_rule in rows:
+        if assignment is not None:
+            assignments.append(assignment)
+        if chore is not None:
+            chores[chore.Id] = chore
+        rule = rule or row_rule
+
+    date_filter = ChoreEntry.EntryDate.between(start_date, end_date)
+    if extra_date is not None and not start_date <= extra_date <= end_date:
+        date_filter = or_(date_filter, ChoreEntry.EntryDate == extra_date)
+    entries = (
+        db.query(ChoreEntry)
+        .filter(ChoreEntry.KidUserId == kid_user_id, ChoreEntry.IsDeleted == False, date_filter)
+        .order_by(ChoreEntry.CreatedAt.desc())
+        .all()
+    )
+    return KidMonthContext(Assignments=assignments, Chores=list(chores.values()), Rule=rule, Entries=entries)
@@ -1,17 +1,21 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from datetime import date, timedelta
 import calendar
 
+from sqlalchemy import or_
 from sqlalchemy.orm import Session
 
 from app.modules.kids.models import Chore, ChoreAssignment, ChoreEntry, LedgerEntry, PocketMoneyRule
+from app.modules.kids.services.balance_snapshot_service import ApplyLedgerDelta
 from app.modules.kids.services.chores_v2_service import (
     BuildMonthProjection,
     CentsToAmount,
     MonthlyAllowanceCents,
     RoundDailySlice,
 )
+from app.modules.kids.services.month_context_service import LoadKidMonthContext
 
 MONTHLY_PAYOUT_SOURCE_TYPE = "KidsMonthlyPayout"
 MONTHLY_PAYOUT_ENTRY_TYPE = "PocketMoney"
@@ -56,56 +60,80 @@ def _FirstMonthly(start_date: date, day_of_month: int) -> date:
     return candidate
 
 
-def _IterScheduleDates(rule: PocketMoneyRule, through_date: date) -> list[date]:
+def _FirstScheduleDate(rule: PocketMoneyRule) -> date | None:
+    """The rule's next occurrence after LastPostedOn (or its first from StartDate)."""
     if not rule.IsActive:
-        return []
-
+        return None
     if rule.Frequency == "weekly":
         if rule.DayOfWeek is None:
-            return []
+            return None
         if rule.LastPostedOn:
-            current = _NextWeekly(rule.LastPostedOn, rule.DayOfWeek)
-        else:
-            current = rule.StartDate
-            if current.weekday() != rule.DayOfWeek:
-                current = _NextWeekly(current - timedelta(days=1), rule.DayOfWeek)
-    elif rule.Frequency == "fortnightly":
+            return _NextWeekly(rule.LastPostedOn, rule.DayOfWeek)
+        current = rule.StartDate
+        if current.weekday() != rule.DayOfWeek:
+            current = _NextWeekly(current - timedelta(days=1), rule.DayOfWeek)
+        return current
+    if rule.Frequency == "fortnightly":
         if rule.DayOfWeek is None:
-            return []
+            return None
         anchor = rule.StartDate
         if anchor.weekday() != rule.DayOfWeek:
             anchor = _NextWeekly(anchor - timedelta(days=1), rule.DayOfWeek)
         if rule.LastPostedOn:
-            current = _NextFortnightly(rule.LastPostedOn, anchor)
-        else:
-            current = anchor
-    elif rule.Frequency == "monthly":
+            return _NextFortnightly(rule.LastPostedOn, anchor)
+        return anchor
+    if rule.Frequency == "monthly":
         if rule.DayOfMonth is None:
-            return []
+            return None
         if rule.LastPostedOn:
-            current = _NextMonthly(rule.LastPostedOn, rule.DayOfMonth)
-        else:
-            current = _FirstMonthly(rule.StartDate, rule.DayOfMonth)
-    else:
-        return []
-
-    dates = []
+            return _NextMonthly(rule.LastPostedOn, rule.DayOfMonth)
+        return _FirstMonthly(rule.StartDate, rule.DayOfMonth)
+    return None
+
+
+def _MonthlyOccurrence(month_index: int, day_of_month: int) -> date:
+    year, month = divmod(month_index, 12)
+    return date(year, month + 1, min(day_of_month, _DaysInMonth(year, month + 1)))
+
+
+def IterPocketMoneyDates(rule: PocketMoneyRule, from_date: date | None, through_date: date) -> Iterator[date]:
+    """Lazily yields the rule's occurrences in `from_date`..`through_date`.
+
+    Occurrences after the first are a fixed 7 or 14 days apart, or the day of month
+    (clamped) in each following month, so the first one at or after `from_date` is
+    computed directly rather than stepped to from StartDate.
+    """
+    first = _FirstScheduleDate(rule)
+    if first is None:
+        return
+    start = first if from_date is None or from_date < first else from_date
+
+    if rule.Frequency == "monthly":
+        month_index = start.year * 12 + start.month - 1
+        current = _MonthlyOccurrence(month_index, rule.DayOfMonth)
+        if current < start:
+            month_index += 1
+            current = _MonthlyOccurrence(month_index, rule.DayOfMonth)
+        while current <= through_date:
+            yield current
+            month_index += 1
+            current = _MonthlyOccurrence(month_index, rule.DayOfMonth)
+        return
+
+    step = 7 if rule.Frequency == "weekly" else 14
+    current = first + timedelta(days=-(-(start - first).days // step) * step)
     while current <= through_date:
-        dates.append(current)
-        if rule.Frequency == "weekly":
-            current = _NextWeekly(current, rule.DayOfWeek)
-        elif rule.Frequency == "fortnightly":
-            anchor = rule.StartDate
-            if anchor.weekday() != rule.DayOfWeek:
-                anchor = _NextWeekly(anchor - timedelta(days=1), rule.DayOfWeek)
-            current = _NextFortnightly(current, anchor)
-        else:
-            current = _NextMonthly(current, rule.DayOfMonth)
-    return dates
+        yield current
+        current += timedelta(days=step)
 
 
-def ComputePocketMoneyDates(rule: PocketMoneyRule, through_date: date) -> list[date]:
-    return _IterScheduleDates(rule, through_date)
+def ComputePocketMoneyDates(
+    rule: PocketMoneyRule,
+    through_date: date,
+    *,
+    from_date: date | None = None,
+) -> list[date]:
+    return list(IterPocketMoneyDates(rule, from_date, through_date))
 
 
 def EnsurePocketMoneyCredits(
@@ -113,106 +141,184 @@ def EnsurePocketMoneyCredits(
     kid_user_id: int,
     today: date,
 ) -> list[LedgerEntry]:
-    """Post month-close allowance payouts based on chore completion."""
-    rule = db.query(PocketMoneyRule).filter(PocketMoneyRule.KidUserId == kid_user_id).first()
-    if not rule or not rule.IsActive:
+    """Post any outstanding month-close payouts for one kid before a ledger write."""
+    rules = _PendingPayoutRules(db, today, kid_user_id=kid_user_id)
+    if not rules:
         return []
+    payout_start = _PayoutStart(rules[0])
+    context = LoadKidMonthContext(
+        db,
+        kid_user_id,
+        date(payout_start.year, payout_start.month, 1),
+        _LastClosedDay(today),
+    )
+    created = _PostPayouts(
+        db,
+        rules,
+        today,
+        chores_by_kid={kid_user_id: context.Chores},
+        assignments_by_kid={kid_user_id: context.Assignments},
+        entries_by_month=_GroupEntriesByMonth(context.Entries),
+    )
+    db.commit()
+    for entry in created:
+        db.refresh(entry)
+    return created
 
-    payout_start = rule.StartDate
-    if rule.LastPostedOn and rule.LastPostedOn >= payout_start:
-        payout_start = rule.LastPostedOn + timedelta(days=1)
 
-    current_month_start = date(today.year, today.month, 1)
-    last_closed_day = current_month_start - timedelta(days=1)
-    if payout_start > last_closed_day:
-        return []
+def PostMonthlyPayouts(db: Session, *, today: date) -> dict:
+    """Month-close payout run for every kid with an active rule, in one transaction.
+
+    Idempotent: a month already posted (same kid, `_MonthSourceId` and month end) is
+    skipped, so repeated runs only fill gaps. Commits.
+    """
+    rules = _PendingPayoutRules(db, today)
+    if not rules:
+        return {"Kids": 0, "Posted": 0}
+    kid_ids = [rule.KidUserId for rule in rules]
+    earliest_start = min(_PayoutStart(rule) for rule in rules)
+    chores_by_kid, assignments_by_kid = _LoadAssignedChoresByKid(db, kid_ids)
+    month_entries = (
+        db.query(ChoreEntry)
+        .filter(
+            ChoreEntry.KidUserId.in_(kid_ids),
+            ChoreEntry.EntryDate >= date(earliest_start.year, earliest_start.month, 1),
+            ChoreEntry.EntryDate <= _LastClosedDay(today),
+            ChoreEntry.IsDeleted == False,
+        )
+        .all()
+    )
+    created = _PostPayouts(
+        db,
+        rules,
+        today,
+        chores_by_kid=chores_by_kid,
+        assignments_by_kid=assignments_by_kid,
+        entries_by_month=_GroupEntriesByMonth(month_entries),
+    )
+    db.commit()
+    return {"Kids": len(rules), "Posted": len(created)}
 
-    chores, assignments = _LoadAssignedChores(db, kid_user_id)
-    monthly_allowance_cents = MonthlyAllowanceCents(rule.Amount)
-    month_starts = _ClosedMonthStarts(payout_start, last_closed_day)
 
-    created = []
-    last_posted = rule.LastPostedOn
-    for month_start in month_starts:
-        month_end = date(month_start.year, month_start.month, _DaysInMonth(month_start.year, month_start.month))
-        source_id = _MonthSourceId(month_start)
-
-        existing = (
-            db.query(LedgerEntry.Id)
-            .filter(
-                LedgerEntry.KidUserId == kid_user_id,
-                LedgerEntry.SourceType == MONTHLY_PAYOUT_SOURCE_TYPE,
-                LedgerEntry.SourceId == source_id,
-                LedgerEntry.EntryDate == month_end,
-            )
-            .first()
+def _LastClosedDay(today: date) -> date:
+    return date(today.year, today.month, 1) - timedelta(days=1)
+
+
+def _PayoutStart(rule: PocketMoneyRule) -> date:
+    if rule.LastPostedOn and rule.LastPostedOn >= rule.StartDate:
+        return rule.LastPostedOn + timedelta(days=1)
+    return rule.StartDate
+
+
+def _PendingPayoutRules(db: Session, today: date, kid_user_id: int | None = None) -> list[PocketMoneyRule]:
+    last_closed_day = _LastClosedDay(today)
+    query = db.query(PocketMoneyRule).filter(
+        PocketMoneyRule.IsActive == True,
+        PocketMoneyRule.StartDate <= last_closed_day,
+        or_(PocketMoneyRule.LastPostedOn.is_(None), PocketMoneyRule.LastPostedOn < last_closed_day),
+    )
+    if kid_user_id is not None:
+        query = query.filter(PocketMoneyRule.KidUserId == kid_user_id)
+    return [rule for rule in query.all() if _PayoutStart(rule) <= last_closed_day]
+
+
+def _GroupEntriesByMonth(entries: list[ChoreEntry]) -> dict[tuple[int, date], list[ChoreEntry]]:
+    grouped: dict[tuple[int, date], list[ChoreEntry]] = {}
+    for entry in entries:
+        key = (entry.KidUserId, date(entry.EntryDate.year, entry.EntryDate.month, 1))
+        grouped.setdefault(key, []).append(entry)
+    return grouped
+
+
+def _PostPayouts(
+    db: Session,
+    rules: list[PocketMoneyRule],
+    today: date,
+    *,
+    chores_by_kid: dict[int, list[Chore]],
+    assignments_by_kid: dict[int, list[ChoreAssignment]],
+    entries_by_month: dict[tuple[int, date], list[ChoreEntry]],
+) -> list[LedgerEntry]:
+    """Adds payout entries for each rule's unpaid closed months from preloaded chores,
+    assignments and chore entries (keyed by kid and month start). The caller commits."""
+    last_closed_day = _LastClosedDay(today)
+    posted = {
+        (row.KidUserId, row.SourceId, row.EntryDate)
+        for row in db.query(LedgerEntry.KidUserId, LedgerEntry.SourceId, LedgerEntry.EntryDate).filter(
+            LedgerEntry.KidUserId.in_([rule.KidUserId for rule in rules]),
+            LedgerEntry.SourceType == MONTHLY_PAYOUT_SOURCE_TYPE,
         )
-        if existing:
+    }
+
+    created = []
+    for rule in rules:
+        kid_user_id = rule.KidUserId
+        monthly_allowance_cents = MonthlyAllowanceCents(rule.Amount)
+        last_posted = rule.LastPostedOn
+        for month_start in _ClosedMonthStarts(_PayoutStart(rule), last_closed_day):
+            days_in_month = _DaysInMonth(month_start.year, month_start.month)
+            month_end = date(month_start.year, month_start.month, days_in_month)
+            source_id = _MonthSourceId(month_start)
+
+            if (kid_user_id, source_id, month_end) not in posted:
+                daily_slice_cents = RoundDailySlice(monthly_allowance_cents, days_in_month)
+                _projection, summary, _protected = BuildMonthProjection(
+                    today=month_end,
+                    month_start=month_start,
+                    month_end=month_end,
+                    daily_slice_cents=daily_slice_cents,
+                    monthly_allowance_cents=monthly_allowance_cents,
+                    chores=chores_by_kid.get(kid_user_id, []),
+                    assignments=assignments_by_kid.get(kid_user_id, []),
+                    entries=entries_by_month.get((kid_user_id, month_start), []),
+                )
+                payout_amount = CentsToAmount(summary.ProjectedPayoutCents)
+                month_label = month_start.strftime("%b %Y")
+                entry = LedgerEntry(
+                    KidUserId=kid_user_id,
+                    EntryType=MONTHLY_PAYOUT_ENTRY_TYPE,
+                    Amount=payout_amount,
+                    EntryDate=month_end,
+                    Narrative=f"Monthly chore allowance ({month_label})",
+                    Notes=None,
+                    CreatedByUserId=rule.CreatedByUserId,
+                    SourceType=MONTHLY_PAYOUT_SOURCE_TYPE,
+                    SourceId=source_id,
+                    IsDeleted=False,
+                )
+                db.add(entry)
+                ApplyLedgerDelta(db, kid_user_id=kid_user_id, entry_date=month_end, amount=payout_amount)
+                created.append(entry)
             if not last_posted or month_end > last_posted:
                 last_posted = month_end
-            continue
-
-        month_entries = (
-            db.query(ChoreEntry)
-            .filter(
-                ChoreEntry.KidUserId == kid_user_id,
-                ChoreEntry.EntryDate >= month_start,
-                ChoreEntry.EntryDate <= month_end,
-                ChoreEntry.IsDeleted == False,
-            )
-            .all()
-        )
-        days_in_month = _DaysInMonth(month_start.year, month_start.month)
-        daily_slice_cents = RoundDailySlice(monthly_allowance_cents, days_in_month)
-        _projection, summary, _protected = BuildMonthProjection(
-            today=month_end,
-            month_start=month_start,
-            month_end=month_end,
-            daily_slice_cents=daily_slice_cents,
-            monthly_allowance_cents=monthly_allowance_cents,
-            chores=chores,
-            assignments=assignments,
-            entries=month_entries,
-        )
 
-        payout_amount = CentsToAmount(summary.ProjectedPayoutCents)
-        month_label = month_start.strftime("%b %Y")
-        entry = LedgerEntry(
-            KidUserId=kid_user_id,
-            EntryType=MONTHLY_PAYOUT_ENTRY_TYPE,
-            Amount=payout_amount,
-            EntryDate=month_end,
-            Narrative=f"Monthly chore allowance ({month_label})",
-            Notes=None,
-            CreatedByUserId=rule.CreatedByUserId,
-            SourceType=MONTHLY_PAYOUT_SOURCE_TYPE,
-            SourceId=source_id,
-            IsDeleted=False,
-        )
-        db.add(entry)
-        created.append(entry)
-        if not last_posted or month_end > last_posted:
-            last_posted = month_end
-
-    if last_posted:
-        rule.LastPostedOn = last_posted
-        db.add(rule)
-    db.commit()
-    for entry in created:
-        db.refresh(entry)
+        if last_posted:
+            rule.LastPostedOn = last_posted
+            db.add(rule)
     return created
 
 
-def _LoadAssignedChores(db: Session, kid_user_id: int) -> tuple[list[Chore], list[ChoreAssignment]]:
+def _LoadAssignedChoresByKid(
+    db: Session,
+    kid_ids: list[int],
+) -> tuple[dict[int, list[Chore]], dict[int, list[ChoreAssignment]]]:
     assignments = (
         db.query(ChoreAssignment)
-        .filter(ChoreAssignment.KidUserId == kid_user_id)
+        .filter(ChoreAssignment.KidUserId.in_(kid_ids))
         .order_by(ChoreAssignment.CreatedAt.asc())
         .all()
     )
-    chore_ids = [assignment.ChoreId for assignment in assignments]
-    chores = db.query(Chore).filter(Chore.Id.in_(chore_ids)).all() if chore_ids else []
-    return chores, assignments
+    chore_ids = {assignment.ChoreId for assignment in assignments}
+    chores = {chore.Id: chore for chore in db.query(Chore).filter(Chore.Id.in_(chore_ids)).all()} if chore_ids else {}
+
+    assignments_by_kid: dict[int, list[ChoreAssignment]] = {}
+    chores_by_kid: dict[int, dict[int, Chore]] = {}
+    for assignment in assignments:
+        assignments_by_kid.setdefault(assignment.KidUserId, []).append(assignment)
+        chore = chores.get(assignment.ChoreId)
+        if chore is not None:
+            chores_by_kid.setdefault(assignment.KidUserId, {})[chore.Id] = chore
+    return {kid_id: list(kid_chores.values()) for kid_id, kid_chores in chores_by_kid.items()}, assignments_by_kid
 
 
 def _ClosedMonthStarts(start_date: date, last_closed_day: date) -> list[date]:
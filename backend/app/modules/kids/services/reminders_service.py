@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 import random
 import re
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from zoneinfo import ZoneInfo
 
 from sqlalchemy.orm import Session
@@ -20,6 +20,14 @@ from app.modules.kids.services.chores_v2_service import (
     IsChoreActiveOnDate,
     STATUS_APPROVED,
 )
+from app.modules.notifications.reminder_schedule_service import (
+    AdvanceReminderSchedule,
+    IsReminderScheduleStale,
+    LoadDueReminderSchedule,
+    ReplaceReminderSchedule,
+    ResolveScheduledLocalDate,
+    SyncReminderSchedule,
+)
 from app.modules.notifications.services import CreateNotification
 
 logger = logging.getLogger("app.kids_reminders")
@@ -111,6 +119,8 @@ def EnsureReminderSettings(db: Session, kid_user_id: int) -> ReminderSettings:
         UpdatedAt=now,
     )
     db.add(created)
+    # Defaults are enabled, so index them now rather than waiting for the next sync.
+    RefreshKidReminderSchedule(db, kid_user_id, created)
     db.commit()
     db.refresh(created)
     return created
@@ -140,29 +150,23 @@ def UpdateReminderSettings(db: Session, kid_user_id: int, payload: dict) -> Remi
 
     record.UpdatedAt = now
     db.add(record)
+    RefreshKidReminderSchedule(db, kid_user_id, record)
     db.commit()
     db.refresh(record)
     return record
 
 
-def _AlreadyRan(
-    db: Session,
-    kid_user_id: int,
-    run_date: date,
-    run_time: str,
-    reminder_type: str,
-) -> bool:
-    return (
-        db.query(ReminderRun)
-        .filter(
+def _LoadRunKeys(db: Session, kid_user_id: int, run_date: date) -> set[tuple[str, str]]:
+    """(RunTime, ReminderType) already recorded for the kid's day. Reads only the
+    uq_kids_reminder_runs_kid_date_time_type key, so it is an index-only seek however
+    long the run history gets."""
+    return {
+        (row.RunTime, row.ReminderType)
+        for row in db.query(ReminderRun.RunTime, ReminderRun.ReminderType).filter(
             ReminderRun.KidUserId == kid_user_id,
             ReminderRun.RunDate == run_date,
-            ReminderRun.RunTime == run_time,
-            ReminderRun.ReminderType == reminder_type,
         )
-        .first()
-        is not None
-    )
+    }
 
 
 def _RecordRun(
@@ -174,21 +178,38 @@ def _RecordRun(
     result: str,
     notification_sent: bool,
     error_message: str | None = None,
-) -> ReminderRun:
-    record = ReminderRun(
-        KidUserId=kid_user_id,
-        RunDate=run_date,
-        RunTime=run_time,
-        ReminderType=reminder_type,
-        Result=result,
-        NotificationSent=notification_sent,
-        ErrorMessage=(error_message or "")[:500] or None,
-        CreatedAt=NowUtc(),
+) -> None:
+    db.add(
+        ReminderRun(
+            KidUserId=kid_user_id,
+            RunDate=run_date,
+            RunTime=run_time,
+            ReminderType=reminder_type,
+            Result=result,
+            NotificationSent=notification_sent,
+            ErrorMessage=(error_message or "")[:500] or None,
+            CreatedAt=NowUtc(),
+        )
     )
-    db.add(record)
     db.commit()
-    db.refresh(record)
-    return record
+
+
+def CompactReminderRuns(db: Session, *, today: date, retention_days: int) -> dict:
+    """Run rows only matter while their day can still be swept. Drops "skipped" rows
+    once their day is over (yesterday is kept for timezone skew) and every row older
+    than `retention_days`. Commits."""
+    compacted = (
+        db.query(ReminderRun)
+        .filter(ReminderRun.RunDate < today - timedelta(days=1), ReminderRun.Result == "skipped")
+        .delete(synchronize_session=False)
+    )
+    pruned = (
+        db.query(ReminderRun)
+        .filter(ReminderRun.RunDate < today - timedelta(days=max(1, retention_days)))
+        .delete(synchronize_session=False)
+    )
+    db.commit()
+    return {"Compacted": compacted, "Pruned": pruned}
 
 
 def _LoadActiveChoreIdsForType(
@@ -267,35 +288,228 @@ def _SendReminderNotification(
     )
 
 
-def RunDailyKidsReminders(
-    db: Session,
-    *,
-    actor_user_id: int,
-    run_date: date | None = None,
-    run_time: str | None = None,
-) -> dict:
-    now_utc = NowUtc()
+def _ReminderJobs(settings: ReminderSettings) -> list[tuple[str, str, bool, str | None]]:
+    return [
+        (
+            REMINDER_TYPE_DAILY,
+            CHORE_TYPE_DAILY,
+            bool(settings.DailyJobsRemindersEnabled),
+            settings.DailyJobsReminderTime,
+        ),
+        (
+            REMINDER_TYPE_HABITS,
+            CHORE_TYPE_HABIT,
+            bool(settings.HabitsRemindersEnabled),
+            settings.HabitsReminderTime,
+        ),
+    ]
+
+
+def _BuildReminderSlots(settings: ReminderSettings) -> dict[str, str]:
+    slots: dict[str, str] = {}
+    for reminder_type, _chore_type, enabled, reminder_time in _ReminderJobs(settings):
+        normalized = _NormalizeTime(reminder_time)
+        if enabled and normalized:
+            slots[reminder_type] = normalized
+    return slots
+
+
+def _ResolveScheduleTimeZone(task_time_zone: str | None, settings: ReminderSettings) -> str:
+    candidate = (task_time_zone or settings.ReminderTimeZone or "").strip()
+    if candidate and _ResolveReminderZone(candidate).key == candidate:
+        return candidate
+    return DEFAULT_REMINDER_TIMEZONE
+
+
+def RefreshKidReminderSchedule(db: Session, kid_user_id: int, settings: ReminderSettings) -> None:
+    task_settings = db.query(TaskSettings).filter(TaskSettings.UserId == kid_user_id).first()
+    ReplaceReminderSchedule(
+        db,
+        source_module="kids",
+        user_id=kid_user_id,
+        time_zone=_ResolveScheduleTimeZone(
+            task_settings.OverdueReminderTimeZone if task_settings else None,
+            settings,
+        ),
+        slots=_BuildReminderSlots(settings),
+        now=NowUtc(),
+    )
 
-    kids = db.query(User).filter(User.Role == "Kid").all()
-    kid_ids = [kid.Id for kid in kids]
+
+def SyncKidsReminderSchedule(db: Session) -> int:
+    """Rebuilds the kids reminder index for every kid. Picks up new kids and role changes
+    that did not go through UpdateReminderSettings."""
+    kid_ids = [row.Id for row in db.query(User.Id).filter(User.Role == "Kid").all()]
+    settings_by_kid = {
+        row.KidUserId: row
+        for row in (
+            db.query(ReminderSettings).filter(ReminderSettings.KidUserId.in_(kid_ids)).all()
+            if kid_ids
+            else []
+        )
+    }
+    task_timezone_by_kid = _LoadTaskTimeZones(db, kid_ids)
+
+    slots_by_kid: dict[int, tuple[str, dict[str, str]]] = {}
+    for kid_id in kid_ids:
+        settings = settings_by_kid.get(kid_id) or EnsureReminderSettings(db, kid_id)
+        slots_by_kid[kid_id] = (
+            _ResolveScheduleTimeZone(task_timezone_by_kid.get(kid_id), settings),
+            _BuildReminderSlots(settings),
+        )
+    SyncReminderSchedule(db, source_module="kids", slots_by_user=slots_by_kid, now=NowUtc())
+    db.commit()
+    return len(slots_by_kid)
+
+
+def _LoadTaskTimeZones(db: Session, user_ids: list[int]) -> dict[int, str]:
     task_settings_rows = (
         db.query(TaskSettings)
-        .filter(TaskSettings.UserId.in_(kid_ids))
+        .filter(TaskSettings.UserId.in_(user_ids))
         .all()
-        if kid_ids
+        if user_ids
         else []
     )
-    task_timezone_by_kid = {
+    return {
         row.UserId: row.OverdueReminderTimeZone
         for row in task_settings_rows
         if row.OverdueReminderTimeZone
     }
 
-    eligible_kids = 0
-    processed_kids = 0
-    notifications_sent = 0
-    skipped = 0
-    errors = 0
+
+def _EmptyRunResult() -> dict:
+    return {
+        "EligibleKids": 0,
+        "ProcessedKids": 0,
+        "NotificationsSent": 0,
+        "Skipped": 0,
+        "Errors": 0,
+    }
+
+
+def _ProcessKidReminders(
+    db: Session,
+    *,
+    actor_user_id: int,
+    kid_user_id: int,
+    run_date: date,
+    due_jobs: list[tuple[str, str, str]],
+    result: dict,
+) -> None:
+    if not due_jobs:
+        return
+    result["EligibleKids"] += 1
+    result["ProcessedKids"] += 1
+    run_time = due_jobs[0][2]
+
+    try:
+        completed_ids = _LoadCompletedChoreIds(db, kid_user_id, run_date)
+        run_keys = _LoadRunKeys(db, kid_user_id, run_date)
+        for reminder_type, chore_type, run_time in due_jobs:
+            if (run_time, reminder_type) in run_keys:
+                result["Skipped"] += 1
+                continue
+
+            active_ids = _LoadActiveChoreIdsForType(db, kid_user_id, run_date, chore_type)
+            remaining_count = len([chore_id for chore_id in active_ids if chore_id not in completed_ids])
+            if remaining_count <= 0:
+                _RecordRun(
+                    db,
+                    kid_user_id=kid_user_id,
+                    run_date=run_date,
+                    run_time=run_time,
+                    reminder_type=reminder_type,
+                    result="skipped",
+                    notification_sent=False,
+                )
+                result["Skipped"] += 1
+                continue
+
+            _SendReminderNotification(
+                db,
+                actor_user_id=actor_user_id,
+                kid_user_id=kid_user_id,
+                reminder_type=reminder_type,
+                remaining_count=remaining_count,
+                run_date=run_date,
+                run_time=run_time,
+            )
+            _RecordRun(
+                db,
+                kid_user_id=kid_user_id,
+                run_date=run_date,
+                run_time=run_time,
+                reminder_type=reminder_type,
+                result="sent",
+                notification_sent=True,
+            )
+            result["NotificationsSent"] += 1
+    except Exception as exc:  # noqa: BLE001
+        logger.exception("Kids reminder run failed for kid_user_id=%s", kid_user_id)
+        result["Errors"] += 1
+        _RecordRun(
+            db,
+            kid_user_id=kid_user_id,
+            run_date=run_date,
+            run_time=run_time,
+            reminder_type="Error",
+            result="error",
+            notification_sent=False,
+            error_message=str(exc),
+        )
+
+
+def _RunDueKidsReminders(db: Session, *, actor_user_id: int) -> dict:
+    now_utc = NowUtc()
+    result = _EmptyRunResult()
+    chore_type_by_reminder = {
+        REMINDER_TYPE_DAILY: CHORE_TYPE_DAILY,
+        REMINDER_TYPE_HABITS: CHORE_TYPE_HABIT,
+    }
+
+    due_rows = LoadDueReminderSchedule(db, source_module="kids", role="Kid", now_utc=now_utc)
+    if not due_rows:
+        return result
+
+    due_jobs_by_kid: dict[tuple[int, date], list[tuple[str, str, str]]] = {}
+    for row in due_rows:
+        chore_type = chore_type_by_reminder.get(row.ReminderKey)
+        if not chore_type or IsReminderScheduleStale(row, now_utc):
+            continue
+        due_jobs_by_kid.setdefault((row.UserId, ResolveScheduledLocalDate(row)), []).append(
+            (row.ReminderKey, chore_type, row.LocalTime)
+        )
+    AdvanceReminderSchedule(db, due_rows, now_utc)
+    db.commit()
+
+    for (kid_user_id, run_date), due_jobs in due_jobs_by_kid.items():
+        _ProcessKidReminders(
+            db,
+            actor_user_id=actor_user_id,
+            kid_user_id=kid_user_id,
+            run_date=run_date,
+            due_jobs=due_jobs,
+            result=result,
+        )
+    return result
+
+
+def RunDailyKidsReminders(
+    db: Session,
+    *,
+    actor_user_id: int,
+    run_date: date | None = None,
+    run_time: str | None = None,
+) -> dict:
+    # The scheduled sweep only touches kids whose indexed reminder is due. An explicit
+    # date/time (admin replay) still scans every kid against their settings.
+    if run_date is None and run_time is None:
+        return _RunDueKidsReminders(db, actor_user_id=actor_user_id)
+
+    now_utc = NowUtc()
+    kids = db.query(User).filter(User.Role == "Kid").all()
+    task_timezone_by_kid = _LoadTaskTimeZones(db, [kid.Id for kid in kids])
+    result = _EmptyRunResult()
 
     for kid in kids:
         settings = EnsureReminderSettings(db, kid.Id)
@@ -308,110 +522,18 @@ def RunDailyKidsReminders(
             run_time=run_time,
             run_zone=effective_zone,
         )
-        completed_ids = _LoadCompletedChoreIds(db, kid.Id, today)
-
-        kid_eligible = False
-        kid_processed = False
-
-        jobs = [
-            (
-                REMINDER_TYPE_DAILY,
-                CHORE_TYPE_DAILY,
-                bool(settings.DailyJobsRemindersEnabled),
-                settings.DailyJobsReminderTime,
-            ),
-            (
-                REMINDER_TYPE_HABITS,
-                CHORE_TYPE_HABIT,
-                bool(settings.HabitsRemindersEnabled),
-                settings.HabitsReminderTime,
-            ),
+        due_jobs = [
+            (reminder_type, chore_type, effective_time)
+            for reminder_type, chore_type, enabled, reminder_time in _ReminderJobs(settings)
+            if enabled and _TimeMatches(effective_time, reminder_time)
         ]
-        try:
-            for reminder_type, chore_type, enabled, reminder_time in jobs:
-                if not enabled:
-                    continue
-                time_matches = _TimeMatches(effective_time, reminder_time)
-                if not time_matches:
-                    continue
-                kid_eligible = True
-                kid_processed = True
-
-                if _AlreadyRan(db, kid.Id, today, effective_time, reminder_type):
-                    skipped += 1
-                    continue
-
-                active_ids = _LoadActiveChoreIdsForType(db, kid.Id, today, chore_type)
-                if not active_ids:
-                    _RecordRun(
-                        db,
-                        kid_user_id=kid.Id,
-                        run_date=today,
-                        run_time=effective_time,
-                        reminder_type=reminder_type,
-                        result="skipped",
-                        notification_sent=False,
-                    )
-                    skipped += 1
-                    continue
-
-                remaining_count = len([chore_id for chore_id in active_ids if chore_id not in completed_ids])
-                if remaining_count <= 0:
-                    _RecordRun(
-                        db,
-                        kid_user_id=kid.Id,
-                        run_date=today,
-                        run_time=effective_time,
-                        reminder_type=reminder_type,
-                        result="skipped",
-                        notification_sent=False,
-                    )
-                    skipped += 1
-                    continue
-
-                _SendReminderNotification(
-                    db,
-                    actor_user_id=actor_user_id,
-                    kid_user_id=kid.Id,
-                    reminder_type=reminder_type,
-                    remaining_count=remaining_count,
-                    run_date=today,
-                    run_time=effective_time,
-                )
-                _RecordRun(
-                    db,
-                    kid_user_id=kid.Id,
-                    run_date=today,
-                    run_time=effective_time,
-                    reminder_type=reminder_type,
-                    result="sent",
-                    notification_sent=True,
-                )
-                notifications_sent += 1
-        except Exception as exc:  # noqa: BLE001
-            logger.exception("Kids reminder run failed for kid_user_id=%s", kid.Id)
-            errors += 1
-            if kid_processed:
-                _RecordRun(
-                    db,
-                    kid_user_id=kid.Id,
-                    run_date=today,
-                    run_time=effective_time,
-                    reminder_type="Error",
-                    result="error",
-                    notification_sent=False,
-                    error_message=str(exc),
-                )
-
-        if kid_eligible:
-            eligible_kids += 1
-        if kid_processed:
-            processed_kids += 1
+        _ProcessKidReminders(
+            db,
+            actor_user_id=actor_user_id,
+            kid_user_id=kid.Id,
+            run_date=today,
+            due_jobs=due_jobs,
+            result=result,
+        )
 
-    return {
-        "EligibleKids": eligible_kids,
-        "ProcessedKids": processed_kids,
-        "NotificationsSent": notifications_sent,
-        "Skipped": skipped,
-        "Errors": errors,
-    }
+    return result
@@ -5,11 +5,13 @@ from __future__ import annotations
 import base64
 import json
 import os
+import time
 from dataclasses import dataclass
 from typing import Any
 
 import httpx
 
+from app.core.metrics import openai_request_duration
 from app.modules.life_admin.document_storage import ResolveDocumentPath
 
 
@@ -109,12 +111,18 @@ def _BuildTextPrompt(filename: str | None, text: str) -> str:
 def _RequestOpenAi(payload: dict) -> dict:
     if not Settings.OpenAiApiKey:
         raise ValueError("OpenAI API key not configured.")
-    response = httpx.post(
-        Settings.OpenAiBaseUrl,
-        headers={"Authorization": f"Bearer {Settings.OpenAiApiKey}", "Content-Type": "application/json"},
-        json=payload,
-        timeout=60.0,
-    )
+    started = time.perf_counter()
+    outcome = "error"
+    try:
+        response = httpx.post(
+            Settings.OpenAiBaseUrl,
+            headers={"Authorization": f"Bearer {Settings.OpenAiApiKey}", "Content-Type": "application/json"},
+            json=payload,
+            timeout=60.0,
+        )
+        outcome = "ok" if response.status_code < 400 else "error"
+    finally:
+        openai_request_duration.Observe(time.perf_counter() - started, caller="life_admin", outcome=outcome)
     response.raise_for_status()
     return response.json()
 
@@ -71,3 +71,62 @@ class NotificationDeviceRegistration(Base):
     LastSeenAt = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
     CreatedAt = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
     UpdatedAt = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
+
+
+class NotificationPushOutbox(Base):
+    __tablename__ = "push_outbox"
+    __table_args__ = (
+        Index(
+            "ix_notifications_push_outbox_status_next_attempt",
+            "Status",
+            "NextAttemptAt",
+        ),
+        Index(
+            "ux_notifications_push_outbox_notification",
+            "NotificationId",
+            unique=True,
+        ),
+        {"schema": "notifications"},
+    )
+
+    Id = Column(Integer, primary_key=True, index=True)
+    NotificationId = Column(Integer, nullable=False)
+    UserId = Column(Integer, nullable=False)
+    Status = Column(String(20), nullable=False, default="Pending")
+    Attempts = Column(Integer, nullable=False, default=0)
+    NextAttemptAt = Column(DateTime(timezone=True), nullable=False)
+    LastError = Column(String(255))
+    ClaimToken = Column(String(32))
+    # JSON list of device ids already delivered (or rejected for good) by earlier attempts.
+    SettledDeviceIds = Column(Text)
+    SentAt = Column(DateTime(timezone=True))
+    CreatedAt = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
+    UpdatedAt = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
+
+
+class ReminderSchedule(Base):
+    __tablename__ = "reminder_schedule"
+    __table_args__ = (
+        Index(
+            "ix_notifications_reminder_schedule_module_next_fire",
+            "SourceModule",
+            "NextFireAt",
+        ),
+        Index(
+            "ux_notifications_reminder_schedule_module_user_key",
+            "SourceModule",
+            "UserId",
+            "ReminderKey",
+            unique=True,
+        ),
+        {"schema": "notifications"},
+    )
+
+    Id = Column(Integer, primary_key=True, index=True)
+    UserId = Column(Integer, nullable=False, index=True)
+    SourceModule = Column(String(20), nullable=False)
+    ReminderKey = Column(String(40), nullable=False)
+    LocalTime = Column(String(5), nullable=False)
+    TimeZone = Column(String(64), nullable=False)
+    NextFireAt = Column(DateTime(timezone=True), nullable=False)
+    UpdatedAt = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
@@ -0,0 +1,209 @@
+import json
+import logging
+import time
+import uuid
+from datetime import timedelta
+
+from sqlalchemy import and_
+from sqlalchemy.orm import Session
+
+from app.core.env import ReadIntEnv
+from app.modules.auth.deps import NowUtc
+from app.modules.notifications.models import Notification, NotificationPushOutbox
+from app.modules.notifications.push_service import (
+    IsPushEnabled,
+    PushBatchResult,
+    SendPushForNotifications,
+)
+from app.modules.notifications.services import (
+    OUTBOX_STATUS_FAILED,
+    OUTBOX_STATUS_PENDING,
+    OUTBOX_STATUS_SENDING,
+    OUTBOX_STATUS_SENT,
+    OUTBOX_STATUS_SKIPPED,
+    CountUnreadByUserIds,
+)
+
+logger = logging.getLogger("notifications.push")
+
+OUTBOX_RETENTION = timedelta(days=7)
+_CLEANUP_INTERVAL_SECONDS = 3600
+_last_cleanup_at = 0.0
+
+
+def _BackoffDelay(attempts: int) -> timedelta:
+    base_seconds = max(1, ReadIntEnv("NOTIFICATIONS_PUSH_RETRY_BASE_SECONDS", 30))
+    max_seconds = max(base_seconds, ReadIntEnv("NOTIFICATIONS_PUSH_RETRY_MAX_SECONDS", 3600))
+    return timedelta(seconds=min(base_seconds * (2 ** max(0, attempts - 1)), max_seconds))
+
+
+def _ClaimLease() -> timedelta:
+    return timedelta(seconds=max(30, ReadIntEnv("NOTIFICATIONS_PUSH_CLAIM_LEASE_SECONDS", 300)))
+
+
+def _CleanupFinishedRows(db: Session) -> None:
+    global _last_cleanup_at
+    if time.monotonic() - _last_cleanup_at < _CLEANUP_INTERVAL_SECONDS:
+        return
+    _last_cleanup_at = time.monotonic()
+    removed = (
+        db.query(NotificationPushOutbox)
+        .filter(
+            NotificationPushOutbox.Status.notin_([OUTBOX_STATUS_PENDING, OUTBOX_STATUS_SENDING]),
+            NotificationPushOutbox.UpdatedAt < NowUtc() - OUTBOX_RETENTION,
+        )
+        .delete(synchronize_session=False)
+    )
+    db.commit()
+    if removed:
+        logger.info("push outbox cleanup removed=%s", removed)
+
+
+def _ParseSettledDeviceIds(value: str | None) -> set[int]:
+    if not value:
+        return set()
+    try:
+        parsed = json.loads(value)
+    except json.JSONDecodeError:
+        return set()
+    return {int(item) for item in parsed if isinstance(item, int)} if isinstance(parsed, list) else set()
+
+
+def _ClaimDueRows(db: Session, batch_size: int) -> list[NotificationPushOutbox]:
+    """Moves up to batch_size due rows to Sending under a fresh claim token and returns
+    them. The guarded UPDATE is what makes the claim exclusive: a row another drainer
+    claimed first no longer matches, so concurrent schedulers and triggers never send
+    the same push twice. Sending rows whose lease ran out (the drainer died mid-send)
+    are due again."""
+    now = NowUtc()
+    due = and_(
+        NotificationPushOutbox.Status.in_([OUTBOX_STATUS_PENDING, OUTBOX_STATUS_SENDING]),
+        NotificationPushOutbox.NextAttemptAt <= now,
+    )
+    candidate_ids = [
+        row_id
+        for (row_id,) in db.query(NotificationPushOutbox.Id)
+        .filter(due)
+        .order_by(NotificationPushOutbox.NextAttemptAt.asc(), NotificationPushOutbox.Id.asc())
+        .limit(batch_size)
+        .all()
+    ]
+    if not candidate_ids:
+        return []
+    token = uuid.uuid4().hex
+    claimed_count = (
+        db.query(NotificationPushOutbox)
+        .filter(NotificationPushOutbox.Id.in_(candidate_ids), due)
+        .update(
+            {
+                NotificationPushOutbox.Status: OUTBOX_STATUS_SENDING,
+                NotificationPushOutbox.ClaimToken: token,
+                NotificationPushOutbox.Attempts: NotificationPushOutbox.Attempts + 1,
+                NotificationPushOutbox.NextAttemptAt: now + _ClaimLease(),
+                NotificationPushOutbox.UpdatedAt: now,
+            },
+            synchronize_session=False,
+        )
+    )
+    db.commit()
+    if not claimed_count:
+        return []
+    return (
+        db.query(NotificationPushOutbox)
+        .filter(
+            NotificationPushOutbox.Id.in_(candidate_ids),
+            NotificationPushOutbox.ClaimToken == token,
+        )
+        .all()
+    )
+
+
+def DrainPushOutbox(db: Session, *, batch_size: int = 100, max_attempts: int = 6) -> dict:
+    """Sends one batch of due outbox rows. Rows are claimed before the APNs call;
+    retryable failures are rescheduled with exponential backoff and only resend to the
+    devices that failed; the in-app notification itself is never touched."""
+    result = {"Claimed": 0, "Sent": 0, "Retried": 0, "Failed": 0, "Skipped": 0}
+    rows = _ClaimDueRows(db, batch_size)
+    if not rows:
+        _CleanupFinishedRows(db)
+        return result
+    result["Claimed"] = len(rows)
+
+    # Snapshot before sending: the push commit expires these instances.
+    claim_token = rows[0].ClaimToken
+    claimed = [(row.Id, row.NotificationId, int(row.Attempts or 0)) for row in rows]
+    settled_before = {row.NotificationId: _ParseSettledDeviceIds(row.SettledDeviceIds) for row in rows}
+    push_enabled = IsPushEnabled()
+    notifications = {
+        record.Id: record
+        for record in db.query(Notification)
+        .filter(Notification.Id.in_({notification_id for _, notification_id, _ in claimed}))
+        .all()
+    }
+    sendable = [
+        record for record in notifications.values() if push_enabled and not record.IsDismissed
+    ]
+    batch = PushBatchResult()
+    if sendable:
+        badge_counts = CountUnreadByUserIds(db, user_ids={record.UserId for record in sendable})
+        batch = SendPushForNotifications(
+            db,
+            notifications=sendable,
+            badge_counts=badge_counts,
+            skip_devices={key: value for key, value in settled_before.items() if value},
+        )
+    sendable_ids = {record.Id for record in sendable}
+
+    now = NowUtc()
+    updates: dict[tuple, list[int]] = {}
+    for outbox_id, notification_id, attempts in claimed:
+        reason = batch.Retry.get(notification_id)
+        if notification_id not in sendable_ids:
+            key = (OUTBOX_STATUS_SKIPPED, attempts, None, None)
+            result["Skipped"] += 1
+        elif reason is None:
+            key = (OUTBOX_STATUS_SENT, attempts, None, None)
+            result["Sent"] += 1
+        elif attempts >= max_attempts:
+            key = (OUTBOX_STATUS_FAILED, attempts, reason, None)
+            result["Failed"] += 1
+        else:
+            settled = settled_before[notification_id] | batch.SettledDevices.get(notification_id, set())
+            key = (OUTBOX_STATUS_PENDING, attempts, reason, json.dumps(sorted(settled)) if settled else None)
+            result["Retried"] += 1
+        updates.setdefault(key, []).append(outbox_id)
+
+    for (status, attempts, reason, settled_device_ids), outbox_ids in updates.items():
+        values = {
+            NotificationPushOutbox.Status: status,
+            NotificationPushOutbox.Attempts: attempts,
+            NotificationPushOutbox.LastError: reason,
+            NotificationPushOutbox.SettledDeviceIds: settled_device_ids,
+            NotificationPushOutbox.ClaimToken: None,
+            NotificationPushOutbox.UpdatedAt: now,
+        }
+        if status == OUTBOX_STATUS_SENT:
+            values[NotificationPushOutbox.SentAt] = now
+        if status == OUTBOX_STATUS_PENDING:
+            values[NotificationPushOutbox.NextAttemptAt] = now + _BackoffDelay(attempts)
+        # Guarded by the token: if this run outlived its lease and another drainer took
+        # the rows over, that drainer owns the outcome.
+        db.query(NotificationPushOutbox).filter(
+            NotificationPushOutbox.Id.in_(outbox_ids),
+            NotificationPushOutbox.ClaimToken == claim_token,
+        ).update(
+            values,
+            synchronize_session=False,
+        )
+    db.commit()
+
+    if result["Retried"] or result["Failed"]:
+        logger.warning(
+            "push outbox batch claimed=%s sent=%s retried=%s failed=%s skipped=%s",
+            result["Claimed"],
+            result["Sent"],
+            result["Retried"],
+            result["Failed"],
+            result["Skipped"],
+        )
+    return result
@@ -4,12 +4,16 @@ import logging
 import os
 import threading
 import time
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 
 import httpx
 import jwt
 from sqlalchemy.orm import Session
 
+from app.core.env import ReadIntEnv
+from app.core.metrics import apns_request_duration
+
 from app.modules.auth.deps import NowUtc
 from app.modules.notifications.models import Notification, NotificationDeviceRegistration
 from app.modules.notifications.utils.text import NormalizeNotificationTitle
@@ -84,6 +88,10 @@ def _LoadApnsConfig() -> _ApnsConfig | None:
     )
 
 
+def IsPushEnabled() -> bool:
+    return _ReadBoolEnv("APNS_ENABLED", default=False)
+
+
 def GetApnsHealthStatus() -> dict[str, object]:
     enabled = _ReadBoolEnv("APNS_ENABLED", default=False)
     if not enabled:
@@ -145,6 +153,133 @@ class _ApnsTokenProvider:
 _token_provider = _ApnsTokenProvider()
 
 
+class _ApnsPushPool:
+    """Long-lived HTTP/2 client plus a bounded worker pool for APNs sends.
+
+    Every send shares one client, so concurrent posts to the same APNs host are
+    multiplexed as streams over a single kept-alive connection instead of paying a
+    TLS + HTTP/2 handshake per notification.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._client: httpx.Client | None = None
+        self._timeout_seconds: float | None = None
+        self._executor: ThreadPoolExecutor | None = None
+
+    def GetClient(self, config: _ApnsConfig) -> httpx.Client:
+        with self._lock:
+            if (
+                self._client is None
+                or self._client.is_closed
+                or self._timeout_seconds != config.timeout_seconds
+            ):
+                if self._client is not None:
+                    self._client.close()
+                self._client = httpx.Client(
+                    http2=True,
+                    timeout=config.timeout_seconds,
+                    limits=httpx.Limits(
+                        max_connections=4,
+                        max_keepalive_connections=4,
+                        keepalive_expiry=300,
+                    ),
+                )
+                self._timeout_seconds = config.timeout_seconds
+            return self._client
+
+    def GetExecutor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=max(1, ReadIntEnv("APNS_MAX_CONCURRENCY", 8)),
+                    thread_name_prefix="apns",
+                )
+            return self._executor
+
+    def Close(self) -> None:
+        with self._lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+class _PushStats:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._batches = 0
+        self._notifications = 0
+        self._attempts = 0
+        self._delivered = 0
+        self._failed = 0
+        self._deactivated = 0
+        self._transport_errors = 0
+        self._total_latency_ms = 0.0
+        self._max_latency_ms = 0.0
+        self._total_batch_seconds = 0.0
+        self._last_batch_ms = 0.0
+
+    def RecordBatch(
+        self,
+        *,
+        notifications: int,
+        results: list["_PushResult"],
+        deactivated: int,
+        duration_seconds: float,
+    ) -> None:
+        with self._lock:
+            self._batches += 1
+            self._notifications += notifications
+            self._attempts += len(results)
+            self._deactivated += deactivated
+            for result in results:
+                if result.status_code == 200:
+                    self._delivered += 1
+                elif result.status_code is None:
+                    self._transport_errors += 1
+                else:
+                    self._failed += 1
+                self._total_latency_ms += result.latency_ms
+                self._max_latency_ms = max(self._max_latency_ms, result.latency_ms)
+            self._total_batch_seconds += duration_seconds
+            self._last_batch_ms = duration_seconds * 1000
+
+    def Snapshot(self) -> dict[str, object]:
+        with self._lock:
+            return {
+                "Batches": self._batches,
+                "Notifications": self._notifications,
+                "Attempts": self._attempts,
+                "Delivered": self._delivered,
+                "Failed": self._failed,
+                "TransportErrors": self._transport_errors,
+                "Deactivated": self._deactivated,
+                "AvgLatencyMs": round(self._total_latency_ms / self._attempts, 1)
+                if self._attempts
+                else 0,
+                "MaxLatencyMs": round(self._max_latency_ms, 1),
+                "LastBatchMs": round(self._last_batch_ms, 1),
+                "SendsPerSecond": round(self._attempts / self._total_batch_seconds, 1)
+                if self._total_batch_seconds
+                else 0,
+            }
+
+
+_push_pool = _ApnsPushPool()
+_push_stats = _PushStats()
+
+
+def GetPushStats() -> dict[str, object]:
+    return _push_stats.Snapshot()
+
+
+def ClosePushPool() -> None:
+    _push_pool.Close()
+
+
 def _NormalizeToken(value: str) -> str:
     cleaned = value.strip().replace(" ", "").replace("<", "").replace(">", "")
     return cleaned.lower()
@@ -306,74 +441,201 @@ def _ShouldDeactivateToken(status_code: int, reason: str) -> bool:
     return status_code in {400, 410} and reason in _APNS_DEACTIVATE_REASONS
 
 
-def SendPushForNotification(
+@dataclass
+class PushBatchResult:
+    Delivered: int = 0
+    # Notification id -> reason, for notifications with a retryable failure
+    # (transport error, 429 or 5xx) on at least one device.
+    Retry: dict[int, str] = field(default_factory=dict)
+    # Notification id -> device ids that need no further attempt: delivered, or
+    # rejected for good (bad token, payload). A retry skips these devices.
+    SettledDevices: dict[int, set[int]] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class _PushJob:
+    notification: Notification
+    device: NotificationDeviceRegistration
+    payload: dict
+
+
+@dataclass(frozen=True)
+class _PushResult:
+    status_code: int | None
+    reason: str
+    latency_ms: float
+
+
+def _PostToDevice(
+    client: httpx.Client,
+    config: _ApnsConfig,
+    bearer_token: str,
+    job: _PushJob,
+) -> _PushResult:
+    started = time.perf_counter()
+    try:
+        response = client.post(
+            f"{_ResolveApnsHost(job.device)}/3/device/{job.device.DeviceToken}",
+            json=job.payload,
+            headers={
+                "authorization": f"bearer {bearer_token}",
+                "apns-topic": config.bundle_id,
+                "apns-push-type": "alert",
+                "apns-priority": "10",
+                # Retries of the same notification replace, rather than stack, on device.
+                "apns-collapse-id": f"notification-{job.notification.Id}",
+            },
+        )
+    except httpx.HTTPError as exc:
+        elapsed = time.perf_counter() - started
+        apns_request_duration.Observe(elapsed, outcome="error")
+        return _PushResult(
+            status_code=None,
+            reason=(str(exc) or exc.__class__.__name__)[:255],
+            latency_ms=elapsed * 1000,
+        )
+    elapsed = time.perf_counter() - started
+    apns_request_duration.Observe(elapsed, outcome="ok" if response.status_code == 200 else "rejected")
+    return _PushResult(
+        status_code=response.status_code,
+        reason=_ExtractReason(response),
+        latency_ms=elapsed * 1000,
+    )
+
+
+def _IsRetryable(result: _PushResult) -> bool:
+    return result.status_code is None or result.status_code == 429 or result.status_code >= 500
+
+
+def _DeliverPushJobs(config: _ApnsConfig, jobs: list[_PushJob]) -> list[_PushResult]:
+    bearer_token = _token_provider.BuildBearerToken(config)
+    client = _push_pool.GetClient(config)
+    if len(jobs) == 1:
+        return [_PostToDevice(client, config, bearer_token, jobs[0])]
+    executor = _push_pool.GetExecutor()
+    return list(executor.map(lambda job: _PostToDevice(client, config, bearer_token, job), jobs))
+
+
+def SendPushForNotifications(
     db: Session,
     *,
-    notification: Notification,
-    badge_count: int,
-) -> int:
+    notifications: list[Notification],
+    badge_counts: dict[int, int],
+    skip_devices: dict[int, set[int]] | None = None,
+) -> PushBatchResult:
+    """Sends each notification to its user's active iOS devices in one APNs batch.
+    skip_devices (notification id -> device ids) leaves out devices an earlier attempt
+    already settled, so a retry only reaches the devices that failed."""
     config = _LoadApnsConfig()
-    if not config:
-        return 0
+    if not config or not notifications:
+        return PushBatchResult()
 
     devices = (
         db.query(NotificationDeviceRegistration)
         .filter(
-            NotificationDeviceRegistration.UserId == notification.UserId,
+            NotificationDeviceRegistration.UserId.in_({record.UserId for record in notifications}),
             NotificationDeviceRegistration.Platform == "ios",
             NotificationDeviceRegistration.IsActive == True,  # noqa: E712
         )
         .all()
     )
     if not devices:
-        return 0
+        return PushBatchResult()
+    devices_by_user: dict[int, list[NotificationDeviceRegistration]] = {}
+    for device in devices:
+        devices_by_user.setdefault(device.UserId, []).append(device)
+
+    jobs: list[_PushJob] = []
+    for notification in notifications:
+        user_devices = devices_by_user.get(notification.UserId)
+        if not user_devices:
+            continue
+        settled_ids = (skip_devices or {}).get(notification.Id, set())
+        payload = _BuildPayload(notification, badge_count=badge_counts.get(notification.UserId, 0))
+        jobs.extend(
+            _PushJob(notification=notification, device=device, payload=payload)
+            for device in user_devices
+            if device.Id not in settled_ids
+        )
+    if not jobs:
+        return PushBatchResult()
+
+    started = time.perf_counter()
+    try:
+        results = _DeliverPushJobs(config, jobs)
+    except Exception as exc:  # noqa: BLE001
+        logger.exception("Failed to dispatch APNS batch notifications=%s", len(notifications))
+        reason = (str(exc) or exc.__class__.__name__)[:255]
+        return PushBatchResult(Retry={job.notification.Id: reason for job in jobs})
 
     now = NowUtc()
-    payload = _BuildPayload(notification, badge_count=badge_count)
-    bearer_token = _token_provider.BuildBearerToken(config)
     delivered = 0
+    deactivated = 0
+    retry: dict[int, str] = {}
+    settled: dict[int, set[int]] = {}
+    touched: dict[int, NotificationDeviceRegistration] = {}
+    for job, result in zip(jobs, results):
+        device = job.device
+        notification = job.notification
+        if _IsRetryable(result):
+            retry.setdefault(notification.Id, result.reason)
+        else:
+            settled.setdefault(notification.Id, set()).add(device.Id)
+        if result.status_code is None:
+            logger.warning(
+                "APNS send error user_id=%s notification_id=%s device_id=%s error=%s",
+                notification.UserId,
+                notification.Id,
+                device.Id,
+                result.reason,
+            )
+            continue
+        device.LastSeenAt = now
+        device.UpdatedAt = now
+        if result.status_code == 200:
+            delivered += 1
+            device.LastDeliveredAt = now
+            device.LastError = None
+            logger.info(
+                "APNS sent user_id=%s notification_id=%s device_id=%s",
+                notification.UserId,
+                notification.Id,
+                device.Id,
+            )
+        else:
+            device.LastError = result.reason
+            if device.IsActive and _ShouldDeactivateToken(result.status_code, result.reason):
+                device.IsActive = False
+                deactivated += 1
+            logger.warning(
+                "APNS send failed user_id=%s notification_id=%s status=%s reason=%s",
+                notification.UserId,
+                notification.Id,
+                result.status_code,
+                result.reason,
+            )
+        touched[device.Id] = device
+
+    if touched:
+        db.add_all(list(touched.values()))
+        db.commit()
+    _push_stats.RecordBatch(
+        notifications=len(notifications),
+        results=results,
+        deactivated=deactivated,
+        duration_seconds=time.perf_counter() - started,
+    )
+    return PushBatchResult(Delivered=delivered, Retry=retry, SettledDevices=settled)
 
-    try:
-        with httpx.Client(http2=True, timeout=config.timeout_seconds) as client:
-            for device in devices:
-                response = client.post(
-                    f"{_ResolveApnsHost(device)}/3/device/{device.DeviceToken}",
-                    json=payload,
-                    headers={
-                        "authorization": f"bearer {bearer_token}",
-                        "apns-topic": config.bundle_id,
-                        "apns-push-type": "alert",
-                        "apns-priority": "10",
-                    },
-                )
-                reason = _ExtractReason(response)
-                device.LastSeenAt = now
-                device.UpdatedAt = now
-                if response.status_code == 200:
-                    delivered += 1
-                    device.LastDeliveredAt = now
-                    device.LastError = None
-                    logger.info(
-                        "APNS sent user_id=%s notification_id=%s device_id=%s",
-                        notification.UserId,
-                        notification.Id,
-                        device.Id,
-                    )
-                else:
-                    device.LastError = reason
-                    if _ShouldDeactivateToken(response.status_code, reason):
-                        device.IsActive = False
-                    logger.warning(
-                        "APNS send failed user_id=%s notification_id=%s status=%s reason=%s",
-                        notification.UserId,
-                        notification.Id,
-                        response.status_code,
-                        reason,
-                    )
-                db.add(device)
-    except Exception:  # noqa: BLE001
-        logger.exception("Failed to dispatch APNS notification id=%s", notification.Id)
-        return 0
 
-    db.commit()
-    return delivered
+def SendPushForNotification(
+    db: Session,
+    *,
+    notification: Notification,
+    badge_count: int,
+) -> int:
+    return SendPushForNotifications(
+        db,
+        notifications=[notification],
+        badge_counts={notification.UserId: badge_count},
+    ).Delivered
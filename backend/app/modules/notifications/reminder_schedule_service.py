@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+from sqlalchemy.orm import Session
+
+from app.modules.auth.models import User
+from app.modules.notifications.models import ReminderSchedule
+
+# A slot that is still unsent this long after its fire time is treated as missed and
+# rolled forward instead of firing late (e.g. after downtime).
+DUE_GRACE = timedelta(minutes=10)
+
+ReminderSlots = dict[str, str]
+
+
+def _ResolveZone(value: str | None) -> ZoneInfo | None:
+    try:
+        return ZoneInfo((value or "").strip())
+    except Exception:  # noqa: BLE001
+        return None
+
+
+def _FloorMinute(value: datetime) -> datetime:
+    return value.replace(second=0, microsecond=0)
+
+
+def ComputeNextFireAt(local_time: str, zone: ZoneInfo, not_before_utc: datetime) -> datetime:
+    """Returns the first UTC instant at or after not_before_utc whose local wall-clock
+    time in zone is local_time."""
+    target = datetime.strptime(local_time, "%H:%M").time()
+    local_day = not_before_utc.astimezone(zone).date()
+    candidate_utc = not_before_utc
+    for offset in range(3):
+        candidate = datetime.combine(local_day + timedelta(days=offset), target, tzinfo=zone)
+        candidate_utc = candidate.astimezone(timezone.utc)
+        if candidate_utc >= not_before_utc:
+            break
+    return candidate_utc
+
+
+def ResolveScheduledLocalDate(row: ReminderSchedule) -> date:
+    zone = _ResolveZone(row.TimeZone) or timezone.utc
+    fire_at = row.NextFireAt
+    if fire_at.tzinfo is None:
+        fire_at = fire_at.replace(tzinfo=timezone.utc)
+    return fire_at.astimezone(zone).date()
+
+
+def IsReminderScheduleStale(row: ReminderSchedule, now_utc: datetime) -> bool:
+    fire_at = row.NextFireAt
+    if fire_at.tzinfo is None:
+        fire_at = fire_at.replace(tzinfo=timezone.utc)
+    return now_utc - fire_at > DUE_GRACE
+
+
+def _ApplySlots(
+    db: Session,
+    existing_rows: list[ReminderSchedule],
+    source_module: str,
+    slots_by_user: dict[int, tuple[str, ReminderSlots]],
+    now: datetime,
+) -> None:
+    not_before = _FloorMinute(now)
+    existing = {(row.UserId, row.ReminderKey): row for row in existing_rows}
+    wanted: set[tuple[int, str]] = set()
+
+    for user_id, (tz_name, slots) in slots_by_user.items():
+        zone = _ResolveZone(tz_name)
+        if zone is None:
+            continue
+        for reminder_key, local_time in slots.items():
+            wanted.add((user_id, reminder_key))
+            row = existing.get((user_id, reminder_key))
+            if row and row.LocalTime == local_time and row.TimeZone == tz_name:
+                continue
+            if not row:
+                row = ReminderSchedule(
+                    UserId=user_id,
+                    SourceModule=source_module,
+                    ReminderKey=reminder_key,
+                )
+            row.LocalTime = local_time
+            row.TimeZone = tz_name
+            row.NextFireAt = ComputeNextFireAt(local_time, zone, not_before)
+            row.UpdatedAt = now
+            db.add(row)
+
+    for key, row in existing.items():
+        if key not in wanted:
+            db.delete(row)
+
+
+def ReplaceReminderSchedule(
+    db: Session,
+    *,
+    source_module: str,
+    user_id: int,
+    time_zone: str,
+    slots: ReminderSlots,
+    now: datetime,
+) -> None:
+    """Rewrites one user's enabled reminder slots for a module. The caller commits."""
+    existing_rows = (
+        db.query(ReminderSchedule)
+        .filter(
+            ReminderSchedule.SourceModule == source_module,
+            ReminderSchedule.UserId == user_id,
+        )
+        .all()
+    )
+    _ApplySlots(db, existing_rows, source_module, {user_id: (time_zone, slots)}, now)
+
+
+def SyncReminderSchedule(
+    db: Session,
+    *,
+    source_module: str,
+    slots_by_user: dict[int, tuple[str, ReminderSlots]],
+    now: datetime,
+) -> None:
+    """Rewrites the whole index for a module, dropping users that are no longer listed.
+    The caller commits."""
+    existing_rows = (
+        db.query(ReminderSchedule).filter(ReminderSchedule.SourceModule == source_module).all()
+    )
+    _ApplySlots(db, existing_rows, source_module, slots_by_user, now)
+
+
+def RetimeReminderSchedule(db: Session, *, user_id: int, time_zone: str, now: datetime) -> None:
+    """Moves every indexed reminder for a user to a new time zone. The caller commits."""
+    zone = _ResolveZone(time_zone)
+    if zone is None:
+        return
+    not_before = _FloorMinute(now)
+    rows = db.query(ReminderSchedule).filter(ReminderSchedule.UserId == user_id).all()
+    for row in rows:
+        if row.TimeZone == time_zone:
+            continue
+        row.TimeZone = time_zone
+        row.NextFireAt = ComputeNextFireAt(row.LocalTime, zone, not_before)
+        row.UpdatedAt = now
+        db.add(row)
+
+
+def LoadDueReminderSchedule(
+    db: Session,
+    *,
+    source_module: str,
+    role: str,
+    now_utc: datetime,
+) -> list[ReminderSchedule]:
+    return (
+        db.query(ReminderSchedule)
+        .join(User, User.Id == ReminderSchedule.UserId)
+        .filter(
+            ReminderSchedule.SourceModule == source_module,
+            ReminderSchedule.NextFireAt <= now_utc,
+            User.Role == role,
+        )
+        .order_by(ReminderSchedule.NextFireAt.asc(), ReminderSchedule.Id.asc())
+        .all()
+    )
+
+
+def AdvanceReminderSchedule(db: Session, rows: list[ReminderSchedule], now_utc: datetime) -> None:
+    """Rolls fired (or missed) slots forward to their next occurrence. The caller commits."""
+    not_before = _FloorMinute(now_utc) + timedelta(minutes=1)
+    for row in rows:
+        zone = _ResolveZone(row.TimeZone)
+        if zone is None:
+            db.delete(row)
+            continue
+        row.NextFireAt = ComputeNextFireAt(row.LocalTime, zone, not_before)
+        row.UpdatedAt = now_utc
+        db.add(row)
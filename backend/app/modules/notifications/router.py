@@ -4,7 +4,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.exc import ProgrammingError
 from sqlalchemy.orm import Session
 
-from app.db import GetDb
+from app.db import AsyncDbSession, AsyncGetDb, GetDb
 from app.modules.auth.deps import RequireAuthenticated, UserContext
 from app.modules.auth.models import User
 from app.modules.notifications.schemas import (
@@ -84,33 +84,51 @@ def _BuildDeviceOut(record) -> NotificationDeviceRegistrationOut:
     )
 
 
+def _LoadNotificationList(
+    db: Session,
+    user_id: int,
+    include_read: bool,
+    include_dismissed: bool,
+    limit: int,
+    offset: int,
+) -> NotificationListResponse:
+    records = ListNotifications(
+        db,
+        user_id=user_id,
+        include_read=include_read,
+        include_dismissed=include_dismissed,
+        limit=limit,
+        offset=offset,
+    )
+    user_ids = {
+        record.CreatedByUserId
+        for record in records
+        if record.CreatedByUserId > 0 and not IsSystemNotificationType(record.Type)
+    }
+    name_map = _LoadUserNames(db, user_ids)
+    notifications = [_BuildNotificationOut(record, name_map) for record in records]
+    unread_count = CountUnread(db, user_id=user_id)
+    return NotificationListResponse(Notifications=notifications, UnreadCount=unread_count)
+
+
 @router.get("", response_model=NotificationListResponse)
-def ListNotificationItems(
+async def ListNotificationItems(
     include_read: bool = True,
     include_dismissed: bool = False,
     limit: int = 20,
     offset: int = 0,
-    db: Session = Depends(GetDb),
+    db: AsyncDbSession = Depends(AsyncGetDb),
     user: UserContext = Depends(RequireAuthenticated),
 ) -> NotificationListResponse:
     try:
-        records = ListNotifications(
-            db,
-            user_id=user.Id,
-            include_read=include_read,
-            include_dismissed=include_dismissed,
-            limit=limit,
-            offset=offset,
+        return await db.run_sync(
+            _LoadNotificationList,
+            user.Id,
+            include_read,
+            include_dismissed,
+            limit,
+            offset,
         )
-        user_ids = {
-            record.CreatedByUserId
-            for record in records
-            if record.CreatedByUserId > 0 and not IsSystemNotificationType(record.Type)
-        }
-        name_map = _LoadUserNames(db, user_ids)
-        notifications = [_BuildNotificationOut(record, name_map) for record in records]
-        unread_count = CountUnread(db, user_id=user.Id)
-        return NotificationListResponse(Notifications=notifications, UnreadCount=unread_count)
     except ProgrammingError as exc:
         _handle_db_error(exc)
 
@@ -165,12 +183,12 @@ def CreateNotificationItems(
 
 
 @router.get("/badge-count", response_model=NotificationBadgeCountResponse)
-def GetBadgeCount(
-    db: Session = Depends(GetDb),
+async def GetBadgeCount(
+    db: AsyncDbSession = Depends(AsyncGetDb),
     user: UserContext = Depends(RequireAuthenticated),
 ) -> NotificationBadgeCountResponse:
     try:
-        unread_count = CountUnread(db, user_id=user.Id)
+        unread_count = await db.run_sync(CountUnread, user_id=user.Id)
         return NotificationBadgeCountResponse(UnreadCount=unread_count)
     except ProgrammingError as exc:
         _handle_db_error(exc)
@@ -6,10 +6,15 @@ from sqlalchemy.orm import Session
 
 from app.modules.auth.deps import NowUtc, UserContext
 from app.modules.auth.models import User
-from app.modules.notifications.models import Notification, NotificationDeviceRegistration
+from app.core.scheduler import GetScheduler
+from app.modules.notifications.models import (
+    Notification,
+    NotificationDeviceRegistration,
+    NotificationPushOutbox,
+)
 from app.modules.notifications.push_service import (
+    IsPushEnabled,
     RegisterNotificationDevice,
-    SendPushForNotification,
     UnregisterNotificationDevice,
 )
 from app.modules.notifications.schemas import NotificationTargetScope
@@ -17,6 +22,12 @@ from app.modules.notifications.utils.rbac import IsAdmin
 from app.modules.notifications.utils.text import NormalizeNotificationTitle
 
 logger = logging.getLogger("notifications")
+PUSH_OUTBOX_JOB = "notification_push_outbox"
+OUTBOX_STATUS_PENDING = "Pending"
+OUTBOX_STATUS_SENDING = "Sending"
+OUTBOX_STATUS_SENT = "Sent"
+OUTBOX_STATUS_FAILED = "Failed"
+OUTBOX_STATUS_SKIPPED = "Skipped"
 SYSTEM_CREATED_BY_NAME = "Everday"
 SYSTEM_NOTIFICATION_TYPES: frozenset[str] = frozenset(
     {
@@ -124,9 +135,10 @@ def CreateNotification(
         UpdatedAt=now,
     )
     db.add(record)
+    _EnqueuePushOutbox(db, [record])
     db.commit()
     db.refresh(record)
-    _DispatchPushForNotifications(db, [record])
+    _KickPushOutbox()
     return record
 
 
@@ -174,10 +186,11 @@ def CreateNotificationsForUsers(
     if not records:
         return []
     db.add_all(records)
+    _EnqueuePushOutbox(db, records)
     db.commit()
     for record in records:
         db.refresh(record)
-    _DispatchPushForNotifications(db, records)
+    _KickPushOutbox()
     return records
 
 
@@ -369,19 +382,32 @@ def UnregisterUserNotificationDevice(
     )
 
 
-def _DispatchPushForNotifications(db: Session, records: list[Notification]) -> None:
-    if not records:
+def _EnqueuePushOutbox(db: Session, records: list[Notification]) -> None:
+    # Written in the caller's transaction so a notification never commits without its
+    # push (or vice versa). PUSH_OUTBOX_JOB delivers it off the request path.
+    if not records or not IsPushEnabled():
         return
-    unread_count_map = CountUnreadByUserIds(db, user_ids={record.UserId for record in records})
-    for record in records:
-        try:
-            SendPushForNotification(
-                db,
-                notification=record,
-                badge_count=unread_count_map.get(record.UserId, 0),
+    db.flush()
+    now = NowUtc()
+    db.add_all(
+        [
+            NotificationPushOutbox(
+                NotificationId=record.Id,
+                UserId=record.UserId,
+                Status=OUTBOX_STATUS_PENDING,
+                Attempts=0,
+                NextAttemptAt=now,
+                CreatedAt=now,
+                UpdatedAt=now,
             )
-        except Exception:  # noqa: BLE001
-            logger.exception("Failed push dispatch notification_id=%s", record.Id)
+            for record in records
+        ]
+    )
+
+
+def _KickPushOutbox() -> None:
+    if IsPushEnabled():
+        GetScheduler().Trigger(PUSH_OUTBOX_JOB)
 
 
 def BuildNotificationPayload(record: Notification) -> dict:
@@ -4,6 +4,8 @@ from sqlalchemy.orm import Session
 from app.db import GetDb
 from app.modules.auth.deps import RequireModuleRole, UserContext, NowUtc, _require_env
 from app.modules.auth.models import RefreshToken, User
+from app.modules.auth.principal_cache import InvalidatePrincipal
+from app.modules.auth.user_name_cache import InvalidateUserName
 from app.modules.kids.models import KidLink
 from app.modules.auth.schemas import (
     CreateUserRequest,
@@ -112,6 +114,7 @@ def UpdateUserRole(
     else:
         db.query(KidLink).filter(KidLink.KidUserId == target.Id).delete()
     db.commit()
+    InvalidatePrincipal(target.Id)
 
     return _ToUserOut(target)
 
@@ -168,6 +171,7 @@ def UpdateUserProfile(
 
     db.add(target)
     db.commit()
+    InvalidateUserName(target.Id)
 
     return _ToUserOut(target)
 
@@ -191,5 +195,6 @@ def ApproveUser(
         db.add(target)
         db.commit()
         db.refresh(target)
+        InvalidatePrincipal(target.Id)
 
     return _ToUserOut(target)
@@ -7,6 +7,7 @@ from sqlalchemy.orm import Session
 from app.db import GetDb
 from app.modules.auth.deps import RequireModuleRole, UserContext
 from app.modules.auth.models import User
+from app.modules.auth.user_name_cache import DisplayName, LoadUserNames
 from app.modules.shopping.schemas import ShoppingItemCreate, ShoppingItemOut, ShoppingItemUpdate
 from app.modules.shopping.services import AddItem, DeleteItem, ListItems, UpdateItem
 
@@ -22,19 +23,6 @@ def _handle_db_error(exc: Exception) -> None:
     ) from exc
 
 
-def _DisplayName(user: User) -> str:
-    parts = [user.FirstName, user.LastName]
-    name = " ".join([part for part in parts if part])
-    return name or user.Username
-
-
-def _LoadUserNames(db: Session, user_ids: set[int]) -> dict[int, str]:
-    if not user_ids:
-        return {}
-    users = db.query(User).filter(User.Id.in_(user_ids)).all()
-    return {user.Id: _DisplayName(user) for user in users}
-
-
 def _BuildShoppingOut(entry, added_by_name: str | None) -> ShoppingItemOut:
     return ShoppingItemOut(
         Id=entry.Id,
@@ -64,7 +52,7 @@ def ListShoppingItems(
             for entry in entries
             if (entry.AddedByType or "").lower() != "alexa"
         }
-        user_map = _LoadUserNames(db, user_ids)
+        user_map = LoadUserNames(db, user_ids)
         results = []
         for entry in entries:
             added_by_type = (entry.AddedByType or "").lower()
@@ -90,7 +78,7 @@ def CreateShoppingItem(
             added_by_type="User",
         )
         creator = db.query(User).filter(User.Id == entry.OwnerUserId).first()
-        added_by_name = _DisplayName(creator) if creator else user.Username
+        added_by_name = DisplayName(creator) if creator else user.Username
         return _BuildShoppingOut(entry, added_by_name)
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
@@ -118,7 +106,7 @@ def UpdateShoppingItem(
         if (entry.AddedByType or "").lower() == "alexa":
             added_by_name = "Alexa"
         else:
-            added_by_name = _LoadUserNames(db, {entry.OwnerUserId}).get(entry.OwnerUserId, user.Username)
+            added_by_name = LoadUserNames(db, {entry.OwnerUserId}).get(entry.OwnerUserId, user.Username)
         return _BuildShoppingOut(entry, added_by_name)
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
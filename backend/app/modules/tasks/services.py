@@ -13,6 +13,7 @@ from sqlalchemy.orm import Session
 
 from app.modules.auth.deps import NowUtc, UserContext
 from app.modules.auth.models import User
+from app.modules.notifications.reminder_schedule_service import RetimeReminderSchedule
 from app.modules.notifications.services import CreateNotificationsForUsers
 from app.modules.health.models import Settings as HealthSettings
 from app.modules.kids.models import ReminderSettings as KidsReminderSettings
@@ -1160,6 +1161,8 @@ def _PropagateGlobalReminderTimeZone(
         kids_settings.UpdatedAt = now
         db.add(kids_settings)
 
+    RetimeReminderSchedule(db, user_id=user_id, time_zone=reminder_time_zone, now=now)
+
 
 def ResolveOverdueReminderTime(value: str | None) -> time:
     return _ResolveReminderTime(value)
@@ -0,0 +1,40 @@
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+
+@pytest.fixture
+def make_sqlite_session():
+    """Returns a factory for in-memory SQLite sessions with the given models' tables.
+
+    Each model schema (health, kids, ...) is attached as its own in-memory database, so
+    schema-qualified SQL runs unchanged and same-named tables in different schemas do not
+    collide. A single shared connection lets AsyncDbSession executor threads see the
+    same data. Sessions match SessionLocal (autoflush off).
+    """
+    sessions = []
+
+    def _Create(*models, schemas=()):
+        attached = sorted({model.__table__.schema for model in models if model.__table__.schema} | set(schemas))
+        engine = create_engine(
+            "sqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+
+        @event.listens_for(engine, "connect")
+        def _AttachSchemas(dbapi_connection, _record):
+            for schema in attached:
+                dbapi_connection.execute(f"ATTACH DATABASE ':memory:' AS {schema}")
+
+        for model in models:
+            model.__table__.create(engine)
+        session = sessionmaker(bind=engine, autoflush=False)()
+        sessions.append(session)
+        return session
+
+    yield _Create
+    for session in sessions:
+        session.close()
+        session.get_bind().dispose()
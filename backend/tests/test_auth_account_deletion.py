@@ -0,0 +1,23 @@
+from app.db import Base
+from app.modules.auth.account_deletion_service import DeleteAccountAndData
+from app.modules.auth.models import User
+from app.modules.health.models import DailyLog, DailyTotals
+from app.modules.health.services.daily_logs_service import UpdateSteps
+from app.modules.notes.models import NoteTaskLink
+
+
+def test_delete_account_purges_health_history_and_rollup(make_sqlite_session):
+    # NoteTaskLink's foreign key names a table that does not exist under that name, so it
+    # cannot be created here; the purge only touches it for users who own notes.
+    models = [mapper.class_ for mapper in Base.registry.mappers if mapper.class_ is not NoteTaskLink]
+    db = make_sqlite_session(*models)
+    for user_id in (5, 6):
+        db.add(User(Id=user_id, Username=f"user{user_id}", PasswordHash="x", Role="Parent"))
+        db.commit()
+        UpdateSteps(db, user_id, "2026-03-02", 4000, None, WeightKg=80.5)
+
+    DeleteAccountAndData(db, user_id=5)
+    db.commit()
+
+    assert [row.UserId for row in db.query(DailyLog).all()] == [6]
+    assert [row.UserId for row in db.query(DailyTotals).all()] == [6]
@@ -0,0 +1,102 @@
+from types import SimpleNamespace
+
+import jwt
+import pytest
+from fastapi import HTTPException
+
+import app.modules.auth.deps as auth_deps
+import app.core.ttl_cache as ttl_cache_module
+import app.modules.auth.principal_cache as principal_cache_module
+from app.modules.auth.principal_cache import PrincipalCache
+
+_SECRET = "test-secret-key-for-principal-cache-tests"
+
+
+class _FakeUserQuery:
+    def __init__(self, db):
+        self._db = db
+
+    def filter(self, *_args, **_kwargs):
+        return self
+
+    def first(self):
+        self._db.queries += 1
+        return self._db.user
+
+
+class _FakeDb:
+    def __init__(self, user):
+        self.user = user
+        self.queries = 0
+
+    def query(self, *_args, **_kwargs):
+        return _FakeUserQuery(self)
+
+
+def _Request(user_id: int):
+    token = jwt.encode({"sub": str(user_id)}, _SECRET, algorithm="HS256")
+    return SimpleNamespace(headers={"Authorization": f"Bearer {token}"})
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    monkeypatch.setenv("JWT_SECRET_KEY", _SECRET)
+    fresh = PrincipalCache(max_entries=2, ttl_seconds=60)
+    monkeypatch.setattr(auth_deps, "principal_cache", fresh)
+    monkeypatch.setattr(principal_cache_module, "principal_cache", fresh)
+    return fresh
+
+
+def test_require_authenticated_serves_repeat_requests_from_cache(cache):
+    db = _FakeDb(SimpleNamespace(Id=7, Username="sam", Role="Parent", IsApproved=True))
+
+    first = auth_deps.RequireAuthenticated(_Request(7), db)
+    second = auth_deps.RequireAuthenticated(_Request(7), db)
+
+    assert first == second == auth_deps.UserContext(Id=7, Username="sam", Role="Parent")
+    assert db.queries == 1
+    stats = cache.GetStats()
+    assert stats["Hits"] == 1
+    assert stats["Misses"] == 1
+
+
+def test_invalidate_principal_forces_reload(cache):
+    db = _FakeDb(SimpleNamespace(Id=7, Username="sam", Role="Parent", IsApproved=True))
+    auth_deps.RequireAuthenticated(_Request(7), db)
+
+    db.user.Role = "Kid"
+    principal_cache_module.InvalidatePrincipal(7)
+    reloaded = auth_deps.RequireAuthenticated(_Request(7), db)
+
+    assert reloaded.Role == "Kid"
+    assert db.queries == 2
+
+
+def test_unapproved_users_are_not_cached(cache):
+    db = _FakeDb(SimpleNamespace(Id=9, Username="new", Role="Kid", IsApproved=False))
+
+    for _ in range(2):
+        with pytest.raises(HTTPException) as exc:
+            auth_deps.RequireAuthenticated(_Request(9), db)
+        assert exc.value.status_code == 403
+
+    assert db.queries == 2
+    assert cache.GetStats()["Size"] == 0
+
+
+def test_principal_cache_evicts_least_recently_used_and_expires(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(ttl_cache_module.time, "monotonic", lambda: clock[0])
+    cache = PrincipalCache(max_entries=2, ttl_seconds=30)
+
+    cache.Put(1, ("a", "Parent"))
+    cache.Put(2, ("b", "Kid"))
+    assert cache.Get(1) == ("a", "Parent")
+    cache.Put(3, ("c", "Kid"))
+
+    assert cache.Get(2) is None
+    assert cache.Get(1) == ("a", "Parent")
+    assert cache.GetStats()["Evictions"] == 1
+
+    clock[0] += 31
+    assert cache.Get(1) is None
@@ -7,6 +7,7 @@ from fastapi import HTTPException
 from app.modules.auth import router as auth_router
 from app.modules.auth.models import RefreshToken, User
 from app.modules.auth.schemas import RefreshRequest
+from app.modules.auth.service import GetRefreshTokenLookupStats
 
 
 class _FakeRefreshTokenQuery:
@@ -119,7 +120,7 @@ def test_refresh_uses_exact_lookup_for_hashed_tokens(monkeypatch):
     assert created_tokens[0].LookupHash == "lookup:next-refresh"
 
 
-def test_refresh_falls_back_to_legacy_scan_once_and_backfills_lookup_hash(monkeypatch):
+def test_refresh_rejects_legacy_token_without_scanning(monkeypatch):
     now = datetime(2026, 3, 24, tzinfo=timezone.utc)
     legacy = SimpleNamespace(
         UserId=4,
@@ -128,36 +129,27 @@ def test_refresh_falls_back_to_legacy_scan_once_and_backfills_lookup_hash(monkey
         RevokedAt=None,
         ExpiresAt=now + timedelta(days=7),
     )
-    user = SimpleNamespace(
-        Id=4,
-        Username="bianca",
-        IsApproved=True,
-        RequirePasswordChange=False,
-        Role="Parent",
-        FirstName="Bianca",
-        LastName="Hammer",
-        Email="bianca@example.com",
-        DiscordHandle=None,
-    )
-    db = _FakeDb(exact_token=None, legacy_tokens=[legacy], user=user)
+    db = _FakeDb(exact_token=None, legacy_tokens=[legacy])
+    verify_calls = []
+
+    def _Verify(raw, token_hash):
+        verify_calls.append(token_hash)
+        return token_hash == f"hash:{raw}"
 
     monkeypatch.setattr(auth_router, "NowUtc", lambda: now)
-    monkeypatch.setattr(auth_router, "VerifyRefreshToken", lambda raw, token_hash: token_hash == f"hash:{raw}")
+    monkeypatch.setattr(auth_router, "VerifyRefreshToken", _Verify)
     monkeypatch.setattr(auth_router, "ComputeRefreshTokenLookupHash", lambda raw: f"lookup:{raw}")
-    monkeypatch.setattr(auth_router, "CreateAccessToken", lambda user_id, username: ("access-456", 1800))
-    monkeypatch.setattr(auth_router, "CreateRefreshToken", lambda: "rotated-refresh")
-    monkeypatch.setattr(auth_router, "HashRefreshToken", lambda raw: f"hash:{raw}")
-    monkeypatch.setattr(auth_router, "_require_env", lambda name: "30")
+    misses_before = GetRefreshTokenLookupStats()["Misses"]
 
-    response = auth_router.Refresh(RefreshRequest(RefreshToken="legacy-refresh"), db=db)
+    with pytest.raises(HTTPException) as exc_info:
+        auth_router.Refresh(RefreshRequest(RefreshToken="legacy-refresh"), db=db)
 
-    assert response.AccessToken == "access-456"
-    assert response.RefreshToken == "rotated-refresh"
-    assert legacy.LookupHash == "lookup:legacy-refresh"
-    assert legacy.RevokedAt == now
+    assert exc_info.value.status_code == 401
+    assert verify_calls == []
     assert db.exact_first_calls == 1
-    assert db.legacy_all_calls == 1
-    assert db.commit_count == 1
+    assert db.legacy_all_calls == 0
+    assert legacy.LookupHash is None
+    assert GetRefreshTokenLookupStats()["Misses"] == misses_before + 1
 
 
 def test_logout_rejects_token_owned_by_another_user(monkeypatch):
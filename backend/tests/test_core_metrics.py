@@ -0,0 +1,47 @@
+import pytest
+
+from app.core.metrics import MetricsRegistry
+
+
+def test_histogram_renders_cumulative_buckets_per_label_set():
+    registry = MetricsRegistry()
+    histogram = registry.Histogram("req_seconds", "Latency.", ("route",), buckets=(0.1, 1.0))
+
+    histogram.Observe(0.05, route="/a")
+    histogram.Observe(0.1, route="/a")
+    histogram.Observe(2.0, route="/a")
+    histogram.Observe(0.5, route="/b")
+
+    lines = registry.Render().splitlines()
+    assert "# TYPE req_seconds histogram" in lines
+    assert 'req_seconds_bucket{route="/a",le="0.1"} 2' in lines
+    assert 'req_seconds_bucket{route="/a",le="1"} 2' in lines
+    assert 'req_seconds_bucket{route="/a",le="+Inf"} 3' in lines
+    assert 'req_seconds_count{route="/a"} 3' in lines
+    assert 'req_seconds_sum{route="/a"} 2.15' in lines
+    assert 'req_seconds_bucket{route="/b",le="1"} 1' in lines
+
+
+def test_counter_and_gauge_render_and_escape_labels():
+    registry = MetricsRegistry()
+    counter = registry.Counter("calls_total", "Calls.", ("name",))
+    counter.Inc(name='say "hi"')
+    counter.Inc(2, name='say "hi"')
+    gauge = registry.Gauge("pool_checked_out", "Checked out.")
+    gauge.SetFunction(lambda: 4)
+
+    text = registry.Render()
+
+    assert 'calls_total{name="say \\"hi\\""} 3' in text
+    assert "pool_checked_out 4" in text
+
+
+def test_registry_returns_existing_metric_and_rejects_type_clash():
+    registry = MetricsRegistry()
+    first = registry.Counter("jobs_total", "Jobs.")
+
+    assert registry.Counter("jobs_total", "Jobs.") is first
+    with pytest.raises(ValueError):
+        registry.Gauge("jobs_total", "Jobs.")
+    with pytest.raises(ValueError):
+        first.Inc(job="unexpected")
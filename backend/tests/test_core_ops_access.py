@@ -0,0 +1,49 @@
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+import app.modules.core.router as core_router
+from app.modules.auth.deps import UserContext
+
+
+def _Request(authorization=None):
+    return SimpleNamespace(headers={"Authorization": authorization} if authorization else {})
+
+
+def _SignedIn(monkeypatch, role):
+    monkeypatch.setattr(
+        core_router,
+        "RequireAuthenticated",
+        lambda _request, _db: UserContext(Id=1, Username="someone", Role=role),
+    )
+
+
+def test_scrape_token_grants_access_without_a_session(monkeypatch):
+    monkeypatch.setenv("METRICS_SCRAPE_TOKEN", "scrape-secret")
+
+    def _NoSession(_request, _db):
+        raise AssertionError("scrape token should not need a session")
+
+    monkeypatch.setattr(core_router, "RequireAuthenticated", _NoSession)
+
+    assert core_router._RequireOpsAccess(_Request("Bearer scrape-secret"), db=None) is None
+
+
+def test_ops_endpoints_need_a_parent_without_the_scrape_token(monkeypatch):
+    monkeypatch.setenv("METRICS_SCRAPE_TOKEN", "scrape-secret")
+    _SignedIn(monkeypatch, "Kid")
+    with pytest.raises(HTTPException) as denied:
+        core_router._RequireOpsAccess(_Request("Bearer kid-jwt"), db=None)
+    assert denied.value.status_code == 403
+
+    _SignedIn(monkeypatch, "Parent")
+    assert core_router._RequireOpsAccess(_Request("Bearer parent-jwt"), db=None) is None
+
+
+def test_ops_endpoints_reject_anonymous_requests(monkeypatch):
+    monkeypatch.delenv("METRICS_SCRAPE_TOKEN", raising=False)
+
+    with pytest.raises(HTTPException) as denied:
+        core_router._RequireOpsAccess(_Request(), db=None)
+    assert denied.value.status_code == 401
@@ -0,0 +1,73 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from app.core.query_stats import (
+    BeginRequestQueryStats,
+    EndRequestQueryStats,
+    InstallQueryInstrumentation,
+    NormalizeStatement,
+)
+from app.db import AsyncDbSession
+
+
+def _Engine():
+    InstallQueryInstrumentation()
+    return create_engine("sqlite://", connect_args={"check_same_thread": False})
+
+
+def test_request_stats_count_queries_and_flag_repeated_shapes():
+    engine = _Engine()
+    stats, token = BeginRequestQueryStats()
+    try:
+        with engine.connect() as conn:
+            for value in range(6):
+                conn.execute(text("SELECT :value"), {"value": value})
+            conn.execute(text("SELECT 1, 2"))
+    finally:
+        EndRequestQueryStats(token)
+
+    assert stats.Count == 7
+    assert stats.DurationSeconds > 0
+    suspects = stats.NPlusOneSuspects(threshold=5)
+    assert suspects == [("SELECT ?", 6)]
+    assert stats.NPlusOneSuspects(threshold=0) == []
+
+
+def test_queries_outside_a_request_are_not_recorded():
+    engine = _Engine()
+    stats, token = BeginRequestQueryStats()
+    EndRequestQueryStats(token)
+
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+    assert stats.Count == 0
+
+
+def test_async_session_work_is_counted_against_the_request():
+    engine = _Engine()
+    session = sessionmaker(bind=engine)()
+    executor = ThreadPoolExecutor(max_workers=1)
+
+    async def _Run():
+        stats, token = BeginRequestQueryStats()
+        try:
+            handle = AsyncDbSession(session, executor)
+            await handle.run_sync(lambda db: db.execute(text("SELECT 1")).scalar_one())
+            await handle.close()
+        finally:
+            EndRequestQueryStats(token)
+        return stats
+
+    stats = asyncio.run(_Run())
+    executor.shutdown()
+
+    assert stats.Count == 1
+
+
+def test_normalize_statement_folds_in_lists_and_whitespace():
+    assert NormalizeStatement("SELECT *\n  FROM t WHERE id IN (?, ?, ?)") == "SELECT * FROM t WHERE id IN (?)"
+    assert NormalizeStatement("SELECT * FROM t WHERE id IN (?)") == "SELECT * FROM t WHERE id IN (?)"
@@ -0,0 +1,164 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from app.core.scheduler import JobScheduler
+
+
+class _FakeSession:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def test_scheduler_runs_job_with_own_session_and_records_duration():
+    sessions: list[_FakeSession] = []
+
+    def _factory():
+        session = _FakeSession()
+        sessions.append(session)
+        return session
+
+    seen = []
+    scheduler = JobScheduler(max_workers=1, session_factory=_factory)
+    scheduler.Register("sample", lambda db: seen.append(db), interval_seconds=60)
+    job = scheduler._jobs["sample"]
+
+    scheduler._Execute(job)
+
+    stats = scheduler.GetStats()["sample"]
+    assert seen == [sessions[0]]
+    assert sessions[0].closed is True
+    assert stats["Runs"] == 1
+    assert stats["Failures"] == 0
+    assert stats["LastRunFailed"] is False
+    assert stats["Running"] is False
+
+
+def test_scheduler_counts_failures_without_raising():
+    scheduler = JobScheduler(max_workers=1, session_factory=_FakeSession)
+
+    def _boom(_db):
+        raise RuntimeError("boom")
+
+    scheduler.Register("failing", _boom, interval_seconds=60)
+    scheduler._Execute(scheduler._jobs["failing"])
+
+    stats = scheduler.GetStats()["failing"]
+    assert stats["Runs"] == 1
+    assert stats["Failures"] == 1
+    assert stats["LastRunFailed"] is True
+
+
+def test_scheduler_skips_tick_while_previous_run_in_flight():
+    release = threading.Event()
+    started = threading.Event()
+
+    def _slow(_db):
+        started.set()
+        release.wait(timeout=5)
+
+    scheduler = JobScheduler(max_workers=2, session_factory=_FakeSession)
+    scheduler.Register("slow", _slow, interval_seconds=60)
+    scheduler._executor = ThreadPoolExecutor(max_workers=2)
+    job = scheduler._jobs["slow"]
+    try:
+        assert scheduler._Submit(job) is True
+        assert started.wait(timeout=5)
+        assert scheduler._Submit(job) is False
+        release.set()
+        job.future.result(timeout=5)
+    finally:
+        release.set()
+        scheduler._executor.shutdown(wait=True)
+
+    stats = scheduler.GetStats()["slow"]
+    assert stats["Overlaps"] == 1
+    assert stats["Runs"] == 1
+
+
+def test_scheduler_trigger_runs_job_once_and_ignores_when_busy():
+    release = threading.Event()
+    runs = []
+
+    def _job(_db):
+        runs.append(1)
+        release.wait(timeout=5)
+
+    scheduler = JobScheduler(max_workers=2, session_factory=_FakeSession)
+    scheduler.Register("outbox", _job, interval_seconds=60)
+    assert scheduler.Trigger("outbox") is False
+
+    scheduler._executor = ThreadPoolExecutor(max_workers=2)
+    job = scheduler._jobs["outbox"]
+    try:
+        assert scheduler.Trigger("outbox") is True
+        assert scheduler.Trigger("outbox") is False
+        release.set()
+        job.future.result(timeout=5)
+    finally:
+        release.set()
+        scheduler._executor.shutdown(wait=True)
+
+    assert runs == [1]
+    assert scheduler.GetStats()["outbox"]["Overlaps"] == 0
+
+
+def test_scheduler_counts_queued_tick_separately_from_overlap():
+    release = threading.Event()
+    started = threading.Event()
+
+    def _slow(_db):
+        started.set()
+        release.wait(timeout=5)
+
+    scheduler = JobScheduler(max_workers=1, session_factory=_FakeSession)
+    scheduler.Register("slow", _slow, interval_seconds=60)
+    scheduler.Register("queued", lambda _db: None, interval_seconds=60)
+    scheduler._executor = ThreadPoolExecutor(max_workers=1)
+    queued = scheduler._jobs["queued"]
+    try:
+        assert scheduler._Submit(scheduler._jobs["slow"]) is True
+        assert started.wait(timeout=5)
+        assert scheduler._Submit(queued) is True
+        assert scheduler._Submit(queued) is False
+        release.set()
+        queued.future.result(timeout=5)
+    finally:
+        release.set()
+        scheduler._executor.shutdown(wait=True)
+
+    stats = scheduler.GetStats()["queued"]
+    assert (stats["Overlaps"], stats["QueuedSkips"], stats["Runs"]) == (0, 1, 1)
+
+
+def test_scheduler_dedicated_worker_does_not_wait_behind_shared_pool():
+    release = threading.Event()
+    started = threading.Event()
+    ran = threading.Event()
+
+    def _slow(_db):
+        started.set()
+        release.wait(timeout=5)
+
+    async def _Run():
+        scheduler = JobScheduler(max_workers=1, session_factory=_FakeSession)
+        scheduler.Register("slow", _slow, interval_seconds=60)
+        scheduler.Register("outbox", lambda _db: ran.set(), interval_seconds=60, dedicated_worker=True)
+        scheduler.Register("daily", lambda _db: None, interval_seconds=60, first_run_delay_seconds=60)
+        scheduler.Start()
+        try:
+            await asyncio.sleep(0)
+            assert await asyncio.to_thread(started.wait, 5)
+            assert await asyncio.to_thread(ran.wait, 5)
+            return scheduler.GetStats()
+        finally:
+            release.set()
+            await scheduler.Stop()
+
+    stats = asyncio.run(_Run())
+    assert stats["outbox"]["DedicatedWorker"] is True
+    assert stats["daily"]["Runs"] == 0
+    assert stats["daily"]["LastStartedAt"] is None
@@ -0,0 +1,91 @@
+from sqlalchemy import Column, Integer, MetaData, Table
+
+import app.core.schema_ready as schema_ready
+
+
+class _FakeResult:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def all(self):
+        return self._rows
+
+
+class _FakeConnection:
+    def __init__(self, engine):
+        self._engine = engine
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc):
+        return False
+
+    def execute(self, _statement, params):
+        self._engine.queries.append(params["schemas"])
+        return _FakeResult([(schema.upper(), name) for schema, name in self._engine.present])
+
+
+class _FakeEngine:
+    def __init__(self, present):
+        self.present = present
+        self.queries = []
+
+    def connect(self):
+        return _FakeConnection(self)
+
+    def begin(self):
+        return _FakeConnection(self)
+
+
+def _Expected():
+    metadata = MetaData()
+    return {
+        ("kids", "chores"): Table("chores", metadata, Column("Id", Integer, primary_key=True), schema="kids"),
+        ("auth", "users"): Table("users", metadata, Column("Id", Integer, primary_key=True), schema="auth"),
+    }
+
+
+def _Setup(monkeypatch, tmp_path):
+    monkeypatch.setenv("SCHEMA_READY_MARKER_PATH", str(tmp_path / "marker"))
+    monkeypatch.setattr(schema_ready, "_ExpectedTables", _Expected)
+    monkeypatch.setattr(schema_ready, "GetHeadRevisions", lambda: ["0066"])
+
+
+def test_ready_schema_writes_marker_and_later_workers_skip_the_catalog(monkeypatch, tmp_path):
+    _Setup(monkeypatch, tmp_path)
+    engine = _FakeEngine({("kids", "chores"), ("auth", "users")})
+
+    assert schema_ready.EnsureSchemaReady(engine) is True
+    assert engine.queries == [["auth", "kids"]]
+    assert (tmp_path / "marker").exists()
+
+    second_worker = _FakeEngine(set())
+    assert schema_ready.EnsureSchemaReady(second_worker) is True
+    assert second_worker.queries == []
+    assert schema_ready.IsSchemaReady("kids") is True
+
+
+def test_new_migration_head_invalidates_marker(monkeypatch, tmp_path):
+    _Setup(monkeypatch, tmp_path)
+    schema_ready.EnsureSchemaReady(_FakeEngine({("kids", "chores"), ("auth", "users")}))
+    monkeypatch.setattr(schema_ready, "GetHeadRevisions", lambda: ["0067"])
+
+    engine = _FakeEngine({("kids", "chores"), ("auth", "users")})
+    assert schema_ready.EnsureSchemaReady(engine) is True
+    assert len(engine.queries) == 1
+
+
+def test_missing_tables_mark_only_their_schema_unready(monkeypatch, tmp_path):
+    _Setup(monkeypatch, tmp_path)
+    monkeypatch.setattr(schema_ready.Base.metadata, "create_all", lambda **_kwargs: None)
+    engine = _FakeEngine({("auth", "users")})
+
+    try:
+        assert schema_ready.EnsureSchemaReady(engine) is False
+        assert schema_ready.IsSchemaReady("kids") is False
+        assert schema_ready.IsSchemaReady("auth") is True
+        assert not (tmp_path / "marker").exists()
+        assert len(engine.queries) == 2
+    finally:
+        schema_ready._missing.clear()
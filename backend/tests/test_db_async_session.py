@@ -0,0 +1,83 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import app.db as db_module
+from app.db import AsyncDbSession
+
+
+class _FakeSession:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def test_run_sync_passes_session_and_runs_off_the_event_loop():
+    session = _FakeSession()
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="db-async")
+
+    def _Query(db, user_id, *, limit):
+        return db, user_id, limit, threading.current_thread().name
+
+    async def _Run():
+        handle = AsyncDbSession(session, executor)
+        result = await handle.run_sync(_Query, 7, limit=3)
+        await handle.close()
+        return result
+
+    seen_session, user_id, limit, thread_name = asyncio.run(_Run())
+    executor.shutdown()
+
+    assert seen_session is session
+    assert (user_id, limit) == (7, 3)
+    assert thread_name.startswith("db-async")
+    assert session.closed is True
+
+
+def test_close_waits_for_call_left_running_by_cancelled_request():
+    session = _FakeSession()
+    executor = ThreadPoolExecutor(max_workers=2)
+    started = threading.Event()
+    release = threading.Event()
+    closed_while_running = []
+
+    def _Slow(db):
+        started.set()
+        release.wait(timeout=5)
+        closed_while_running.append(db.closed)
+
+    async def _Run():
+        handle = AsyncDbSession(session, executor)
+        task = asyncio.ensure_future(handle.run_sync(_Slow))
+        await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+        task.cancel()
+        closing = asyncio.ensure_future(handle.close())
+        await asyncio.sleep(0.05)
+        assert session.closed is False
+        release.set()
+        await closing
+
+    asyncio.run(_Run())
+    executor.shutdown()
+
+    assert closed_while_running == [False]
+    assert session.closed is True
+
+
+def test_async_get_db_closes_session(monkeypatch):
+    session = _FakeSession()
+    monkeypatch.setattr(db_module, "SessionLocal", lambda: session)
+    monkeypatch.setattr(db_module, "_async_executor", ThreadPoolExecutor(max_workers=1))
+
+    async def _Run():
+        dependency = db_module.AsyncGetDb()
+        handle = await dependency.__anext__()
+        assert isinstance(handle, AsyncDbSession)
+        await dependency.aclose()
+
+    asyncio.run(_Run())
+    db_module.CloseAsyncDb()
+
+    assert session.closed is True
@@ -0,0 +1,98 @@
+import json
+
+import pytest
+
+import app.modules.health.services.food_lookup_service as food_lookup_module
+from app.modules.health.models import LookupCacheEntry
+from app.modules.health.services.food_lookup_service import (
+    GetAiLookupCacheStats,
+    GetFoodSuggestions,
+    LookupFoodByText,
+    LookupFoodByTextOptions,
+    NormalizeFoodQuery,
+)
+from app.modules.health.services.lookup_cache import PersistentLookupCache
+
+MILK = {
+    "FoodName": "Milk, full cream",
+    "ServingQuantity": 250,
+    "ServingUnit": "mL",
+    "CaloriesPerServing": 160,
+    "ProteinPerServing": 8.5,
+}
+
+
+def _NewCaches(monkeypatch):
+    monkeypatch.setattr(
+        food_lookup_module,
+        "ai_text_lookup_cache",
+        PersistentLookupCache("ai-text", max_entries=16, ttl_seconds=3600, negative_ttl_seconds=0),
+    )
+    monkeypatch.setattr(
+        food_lookup_module,
+        "ai_suggestion_cache",
+        PersistentLookupCache("ai-suggest", max_entries=16, ttl_seconds=3600, negative_ttl_seconds=0),
+    )
+
+
+@pytest.fixture
+def openai_calls(monkeypatch):
+    calls = []
+
+    def _Content(Messages, Temperature, MaxTokens=None):
+        calls.append(("text", Messages[-1]["content"]))
+        return json.dumps([MILK, MILK]) if MaxTokens == 700 else json.dumps(MILK)
+
+    def _ContentForModel(Model, Messages, Temperature, MaxTokens=None):
+        calls.append((Model, Messages[-1]["content"]))
+        return json.dumps(["Milk", "Milk powder"]), Model
+
+    monkeypatch.setattr(food_lookup_module.Settings, "OpenAiApiKey", "test-key")
+    monkeypatch.setattr(food_lookup_module.Settings, "OpenAiModel", "model-a")
+    monkeypatch.setattr(food_lookup_module, "GetOpenAiContent", _Content)
+    monkeypatch.setattr(food_lookup_module, "GetOpenAiContentForModel", _ContentForModel)
+    _NewCaches(monkeypatch)
+    return calls
+
+
+@pytest.fixture
+def db(make_sqlite_session):
+    return make_sqlite_session(LookupCacheEntry)
+
+
+def test_normalize_food_query_folds_case_spacing_and_plurals():
+    assert NormalizeFoodQuery("  Bananas ") == "banana"
+    assert NormalizeFoodQuery("Cherry  TOMATOES") == "cherry tomato"
+    assert NormalizeFoodQuery("blueberries") == "blueberry"
+    assert NormalizeFoodQuery("Sandwiches") == "sandwich"
+    assert NormalizeFoodQuery("hummus glass oats") == "hummus glass oat"
+
+
+def test_repeat_text_lookups_are_served_from_the_shared_cache(db, openai_calls, monkeypatch):
+    first = LookupFoodByText(db, "Milk")
+    again = LookupFoodByText(db, " milk ")
+    options = LookupFoodByTextOptions(db, "milk")
+    # Another worker, or the same one after a restart, only has the table.
+    _NewCaches(monkeypatch)
+    other_worker = LookupFoodByTextOptions(db, "MILKS")
+
+    assert first.ToDict() == again.ToDict()
+    assert [item.ToDict() for item in other_worker] == [item.ToDict() for item in options]
+    assert len(openai_calls) == 2
+    assert GetAiLookupCacheStats()["TextLookups"]["PersistentHits"] == 1
+
+    monkeypatch.setattr(food_lookup_module.Settings, "OpenAiModel", "model-b")
+    LookupFoodByText(db, "milk")
+    assert len(openai_calls) == 3
+
+
+def test_suggestions_are_cached_per_model(db, openai_calls, monkeypatch):
+    monkeypatch.setattr(food_lookup_module.Settings, "OpenAiAutosuggestModel", "suggest-a")
+    assert GetFoodSuggestions(db, "milk") == ["Milk", "Milk powder"]
+    assert GetFoodSuggestions(db, "Milk ") == ["Milk", "Milk powder"]
+    monkeypatch.setattr(food_lookup_module.Settings, "OpenAiAutosuggestModel", "suggest-b")
+    GetFoodSuggestions(db, "milk")
+
+    assert [model for model, _content in openai_calls] == ["suggest-a", "suggest-b"]
+    stats = GetAiLookupCacheStats()["Suggestions"]
+    assert (stats["MemoryHits"], stats["Misses"]) == (1, 2)
@@ -0,0 +1,128 @@
+from datetime import date
+
+import pytest
+
+from app.core.query_stats import BeginRequestQueryStats, EndRequestQueryStats, InstallQueryInstrumentation
+from app.modules.auth.models import User
+from app.modules.health.models import (
+    DailyLog,
+    DailyTotals,
+    Food,
+    ImportLog,
+    MealEntry,
+    MealTemplate,
+    MealTemplateItem,
+    MetricEntry,
+)
+from app.modules.health.schemas import CreateMealEntryInput, UpdateFoodInput, UpdateMealEntryInput
+from app.modules.health.services.daily_logs_service import (
+    CreateMealEntry,
+    DeleteMealEntry,
+    EnsureDailyLogForDate,
+    GetStepsHistory,
+    GetWeightHistory,
+    UpdateMealEntry,
+    UpdateSteps,
+)
+from app.modules.health.services.foods_service import UpdateFood
+from app.modules.health.services.hae_import_service import ImportHealthAutoExportPayload
+
+
+@pytest.fixture
+def db(make_sqlite_session):
+    InstallQueryInstrumentation()
+    session = make_sqlite_session(
+        User, DailyLog, DailyTotals, Food, ImportLog, MealEntry, MealTemplate, MealTemplateItem, MetricEntry
+    )
+    session.add(
+        Food(
+            FoodId="egg",
+            OwnerUserId=1,
+            FoodName="Egg",
+            ServingDescription="1 serving",
+            CaloriesPerServing=70,
+            ProteinPerServing=6,
+        )
+    )
+    session.commit()
+    return session
+
+
+def _Rollup(db, log_date):
+    db.expire_all()
+    return db.query(DailyTotals).filter(DailyTotals.UserId == 1, DailyTotals.LogDate == log_date).one()
+
+
+def _LogEgg(db, daily_log_id, quantity):
+    return CreateMealEntry(
+        db,
+        1,
+        CreateMealEntryInput(
+            DailyLogId=daily_log_id,
+            MealType="Breakfast",
+            FoodId="egg",
+            Quantity=quantity,
+            PortionLabel="serving",
+            PortionBaseUnit="each",
+            PortionBaseAmount=1,
+        ),
+    )
+
+
+def test_meal_entry_writes_keep_the_rollup_current(db):
+    log = EnsureDailyLogForDate(db, 1, "2026-03-02")
+    assert float(_Rollup(db, date(2026, 3, 2)).TotalCalories) == 0
+
+    entry = _LogEgg(db, log.DailyLogId, 2)
+    rollup = _Rollup(db, date(2026, 3, 2))
+    assert float(rollup.TotalCalories) == 140
+    assert float(rollup.TotalProtein) == 12
+
+    UpdateMealEntry(
+        db,
+        1,
+        entry.MealEntryId,
+        UpdateMealEntryInput(Quantity=3, PortionLabel="serving", PortionBaseUnit="each", PortionBaseAmount=1),
+    )
+    assert float(_Rollup(db, date(2026, 3, 2)).TotalCalories) == 210
+
+    UpdateFood(db, 1, "egg", UpdateFoodInput(CaloriesPerServing=80))
+    assert float(_Rollup(db, date(2026, 3, 2)).TotalCalories) == 240
+
+    DeleteMealEntry(db, 1, entry.MealEntryId)
+    assert float(_Rollup(db, date(2026, 3, 2)).TotalCalories) == 0
+
+
+def test_steps_weight_and_import_feed_history_from_the_rollup(db):
+    db.add(User(Id=1, Username="sam", PasswordHash="x", Role="Parent"))
+    db.commit()
+    UpdateSteps(db, 1, "2026-03-02", 4000, None, WeightKg=80.5)
+    UpdateSteps(db, 1, "2026-03-03", 6000, 0.05)
+    ImportHealthAutoExportPayload(
+        db,
+        1,
+        {
+            "data": {
+                "metrics": [
+                    {"name": "step_count", "data": [{"date": "2026-03-04 08:00:00 +1030", "qty": 1500}]},
+                    {
+                        "name": "weight_body_mass",
+                        "units": "kg",
+                        "data": [{"date": "2026-03-04 07:00:00 +1030", "qty": 80}],
+                    },
+                ]
+            }
+        },
+    )
+
+    stats, token = BeginRequestQueryStats()
+    try:
+        steps = GetStepsHistory(db, 1, "2026-03-01", "2026-03-31")
+        weights = GetWeightHistory(db, 1, "2026-03-01", "2026-03-31")
+    finally:
+        EndRequestQueryStats(token)
+
+    assert [(row.LogDate.day, row.Steps) for row in steps] == [(2, 4000), (3, 6000), (4, 1500)]
+    assert [(row.LogDate.day, row.WeightKg) for row in weights] == [(2, 80.5), (4, 80.0)]
+    assert float(_Rollup(db, date(2026, 3, 3)).StepKcalFactorOverride) == 0.05
+    assert stats.Count == 2
@@ -0,0 +1,94 @@
+from types import SimpleNamespace
+
+import pytest
+
+import app.modules.health.services.settings_service as settings_service
+from app.modules.auth.service import ComputeApiKeyLookupHash
+
+
+class _FakeSettingsQuery:
+    def __init__(self, db):
+        self._db = db
+
+    def filter(self, *_args, **_kwargs):
+        return self
+
+    def first(self):
+        return self._db.indexed
+
+    def all(self):
+        self._db.legacy_scans += 1
+        return list(self._db.legacy)
+
+
+class _FakeDb:
+    def __init__(self, indexed=None, legacy=None):
+        self.indexed = indexed
+        self.legacy = legacy or []
+        self.legacy_scans = 0
+        self.commits = 0
+
+    def query(self, *_args, **_kwargs):
+        return _FakeSettingsQuery(self)
+
+    def add(self, _record):
+        return None
+
+    def commit(self):
+        self.commits += 1
+
+
+@pytest.fixture
+def verify_calls(monkeypatch):
+    calls = []
+
+    def _Verify(key, key_hash):
+        calls.append(key_hash)
+        return key_hash == f"argon:{key}"
+
+    monkeypatch.setattr(settings_service, "VerifyApiKey", _Verify)
+    monkeypatch.setattr(
+        settings_service,
+        "_verified_hae_keys",
+        settings_service._VerifiedApiKeyCache(ttl_seconds=300, max_entries=8),
+    )
+    return calls
+
+
+def test_resolve_hae_api_key_uses_lookup_hash_and_caches_verification(verify_calls):
+    key = "device-key-abcd"
+    record = SimpleNamespace(
+        UserId=4,
+        HaeApiKeyHash=f"argon:{key}",
+        HaeApiKeyLookupHash=ComputeApiKeyLookupHash(key),
+    )
+    db = _FakeDb(indexed=record)
+
+    assert settings_service.ResolveUserIdByHaeApiKey(db, key) == 4
+    assert settings_service.ResolveUserIdByHaeApiKey(db, key) == 4
+
+    assert verify_calls == [f"argon:{key}"]
+    assert db.legacy_scans == 0
+
+
+def test_resolve_hae_api_key_cache_is_dropped_when_key_rotates(verify_calls):
+    key = "device-key-abcd"
+    record = SimpleNamespace(UserId=4, HaeApiKeyHash=f"argon:{key}", HaeApiKeyLookupHash="x")
+    db = _FakeDb(indexed=record)
+    assert settings_service.ResolveUserIdByHaeApiKey(db, key) == 4
+
+    record.HaeApiKeyHash = "argon:some-other-key"
+
+    assert settings_service.ResolveUserIdByHaeApiKey(db, key) is None
+    assert len(verify_calls) == 2
+
+
+def test_resolve_hae_api_key_backfills_legacy_rows(verify_calls):
+    key = "legacy-key-wxyz"
+    legacy = SimpleNamespace(UserId=9, HaeApiKeyHash=f"argon:{key}", HaeApiKeyLookupHash=None)
+    db = _FakeDb(legacy=[legacy])
+
+    assert settings_service.ResolveUserIdByHaeApiKey(db, key) == 9
+
+    assert legacy.HaeApiKeyLookupHash == ComputeApiKeyLookupHash(key)
+    assert db.commits == 1
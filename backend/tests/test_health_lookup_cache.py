@@ -0,0 +1,105 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import app.modules.health.services.multi_source_lookup_service as lookup_module
+from app.db import AsyncDbSession
+from app.modules.health.models import LookupCacheEntry
+from app.modules.health.schemas import FoodInfo
+from app.modules.health.services.lookup_cache import PersistentLookupCache, PruneExpiredLookupCache
+from app.modules.health.services.multi_source_lookup_service import MultiSourceFoodLookupService
+
+BANANA = FoodInfo(FoodName="Banana", ServingDescription="1 medium", CaloriesPerServing=105)
+
+
+class _FakeOpenFoodFacts:
+    def __init__(self):
+        self.searches = []
+        self.barcodes = []
+        self.fail = False
+
+    async def SearchProducts(self, Query, PageSize=10):
+        self.searches.append(Query)
+        if self.fail:
+            raise RuntimeError("rate limited")
+        return [BANANA] if "banana" in Query.lower() else []
+
+    async def GetProductByBarcode(self, Barcode):
+        self.barcodes.append(Barcode)
+        return BANANA if Barcode == "123" else None
+
+
+def _NewCache(max_entries=16):
+    return PersistentLookupCache("openfoodfacts", max_entries=max_entries, ttl_seconds=3600, negative_ttl_seconds=60)
+
+
+@pytest.fixture
+def lookup(monkeypatch, make_sqlite_session):
+    session = make_sqlite_session(LookupCacheEntry)
+    executor = ThreadPoolExecutor(max_workers=1)
+    upstream = _FakeOpenFoodFacts()
+    monkeypatch.setattr(lookup_module, "OpenFoodFactsService", upstream)
+    monkeypatch.setattr(lookup_module, "food_lookup_cache", _NewCache())
+
+    def _Run(method, *args):
+        async def _Call():
+            return await method(*args, AsyncDbSession(session, executor))
+
+        return asyncio.run(_Call())
+
+    yield session, upstream, _Run
+    executor.shutdown()
+
+
+def test_search_results_are_shared_through_the_table(lookup, monkeypatch):
+    session, upstream, run = lookup
+
+    first = run(MultiSourceFoodLookupService.Search, "Banana")
+    again = run(MultiSourceFoodLookupService.Search, "  banana ")
+    # A fresh process (restart or another worker) starts with an empty memory tier.
+    monkeypatch.setattr(lookup_module, "food_lookup_cache", _NewCache())
+    other_worker = run(MultiSourceFoodLookupService.Search, "BANANA")
+
+    assert first["openfoodfacts"] == again["openfoodfacts"] == other_worker["openfoodfacts"] == [BANANA]
+    assert upstream.searches == ["Banana"]
+    stats = MultiSourceFoodLookupService.GetCacheStats()
+    assert (stats["PersistentHits"], stats["MemoryHits"], stats["Misses"]) == (1, 0, 0)
+
+
+def test_barcode_misses_are_cached_negatively_and_failures_are_not(lookup):
+    session, upstream, run = lookup
+
+    assert run(MultiSourceFoodLookupService.GetByBarcode, "999") is None
+    assert run(MultiSourceFoodLookupService.GetByBarcode, "999") is None
+    assert run(MultiSourceFoodLookupService.GetByBarcode, "123") == BANANA
+    assert upstream.barcodes == ["999", "123"]
+    assert session.query(LookupCacheEntry).filter(LookupCacheEntry.IsNegative.is_(True)).count() == 1
+
+    upstream.fail = True
+    assert run(MultiSourceFoodLookupService.Search, "apple")["openfoodfacts"] == []
+    upstream.fail = False
+    run(MultiSourceFoodLookupService.Search, "apple")
+    assert upstream.searches == ["apple", "apple"]
+
+    stats = MultiSourceFoodLookupService.GetCacheStats()
+    assert stats["NegativeHits"] == 1
+    assert stats["Misses"] == 4
+
+
+def test_memory_tier_is_lru_bounded_and_expired_rows_are_pruned(lookup):
+    session, _upstream, _run = lookup
+    cache = _NewCache(max_entries=2)
+    for key in ("a", "b", "c"):
+        cache.Put(session, key, {"Key": key})
+
+    assert cache.GetStats()["Size"] == 2
+    assert cache.GetStats()["Evictions"] == 1
+    # Evicted from memory, still served from the table.
+    assert cache.Get(session, "a") == (True, {"Key": "a"})
+    assert cache.GetStats()["PersistentHits"] == 1
+
+    removed = PruneExpiredLookupCache(session, datetime.now(timezone.utc) + timedelta(hours=2))
+    assert removed == 3
+    assert session.query(LookupCacheEntry).count() == 0
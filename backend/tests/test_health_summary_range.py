@@ -0,0 +1,157 @@
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+import app.modules.health.services.summary_service as summary_service
+from app.core.query_stats import BeginRequestQueryStats, EndRequestQueryStats, InstallQueryInstrumentation
+from app.modules.health.models import DailyLog, DailyTotals, Food, MealEntry, MealTemplate, MealTemplateItem
+from app.modules.health.services.calculations import BuildDailySummary, CalculateDailyTotals
+from app.modules.health.services.daily_logs_service import BackfillDailyTotals, GetEntriesForLog
+from app.modules.health.services.template_nutrition_service import RefreshTemplateNutrition
+
+SETTINGS = SimpleNamespace(
+    StepKcalFactor=0.04,
+    DailyCalorieTarget=2000,
+    ProteinTargetMin=100,
+    ProteinTargetMax=150,
+    FibreTarget=30,
+    CarbsTarget=None,
+    FatTarget=None,
+    SaturatedFatTarget=None,
+    SugarTarget=None,
+    SodiumTarget=None,
+)
+
+
+@pytest.fixture
+def db(monkeypatch, make_sqlite_session):
+    monkeypatch.setattr(summary_service, "GetSettings", lambda *_args: SETTINGS)
+    InstallQueryInstrumentation()
+    session = make_sqlite_session(DailyLog, DailyTotals, Food, MealEntry, MealTemplate, MealTemplateItem)
+
+    for food_id, calories, protein, fibre in (("oats", 150, 5, 4), ("milk", 120, 8, None), ("egg", 70, 6, None)):
+        session.add(
+            Food(
+                FoodId=food_id,
+                OwnerUserId=1,
+                FoodName=food_id.title(),
+                ServingDescription="1 serve",
+                CaloriesPerServing=calories,
+                ProteinPerServing=protein,
+                FibrePerServing=fibre,
+            )
+        )
+    for template_id, servings, items in (
+        ("porridge", 2, (("oats", 2), ("milk", 1))),
+        ("omelette", 1, (("egg", 3), ("milk", 0.5))),
+    ):
+        session.add(MealTemplate(MealTemplateId=template_id, UserId=1, TemplateName=template_id, Servings=servings))
+        for index, (food_id, quantity) in enumerate(items):
+            session.add(
+                MealTemplateItem(
+                    MealTemplateItemId=f"{template_id}-{index}",
+                    MealTemplateId=template_id,
+                    FoodId=food_id,
+                    MealType="Breakfast",
+                    Quantity=quantity,
+                )
+            )
+    RefreshTemplateNutrition(session, {"porridge", "omelette"})
+
+    start = date(2026, 3, 2)
+    for day in range(10):
+        if day == 4:
+            continue
+        log_id = f"log-{day}"
+        session.add(
+            DailyLog(
+                DailyLogId=log_id,
+                UserId=1,
+                LogDate=start + timedelta(days=day),
+                Steps=1000 * day,
+                StepKcalFactorOverride=0.05 if day == 2 else None,
+            )
+        )
+        meals = [("Breakfast", "porridge", None, 1 + day % 2), ("Lunch", None, "egg", 2), ("Dinner", "omelette", None, 1)]
+        for index, (meal_type, template_id, food_id, quantity) in enumerate(meals[: 1 + day % 3]):
+            session.add(
+                MealEntry(
+                    MealEntryId=f"{log_id}-{index}",
+                    DailyLogId=log_id,
+                    MealType=meal_type,
+                    FoodId=food_id,
+                    MealTemplateId=template_id,
+                    Quantity=quantity,
+                    SortOrder=index,
+                )
+            )
+    # Another user's log in the same range must not leak in.
+    session.add(DailyLog(DailyLogId="other", UserId=2, LogDate=start, Steps=0))
+    session.add(MealEntry(MealEntryId="other-0", DailyLogId="other", MealType="Lunch", FoodId="egg", Quantity=9))
+    session.commit()
+    assert BackfillDailyTotals(session, BatchSize=4) == 10
+    return session
+
+
+def _PerDaySummaries(db, start, end):
+    logs = (
+        db.query(DailyLog)
+        .filter(DailyLog.UserId == 1, DailyLog.LogDate >= start, DailyLog.LogDate <= end)
+        .order_by(DailyLog.LogDate)
+        .all()
+    )
+    summaries = []
+    for log in logs:
+        factor = float(log.StepKcalFactorOverride) if log.StepKcalFactorOverride is not None else SETTINGS.StepKcalFactor
+        totals = CalculateDailyTotals(GetEntriesForLog(db, 1, log.DailyLogId), log.Steps, factor, SETTINGS)
+        summaries.append(BuildDailySummary(log.LogDate, log.Steps, totals))
+    return summaries
+
+
+def test_weekly_summary_matches_per_day_totals_in_fixed_queries(db):
+    stats, token = BeginRequestQueryStats()
+    try:
+        summary = summary_service.GetWeeklySummary(db, 1, "2026-03-02")
+    finally:
+        EndRequestQueryStats(token)
+
+    assert summary.Days == _PerDaySummaries(db, date(2026, 3, 2), date(2026, 3, 8))
+    assert len(summary.Days) == 6
+    assert all(day.TotalCalories > 0 for day in summary.Days)
+    # One DailyTotals range scan.
+    assert stats.Count == 1
+
+
+def test_monthly_and_range_summaries_share_the_same_days(db):
+    monthly = summary_service.GetMonthlySummary(db, 1, "2026-03")
+    ranged = summary_service.GetRangeSummary(db, 1, "2026-03-01", "2026-03-31")
+
+    assert monthly == ranged
+    assert monthly.Days == _PerDaySummaries(db, date(2026, 3, 1), date(2026, 3, 31))
+    assert monthly.Totals["TotalSteps"] == sum(1000 * day for day in range(10) if day != 4)
+
+
+def test_unsummed_rollup_rows_are_computed_from_entries(db):
+    expected = summary_service.GetWeeklySummary(db, 1, "2026-03-02")
+    # The state migration 0069 leaves behind before the backfill runs.
+    db.query(DailyTotals).update({DailyTotals.TotalCalories: None, DailyTotals.NutritionUpdatedAt: None})
+    db.commit()
+
+    stats, token = BeginRequestQueryStats()
+    try:
+        summary = summary_service.GetWeeklySummary(db, 1, "2026-03-02")
+    finally:
+        EndRequestQueryStats(token)
+
+    assert summary == expected
+    assert stats.Count == 2
+
+
+@pytest.mark.parametrize(
+    ("start_date", "end_date"),
+    [("2026-03-10", "2026-03-01"), ("2025-01-01", "2026-03-01"), ("bad", "2026-03-01")],
+)
+def test_range_summary_rejects_bad_ranges(db, start_date, end_date):
+    with pytest.raises(ValueError):
+        summary_service.GetRangeSummary(db, 1, start_date, end_date)
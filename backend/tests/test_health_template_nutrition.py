@@ -0,0 +1,124 @@
+from datetime import date
+
+import pytest
+
+from app.core.query_stats import BeginRequestQueryStats, EndRequestQueryStats, InstallQueryInstrumentation
+from app.modules.health.models import DailyLog, DailyTotals, Food, MealEntry, MealTemplate, MealTemplateItem
+from app.modules.health.schemas import (
+    CreateMealTemplateInput,
+    MealTemplateItemInput,
+    UpdateFoodInput,
+    UpdateMealTemplateInput,
+)
+from app.modules.health.services.daily_logs_service import GetEntriesForLog
+from app.modules.health.services.foods_service import UpdateFood
+from app.modules.health.services.meal_templates_service import CreateMealTemplate, UpdateMealTemplate
+
+
+@pytest.fixture
+def db(make_sqlite_session):
+    InstallQueryInstrumentation()
+    session = make_sqlite_session(DailyLog, DailyTotals, Food, MealEntry, MealTemplate, MealTemplateItem)
+    for food_id, calories, protein, fibre in (("oats", 150, 5, 4), ("milk", 120, 8, None), ("egg", 70, 6, None)):
+        session.add(
+            Food(
+                FoodId=food_id,
+                OwnerUserId=1,
+                FoodName=food_id.title(),
+                ServingDescription="1 serving",
+                CaloriesPerServing=calories,
+                ProteinPerServing=protein,
+                FibrePerServing=fibre,
+            )
+        )
+    session.add(DailyLog(DailyLogId="log", UserId=1, LogDate=date(2026, 3, 2), Steps=0))
+    session.commit()
+    return session
+
+
+def _Items(*pairs):
+    return [MealTemplateItemInput(FoodId=food_id, MealType="Breakfast", Quantity=quantity) for food_id, quantity in pairs]
+
+
+def _LogTemplate(db, template_id, quantity=1):
+    db.add(
+        MealEntry(
+            MealEntryId=f"entry-{template_id}",
+            DailyLogId="log",
+            MealType="Breakfast",
+            MealTemplateId=template_id,
+            Quantity=quantity,
+            SortOrder=0,
+        )
+    )
+    db.commit()
+
+
+def _RenderTemplateEntry(db):
+    stats, token = BeginRequestQueryStats()
+    try:
+        entries = GetEntriesForLog(db, 1, "log")
+    finally:
+        EndRequestQueryStats(token)
+    # Entries joined to their food and template only; no template-items query.
+    assert stats.Count == 1
+    (entry,) = entries
+    return entry
+
+
+def test_created_template_renders_from_stored_totals(db):
+    created = CreateMealTemplate(
+        db, 1, CreateMealTemplateInput(TemplateName="Porridge", Servings=2, Items=_Items(("oats", 2), ("milk", 1)))
+    )
+    template_id = created.Template.MealTemplateId
+    _LogTemplate(db, template_id)
+
+    stored = db.get(MealTemplate, template_id)
+    assert float(stored.TotalCalories) == 420
+    assert float(stored.TotalFibre) == 8
+
+    entry = _RenderTemplateEntry(db)
+    assert entry.CaloriesPerServing == 210
+    assert entry.ProteinPerServing == 9
+    assert entry.FibrePerServing == 4
+    assert entry.CarbsPerServing is None
+
+
+def test_food_and_template_updates_refresh_stored_totals(db):
+    created = CreateMealTemplate(
+        db, 1, CreateMealTemplateInput(TemplateName="Omelette", Items=_Items(("egg", 3), ("milk", 0.5)))
+    )
+    template_id = created.Template.MealTemplateId
+    _LogTemplate(db, template_id)
+    assert _RenderTemplateEntry(db).CaloriesPerServing == 270
+
+    UpdateFood(db, 1, "egg", UpdateFoodInput(CaloriesPerServing=80, CarbsPerServing=1))
+    entry = _RenderTemplateEntry(db)
+    assert entry.CaloriesPerServing == 300
+    assert entry.CarbsPerServing == 3
+
+    UpdateMealTemplate(db, 1, template_id, UpdateMealTemplateInput(Items=_Items(("egg", 2))))
+    assert _RenderTemplateEntry(db).CaloriesPerServing == 160
+
+    # Servings is applied at render time, so it needs no recompute.
+    UpdateMealTemplate(db, 1, template_id, UpdateMealTemplateInput(Servings=2))
+    assert _RenderTemplateEntry(db).CaloriesPerServing == 80
+
+
+def test_template_without_stored_totals_falls_back_to_items(db):
+    db.add(MealTemplate(MealTemplateId="legacy", UserId=1, TemplateName="Legacy", Servings=1))
+    db.add(
+        MealTemplateItem(
+            MealTemplateItemId="legacy-0",
+            MealTemplateId="legacy",
+            FoodId="oats",
+            MealType="Breakfast",
+            Quantity=1,
+        )
+    )
+    db.commit()
+    _LogTemplate(db, "legacy")
+
+    entries = GetEntriesForLog(db, 1, "log")
+
+    assert entries[0].CaloriesPerServing == 150
@@ -0,0 +1,105 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from app.modules.kids.models import BalanceSnapshot, LedgerEntry
+from app.modules.kids.services.balance_snapshot_service import (
+    ApplyLedgerDelta,
+    GetBalanceAsOf,
+    GetOpeningBalance,
+    ReconcileBalanceSnapshots,
+)
+
+
+@pytest.fixture
+def db(make_sqlite_session):
+    return make_sqlite_session(LedgerEntry, BalanceSnapshot)
+
+
+def _AddEntry(db, kid_user_id, entry_date, amount, is_deleted=False):
+    db.add(
+        LedgerEntry(
+            KidUserId=kid_user_id,
+            EntryType="Deposit",
+            Amount=Decimal(str(amount)),
+            EntryDate=entry_date,
+            CreatedByUserId=1,
+            IsDeleted=is_deleted,
+        )
+    )
+    db.commit()
+
+
+def _Snapshots(db, kid_user_id):
+    rows = (
+        db.query(BalanceSnapshot)
+        .filter(BalanceSnapshot.KidUserId == kid_user_id)
+        .order_by(BalanceSnapshot.MonthStart)
+        .all()
+    )
+    return [(row.MonthStart, Decimal(row.ClosingBalance)) for row in rows]
+
+
+def test_balance_falls_back_to_full_sum_without_snapshot(db):
+    _AddEntry(db, 3, date(2026, 1, 10), "10.00")
+    _AddEntry(db, 3, date(2026, 2, 5), "2.50")
+    _AddEntry(db, 3, date(2026, 2, 20), "99.00", is_deleted=True)
+    _AddEntry(db, 4, date(2026, 2, 5), "50.00")
+
+    assert GetBalanceAsOf(db, 3, date(2026, 2, 28)) == Decimal("12.50")
+    assert GetOpeningBalance(db, 3, date(2026, 2, 1)) == Decimal("10.00")
+
+
+def test_reconcile_creates_closed_month_snapshots_and_reads_use_them(db):
+    _AddEntry(db, 3, date(2026, 1, 10), "10.00")
+    _AddEntry(db, 3, date(2026, 3, 2), "5.00")
+    _AddEntry(db, 3, date(2026, 4, 1), "1.00")
+
+    result = ReconcileBalanceSnapshots(db, today=date(2026, 4, 15))
+
+    assert result == {"Checked": 0, "Created": 3, "Repaired": 0}
+    assert _Snapshots(db, 3) == [
+        (date(2026, 1, 1), Decimal("10.00")),
+        (date(2026, 2, 1), Decimal("10.00")),
+        (date(2026, 3, 1), Decimal("15.00")),
+    ]
+
+    # The snapshot, not the ledger, supplies the opening balance once it exists.
+    db.query(BalanceSnapshot).filter(BalanceSnapshot.MonthStart == date(2026, 3, 1)).update(
+        {BalanceSnapshot.ClosingBalance: Decimal("100.00")}
+    )
+    db.commit()
+    assert GetBalanceAsOf(db, 3, date(2026, 4, 30)) == Decimal("101.00")
+    # The opening balance is March's closing snapshot itself, not February's plus March's entries.
+    assert GetOpeningBalance(db, 3, date(2026, 4, 1)) == Decimal("100.00")
+
+
+def test_ledger_delta_shifts_snapshots_from_entry_month_onwards(db):
+    _AddEntry(db, 3, date(2026, 1, 10), "10.00")
+    ReconcileBalanceSnapshots(db, today=date(2026, 4, 15))
+
+    _AddEntry(db, 3, date(2026, 2, 14), "-4.00")
+    ApplyLedgerDelta(db, kid_user_id=3, entry_date=date(2026, 2, 14), amount=-4)
+    db.commit()
+
+    assert _Snapshots(db, 3) == [
+        (date(2026, 1, 1), Decimal("10.00")),
+        (date(2026, 2, 1), Decimal("6.00")),
+        (date(2026, 3, 1), Decimal("6.00")),
+    ]
+    assert GetOpeningBalance(db, 3, date(2026, 4, 1)) == Decimal("6.00")
+
+
+def test_reconcile_repairs_drifted_and_orphaned_snapshots(db):
+    _AddEntry(db, 3, date(2026, 2, 10), "8.00")
+    ReconcileBalanceSnapshots(db, today=date(2026, 3, 15))
+    db.query(BalanceSnapshot).update({BalanceSnapshot.ClosingBalance: Decimal("1.00")})
+    db.add(BalanceSnapshot(KidUserId=9, MonthStart=date(2026, 2, 1), ClosingBalance=Decimal("3.00")))
+    db.commit()
+
+    result = ReconcileBalanceSnapshots(db, today=date(2026, 3, 15))
+
+    assert result == {"Checked": 2, "Created": 0, "Repaired": 2}
+    assert _Snapshots(db, 3) == [(date(2026, 2, 1), Decimal("8.00"))]
+    assert _Snapshots(db, 9) == [(date(2026, 2, 1), Decimal("0.00"))]
@@ -33,6 +33,17 @@ class _FakeDb:
         self.refresh_called = True
 
 
+@pytest.fixture(autouse=True)
+def snapshot_deltas(monkeypatch):
+    deltas = []
+    monkeypatch.setattr(
+        kids_router,
+        "ApplyLedgerDelta",
+        lambda _db, **kwargs: deltas.append((kwargs["kid_user_id"], kwargs["entry_date"], float(kwargs["amount"]))),
+    )
+    return deltas
+
+
 def test_clamp_non_negative_balance_returns_zero_for_negative_total():
     assert kids_router._ClampNonNegativeBalance(-74.44) == 0.0
     assert kids_router._ClampNonNegativeBalance(24.58) == 24.58
@@ -76,7 +87,7 @@ def test_add_withdrawal_rejects_when_request_exceeds_available_balance(monkeypat
     assert db.refresh_called is False
 
 
-def test_add_withdrawal_allows_amount_within_available_balance(monkeypatch):
+def test_add_withdrawal_allows_amount_within_available_balance(monkeypatch, snapshot_deltas):
     db = _FakeDb()
     payload = LedgerEntryCreate(
         Amount=12.34,
@@ -89,7 +100,7 @@ def test_add_withdrawal_allows_amount_within_available_balance(monkeypatch):
     monkeypatch.setattr(kids_router, "_EnsureParentKidAccess", lambda *_args, **_kwargs: None)
     monkeypatch.setattr(kids_router, "EnsurePocketMoneyCredits", lambda *_args, **_kwargs: None)
     monkeypatch.setattr(kids_router, "_KidBalance", lambda *_args, **_kwargs: 24.58)
-    monkeypatch.setattr(kids_router, "_LoadUserNames", lambda *_args, **_kwargs: {1: "Parent User"})
+    monkeypatch.setattr(kids_router, "LoadUserNames", lambda *_args, **_kwargs: {1: "Parent User"})
 
     result = kids_router.AddWithdrawal(3, payload, db=db, user=user)
 
@@ -100,6 +111,7 @@ def test_add_withdrawal_allows_amount_within_available_balance(monkeypatch):
     assert db.refresh_called is True
     assert result.Amount == -12.34
     assert result.CreatedByName == "Parent User"
+    assert snapshot_deltas == [(3, date(2026, 3, 21), -12.34)]
 
 
 def test_add_withdrawal_uses_requested_entry_date_for_balance_check(monkeypatch):
@@ -121,7 +133,7 @@ def test_add_withdrawal_uses_requested_entry_date_for_balance_check(monkeypatch)
         return 12.0
 
     monkeypatch.setattr(kids_router, "_KidBalance", _fake_kid_balance)
-    monkeypatch.setattr(kids_router, "_LoadUserNames", lambda *_args, **_kwargs: {1: "Parent User"})
+    monkeypatch.setattr(kids_router, "LoadUserNames", lambda *_args, **_kwargs: {1: "Parent User"})
 
     result = kids_router.AddWithdrawal(3, payload, db=db, user=user)
 
@@ -149,7 +161,7 @@ def test_add_starting_balance_uses_raw_ledger_total(monkeypatch):
 
     monkeypatch.setattr(kids_router, "_KidBalance", _fail_if_display_balance_used)
     monkeypatch.setattr(kids_router, "_KidRawBalance", lambda *_args, **_kwargs: -15.0)
-    monkeypatch.setattr(kids_router, "_LoadUserNames", lambda *_args, **_kwargs: {1: "Parent User"})
+    monkeypatch.setattr(kids_router, "LoadUserNames", lambda *_args, **_kwargs: {1: "Parent User"})
 
     result = kids_router.AddStartingBalance(3, payload, db=db, user=user)
 
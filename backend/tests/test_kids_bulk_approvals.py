@@ -0,0 +1,124 @@
+import json
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+from fastapi import HTTPException
+
+import app.modules.kids.router as kids_router
+from app.core.query_stats import BeginRequestQueryStats, EndRequestQueryStats, InstallQueryInstrumentation
+from app.modules.auth.deps import UserContext
+from app.modules.kids.models import Chore, ChoreEntry, ChoreEntryAudit, KidLink
+from app.modules.kids.schemas import KidsApprovalBulkRequest
+from app.modules.kids.services.chores_v2_service import (
+    CHORE_TYPE_BONUS,
+    STATUS_APPROVED,
+    STATUS_PENDING,
+    STATUS_REJECTED,
+)
+
+PARENT = UserContext(Id=1, Username="parent", Role="Parent")
+
+
+@pytest.fixture
+def db(make_sqlite_session):
+    InstallQueryInstrumentation()
+    session = make_sqlite_session(KidLink, Chore, ChoreEntry, ChoreEntryAudit)
+    session.add(KidLink(ParentUserId=1, KidUserId=3))
+    session.add(KidLink(ParentUserId=1, KidUserId=4))
+    session.add(
+        Chore(
+            Id=1,
+            OwnerUserId=1,
+            Label="Wash car",
+            Type=CHORE_TYPE_BONUS,
+            Amount=Decimal("2.00"),
+            StartsOn=date(2026, 1, 1),
+        )
+    )
+    for entry_id, kid_user_id, entry_status in (
+        (10, 3, STATUS_PENDING),
+        (11, 3, STATUS_PENDING),
+        (12, 4, STATUS_PENDING),
+        (13, 4, STATUS_APPROVED),
+        (14, 5, STATUS_PENDING),
+    ):
+        session.add(
+            ChoreEntry(
+                Id=entry_id,
+                KidUserId=kid_user_id,
+                ChoreId=1,
+                EntryDate=date(2026, 3, 2),
+                Status=entry_status,
+                ChoreType=CHORE_TYPE_BONUS,
+                Amount=Decimal("2.00"),
+                CreatedByUserId=kid_user_id,
+                CreatedAt=datetime(2026, 3, 2, 8),
+            )
+        )
+    session.commit()
+    return session
+
+
+def _Review(db, entry_ids, action):
+    return kids_router.BulkReviewChoreEntries(
+        payload=KidsApprovalBulkRequest(EntryIds=entry_ids, Action=action),
+        db=db,
+        user=PARENT,
+    )
+
+
+def _Statuses(db):
+    return {entry.Id: entry.Status for entry in db.query(ChoreEntry).order_by(ChoreEntry.Id)}
+
+
+def test_bulk_approve_updates_and_audits_in_fixed_queries(db):
+    stats, token = BeginRequestQueryStats()
+    try:
+        results = _Review(db, [12, 10, 11, 10], "Approve")
+    finally:
+        EndRequestQueryStats(token)
+
+    assert [result.Id for result in results] == [12, 10, 11]
+    assert all(result.Status == STATUS_APPROVED and result.ReviewedByUserId == 1 for result in results)
+    # Entries, links, chores, one UPDATE and one executemany INSERT.
+    assert stats.Count == 5
+    assert _Statuses(db) == {
+        10: STATUS_APPROVED,
+        11: STATUS_APPROVED,
+        12: STATUS_APPROVED,
+        13: STATUS_APPROVED,
+        14: STATUS_PENDING,
+    }
+    audits = db.query(ChoreEntryAudit).order_by(ChoreEntryAudit.ChoreEntryId).all()
+    assert [(audit.ChoreEntryId, audit.Action) for audit in audits] == [
+        (10, "Approved"),
+        (11, "Approved"),
+        (12, "Approved"),
+    ]
+    assert json.loads(audits[0].AfterJson)["Status"] == STATUS_APPROVED
+
+
+def test_bulk_reject_sets_rejected_status(db):
+    results = _Review(db, [10], "Reject")
+
+    assert results[0].Status == STATUS_REJECTED
+    assert db.query(ChoreEntryAudit).one().Summary == "Rejected chore entry"
+
+
+@pytest.mark.parametrize(
+    ("entry_ids", "action", "status_code"),
+    [
+        ([10, 13], "Approve", 400),
+        ([10, 14], "Approve", 404),
+        ([10, 99], "Approve", 404),
+        ([10], "Archive", 400),
+    ],
+)
+def test_bulk_review_writes_nothing_unless_every_entry_passes(db, entry_ids, action, status_code):
+    with pytest.raises(HTTPException) as exc_info:
+        _Review(db, entry_ids, action)
+
+    assert exc_info.value.status_code == status_code
+    assert _Statuses(db)[10] == STATUS_PENDING
+    assert db.query(ChoreEntryAudit).count() == 0
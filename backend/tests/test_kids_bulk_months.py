@@ -0,0 +1,128 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from fastapi import HTTPException
+
+import app.modules.kids.router as kids_router
+from app.core.query_stats import BeginRequestQueryStats, EndRequestQueryStats, InstallQueryInstrumentation
+from app.modules.auth.deps import UserContext
+from app.modules.kids.models import Chore, ChoreAssignment, ChoreEntry, KidLink, PocketMoneyRule
+from app.modules.kids.services.chores_v2_service import (
+    CHORE_TYPE_BONUS,
+    CHORE_TYPE_DAILY,
+    STATUS_APPROVED,
+    STATUS_PENDING,
+)
+
+PARENT = UserContext(Id=1, Username="parent", Role="Parent")
+
+
+def _AddKid(db, kid_user_id: int) -> None:
+    db.add(KidLink(ParentUserId=1, KidUserId=kid_user_id))
+    for offset, chore_type in enumerate([CHORE_TYPE_DAILY, CHORE_TYPE_DAILY, CHORE_TYPE_BONUS]):
+        chore = Chore(
+            OwnerUserId=1,
+            Label=f"Chore {kid_user_id}-{offset}",
+            Type=chore_type,
+            Amount=Decimal("1.50"),
+            StartsOn=date(2026, 1, 1 + offset * 10),
+        )
+        db.add(chore)
+        db.flush()
+        db.add(ChoreAssignment(ChoreId=chore.Id, KidUserId=kid_user_id, StartsOn=date(2026, 1, 5)))
+        for day in range(1, 28, kid_user_id):
+            db.add(
+                ChoreEntry(
+                    KidUserId=kid_user_id,
+                    ChoreId=chore.Id,
+                    EntryDate=date(2026, 1 + day % 3, day),
+                    Status=STATUS_PENDING if day % 5 == 0 else STATUS_APPROVED,
+                    ChoreType=chore_type,
+                    Amount=Decimal("1.50") if chore_type == CHORE_TYPE_BONUS else Decimal("0.00"),
+                    CreatedByUserId=kid_user_id,
+                )
+            )
+    db.add(
+        PocketMoneyRule(
+            KidUserId=kid_user_id,
+            Amount=Decimal("30.00") + kid_user_id,
+            Frequency="monthly",
+            DayOfMonth=1,
+            StartDate=date(2026, 1, 1),
+            CreatedByUserId=1,
+        )
+    )
+    db.commit()
+
+
+@pytest.fixture
+def db(monkeypatch, make_sqlite_session):
+    monkeypatch.setattr(kids_router, "TodayAdelaide", lambda: date(2026, 2, 14))
+    InstallQueryInstrumentation()
+    session = make_sqlite_session(KidLink, Chore, ChoreAssignment, ChoreEntry, PocketMoneyRule)
+    for kid_user_id in (2, 3, 4):
+        _AddKid(session, kid_user_id)
+    return session
+
+
+def _CountQueries(fn):
+    stats, token = BeginRequestQueryStats()
+    try:
+        result = fn()
+    finally:
+        EndRequestQueryStats(token)
+    return result, stats.Count
+
+
+def test_bulk_months_match_single_kid_endpoints(db):
+    result = kids_router.GetKidsMonths(
+        kid_ids=[3, 2],
+        start=date(2026, 1, 20),
+        end=date(2026, 3, 2),
+        db=db,
+        user=PARENT,
+    )
+
+    assert (result.StartMonth, result.EndMonth) == (date(2026, 1, 1), date(2026, 3, 1))
+    assert [(bundle.KidUserId, bundle.Overview.MonthStart) for bundle in result.Months] == [
+        (kid_id, month) for kid_id in (3, 2) for month in (date(2026, 1, 1), date(2026, 2, 1), date(2026, 3, 1))
+    ]
+    for bundle in result.Months:
+        month = bundle.Overview.MonthStart
+        assert bundle.Overview == kids_router.GetKidMonthOverview(bundle.KidUserId, month, db=db, user=PARENT)
+        assert bundle.Summary == kids_router.GetKidMonthSummary(bundle.KidUserId, month, db=db, user=PARENT)
+
+
+def test_bulk_months_query_count_does_not_grow_with_kids_or_months(db):
+    _single, single_count = _CountQueries(
+        lambda: kids_router.GetKidsMonths(kid_ids=[2], start=None, end=None, db=db, user=PARENT)
+    )
+    family, family_count = _CountQueries(
+        lambda: kids_router.GetKidsMonths(
+            kid_ids=None,
+            start=date(2026, 1, 1),
+            end=date(2026, 6, 1),
+            db=db,
+            user=PARENT,
+        )
+    )
+
+    assert len(family.Months) == 18
+    assert single_count == family_count == 5
+
+
+def test_bulk_months_rejects_unlinked_kid_and_oversized_range(db):
+    with pytest.raises(HTTPException) as exc_info:
+        kids_router.GetKidsMonths(kid_ids=[2, 99], start=None, end=None, db=db, user=PARENT)
+    assert exc_info.value.status_code == 404
+
+    with pytest.raises(HTTPException) as exc_info:
+        kids_router.GetKidsMonths(
+            kid_ids=None,
+            start=date(2025, 1, 1),
+            end=date(2026, 1, 1),
+            db=db,
+            user=PARENT,
+        )
+    assert exc_info.value.status_code == 400
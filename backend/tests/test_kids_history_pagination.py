@@ -0,0 +1,151 @@
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+from fastapi import HTTPException, Response
+
+import app.modules.auth.user_name_cache as user_name_cache_module
+import app.modules.kids.router as kids_router
+from app.core.query_stats import BeginRequestQueryStats, EndRequestQueryStats, InstallQueryInstrumentation
+from app.modules.auth.deps import UserContext
+from app.modules.auth.models import User
+from app.modules.auth.user_name_cache import InvalidateUserName, LoadUserNames, UserNameCache
+from app.modules.kids.models import Chore, ChoreEntry, LedgerEntry
+from app.modules.kids.services.chores_v2_service import CHORE_TYPE_DAILY, STATUS_APPROVED
+
+KID = UserContext(Id=3, Username="kid", Role="Kid")
+
+
+@pytest.fixture
+def db(monkeypatch, make_sqlite_session):
+    monkeypatch.setattr(kids_router, "_KidBalance", lambda *_args, **_kwargs: 0.0)
+    monkeypatch.setattr(user_name_cache_module, "user_name_cache", UserNameCache(max_entries=16, ttl_seconds=60))
+    InstallQueryInstrumentation()
+    session = make_sqlite_session(User, Chore, ChoreEntry, LedgerEntry)
+    session.add(User(Id=1, Username="parent", PasswordHash="x", Role="Parent", FirstName="Pat", LastName="Parent"))
+    session.add(User(Id=3, Username="kid", PasswordHash="x", Role="Kid"))
+    session.add(
+        Chore(
+            Id=1,
+            OwnerUserId=1,
+            Label="Make bed",
+            Type=CHORE_TYPE_DAILY,
+            Amount=Decimal("0.00"),
+            StartsOn=date(2026, 1, 1),
+        )
+    )
+    # Several entries share an EntryDate and some share a CreatedAt too, so the Id
+    # tiebreak decides their order.
+    for index in range(11):
+        entry_date = date(2026, 3, 1 + index // 3)
+        created_at = datetime(2026, 3, 1, 8 + index // 2)
+        session.add(
+            LedgerEntry(
+                KidUserId=3,
+                EntryType="Deposit",
+                Amount=Decimal("1.00"),
+                EntryDate=entry_date,
+                CreatedByUserId=1 if index % 2 else 3,
+                IsDeleted=index == 4,
+                CreatedAt=created_at,
+            )
+        )
+        session.add(
+            ChoreEntry(
+                KidUserId=3,
+                ChoreId=1,
+                EntryDate=entry_date,
+                Status=STATUS_APPROVED,
+                ChoreType=CHORE_TYPE_DAILY,
+                Amount=Decimal("0.00"),
+                IsDeleted=index == 4,
+                CreatedByUserId=3,
+                CreatedAt=created_at,
+            )
+        )
+    session.add(
+        LedgerEntry(
+            KidUserId=4,
+            EntryType="Deposit",
+            Amount=Decimal("5.00"),
+            EntryDate=date(2026, 3, 2),
+            CreatedByUserId=1,
+        )
+    )
+    session.commit()
+    return session
+
+
+def _Expected(db, model, include_deleted: bool) -> list[int]:
+    query = db.query(model).filter(model.KidUserId == 3)
+    if not include_deleted:
+        query = query.filter(model.IsDeleted == False)
+    rows = query.all()
+    rows.sort(key=lambda row: (row.EntryDate, row.CreatedAt, row.Id), reverse=True)
+    return [row.Id for row in rows]
+
+
+def test_ledger_pages_walk_whole_history_in_order(db):
+    seen = []
+    cursor = None
+    pages = 0
+    while True:
+        page = kids_router.GetKidsLedger(limit=3, cursor=cursor, db=db, user=KID)
+        seen.extend(entry.Id for entry in page.Entries)
+        pages += 1
+        cursor = page.NextCursor
+        if cursor is None:
+            break
+
+    assert seen == _Expected(db, LedgerEntry, include_deleted=False)
+    assert pages == 4
+    assert {entry.CreatedByName for entry in page.Entries} <= {"Pat Parent", "kid"}
+
+
+def test_chore_entry_pages_return_cursor_in_header(db):
+    seen = []
+    cursor = None
+    while True:
+        response = Response()
+        page = kids_router.GetChoreEntries(
+            response=response, limit=4, cursor=cursor, include_deleted=True, db=db, user=KID
+        )
+        seen.extend(entry.Id for entry in page)
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+
+    assert seen == _Expected(db, ChoreEntry, include_deleted=True)
+
+
+def test_last_full_page_has_no_cursor(db):
+    page = kids_router.GetKidsLedger(limit=10, cursor=None, db=db, user=KID)
+
+    assert len(page.Entries) == 10
+    assert page.NextCursor is None
+
+
+def test_malformed_cursor_is_rejected(db):
+    with pytest.raises(HTTPException) as exc_info:
+        kids_router.GetKidsLedger(limit=3, cursor="not-a-cursor", db=db, user=KID)
+
+    assert exc_info.value.status_code == 400
+
+
+def test_user_names_are_cached_until_invalidated(db):
+    stats, token = BeginRequestQueryStats()
+    try:
+        assert LoadUserNames(db, {1, 3}) == {1: "Pat Parent", 3: "kid"}
+        assert LoadUserNames(db, {1, 3}) == {1: "Pat Parent", 3: "kid"}
+        first_count = stats.Count
+
+        db.query(User).filter(User.Id == 1).update({User.FirstName: "Sam"})
+        db.commit()
+        InvalidateUserName(1)
+        names = LoadUserNames(db, {1, 3})
+    finally:
+        EndRequestQueryStats(token)
+
+    assert first_count == 1
+    assert names == {1: "Sam Parent", 3: "kid"}
+    assert user_name_cache_module.GetUserNameCacheStats()["Hits"] == 3
@@ -0,0 +1,142 @@
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+
+import app.modules.kids.router as kids_router
+from app.core.query_stats import BeginRequestQueryStats, EndRequestQueryStats, InstallQueryInstrumentation
+from app.modules.auth.deps import UserContext
+from app.modules.kids.models import Chore, ChoreAssignment, ChoreEntry, KidLink, PocketMoneyRule
+from app.modules.kids.services.chores_v2_service import CHORE_TYPE_DAILY, STATUS_APPROVED
+from app.modules.kids.services.month_context_service import LoadKidMonthContext
+
+PARENT = UserContext(Id=1, Username="parent", Role="Parent")
+
+
+@pytest.fixture
+def db(monkeypatch, make_sqlite_session):
+    monkeypatch.setattr(kids_router, "TodayAdelaide", lambda: date(2026, 3, 18))
+    InstallQueryInstrumentation()
+    session = make_sqlite_session(KidLink, Chore, ChoreAssignment, ChoreEntry, PocketMoneyRule)
+
+    session.add(KidLink(ParentUserId=1, KidUserId=3))
+    for chore_id, label in ((1, "Make bed"), (2, "Feed cat")):
+        session.add(
+            Chore(
+                Id=chore_id,
+                OwnerUserId=1,
+                Label=label,
+                Type=CHORE_TYPE_DAILY,
+                Amount=Decimal("0.00"),
+                StartsOn=date(2026, 1, 1),
+            )
+        )
+        session.add(
+            ChoreAssignment(
+                ChoreId=chore_id,
+                KidUserId=3,
+                StartsOn=date(2026, 1, 1),
+                CreatedAt=datetime(2026, 1, chore_id),
+            )
+        )
+    session.add(
+        PocketMoneyRule(
+            KidUserId=3,
+            Amount=Decimal("31.00"),
+            Frequency="monthly",
+            DayOfMonth=1,
+            StartDate=date(2026, 1, 1),
+            CreatedByUserId=1,
+        )
+    )
+    session.add(
+        PocketMoneyRule(
+            KidUserId=4,
+            Amount=Decimal("10.00"),
+            Frequency="monthly",
+            DayOfMonth=1,
+            StartDate=date(2026, 1, 1),
+            CreatedByUserId=1,
+        )
+    )
+    for day, chore_id, is_deleted in ((2, 1, False), (2, 2, False), (3, 1, True), (17, 1, False)):
+        session.add(
+            ChoreEntry(
+                KidUserId=3,
+                ChoreId=chore_id,
+                EntryDate=date(2026, 3, day),
+                Status=STATUS_APPROVED,
+                ChoreType=CHORE_TYPE_DAILY,
+                Amount=Decimal("0.00"),
+                IsDeleted=is_deleted,
+                CreatedByUserId=3,
+                CreatedAt=datetime(2026, 3, day, chore_id),
+            )
+        )
+    session.add(
+        ChoreEntry(
+            KidUserId=3,
+            ChoreId=1,
+            EntryDate=date(2026, 2, 10),
+            Status=STATUS_APPROVED,
+            ChoreType=CHORE_TYPE_DAILY,
+            Amount=Decimal("0.00"),
+            CreatedByUserId=3,
+            CreatedAt=datetime(2026, 2, 10),
+        )
+    )
+    session.commit()
+    return session
+
+
+def _CountQueries(fn):
+    stats, token = BeginRequestQueryStats()
+    try:
+        result = fn()
+    finally:
+        EndRequestQueryStats(token)
+    return result, stats.Count
+
+
+def test_month_context_loads_everything_in_two_queries(db):
+    context, count = _CountQueries(
+        lambda: LoadKidMonthContext(db, 3, date(2026, 3, 1), date(2026, 3, 31), extra_date=date(2026, 2, 10))
+    )
+
+    assert count == 2
+    assert [assignment.ChoreId for assignment in context.Assignments] == [1, 2]
+    assert sorted(context.ChoreMap) == [1, 2]
+    assert context.Rule.KidUserId == 3
+    assert [(entry.EntryDate.day, entry.ChoreId) for entry in context.Entries] == [(17, 1), (2, 2), (2, 1), (10, 1)]
+    assert len(context.EntriesBetween(date(2026, 3, 1), date(2026, 3, 31))) == 3
+    assert [entry.ChoreId for entry in context.EntriesOn(date(2026, 3, 2))] == [2, 1]
+
+
+def test_month_context_returns_rule_for_kid_without_assignments(db):
+    context, count = _CountQueries(lambda: LoadKidMonthContext(db, 4, date(2026, 3, 1), date(2026, 3, 31)))
+
+    assert count == 2
+    assert context.Assignments == []
+    assert context.Chores == []
+    assert context.Rule.KidUserId == 4
+
+
+def test_kid_overview_runs_two_queries(db):
+    overview, count = _CountQueries(lambda: kids_router._LoadKidsOverview(db, 3, date(2026, 2, 10)))
+
+    assert count == 2
+    assert overview.SelectedDate == date(2026, 2, 10)
+    assert [entry.ChoreId for entry in overview.Entries] == [1]
+    assert [chore.Label for chore in overview.Chores] == ["Feed cat", "Make bed"]
+    assert overview.MonthlyAllowance == 31.0
+    assert overview.DayProtected is False
+
+
+def test_parent_month_overview_runs_access_check_plus_two_queries(db):
+    overview, count = _CountQueries(
+        lambda: kids_router.GetKidMonthOverview(3, date(2026, 3, 5), db=db, user=PARENT)
+    )
+
+    assert count == 3
+    day = overview.Days[1]
+    assert (day.Date, day.DailyDone, day.DailyTotal) == (date(2026, 3, 2), 2, 2)
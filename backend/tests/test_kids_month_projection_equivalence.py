@@ -0,0 +1,201 @@
+"""BuildMonthProjection must match the original day-by-day implementation, kept
+below as the reference, on randomly generated months."""
+
+import random
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+from app.modules.kids.services.chores_v2_service import (
+    CHORE_TYPE_BONUS,
+    CHORE_TYPE_DAILY,
+    CHORE_TYPE_HABIT,
+    STATUS_APPROVED,
+    STATUS_PENDING,
+    STATUS_REJECTED,
+    AmountToCents,
+    BuildMonthProjection,
+    DaysInMonth,
+    IsAssignmentActiveOnDate,
+    IsChoreActiveOnDate,
+    MonthSummary,
+    ProjectionPoint,
+    RoundDailySlice,
+)
+
+
+def _ReferenceProjection(
+    today: date,
+    month_start: date,
+    month_end: date,
+    daily_slice_cents: int,
+    monthly_allowance_cents: int | None,
+    chores: list,
+    assignments: list,
+    entries: list,
+) -> tuple[list[ProjectionPoint], MonthSummary, dict[date, bool]]:
+    days_in_month = (month_end - month_start).days + 1
+    normalized_allowance = max(0, monthly_allowance_cents if monthly_allowance_cents is not None else 0)
+    base_daily = normalized_allowance // days_in_month if days_in_month > 0 else 0
+    remainder = normalized_allowance % days_in_month if days_in_month > 0 else 0
+    fallback_daily_slice = max(0, daily_slice_cents)
+
+    daily_slice_by_date: dict[date, int] = {}
+    cursor = month_start
+    offset = 0
+    while cursor <= month_end:
+        if monthly_allowance_cents is None:
+            daily_slice_by_date[cursor] = fallback_daily_slice
+        else:
+            daily_slice_by_date[cursor] = base_daily + (1 if offset < remainder else 0)
+        cursor = cursor + timedelta(days=1)
+        offset += 1
+
+    chore_by_id = {chore.Id: chore for chore in chores}
+    assignment_by_chore: dict[int, list[ChoreAssignment]] = {}
+    for assignment in assignments:
+        assignment_by_chore.setdefault(assignment.ChoreId, []).append(assignment)
+
+    approved_by_date: dict[date, set[int]] = {}
+    approved_bonus_by_date: dict[date, int] = {}
+    pending_bonus_total = 0
+    approved_bonus_total = 0
+
+    for entry in entries:
+        if entry.IsDeleted:
+            continue
+        entry_date = entry.EntryDate
+        chore = chore_by_id.get(entry.ChoreId)
+        chore_type = entry.ChoreType or (chore.Type if chore else None)
+        status = entry.Status
+        amount_cents = AmountToCents(entry.Amount)
+        if status == STATUS_APPROVED:
+            approved_by_date.setdefault(entry_date, set()).add(entry.ChoreId)
+            if chore_type == CHORE_TYPE_BONUS and amount_cents:
+                approved_bonus_by_date[entry_date] = approved_bonus_by_date.get(entry_date, 0) + amount_cents
+                approved_bonus_total += amount_cents
+        elif status == STATUS_PENDING and chore_type == CHORE_TYPE_BONUS and amount_cents:
+            pending_bonus_total += amount_cents
+
+    def _RequiredDailyChores(on_date: date) -> set[int]:
+        required: set[int] = set()
+        for chore in chores:
+            if chore.Type != CHORE_TYPE_DAILY:
+                continue
+            if not IsChoreActiveOnDate(chore, on_date):
+                continue
+            assignments_for_chore = assignment_by_chore.get(chore.Id, [])
+            if not assignments_for_chore:
+                continue
+            if not any(IsAssignmentActiveOnDate(assignment, on_date) for assignment in assignments_for_chore):
+                continue
+            required.add(chore.Id)
+        return required
+
+    def _IsProtected(on_date: date) -> bool:
+        required = _RequiredDailyChores(on_date)
+        if not required:
+            return True
+        approved = approved_by_date.get(on_date, set())
+        return required.issubset(approved)
+
+    is_closed_month = today >= month_end
+    missed_days = 0
+    missed_deduction_cents = 0
+    running = 0
+    projection: list[ProjectionPoint] = []
+    protected_by_date: dict[date, bool] = {}
+
+    cursor = month_start
+    while cursor <= month_end:
+        protected = _IsProtected(cursor)
+        protected_by_date[cursor] = protected
+        day_slice = daily_slice_by_date.get(cursor, fallback_daily_slice)
+        if cursor < today:
+            if protected:
+                running += day_slice
+            else:
+                missed_days += 1
+                missed_deduction_cents += day_slice
+        elif cursor == today:
+            if protected:
+                running += day_slice
+            elif is_closed_month:
+                missed_days += 1
+                missed_deduction_cents += day_slice
+        else:
+            # Future days remain potential earnings for projection.
+            running += day_slice
+        running += approved_bonus_by_date.get(cursor, 0)
+        projection.append(ProjectionPoint(Date=cursor, AmountCents=running))
+        cursor = cursor + timedelta(days=1)
+
+    projected_payout = projection[-1].AmountCents if projection else 0
+    summary = MonthSummary(
+        MissedDays=missed_days,
+        MissedDeductionCents=missed_deduction_cents,
+        ApprovedBonusCents=approved_bonus_total,
+        PendingBonusCents=pending_bonus_total,
+        ProjectedPayoutCents=max(projected_payout, 0),
+    )
+    return projection, summary, protected_by_date
+
+
+def _RandomDate(rng: random.Random, month_start: date, month_end: date) -> date | None:
+    if rng.random() < 0.3:
+        return None
+    return month_start + timedelta(days=rng.randint(-10, (month_end - month_start).days + 10))
+
+
+def _RandomCase(rng: random.Random) -> dict:
+    month_start = date(rng.choice([2024, 2025, 2026]), rng.randint(1, 12), 1)
+    month_end = date(month_start.year, month_start.month, DaysInMonth(month_start.year, month_start.month))
+    chore_ids = list(range(1, rng.randint(1, 8) + 1))
+    chores = [
+        SimpleNamespace(
+            Id=chore_id,
+            Type=rng.choice([CHORE_TYPE_DAILY, CHORE_TYPE_DAILY, CHORE_TYPE_HABIT, CHORE_TYPE_BONUS]),
+            IsActive=rng.random() < 0.85,
+            StartsOn=_RandomDate(rng, month_start, month_end),
+            DisabledOn=_RandomDate(rng, month_start, month_end),
+        )
+        for chore_id in chore_ids
+    ]
+    assignments = [
+        SimpleNamespace(
+            ChoreId=rng.choice(chore_ids + [99]),
+            IsEnabled=rng.random() < 0.85,
+            StartsOn=_RandomDate(rng, month_start, month_end),
+            DisabledOn=_RandomDate(rng, month_start, month_end),
+        )
+        for _ in range(rng.randint(0, 10))
+    ]
+    entries = [
+        SimpleNamespace(
+            IsDeleted=rng.random() < 0.1,
+            EntryDate=month_start + timedelta(days=rng.randint(-3, (month_end - month_start).days + 3)),
+            ChoreId=rng.choice(chore_ids + [99]),
+            ChoreType=rng.choice([None, CHORE_TYPE_DAILY, CHORE_TYPE_BONUS]),
+            Status=rng.choice([STATUS_APPROVED, STATUS_APPROVED, STATUS_PENDING, STATUS_REJECTED]),
+            Amount=rng.choice([0, 0.5, 1, 2.25]),
+        )
+        for _ in range(rng.randint(0, 80))
+    ]
+    monthly_allowance_cents = rng.choice([None, 0, 2999, 3000, 4000, 12345])
+    days = (month_end - month_start).days + 1
+    return {
+        "today": month_start + timedelta(days=rng.randint(-5, days + 5)),
+        "month_start": month_start,
+        "month_end": month_end,
+        "daily_slice_cents": rng.choice([0, 97, RoundDailySlice(monthly_allowance_cents or 0, days)]),
+        "monthly_allowance_cents": monthly_allowance_cents,
+        "chores": chores,
+        "assignments": assignments,
+        "entries": entries,
+    }
+
+
+def test_build_month_projection_matches_reference_on_random_months() -> None:
+    rng = random.Random(20260415)
+    for _ in range(500):
+        case = _RandomCase(rng)
+        assert BuildMonthProjection(**case) == _ReferenceProjection(**case), case
@@ -0,0 +1,109 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from app.modules.kids.models import (
+    BalanceSnapshot,
+    Chore,
+    ChoreAssignment,
+    ChoreEntry,
+    LedgerEntry,
+    PocketMoneyRule,
+)
+from app.modules.kids.services.chores_v2_service import CHORE_TYPE_DAILY, STATUS_APPROVED
+from app.modules.kids.services.pocket_money_service import (
+    MONTHLY_PAYOUT_SOURCE_TYPE,
+    EnsurePocketMoneyCredits,
+    PostMonthlyPayouts,
+)
+
+
+@pytest.fixture
+def db(make_sqlite_session):
+    return make_sqlite_session(Chore, ChoreAssignment, ChoreEntry, LedgerEntry, PocketMoneyRule, BalanceSnapshot)
+
+
+def _AddKid(db, kid_user_id, chore_id, completed_days, last_posted_on=None):
+    db.add(
+        Chore(
+            Id=chore_id,
+            OwnerUserId=1,
+            Label="Make bed",
+            Type=CHORE_TYPE_DAILY,
+            Amount=Decimal("0.00"),
+            StartsOn=date(2026, 4, 1),
+        )
+    )
+    db.add(ChoreAssignment(ChoreId=chore_id, KidUserId=kid_user_id, StartsOn=date(2026, 4, 1)))
+    db.add(
+        PocketMoneyRule(
+            KidUserId=kid_user_id,
+            Amount=Decimal("30.00"),
+            Frequency="monthly",
+            DayOfMonth=1,
+            StartDate=date(2026, 4, 1),
+            LastPostedOn=last_posted_on,
+            CreatedByUserId=1,
+        )
+    )
+    for day in completed_days:
+        db.add(
+            ChoreEntry(
+                KidUserId=kid_user_id,
+                ChoreId=chore_id,
+                EntryDate=day,
+                Status=STATUS_APPROVED,
+                ChoreType=CHORE_TYPE_DAILY,
+                Amount=Decimal("0.00"),
+                CreatedByUserId=kid_user_id,
+            )
+        )
+    db.commit()
+
+
+def _Payouts(db, kid_user_id):
+    rows = (
+        db.query(LedgerEntry)
+        .filter(LedgerEntry.KidUserId == kid_user_id, LedgerEntry.SourceType == MONTHLY_PAYOUT_SOURCE_TYPE)
+        .order_by(LedgerEntry.EntryDate)
+        .all()
+    )
+    return [(row.EntryDate, row.SourceId, Decimal(row.Amount)) for row in rows]
+
+
+def test_month_close_job_pays_all_kids_once(db):
+    _AddKid(db, 3, 1, [date(2026, 4, day) for day in range(1, 21)])
+    _AddKid(db, 4, 2, [date(2026, 5, day) for day in range(1, 32)])
+    _AddKid(db, 5, 3, [], last_posted_on=date(2026, 5, 31))
+
+    result = PostMonthlyPayouts(db, today=date(2026, 6, 10))
+
+    assert result == {"Kids": 2, "Posted": 4}
+    assert _Payouts(db, 3) == [
+        (date(2026, 4, 30), 202604, Decimal("20.00")),
+        (date(2026, 5, 31), 202605, Decimal("0.00")),
+    ]
+    assert _Payouts(db, 4) == [
+        (date(2026, 4, 30), 202604, Decimal("0.00")),
+        (date(2026, 5, 31), 202605, Decimal("30.00")),
+    ]
+    assert _Payouts(db, 5) == []
+    rules = {rule.KidUserId: rule.LastPostedOn for rule in db.query(PocketMoneyRule).all()}
+    assert rules == {3: date(2026, 5, 31), 4: date(2026, 5, 31), 5: date(2026, 5, 31)}
+
+    assert PostMonthlyPayouts(db, today=date(2026, 6, 30)) == {"Kids": 0, "Posted": 0}
+
+
+def test_rerun_skips_months_already_posted_when_rule_is_behind(db):
+    _AddKid(db, 3, 1, [date(2026, 4, day) for day in range(1, 31)])
+    EnsurePocketMoneyCredits(db, 3, date(2026, 5, 2))
+    rule = db.query(PocketMoneyRule).one()
+    rule.LastPostedOn = None
+    db.commit()
+
+    result = PostMonthlyPayouts(db, today=date(2026, 5, 20))
+
+    assert result == {"Kids": 1, "Posted": 0}
+    assert _Payouts(db, 3) == [(date(2026, 4, 30), 202604, Decimal("30.00"))]
+    assert db.query(PocketMoneyRule).one().LastPostedOn == date(2026, 4, 30)
@@ -0,0 +1,97 @@
+"""IterPocketMoneyDates must match the original step-by-step schedule walk, kept
+below as the reference, on randomly generated rules and windows."""
+
+import random
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+from app.modules.kids.services.pocket_money_service import (
+    ComputePocketMoneyDates,
+    IterPocketMoneyDates,
+    _FirstMonthly,
+    _NextFortnightly,
+    _NextMonthly,
+    _NextWeekly,
+)
+
+
+def _ReferenceScheduleDates(rule, through_date: date) -> list[date]:
+    if not rule.IsActive:
+        return []
+
+    if rule.Frequency == "weekly":
+        if rule.DayOfWeek is None:
+            return []
+        if rule.LastPostedOn:
+            current = _NextWeekly(rule.LastPostedOn, rule.DayOfWeek)
+        else:
+            current = rule.StartDate
+            if current.weekday() != rule.DayOfWeek:
+                current = _NextWeekly(current - timedelta(days=1), rule.DayOfWeek)
+    elif rule.Frequency == "fortnightly":
+        if rule.DayOfWeek is None:
+            return []
+        anchor = rule.StartDate
+        if anchor.weekday() != rule.DayOfWeek:
+            anchor = _NextWeekly(anchor - timedelta(days=1), rule.DayOfWeek)
+        if rule.LastPostedOn:
+            current = _NextFortnightly(rule.LastPostedOn, anchor)
+        else:
+            current = anchor
+    elif rule.Frequency == "monthly":
+        if rule.DayOfMonth is None:
+            return []
+        if rule.LastPostedOn:
+            current = _NextMonthly(rule.LastPostedOn, rule.DayOfMonth)
+        else:
+            current = _FirstMonthly(rule.StartDate, rule.DayOfMonth)
+    else:
+        return []
+
+    dates = []
+    while current <= through_date:
+        dates.append(current)
+        if rule.Frequency == "weekly":
+            current = _NextWeekly(current, rule.DayOfWeek)
+        elif rule.Frequency == "fortnightly":
+            anchor = rule.StartDate
+            if anchor.weekday() != rule.DayOfWeek:
+                anchor = _NextWeekly(anchor - timedelta(days=1), rule.DayOfWeek)
+            current = _NextFortnightly(current, anchor)
+        else:
+            current = _NextMonthly(current, rule.DayOfMonth)
+    return dates
+
+
+def _RandomRule(rng: random.Random) -> SimpleNamespace:
+    frequency = rng.choice(["weekly", "fortnightly", "monthly", "monthly", "yearly"])
+    start_date = date(2016, 1, 1) + timedelta(days=rng.randint(0, 3000))
+    last_posted_on = None
+    if rng.random() < 0.5:
+        last_posted_on = start_date + timedelta(days=rng.randint(-20, 400))
+    return SimpleNamespace(
+        Frequency=frequency,
+        DayOfWeek=rng.randint(0, 6) if rng.random() < 0.95 else None,
+        DayOfMonth=rng.choice([1, 15, 28, 29, 30, 31]) if rng.random() < 0.95 else None,
+        StartDate=start_date,
+        LastPostedOn=last_posted_on,
+        IsActive=rng.random() < 0.95,
+    )
+
+
+def test_schedule_matches_reference_on_random_rules() -> None:
+    rng = random.Random(20260416)
+    for _ in range(1000):
+        rule = _RandomRule(rng)
+        through_date = rule.StartDate + timedelta(days=rng.randint(-10, 900))
+        assert ComputePocketMoneyDates(rule, through_date) == _ReferenceScheduleDates(rule, through_date), rule
+
+
+def test_windowed_schedule_matches_filtered_reference() -> None:
+    rng = random.Random(20260417)
+    for _ in range(1000):
+        rule = _RandomRule(rng)
+        from_date = rule.StartDate + timedelta(days=rng.randint(-40, 900))
+        through_date = from_date + timedelta(days=rng.randint(0, 120))
+        expected = [value for value in _ReferenceScheduleDates(rule, through_date) if value >= from_date]
+        assert list(IterPocketMoneyDates(rule, from_date, through_date)) == expected, (rule, from_date)
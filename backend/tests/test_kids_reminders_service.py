@@ -1,13 +1,26 @@
 from datetime import date, datetime, timezone
+from decimal import Decimal
 
+import pytest
+
+import app.modules.kids.services.reminders_service as reminders_service
+from app.modules.kids.models import Chore, ChoreAssignment, ChoreEntry, ReminderRun, ReminderSettings
+from app.modules.kids.services.chores_v2_service import CHORE_TYPE_DAILY, CHORE_TYPE_HABIT
 from app.modules.kids.services.reminders_service import (
     REMINDER_EMOJIS,
+    REMINDER_TYPE_DAILY,
+    REMINDER_TYPE_HABITS,
+    CompactReminderRuns,
+    EnsureReminderSettings,
+    _ProcessKidReminders,
     _IsValidTime,
     _NormalizeTime,
     _ResolveEffectiveRunDateTime,
     _ResolveReminderZone,
     _TimeMatches,
 )
+from app.modules.notifications.models import ReminderSchedule
+from app.modules.tasks.models import TaskSettings
 
 
 def test_kids_reminder_time_validation():
@@ -53,3 +66,86 @@ def test_kids_resolve_effective_run_date_time_uses_timezone():
     assert adelaide_time == "02:30"
     assert utc_date == date(2026, 3, 8)
     assert utc_time == "16:00"
+
+
+@pytest.fixture
+def db(make_sqlite_session):
+    return make_sqlite_session(Chore, ChoreAssignment, ChoreEntry, ReminderRun)
+
+
+def _AddRun(db, run_date, result, reminder_type=REMINDER_TYPE_DAILY):
+    db.add(
+        ReminderRun(
+            KidUserId=3,
+            RunDate=run_date,
+            RunTime="19:00",
+            ReminderType=reminder_type,
+            Result=result,
+            NotificationSent=result == "sent",
+        )
+    )
+
+
+def test_kids_reminders_record_each_slot_once(db, monkeypatch):
+    db.add(
+        Chore(
+            Id=1,
+            OwnerUserId=1,
+            Label="Make bed",
+            Type=CHORE_TYPE_DAILY,
+            Amount=Decimal("0.00"),
+            StartsOn=date(2026, 1, 1),
+        )
+    )
+    db.add(ChoreAssignment(ChoreId=1, KidUserId=3, StartsOn=date(2026, 1, 1)))
+    db.commit()
+    sent = []
+    monkeypatch.setattr(reminders_service, "_SendReminderNotification", lambda _db, **kwargs: sent.append(kwargs))
+    due_jobs = [
+        (REMINDER_TYPE_DAILY, CHORE_TYPE_DAILY, "19:00"),
+        (REMINDER_TYPE_HABITS, CHORE_TYPE_HABIT, "19:00"),
+    ]
+
+    results = []
+    for _ in range(2):
+        result = reminders_service._EmptyRunResult()
+        _ProcessKidReminders(
+            db, actor_user_id=1, kid_user_id=3, run_date=date(2026, 3, 9), due_jobs=due_jobs, result=result
+        )
+        results.append(result)
+
+    assert [job["reminder_type"] for job in sent] == [REMINDER_TYPE_DAILY]
+    assert (results[0]["NotificationsSent"], results[0]["Skipped"]) == (1, 1)
+    assert (results[1]["NotificationsSent"], results[1]["Skipped"]) == (0, 2)
+    assert sorted((run.ReminderType, run.Result) for run in db.query(ReminderRun)) == [
+        (REMINDER_TYPE_DAILY, "sent"),
+        (REMINDER_TYPE_HABITS, "skipped"),
+    ]
+
+
+def test_kids_reminder_run_compaction_drops_finished_skips_and_expired_rows(db):
+    _AddRun(db, date(2026, 1, 1), "sent")
+    _AddRun(db, date(2026, 3, 1), "skipped")
+    _AddRun(db, date(2026, 3, 1), "sent", reminder_type=REMINDER_TYPE_HABITS)
+    _AddRun(db, date(2026, 3, 8), "skipped")
+    _AddRun(db, date(2026, 3, 9), "skipped")
+    db.commit()
+
+    result = CompactReminderRuns(db, today=date(2026, 3, 9), retention_days=30)
+
+    assert result == {"Compacted": 1, "Pruned": 1}
+    assert sorted((run.RunDate, run.Result) for run in db.query(ReminderRun)) == [
+        (date(2026, 3, 1), "sent"),
+        (date(2026, 3, 8), "skipped"),
+        (date(2026, 3, 9), "skipped"),
+    ]
+
+
+def test_kids_default_reminder_settings_are_indexed_when_created(make_sqlite_session):
+    db = make_sqlite_session(ReminderSettings, ReminderSchedule, TaskSettings)
+
+    EnsureReminderSettings(db, 3)
+    EnsureReminderSettings(db, 3)
+
+    rows = db.query(ReminderSchedule).filter(ReminderSchedule.UserId == 3).all()
+    assert sorted(row.ReminderKey for row in rows) == sorted([REMINDER_TYPE_DAILY, REMINDER_TYPE_HABITS])
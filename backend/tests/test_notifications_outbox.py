@@ -0,0 +1,137 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+import app.modules.notifications.outbox_service as outbox_service
+from app.modules.notifications.models import Notification, NotificationPushOutbox
+from app.modules.notifications.push_service import PushBatchResult
+
+NOW = datetime(2026, 4, 3, 9, 0)
+
+
+@pytest.fixture
+def db(monkeypatch, make_sqlite_session):
+    monkeypatch.setattr(outbox_service, "NowUtc", lambda: NOW)
+    monkeypatch.setattr(outbox_service, "IsPushEnabled", lambda: True)
+    monkeypatch.setattr(outbox_service, "CountUnreadByUserIds", lambda _db, user_ids: {})
+    return make_sqlite_session(Notification, NotificationPushOutbox)
+
+
+def _Queue(db, notification_id, user_id=1, attempts=0, dismissed=False, status="Pending", next_attempt_at=NOW):
+    db.add(
+        Notification(
+            Id=notification_id,
+            UserId=user_id,
+            CreatedByUserId=user_id,
+            Title="Reminder",
+            IsDismissed=dismissed,
+            IsRead=False,
+            CreatedAt=NOW,
+            UpdatedAt=NOW,
+        )
+    )
+    db.add(
+        NotificationPushOutbox(
+            Id=notification_id,
+            NotificationId=notification_id,
+            UserId=user_id,
+            Status=status,
+            Attempts=attempts,
+            NextAttemptAt=next_attempt_at,
+            CreatedAt=NOW,
+            UpdatedAt=NOW,
+        )
+    )
+    db.commit()
+
+
+def _Outbox(db):
+    db.expire_all()
+    return {row.NotificationId: row for row in db.query(NotificationPushOutbox).all()}
+
+
+def test_drain_push_outbox_marks_sent_retries_and_gives_up(db, monkeypatch):
+    _Queue(db, 100)
+    _Queue(db, 101)
+    _Queue(db, 102, user_id=2, attempts=5)
+    _Queue(db, 103, user_id=2, dismissed=True)
+    sent_batches = []
+
+    def _Send(_db, *, notifications, badge_counts, skip_devices):
+        sent_batches.append(sorted(record.Id for record in notifications))
+        return PushBatchResult(Delivered=1, Retry={101: "HTTP 503", 102: "ReadTimeout"})
+
+    monkeypatch.setattr(outbox_service, "SendPushForNotifications", _Send)
+
+    result = outbox_service.DrainPushOutbox(db, batch_size=10, max_attempts=6)
+
+    assert result == {"Claimed": 4, "Sent": 1, "Retried": 1, "Failed": 1, "Skipped": 1}
+    assert sent_batches == [[100, 101, 102]]
+    rows = _Outbox(db)
+    assert {key: row.Status for key, row in rows.items()} == {
+        100: "Sent",
+        101: "Pending",
+        102: "Failed",
+        103: "Skipped",
+    }
+    assert rows[100].SentAt == NOW
+    assert rows[101].Attempts == 1
+    assert rows[101].NextAttemptAt == NOW + outbox_service._BackoffDelay(1)
+    assert rows[102].LastError == "ReadTimeout"
+    assert all(row.ClaimToken is None for row in rows.values())
+
+
+def test_claimed_rows_are_not_sent_twice_until_the_lease_expires(db, monkeypatch):
+    _Queue(db, 100)
+    _Queue(db, 101, status="Sending", next_attempt_at=NOW - timedelta(seconds=1))
+
+    first = outbox_service._ClaimDueRows(db, 10)
+    # A second drainer (another worker, or a trigger racing the ticker) finds nothing.
+    assert outbox_service._ClaimDueRows(db, 10) == []
+    assert sorted(row.NotificationId for row in first) == [100, 101]
+    assert {row.Status for row in first} == {"Sending"}
+
+    # The first drainer died mid-send; once the lease runs out the rows are due again.
+    later = NOW + outbox_service._ClaimLease() + timedelta(seconds=1)
+    monkeypatch.setattr(outbox_service, "NowUtc", lambda: later)
+    monkeypatch.setattr(
+        outbox_service,
+        "SendPushForNotifications",
+        lambda _db, *, notifications, badge_counts, skip_devices: PushBatchResult(
+            Delivered=len(notifications), Retry={}
+        ),
+    )
+    assert outbox_service.DrainPushOutbox(db, batch_size=10)["Sent"] == 2
+    assert {row.Attempts for row in _Outbox(db).values()} == {2}
+
+
+def test_retry_only_resends_to_devices_that_failed(db, monkeypatch):
+    _Queue(db, 100)
+    skipped = []
+
+    def _Send(_db, *, notifications, badge_counts, skip_devices):
+        skipped.append(skip_devices)
+        if len(skipped) == 1:
+            # Device 7 took it, device 8 timed out, device 9 has a dead token.
+            return PushBatchResult(Delivered=1, Retry={100: "ReadTimeout"}, SettledDevices={100: {7, 9}})
+        return PushBatchResult(Delivered=1, SettledDevices={100: {8}})
+
+    monkeypatch.setattr(outbox_service, "SendPushForNotifications", _Send)
+
+    assert outbox_service.DrainPushOutbox(db)["Retried"] == 1
+    assert _Outbox(db)[100].SettledDeviceIds == "[7, 9]"
+
+    later = NOW + outbox_service._BackoffDelay(1)
+    monkeypatch.setattr(outbox_service, "NowUtc", lambda: later)
+    assert outbox_service.DrainPushOutbox(db)["Sent"] == 1
+    assert skipped == [{}, {100: {7, 9}}]
+    assert _Outbox(db)[100].SettledDeviceIds is None
+
+
+def test_push_outbox_backoff_is_exponential_and_capped(monkeypatch):
+    monkeypatch.setenv("NOTIFICATIONS_PUSH_RETRY_BASE_SECONDS", "30")
+    monkeypatch.setenv("NOTIFICATIONS_PUSH_RETRY_MAX_SECONDS", "300")
+
+    delays = [outbox_service._BackoffDelay(attempt).total_seconds() for attempt in range(1, 6)]
+
+    assert delays == [30, 60, 120, 240, 300]
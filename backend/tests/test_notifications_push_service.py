@@ -1,7 +1,10 @@
 import base64
+from types import SimpleNamespace
 
+import app.modules.notifications.push_service as push_service
 from app.modules.notifications.push_service import (
     GetApnsHealthStatus,
+    SendPushForNotifications,
     _NormalizePrivateKey,
     _NormalizePushEnvironment,
     _ShouldDeactivateToken,
@@ -80,3 +83,125 @@ def test_get_apns_health_status_reports_configured(monkeypatch):
         "missing": [],
         "bundle_id": "au.batserver.everday.ios",
     }
+
+
+class _FakeDeviceQuery:
+    def __init__(self, devices):
+        self._devices = devices
+
+    def filter(self, *_args, **_kwargs):
+        return self
+
+    def all(self):
+        return list(self._devices)
+
+
+class _FakeDb:
+    def __init__(self, devices):
+        self._devices = devices
+        self.queries = 0
+        self.commits = 0
+        self.added = []
+
+    def query(self, *_args, **_kwargs):
+        self.queries += 1
+        return _FakeDeviceQuery(self._devices)
+
+    def add_all(self, rows):
+        self.added.extend(rows)
+
+    def commit(self):
+        self.commits += 1
+
+
+def _Notification(notification_id, user_id):
+    return SimpleNamespace(
+        Id=notification_id,
+        UserId=user_id,
+        Title="Hello",
+        Body=None,
+        Type="General",
+        LinkUrl=None,
+        SourceModule=None,
+        SourceId=None,
+    )
+
+
+def _Device(device_id, user_id):
+    return SimpleNamespace(
+        Id=device_id,
+        UserId=user_id,
+        DeviceToken=f"token{device_id:06d}",
+        PushEnvironment="production",
+        IsActive=True,
+        LastError=None,
+        LastDeliveredAt=None,
+    )
+
+
+def test_send_push_for_notifications_batches_devices_and_commits_once(monkeypatch):
+    devices = [_Device(1, 10), _Device(2, 10), _Device(3, 20)]
+    db = _FakeDb(devices)
+    sent_jobs = []
+
+    def _Deliver(_config, jobs):
+        sent_jobs.extend(jobs)
+        return [
+            push_service._PushResult(status_code=410, reason="Unregistered", latency_ms=5)
+            if job.device.Id == 3
+            else push_service._PushResult(status_code=200, reason="HTTP 200", latency_ms=5)
+            for job in jobs
+        ]
+
+    monkeypatch.setattr(push_service, "_LoadApnsConfig", lambda: object())
+    monkeypatch.setattr(push_service, "_DeliverPushJobs", _Deliver)
+    monkeypatch.setattr(push_service, "_push_stats", push_service._PushStats())
+
+    result = SendPushForNotifications(
+        db,
+        notifications=[_Notification(100, 10), _Notification(101, 20), _Notification(102, 30)],
+        badge_counts={10: 3, 20: 1},
+    )
+
+    assert result.Delivered == 2
+    assert result.Retry == {}
+    assert db.queries == 1
+    assert db.commits == 1
+    assert [job.device.Id for job in sent_jobs] == [1, 2, 3]
+    assert sent_jobs[0].payload["aps"]["badge"] == 3
+    assert devices[2].IsActive is False
+    assert devices[2].LastError == "Unregistered"
+    stats = push_service.GetPushStats()
+    assert stats["Attempts"] == 3
+    assert stats["Delivered"] == 2
+    assert stats["Deactivated"] == 1
+
+
+def test_send_push_for_notifications_skips_settled_devices_and_reports_outcomes(monkeypatch):
+    devices = [_Device(1, 10), _Device(2, 10), _Device(3, 10)]
+    db = _FakeDb(devices)
+    sent_jobs = []
+
+    def _Deliver(_config, jobs):
+        sent_jobs.extend(jobs)
+        return [
+            push_service._PushResult(status_code=503, reason="ServiceUnavailable", latency_ms=5)
+            if job.device.Id == 2
+            else push_service._PushResult(status_code=200, reason="HTTP 200", latency_ms=5)
+            for job in jobs
+        ]
+
+    monkeypatch.setattr(push_service, "_LoadApnsConfig", lambda: object())
+    monkeypatch.setattr(push_service, "_DeliverPushJobs", _Deliver)
+    monkeypatch.setattr(push_service, "_push_stats", push_service._PushStats())
+
+    result = SendPushForNotifications(
+        db,
+        notifications=[_Notification(100, 10)],
+        badge_counts={10: 1},
+        skip_devices={100: {1}},
+    )
+
+    assert [job.device.Id for job in sent_jobs] == [2, 3]
+    assert result.Retry == {100: "ServiceUnavailable"}
+    assert result.SettledDevices == {100: {3}}
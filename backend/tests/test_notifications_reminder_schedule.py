@@ -0,0 +1,144 @@
+from datetime import date, datetime, timezone
+from types import SimpleNamespace
+from zoneinfo import ZoneInfo
+
+import app.modules.kids.services.reminders_service as kids_reminders
+from app.modules.notifications.reminder_schedule_service import (
+    AdvanceReminderSchedule,
+    ComputeNextFireAt,
+    SyncReminderSchedule,
+)
+
+ADELAIDE = ZoneInfo("Australia/Adelaide")
+
+
+class _FakeQuery:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def filter(self, *_args, **_kwargs):
+        return self
+
+    def all(self):
+        return list(self._rows)
+
+
+class _FakeDb:
+    def __init__(self, rows=None):
+        self.rows = rows or []
+        self.added = []
+        self.deleted = []
+        self.commits = 0
+
+    def query(self, *_args, **_kwargs):
+        return _FakeQuery(self.rows)
+
+    def add(self, row):
+        self.added.append(row)
+
+    def delete(self, row):
+        self.deleted.append(row)
+
+    def commit(self):
+        self.commits += 1
+
+
+def test_compute_next_fire_at_uses_local_wall_clock():
+    # 18:59 in Adelaide (UTC+10:30 in January) fires at 19:00 local the same day.
+    now_utc = datetime(2026, 1, 10, 8, 29, tzinfo=timezone.utc)
+    assert ComputeNextFireAt("19:00", ADELAIDE, now_utc) == datetime(
+        2026, 1, 10, 8, 30, tzinfo=timezone.utc
+    )
+
+    # Once 19:00 has passed it rolls to tomorrow.
+    later_utc = datetime(2026, 1, 10, 8, 31, tzinfo=timezone.utc)
+    assert ComputeNextFireAt("19:00", ADELAIDE, later_utc) == datetime(
+        2026, 1, 11, 8, 30, tzinfo=timezone.utc
+    )
+
+
+def test_compute_next_fire_at_follows_dst_change():
+    # Adelaide leaves daylight saving on 2026-04-05, so 19:00 moves from 08:30 to 09:30 UTC.
+    before = ComputeNextFireAt("19:00", ADELAIDE, datetime(2026, 4, 4, 9, 0, tzinfo=timezone.utc))
+    assert before == datetime(2026, 4, 5, 9, 30, tzinfo=timezone.utc)
+
+
+def test_sync_reminder_schedule_only_rewrites_changed_slots():
+    now = datetime(2026, 1, 10, 0, 0, tzinfo=timezone.utc)
+    unchanged = SimpleNamespace(
+        UserId=1,
+        ReminderKey="DailyJobs",
+        LocalTime="19:00",
+        TimeZone="Australia/Adelaide",
+        NextFireAt=datetime(2026, 1, 10, 8, 30, tzinfo=timezone.utc),
+    )
+    dropped = SimpleNamespace(
+        UserId=2,
+        ReminderKey="Habits",
+        LocalTime="19:00",
+        TimeZone="Australia/Adelaide",
+        NextFireAt=datetime(2026, 1, 10, 8, 30, tzinfo=timezone.utc),
+    )
+    db = _FakeDb([unchanged, dropped])
+
+    SyncReminderSchedule(
+        db,
+        source_module="kids",
+        slots_by_user={1: ("Australia/Adelaide", {"DailyJobs": "19:00", "Habits": "18:00"})},
+        now=now,
+    )
+
+    assert [row.ReminderKey for row in db.added] == ["Habits"]
+    assert db.added[0].NextFireAt == datetime(2026, 1, 10, 7, 30, tzinfo=timezone.utc)
+    assert db.deleted == [dropped]
+
+
+def test_advance_reminder_schedule_moves_fired_slot_to_next_day():
+    row = SimpleNamespace(
+        LocalTime="19:00",
+        TimeZone="Australia/Adelaide",
+        NextFireAt=datetime(2026, 1, 10, 8, 30, tzinfo=timezone.utc),
+    )
+    AdvanceReminderSchedule(_FakeDb(), [row], datetime(2026, 1, 10, 8, 30, 20, tzinfo=timezone.utc))
+    assert row.NextFireAt == datetime(2026, 1, 11, 8, 30, tzinfo=timezone.utc)
+
+
+def test_scheduled_kids_sweep_only_processes_due_rows(monkeypatch):
+    now_utc = datetime(2026, 1, 10, 8, 31, tzinfo=timezone.utc)
+    due = SimpleNamespace(
+        UserId=7,
+        ReminderKey="DailyJobs",
+        LocalTime="19:00",
+        TimeZone="Australia/Adelaide",
+        NextFireAt=datetime(2026, 1, 10, 8, 30, tzinfo=timezone.utc),
+    )
+    stale = SimpleNamespace(
+        UserId=8,
+        ReminderKey="Habits",
+        LocalTime="19:00",
+        TimeZone="Australia/Adelaide",
+        NextFireAt=datetime(2026, 1, 9, 8, 30, tzinfo=timezone.utc),
+    )
+    processed = []
+    advanced = []
+
+    monkeypatch.setattr(kids_reminders, "NowUtc", lambda: now_utc)
+    monkeypatch.setattr(kids_reminders, "LoadDueReminderSchedule", lambda *_a, **_k: [due, stale])
+    monkeypatch.setattr(
+        kids_reminders,
+        "AdvanceReminderSchedule",
+        lambda _db, rows, _now: advanced.extend(rows),
+    )
+    monkeypatch.setattr(
+        kids_reminders,
+        "_ProcessKidReminders",
+        lambda _db, **kwargs: processed.append(kwargs),
+    )
+
+    kids_reminders.RunDailyKidsReminders(_FakeDb(), actor_user_id=1)
+
+    assert advanced == [due, stale]
+    assert len(processed) == 1
+    assert processed[0]["kid_user_id"] == 7
+    assert processed[0]["run_date"] == date(2026, 1, 10)
+    assert processed[0]["due_jobs"] == [("DailyJobs", kids_reminders.CHORE_TYPE_DAILY, "19:00")]
@@ -129,6 +129,16 @@ export const ParseMealTemplateText = (payload) =>
 export const FetchWeeklySummary = (startDate) =>
   RequestJson(`${Health}/summary/weekly?start_date=${encodeURIComponent(startDate)}`);
 
+export const FetchMonthlySummary = (month) =>
+  RequestJson(`${Health}/summary/monthly?month=${encodeURIComponent(month)}`);
+
+export const FetchRangeSummary = (startDate, endDate) =>
+  RequestJson(
+    `${Health}/summary/range?start_date=${encodeURIComponent(startDate)}&end_date=${encodeURIComponent(
+      endDate
+    )}`
+  );
+
 export const FetchStepsHistory = (startDate, endDate) =>
   RequestJson(
     `${Health}/daily-logs/steps/history?start_date=${encodeURIComponent(
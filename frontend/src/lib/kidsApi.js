@@ -7,14 +7,31 @@ export const FetchKidsOverview = async (selectedDate = "") => {
   return RequestJson(`/kids/me/overview${query}`);
 };
 
-export const FetchKidsLedger = async (limit = 50) =>
-  RequestJson(`/kids/me/ledger?limit=${limit}`);
+const CursorQuery = (cursor) => (cursor ? `&cursor=${encodeURIComponent(cursor)}` : "");
+
+// Chore-entry history is a plain list; its next-page cursor comes back in a header.
+const RequestChoreEntriesPage = async (path) => {
+  const response = await RequestWithAuth(path);
+  if (!response.ok) {
+    const detail = await response.text();
+    throw new Error(detail || "Request failed");
+  }
+  return {
+    Entries: await response.json(),
+    NextCursor: response.headers.get("X-Next-Cursor") || null
+  };
+};
+
+export const FetchKidsLedger = async (limit = 50, cursor = "") =>
+  RequestJson(`/kids/me/ledger?limit=${limit}${CursorQuery(cursor)}`);
 
 export const FetchKidsChores = async () => RequestJson("/kids/me/chores");
 
-export const FetchKidsChoreEntries = async (limit = 50, includeDeleted = false) =>
-  RequestJson(
-    `/kids/me/chore-entries?limit=${limit}&include_deleted=${includeDeleted ? "true" : "false"}`
+export const FetchKidsChoreEntries = async (limit = 50, includeDeleted = false, cursor = "") =>
+  RequestChoreEntriesPage(
+    `/kids/me/chore-entries?limit=${limit}&include_deleted=${
+      includeDeleted ? "true" : "false"
+    }${CursorQuery(cursor)}`
   );
 
 export const FetchKidsChoreEntryAudit = async (entryId) =>
@@ -50,14 +67,14 @@ export const CreateKidLink = async (payload) =>
     body: JSON.stringify(payload)
   });
 
-export const FetchKidLedger = async (kidId, limit = 100) =>
-  RequestJson(`/kids/parents/children/${kidId}/ledger?limit=${limit}`);
+export const FetchKidLedger = async (kidId, limit = 100, cursor = "") =>
+  RequestJson(`/kids/parents/children/${kidId}/ledger?limit=${limit}${CursorQuery(cursor)}`);
 
-export const FetchKidChoreEntries = async (kidId, limit = 200, includeDeleted = true) =>
-  RequestJson(
+export const FetchKidChoreEntries = async (kidId, limit = 200, includeDeleted = true, cursor = "") =>
+  RequestChoreEntriesPage(
     `/kids/parents/children/${kidId}/chore-entries?limit=${limit}&include_deleted=${
       includeDeleted ? "true" : "false"
-    }`
+    }${CursorQuery(cursor)}`
   );
 
 export const FetchKidChoreEntryAudit = async (kidId, entryId) =>
@@ -121,6 +138,12 @@ export const ApproveKidsChoreEntry = async (entryId) =>
 export const RejectKidsChoreEntry = async (entryId) =>
   RequestJson(`/kids/parents/approvals/${entryId}/reject`, { method: "POST" });
 
+export const BulkReviewKidsChoreEntries = async (entryIds, action) =>
+  RequestJson("/kids/parents/approvals/bulk", {
+    method: "POST",
+    body: JSON.stringify({ EntryIds: entryIds, Action: action })
+  });
+
 export const CreateKidDeposit = async (kidId, payload) =>
   RequestJson(`/kids/parents/children/${kidId}/ledger/deposit`, {
     method: "POST",
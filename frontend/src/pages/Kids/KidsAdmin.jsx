@@ -266,7 +266,7 @@ const KidsAdmin = () => {
     setError("");
     try {
       const data = await FetchKidChoreEntries(activeKidId, 500, false);
-      setHistoryEntries(data || []);
+      setHistoryEntries(data?.Entries || []);
       setStatus("ready");
     } catch (err) {
       setStatus("error");
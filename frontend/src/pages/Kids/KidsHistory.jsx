@@ -136,7 +136,7 @@ const KidsHistory = () => {
         FetchKidsChoreEntries(50, false),
         FetchKidsLedger(100)
       ]);
-      setEntries(choreData || []);
+      setEntries(choreData?.Entries || []);
       setLedgerEntries(ledgerData?.Entries || []);
       setStatus("ready");
     } catch (err) {
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+backfill_daily_totals.py - Populate the health.daily_totals rollup.
+
+Migration 0069 copies steps and weight for every existing daily log but leaves the
+nutrient sums empty; until they are filled, summaries compute those days from their
+meal entries on every read. This computes them for every daily log whose rollup row is
+missing or unsummed, committing per batch, so it is safe to re-run or interrupt.
+
+Usage examples:
+  python scripts/backfill_daily_totals.py
+  python scripts/backfill_daily_totals.py --batch-size 200
+
+Flags:
+  --batch-size N    Daily logs refreshed per commit (default: 500).
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "backend"))
+
+from app import db as db_module  # noqa: E402
+from app.modules.health.services.daily_logs_service import BackfillDailyTotals  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Backfill the health daily totals rollup.")
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+    if args.batch_size <= 0:
+        parser.error("--batch-size must be greater than zero")
+
+    db_module._ensure_engine()
+    db = db_module.SessionLocal()
+    started = time.perf_counter()
+    try:
+        refreshed = BackfillDailyTotals(db, BatchSize=args.batch_size)
+    finally:
+        db.close()
+    print(f"refreshed {refreshed} daily log(s) in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+bench_async_db.py - Compare sync (GetDb) and async (AsyncGetDb) route modes under load.
+
+Builds an in-process FastAPI app over a SQLite file whose every statement sleeps for
+a fixed delay (standing in for the SQL Server round trip), with the production pool
+settings from app.db. Each mode fires N concurrent DB-bound requests and, while they
+are in flight, times a cheap sync route. That route shares AnyIO's ~40-thread pool
+with sync DB handlers, which is the contention AsyncGetDb removes.
+
+Once sync load exceeds pool size + overflow, the threadpool fills with handlers
+waiting on pool checkout while the sessions holding connections wait for a thread
+to run GetDb's teardown; those requests stall until --pool-timeout and fail.
+
+Usage examples:
+  python scripts/bench_async_db.py
+  python scripts/bench_async_db.py --requests 400 --query-ms 20
+  SQLALCHEMY_ASYNC_WORKERS=40 python scripts/bench_async_db.py
+
+Flags:
+  --requests N    Concurrent DB-bound requests per mode (default: 200).
+  --query-ms N    Simulated latency per SQL statement (default: 15).
+  --probes N      Cheap sync requests timed during the load (default: 20).
+  --pool-timeout N  Seconds to wait for a pooled connection (default: 10).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import Session, sessionmaker
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "backend"))
+
+from app import db as db_module  # noqa: E402
+
+
+def _Configure(query_ms: int, pool_timeout: int, path: str) -> None:
+    engine = create_engine(
+        f"sqlite:///{path}",
+        connect_args={"check_same_thread": False},
+        pool_size=db_module._read_int_env("SQLALCHEMY_POOL_SIZE", 10),
+        max_overflow=db_module._read_int_env("SQLALCHEMY_MAX_OVERFLOW", 20),
+        pool_timeout=pool_timeout,
+    )
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _Delay(*_args) -> None:
+        time.sleep(query_ms / 1000)
+
+    db_module.engine = engine
+    db_module.SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+
+
+def _Query(db: Session) -> int:
+    return db.execute(text("SELECT 1")).scalar_one()
+
+
+def _BuildApp() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/sync")
+    def SyncRoute(db: Session = Depends(db_module.GetDb)) -> dict:
+        return {"value": _Query(db)}
+
+    @app.get("/async")
+    async def AsyncRoute(db: db_module.AsyncDbSession = Depends(db_module.AsyncGetDb)) -> dict:
+        return {"value": await db.run_sync(_Query)}
+
+    @app.get("/probe")
+    def ProbeRoute() -> dict:
+        return {"status": "ok"}
+
+    return app
+
+
+async def _Timed(client: httpx.AsyncClient, path: str) -> tuple[float, bool]:
+    started = time.perf_counter()
+    response = await client.get(path)
+    return time.perf_counter() - started, response.status_code == 200
+
+
+async def _RunMode(app: FastAPI, path: str, requests: int, probes: int) -> dict:
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        started = time.perf_counter()
+        load = [asyncio.ensure_future(_Timed(client, path)) for _ in range(requests)]
+        await asyncio.sleep(0.05)
+        probe_latencies = [(await _Timed(client, "/probe"))[0] for _ in range(probes)]
+        outcomes = await asyncio.gather(*load)
+        elapsed = time.perf_counter() - started
+    latencies = sorted(latency for latency, _ok in outcomes)
+    return {
+        "elapsed": elapsed,
+        "throughput": requests / elapsed,
+        "errors": sum(1 for _latency, ok in outcomes if not ok),
+        "p50": statistics.median(latencies),
+        "p95": latencies[int(len(latencies) * 0.95) - 1],
+        "probe_p50": statistics.median(probe_latencies),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark sync vs async DB route modes.")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--query-ms", type=int, default=15)
+    parser.add_argument("--probes", type=int, default=20)
+    parser.add_argument("--pool-timeout", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        _Configure(args.query_ms, args.pool_timeout, str(Path(tmp) / "bench.db"))
+        app = _BuildApp()
+        results = {
+            mode: asyncio.run(_RunMode(app, f"/{mode}", args.requests, args.probes))
+            for mode in ("sync", "async")
+        }
+        db_module.CloseAsyncDb()
+        db_module.engine.dispose()
+
+    print(f"requests={args.requests} query={args.query_ms}ms workers={db_module._read_int_env('SQLALCHEMY_ASYNC_WORKERS', 30)}")
+    for mode, stats in results.items():
+        print(
+            f"{mode:<6} {stats['throughput']:7.0f} req/s  "
+            f"p50={stats['p50'] * 1000:6.0f}ms  p95={stats['p95'] * 1000:6.0f}ms  "
+            f"probe p50={stats['probe_p50'] * 1000:6.1f}ms  errors={stats['errors']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+bench_month_projection.py - Time BuildMonthProjection against the original per-day version.
+
+The original implementation (kept as the reference in
+backend/tests/test_kids_month_projection_equivalence.py) re-checks every chore and
+assignment window for each day of the month. The current engine turns each window
+into one day bitmap. Both are run on the same synthetic month: daily chores with
+staggered start/disable dates, assignments for each, and approved entries on most days.
+
+Usage examples:
+  python scripts/bench_month_projection.py
+  python scripts/bench_month_projection.py --chores 40 --repeat 500
+
+Flags:
+  --chores N    Daily chores in the month, each with two assignments (default: 12).
+  --repeat N    Projections timed per implementation (default: 2000).
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+backend = Path(__file__).resolve().parents[1] / "backend"
+sys.path.insert(0, str(backend))
+sys.path.insert(0, str(backend / "tests"))
+
+from app.modules.kids.services.chores_v2_service import (  # noqa: E402
+    CHORE_TYPE_DAILY,
+    STATUS_APPROVED,
+    BuildMonthProjection,
+    RoundDailySlice,
+)
+from test_kids_month_projection_equivalence import _ReferenceProjection  # noqa: E402
+
+
+def _BuildCase(chore_count: int) -> dict:
+    rng = random.Random(7)
+    month_start = date(2026, 3, 1)
+    month_end = date(2026, 3, 31)
+    chores = []
+    assignments = []
+    for chore_id in range(1, chore_count + 1):
+        chores.append(
+            SimpleNamespace(
+                Id=chore_id,
+                Type=CHORE_TYPE_DAILY,
+                IsActive=True,
+                StartsOn=month_start - timedelta(days=rng.randint(0, 40)),
+                DisabledOn=None if rng.random() < 0.7 else month_start + timedelta(days=rng.randint(10, 30)),
+            )
+        )
+        for _ in range(2):
+            assignments.append(
+                SimpleNamespace(
+                    ChoreId=chore_id,
+                    IsEnabled=True,
+                    StartsOn=month_start + timedelta(days=rng.randint(-20, 5)),
+                    DisabledOn=None,
+                )
+            )
+    entries = [
+        SimpleNamespace(
+            IsDeleted=False,
+            EntryDate=month_start + timedelta(days=day),
+            ChoreId=chore.Id,
+            ChoreType=CHORE_TYPE_DAILY,
+            Status=STATUS_APPROVED,
+            Amount=0,
+        )
+        for day in range(31)
+        for chore in chores
+        if rng.random() < 0.9
+    ]
+    return {
+        "today": date(2026, 3, 20),
+        "month_start": month_start,
+        "month_end": month_end,
+        "daily_slice_cents": RoundDailySlice(4000, 31),
+        "monthly_allowance_cents": 4000,
+        "chores": chores,
+        "assignments": assignments,
+        "entries": entries,
+    }
+
+
+def _Time(function, case: dict, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        function(**case)
+    return (time.perf_counter() - started) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark BuildMonthProjection.")
+    parser.add_argument("--chores", type=int, default=12)
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    case = _BuildCase(args.chores)
+    if BuildMonthProjection(**case) != _ReferenceProjection(**case):
+        raise SystemExit("results differ from the reference implementation")
+
+    reference = _Time(_ReferenceProjection, case, args.repeat)
+    current = _Time(BuildMonthProjection, case, args.repeat)
+    print(f"chores={args.chores} assignments={len(case['assignments'])} entries={len(case['entries'])}")
+    print(f"per-day   {reference * 1e6:8.1f} us/projection")
+    print(f"bitmap    {current * 1e6:8.1f} us/projection  ({reference / current:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+bench_pocket_money_schedule.py - Time one month of pocket money dates for a 10-year-old rule.
+
+The original schedule walk (kept as the reference in
+backend/tests/test_kids_pocket_money_schedule_equivalence.py) steps from StartDate one
+occurrence at a time, so a window late in the rule's life costs O(history).
+IterPocketMoneyDates jumps straight to the first occurrence in the window.
+
+Usage examples:
+  python scripts/bench_pocket_money_schedule.py
+  python scripts/bench_pocket_money_schedule.py --years 20 --repeat 5000
+
+Flags:
+  --years N     Age of the rule at the start of the window (default: 10).
+  --repeat N    Lookups timed per implementation and frequency (default: 2000).
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+backend = Path(__file__).resolve().parents[1] / "backend"
+sys.path.insert(0, str(backend))
+sys.path.insert(0, str(backend / "tests"))
+
+from app.modules.kids.services.pocket_money_service import ComputePocketMoneyDates  # noqa: E402
+from test_kids_pocket_money_schedule_equivalence import _ReferenceScheduleDates  # noqa: E402
+
+
+def _Rule(frequency: str, start_date: date) -> SimpleNamespace:
+    return SimpleNamespace(
+        Frequency=frequency,
+        DayOfWeek=4,
+        DayOfMonth=31,
+        StartDate=start_date,
+        LastPostedOn=None,
+        IsActive=True,
+    )
+
+
+def _Time(function, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - started) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark pocket money schedule generation.")
+    parser.add_argument("--years", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    window_start = date(2026, 3, 1)
+    window_end = date(2026, 3, 31)
+    start_date = window_start - timedelta(days=round(365.25 * args.years))
+    print(f"rule start={start_date.isoformat()} window={window_start.isoformat()}..{window_end.isoformat()}")
+
+    for frequency in ("weekly", "fortnightly", "monthly"):
+        rule = _Rule(frequency, start_date)
+        expected = [value for value in _ReferenceScheduleDates(rule, window_end) if value >= window_start]
+        if ComputePocketMoneyDates(rule, window_end, from_date=window_start) != expected:
+            raise SystemExit(f"{frequency}: results differ from the reference implementation")
+
+        reference = _Time(
+            lambda: [value for value in _ReferenceScheduleDates(rule, window_end) if value >= window_start],
+            args.repeat,
+        )
+        current = _Time(lambda: ComputePocketMoneyDates(rule, window_end, from_date=window_start), args.repeat)
+        print(
+            f"{frequency:<12} step-walk {reference * 1e6:9.1f} us   "
+            f"closed-form {current * 1e6:6.1f} us  ({reference / current:.0f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
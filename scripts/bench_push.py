@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+bench_push.py - Benchmark APNs push dispatch against a local fake APNs server.
+
+Starts an in-process HTTP/2 (h2c, prior knowledge) server that answers every
+POST /3/device/<token> with 200 after a fixed delay, then compares:
+  - per-notification: a fresh HTTP/2 client per notification, devices sent one by one
+    (the pre-batching behaviour)
+  - batched: the push_service pipeline (one pooled client, APNS_MAX_CONCURRENCY workers)
+
+Usage examples:
+  python scripts/bench_push.py
+  python scripts/bench_push.py --notifications 200 --devices 2 --delay-ms 40
+  APNS_MAX_CONCURRENCY=32 python scripts/bench_push.py
+
+Flags:
+  --notifications N   Notifications to send (default: 100).
+  --devices N         Devices per recipient (default: 2).
+  --delay-ms N        Simulated APNs response latency (default: 25).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import threading
+import time
+import uuid
+from pathlib import Path
+from types import SimpleNamespace
+
+import h2.config
+import h2.connection
+import h2.events
+import httpx
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "backend"))
+
+from app.modules.notifications import push_service  # noqa: E402
+
+
+class _FakeApnsProtocol(asyncio.Protocol):
+    def __init__(self, delay_seconds: float) -> None:
+        self._delay_seconds = delay_seconds
+        self._conn = h2.connection.H2Connection(
+            config=h2.config.H2Configuration(client_side=False, header_encoding="utf-8")
+        )
+        self._transport: asyncio.Transport | None = None
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self._transport = transport  # type: ignore[assignment]
+        self._conn.initiate_connection()
+        self._Flush()
+
+    def data_received(self, data: bytes) -> None:
+        for event in self._conn.receive_data(data):
+            if isinstance(event, h2.events.DataReceived):
+                self._conn.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+            elif isinstance(event, h2.events.StreamEnded):
+                asyncio.get_running_loop().call_later(
+                    self._delay_seconds, self._Respond, event.stream_id
+                )
+        self._Flush()
+
+    def _Respond(self, stream_id: int) -> None:
+        try:
+            self._conn.send_headers(
+                stream_id,
+                [(":status", "200"), ("apns-id", str(uuid.uuid4()))],
+                end_stream=True,
+            )
+        except Exception:  # noqa: BLE001
+            return
+        self._Flush()
+
+    def _Flush(self) -> None:
+        if self._transport is not None:
+            self._transport.write(self._conn.data_to_send())
+
+
+def _StartFakeApns(delay_seconds: float) -> str:
+    loop = asyncio.new_event_loop()
+    ready = threading.Event()
+    address: dict[str, int] = {}
+
+    async def _Serve() -> None:
+        server = await loop.create_server(lambda: _FakeApnsProtocol(delay_seconds), "127.0.0.1", 0)
+        address["port"] = server.sockets[0].getsockname()[1]
+        ready.set()
+        await server.serve_forever()
+
+    threading.Thread(target=lambda: loop.run_until_complete(_Serve()), daemon=True).start()
+    ready.wait(timeout=5)
+    return f"http://127.0.0.1:{address['port']}"
+
+
+def _BuildJobs(notifications: int, devices: int) -> list[list[push_service._PushJob]]:
+    grouped = []
+    for index in range(notifications):
+        notification = SimpleNamespace(Id=index, UserId=index)
+        grouped.append(
+            [
+                push_service._PushJob(
+                    notification=notification,
+                    device=SimpleNamespace(
+                        Id=index * devices + slot,
+                        DeviceToken=f"{index:08x}{slot:08x}",
+                        PushEnvironment="production",
+                    ),
+                    payload={"aps": {"alert": {"title": "Bench"}}, "notification_id": index},
+                )
+                for slot in range(devices)
+            ]
+        )
+    return grouped
+
+
+def _RunPerNotification(config, grouped) -> float:
+    started = time.perf_counter()
+    for jobs in grouped:
+        with httpx.Client(http1=False, http2=True, timeout=config.timeout_seconds) as client:
+            for job in jobs:
+                push_service._PostToDevice(client, config, "bench", job)
+    return time.perf_counter() - started
+
+
+def _RunBatched(config, grouped) -> float:
+    jobs = [job for group in grouped for job in group]
+    started = time.perf_counter()
+    results = push_service._DeliverPushJobs(config, jobs)
+    elapsed = time.perf_counter() - started
+    failures = [result for result in results if result.status_code != 200]
+    if failures:
+        raise SystemExit(f"{len(failures)} batched sends failed: {failures[0].reason}")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark APNs push dispatch.")
+    parser.add_argument("--notifications", type=int, default=100)
+    parser.add_argument("--devices", type=int, default=2)
+    parser.add_argument("--delay-ms", type=int, default=25)
+    args = parser.parse_args()
+
+    base_url = _StartFakeApns(args.delay_ms / 1000)
+    config = push_service._ApnsConfig(
+        team_id="TEAM",
+        key_id="KEY",
+        bundle_id="bench.everday",
+        private_key="unused",
+        timeout_seconds=10.0,
+    )
+    push_service._ResolveApnsHost = lambda _device: base_url
+    push_service._token_provider.BuildBearerToken = lambda _config: "bench"
+    # The fake server speaks cleartext HTTP/2, so swap in a prior-knowledge client.
+    push_service._push_pool._client = httpx.Client(
+        http1=False,
+        http2=True,
+        timeout=config.timeout_seconds,
+    )
+    push_service._push_pool._timeout_seconds = config.timeout_seconds
+
+    grouped = _BuildJobs(args.notifications, args.devices)
+    sends = args.notifications * args.devices
+
+    per_notification = _RunPerNotification(config, grouped)
+    batched = _RunBatched(config, grouped)
+    push_service.ClosePushPool()
+
+    print(f"sends={sends} delay={args.delay_ms}ms")
+    print(f"per-notification: {per_notification:.2f}s ({sends / per_notification:.0f} sends/s)")
+    print(f"batched:          {batched:.2f}s ({sends / batched:.0f} sends/s)")
+    print(f"speedup:          {per_notification / batched:.1f}x")
+
+
+if __name__ == "__main__":
+    main()